@@ -9,3 +9,7 @@ from fastga_he.gui.performances_viewer import PerformancesViewer
 from fastga_he.gui.power_train_weight_breakdown import power_train_mass_breakdown
 from fastga_he.gui.power_train_network_viewer import power_train_network_viewer
 from fastga_he.gui.residuals_viewer import residuals_viewer
+from fastga_he.command.doe import run_doe
+from fastga_he.models.performances.mission_vector.adaptive_discretization import (
+    run_adaptive_mission,
+)
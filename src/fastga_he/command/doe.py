@@ -0,0 +1,503 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import csv
+import logging
+import multiprocessing
+import pathlib
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import openmdao.api as om
+import pandas as pd
+
+import fastoad.api as oad
+
+from fastga_he.problem_outputs import get_outputs_values, set_outputs_values
+
+_LOGGER = logging.getLogger(__name__)
+
+# Name of the columns added to the results file in addition to the design and output variables
+DESIGN_POINT_COLUMN = "design_point"
+CONVERGED_COLUMN = "converged"
+WARM_START_COLUMN = "warm_start_from"
+RUN_TIME_COLUMN = "run_time (s)"
+
+# Time, in s, the main process waits for a result of the workers before checking if they are
+# still running
+_QUEUE_TIMEOUT = 1.0
+
+
+class DOEProblemCache:
+    """
+    Cache for the problems evaluated in a design of experiments. The problem is set up once per
+    process, configuration file, input file and model options. An instance is invalidated if the
+    input file has been modified or if the active submodels have changed.
+    """
+
+    # Cache for storing the set up problems, keyed by configuration file, input file and model
+    # options
+    _cache = {}
+
+    @staticmethod
+    def _get_key(
+        configuration_file_path: Union[str, pathlib.Path],
+        input_file_path: Union[str, pathlib.Path],
+        model_options: dict,
+    ) -> tuple:
+        """
+        Returns the key under which the problem built with the given files and options is
+        stored.
+        """
+
+        return (
+            str(pathlib.Path(configuration_file_path).resolve()),
+            str(pathlib.Path(input_file_path).resolve()),
+            pathlib.Path(input_file_path).lstat().st_mtime,
+            repr(model_options),
+            repr(sorted(oad.RegisterSubmodel.active_models.items())),
+        )
+
+    @staticmethod
+    def clear():
+        """
+        Empties the cache.
+        """
+
+        DOEProblemCache._cache.clear()
+
+    @staticmethod
+    def get_instance(
+        configuration_file_path: Union[str, pathlib.Path],
+        input_file_path: Union[str, pathlib.Path],
+        model_options: dict,
+    ) -> dict:
+        """
+        Returns the cache instance of the problem, which contains the set up problem and its
+        outputs right after setup, setting it up if it does not exist. The input file of the
+        problem, as defined in the configuration file, must already have been written.
+
+        :param configuration_file_path: path to the configuration file of the problem.
+        :param input_file_path: path to the file the inputs of the problem were generated from.
+        :param model_options: model options to apply before the setup of the problem.
+        """
+
+        key = DOEProblemCache._get_key(configuration_file_path, input_file_path, model_options)
+
+        if key not in DOEProblemCache._cache:
+            configurator = oad.FASTOADProblemConfigurator(configuration_file_path)
+            problem = configurator.get_problem(read_inputs=True)
+
+            for option_key, options in model_options.items():
+                problem.model_options[option_key] = options
+
+            problem.setup()
+            # The vectors of the problem are only allocated in the final setup
+            problem.final_setup()
+
+            DOEProblemCache._cache[key] = {
+                "problem": problem,
+                "initial_outputs": get_outputs_values(problem),
+            }
+
+        return DOEProblemCache._cache[key]
+
+
+def run_doe(
+    configuration_file_path: Union[str, pathlib.Path],
+    input_file_path: Union[str, pathlib.Path],
+    design_points: pd.DataFrame,
+    results_file_path: Union[str, pathlib.Path],
+    design_variables_units: Optional[Dict[str, str]] = None,
+    output_variables: Optional[List[Union[str, Tuple[str, str]]]] = None,
+    model_options: Optional[dict] = None,
+    max_workers: int = 1,
+    warm_start: bool = True,
+) -> pd.DataFrame:
+    """
+    Evaluates a design of experiments on the problem described by a configuration file. The
+    problem is set up once per process and reused for all the design points that process
+    evaluates, so that the cost of the setup is not paid for each point.
+
+    The design points are ordered so that consecutive points are close to one another, and split
+    in contiguous shares across a process pool if more than one worker is used. Each point can
+    then be started from the outputs of the closest point that already converged in the same
+    process rather than from the initial state of the problem, which usually saves iterations
+    of the solvers.
+
+    Instead of writing one output file per point, the design variables and the selected outputs
+    of each point are written as a row of a single csv file as soon as the point is computed.
+    The row also indicates whether the solver of the model converged, which point it was started
+    from (-1 for the initial state) and the time it took.
+
+    :param configuration_file_path: path to the configuration file of the problem.
+    :param input_file_path: path to the file to generate the inputs of the problem from.
+    :param design_points: value of the design variables, one column per variable named after it
+    and one row per design point.
+    :param results_file_path: path to the csv file in which results are written, overwritten if
+    it exists.
+    :param design_variables_units: units in which the design variables are given, for the
+    variables which aren't in this dict, the units of the problem are used.
+    :param output_variables: variables to save for each point, either given as a name or as a
+    tuple with the name and the units to save it in. By default, all scalar outputs of the
+    problem are saved in their own units.
+    :param model_options: model options to apply before the setup of the problem, keyed as in
+    problem.model_options.
+    :param max_workers: number of processes used to evaluate the design points, if 1 they are
+    evaluated in the current process.
+    :param warm_start: boolean to start each point from the closest converged point rather than
+    from the initial state of the problem.
+    :return: the content of the results file, sorted by design point.
+    """
+
+    if design_points.empty:
+        raise ValueError("The design of experiments doesn't contain any point")
+
+    if design_variables_units is None:
+        design_variables_units = {}
+    if model_options is None:
+        model_options = {}
+
+    results_file_path = pathlib.Path(results_file_path)
+    results_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # The input file is written once here so that the workers don't write it concurrently
+    configurator = oad.FASTOADProblemConfigurator(configuration_file_path)
+    configurator.get_problem().write_needed_inputs(input_file_path)
+
+    design_values = design_points.to_numpy(dtype=float)
+    evaluation_order = get_evaluation_order(design_values)
+    design_coordinates = _normalize(design_values)
+
+    arguments = (
+        str(configuration_file_path),
+        str(input_file_path),
+        model_options,
+        list(design_points.columns),
+        design_variables_units,
+        output_variables,
+        warm_start,
+    )
+
+    max_workers = min(max_workers, len(design_points))
+
+    with open(results_file_path, "w", newline="", encoding="utf-8") as results_file:
+        writer = _ResultsWriter(results_file)
+
+        if max_workers > 1:
+            # Submodels may have been activated at runtime in the main process
+            active_models = dict(oad.RegisterSubmodel.active_models)
+
+            idx_per_worker = np.array_split(evaluation_order, max_workers)
+            with multiprocessing.Manager() as manager:
+                results_queue = manager.Queue()
+
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    futures = [
+                        executor.submit(
+                            _run_design_points_in_worker,
+                            *arguments,
+                            idx_that_worker,
+                            design_values[idx_that_worker],
+                            design_coordinates[idx_that_worker],
+                            active_models,
+                            results_queue,
+                        )
+                        for idx_that_worker in idx_per_worker
+                    ]
+
+                    # Results are written as they come rather than when each share is done
+                    nb_results = 0
+                    while nb_results < len(design_points):
+                        try:
+                            writer.write(results_queue.get(timeout=_QUEUE_TIMEOUT))
+                            nb_results += 1
+                        except queue.Empty:
+                            # If a worker failed, it will never send its results
+                            for future in futures:
+                                if future.done() and future.exception() is not None:
+                                    raise future.exception()
+
+                    for future in futures:
+                        future.result()
+
+        else:
+            run_design_points(
+                *arguments,
+                evaluation_order,
+                design_values[evaluation_order],
+                design_coordinates[evaluation_order],
+                writer.write,
+            )
+
+    return pd.read_csv(results_file_path).sort_values(DESIGN_POINT_COLUMN).reset_index(drop=True)
+
+
+def run_design_points(
+    configuration_file_path: str,
+    input_file_path: str,
+    model_options: dict,
+    design_variables: list,
+    design_variables_units: dict,
+    output_variables: Optional[list],
+    warm_start: bool,
+    design_points_idx: np.ndarray,
+    design_values: np.ndarray,
+    design_coordinates: np.ndarray,
+    save_results,
+):
+    """
+    Evaluates the design points given, in the order given, with the problem of the current
+    process. The results of each point are passed to save_results as a dict as soon as it is
+    computed.
+
+    :param configuration_file_path: path to the configuration file of the problem.
+    :param input_file_path: path to the file the inputs of the problem were generated from.
+    :param model_options: model options to apply before the setup of the problem.
+    :param design_variables: names of the design variables.
+    :param design_variables_units: units in which the design variables are given.
+    :param output_variables: variables to save for each point.
+    :param warm_start: boolean to start each point from the closest converged point.
+    :param design_points_idx: index of each point in the design of experiments.
+    :param design_values: value of the design variables for each point, one row per point.
+    :param design_coordinates: normalized value of the design variables for each point, used to
+    find the closest converged point.
+    :param save_results: function called with the results of each point.
+    """
+
+    cache_instance = DOEProblemCache.get_instance(
+        configuration_file_path, input_file_path, model_options
+    )
+    problem = cache_instance["problem"]
+
+    # Index, normalized design variables and outputs of the points that converged
+    converged_points = []
+
+    output_variables = _get_output_variables(problem, output_variables)
+
+    # The solver of the model is made to raise an AnalysisError when it doesn't converge so
+    # that the points which did not converge can be identified
+    solver = problem.model.nonlinear_solver
+    check_convergence = "err_on_non_converge" in solver.options
+    original_err_on_non_converge = (
+        solver.options["err_on_non_converge"] if check_convergence else None
+    )
+    if check_convergence:
+        solver.options["err_on_non_converge"] = True
+
+    # The relative tolerance of the solver is taken with respect to the residuals at the start
+    # of the run, which are much smaller when starting from a converged neighbour. To avoid
+    # converging warm started points much more tightly than the others, they are given the
+    # absolute tolerance the solver reached when started from the initial state, i.e. the norm of
+    # the residuals at the end of the first converged cold start.
+    adjust_atol = warm_start and "atol" in solver.options
+    original_atol = solver.options["atol"] if adjust_atol else None
+    cold_start_atol = None
+
+    try:
+        for design_point_idx, values, coordinates in zip(
+            design_points_idx, design_values, design_coordinates
+        ):
+            start_outputs = cache_instance["initial_outputs"]
+            start_point_idx = -1
+
+            if warm_start and converged_points:
+                distances = [
+                    np.linalg.norm(coordinates - converged_coordinates)
+                    for _, converged_coordinates, _ in converged_points
+                ]
+                start_point_idx, _, start_outputs = converged_points[int(np.argmin(distances))]
+
+            if adjust_atol:
+                if start_point_idx == -1 or cold_start_atol is None:
+                    solver.options["atol"] = original_atol
+                else:
+                    solver.options["atol"] = max(original_atol, cold_start_atol)
+
+            # The outputs also contain the inputs of the problem, through the auto_ivc, so the
+            # design variables have to be set after
+            set_outputs_values(problem, start_outputs)
+
+            for variable_name, value in zip(design_variables, values):
+                problem.set_val(
+                    variable_name, value, units=design_variables_units.get(variable_name)
+                )
+
+            start = time.perf_counter()
+            converged = _run_model(problem)
+            run_time = time.perf_counter() - start
+
+            if converged:
+                converged_points.append(
+                    (int(design_point_idx), coordinates, get_outputs_values(problem))
+                )
+                if adjust_atol and start_point_idx == -1:
+                    _, _, residuals = problem.model.get_nonlinear_vectors()
+                    cold_start_atol = residuals.get_norm()
+            else:
+                _LOGGER.warning("Design point %d did not converge", design_point_idx)
+
+            results = {DESIGN_POINT_COLUMN: int(design_point_idx)}
+            for variable_name, value in zip(design_variables, values):
+                results[variable_name] = value
+            for variable_name, units, label in output_variables:
+                results[label] = problem.get_val(variable_name, units=units).item()
+            results[CONVERGED_COLUMN] = converged
+            results[WARM_START_COLUMN] = start_point_idx
+            results[RUN_TIME_COLUMN] = run_time
+
+            save_results(results)
+
+    finally:
+        if adjust_atol:
+            solver.options["atol"] = original_atol
+        if check_convergence:
+            solver.options["err_on_non_converge"] = original_err_on_non_converge
+
+
+def get_evaluation_order(design_values: np.ndarray) -> np.ndarray:
+    """
+    Returns an order in which to evaluate the design points so that each one is close to the one
+    evaluated before it. Starting from the first point, the closest point not yet visited is
+    chosen each time, distances being computed on the design variables normalized by their
+    range.
+
+    :param design_values: value of the design variables, one row per point.
+    """
+
+    coordinates = _normalize(design_values)
+    nb_points = len(coordinates)
+
+    distances = np.linalg.norm(
+        coordinates[:, np.newaxis, :] - coordinates[np.newaxis, :, :], axis=2
+    )
+
+    order = np.zeros(nb_points, dtype=int)
+    visited = np.zeros(nb_points, dtype=bool)
+    visited[0] = True
+
+    for idx in range(1, nb_points):
+        distances_to_last = np.where(visited, np.inf, distances[order[idx - 1]])
+        order[idx] = np.argmin(distances_to_last)
+        visited[order[idx]] = True
+
+    return order
+
+
+def _normalize(design_values: np.ndarray) -> np.ndarray:
+    """
+    Normalizes the design variables by their range so that they all weigh the same in the
+    distance between points.
+    """
+
+    value_range = np.ptp(design_values, axis=0)
+    value_range = np.where(value_range == 0.0, 1.0, value_range)
+
+    return (design_values - np.min(design_values, axis=0)) / value_range
+
+
+def _get_output_variables(problem, output_variables: Optional[list]) -> list:
+    """
+    Returns the name, units and column label of the variables to save for each point. If no
+    variable is given, all the scalar outputs of the problem are saved.
+    """
+
+    if output_variables is None:
+        output_variables = [
+            (metadata["prom_name"], metadata["units"])
+            for variable_name, metadata in problem.model.get_io_metadata(
+                iotypes="output", metadata_keys=["units", "size"]
+            ).items()
+            if metadata["size"] == 1 and not variable_name.startswith("_auto_ivc.")
+        ]
+        # Promoted outputs may appear several times
+        output_variables = list(dict.fromkeys(output_variables))
+
+    output_variables_with_label = []
+    for output_variable in output_variables:
+        if isinstance(output_variable, str):
+            variable_name, units = output_variable, None
+        else:
+            variable_name, units = output_variable
+
+        label = variable_name if units is None else variable_name + " (" + units + ")"
+        output_variables_with_label.append((variable_name, units, label))
+
+    return output_variables_with_label
+
+
+def _run_model(problem) -> bool:
+    """
+    Runs the model and returns whether it converged. A point is considered not converged if one
+    of the solvers raised an AnalysisError, which the solver of the model does when it doesn't
+    converge as its err_on_non_converge option is set, or if some outputs are not finite.
+    """
+
+    try:
+        problem.run_model()
+    except om.AnalysisError as error:
+        _LOGGER.debug("Analysis error during the run of the design point: %s", error)
+        return False
+
+    return bool(np.all(np.isfinite(get_outputs_values(problem))))
+
+
+def _run_design_points_in_worker(
+    configuration_file_path: str,
+    input_file_path: str,
+    model_options: dict,
+    design_variables: list,
+    design_variables_units: dict,
+    output_variables: Optional[list],
+    warm_start: bool,
+    design_points_idx: np.ndarray,
+    design_values: np.ndarray,
+    design_coordinates: np.ndarray,
+    active_models: dict,
+    results_queue,
+):
+    """
+    Function executed by each worker of the process pool. The results of each point are sent
+    to the main process through the queue as soon as they are computed.
+    """
+
+    # Submodels may have been activated at runtime in the main process
+    oad.RegisterSubmodel.active_models.update(active_models)
+
+    run_design_points(
+        configuration_file_path,
+        input_file_path,
+        model_options,
+        design_variables,
+        design_variables_units,
+        output_variables,
+        warm_start,
+        design_points_idx,
+        design_values,
+        design_coordinates,
+        results_queue.put,
+    )
+
+
+class _ResultsWriter:
+    """
+    Writes the results of the design points in a csv file, one row per point, the header being
+    written with the first row.
+    """
+
+    def __init__(self, results_file):
+        self.results_file = results_file
+        self.writer = None
+
+    def write(self, results: dict):
+        if self.writer is None:
+            self.writer = csv.DictWriter(self.results_file, fieldnames=list(results.keys()))
+            self.writer.writeheader()
+
+        self.writer.writerow(results)
+        # Flushed so that the results of the finished points can be read while the others run
+        self.results_file.flush()
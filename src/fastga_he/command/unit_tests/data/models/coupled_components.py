@@ -0,0 +1,51 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import numpy as np
+import openmdao.api as om
+
+import fastoad.api as oad
+
+
+@oad.RegisterOpenMDAOSystem("fastga_he.test.doe.first_discipline")
+class FirstDiscipline(om.ExplicitComponent):
+    """
+    First discipline of a linear coupled problem, y1 = a + coupling * y2. Solved with a
+    fixed-point iteration, the problem only converges if the coupling is smaller than 2.
+    """
+
+    def setup(self):
+        self.add_input("data:doe_test:a", val=np.nan)
+        self.add_input("data:doe_test:coupling", val=np.nan)
+        self.add_input("data:doe_test:y2", val=1.0)
+
+        self.add_output("data:doe_test:y1", val=1.0)
+
+        self.declare_partials(of="*", wrt="*", method="exact")
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        outputs["data:doe_test:y1"] = (
+            inputs["data:doe_test:a"]
+            + inputs["data:doe_test:coupling"] * inputs["data:doe_test:y2"]
+        )
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        partials["data:doe_test:y1", "data:doe_test:a"] = 1.0
+        partials["data:doe_test:y1", "data:doe_test:coupling"] = inputs["data:doe_test:y2"]
+        partials["data:doe_test:y1", "data:doe_test:y2"] = inputs["data:doe_test:coupling"]
+
+
+@oad.RegisterOpenMDAOSystem("fastga_he.test.doe.second_discipline")
+class SecondDiscipline(om.ExplicitComponent):
+    """Second discipline of a linear coupled problem, y2 = 0.5 * y1."""
+
+    def setup(self):
+        self.add_input("data:doe_test:y1", val=1.0)
+
+        self.add_output("data:doe_test:y2", val=1.0)
+
+        self.declare_partials(of="*", wrt="*", val=0.5)
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        outputs["data:doe_test:y2"] = 0.5 * inputs["data:doe_test:y1"]
@@ -0,0 +1,146 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import os.path as pth
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..doe import (
+    run_doe,
+    get_evaluation_order,
+    DOEProblemCache,
+    CONVERGED_COLUMN,
+    DESIGN_POINT_COLUMN,
+    WARM_START_COLUMN,
+)
+
+DATA_FOLDER_PATH = pth.join(pth.dirname(__file__), "data")
+RESULTS_FOLDER_PATH = pth.join(pth.dirname(__file__), "results")
+
+CONFIGURATION_FILE = pth.join(DATA_FOLDER_PATH, "coupled_problem.yml")
+SOURCE_FILE = pth.join(DATA_FOLDER_PATH, "coupled_problem.xml")
+
+OUTPUT_VARIABLES = ["data:doe_test:y1", "data:doe_test:y2"]
+
+
+def expected_y1(design_points: pd.DataFrame) -> np.ndarray:
+    return design_points["data:doe_test:a"] / (1.0 - 0.5 * design_points["data:doe_test:coupling"])
+
+
+def test_evaluation_order():
+    design_values = np.array([[0.0, 0.0], [1.0, 1.0], [0.1, 0.0], [0.9, 1.0], [0.5, 0.5]])
+
+    # Each point is followed by the closest one not visited yet
+    assert list(get_evaluation_order(design_values)) == [0, 2, 4, 3, 1]
+
+
+def test_doe():
+    DOEProblemCache.clear()
+
+    design_points = pd.DataFrame(
+        {
+            "data:doe_test:a": [1.0, 2.0, 3.0, 4.0, 5.0],
+            "data:doe_test:coupling": [0.2, 0.4, 0.6, 0.8, 1.0],
+        }
+    )
+    results_file_path = pth.join(RESULTS_FOLDER_PATH, "doe.csv")
+
+    results = run_doe(
+        CONFIGURATION_FILE,
+        SOURCE_FILE,
+        design_points,
+        results_file_path,
+        output_variables=OUTPUT_VARIABLES,
+    )
+
+    assert pth.exists(results_file_path)
+    assert list(results[DESIGN_POINT_COLUMN]) == [0, 1, 2, 3, 4]
+    assert np.all(results[CONVERGED_COLUMN])
+    assert results["data:doe_test:y1"].to_numpy() == pytest.approx(
+        expected_y1(design_points).to_numpy(), rel=1e-6
+    )
+    assert results["data:doe_test:y2"].to_numpy() == pytest.approx(
+        0.5 * expected_y1(design_points).to_numpy(), rel=1e-6
+    )
+
+    # Only the first point is started from the initial state, the others are started from the
+    # point evaluated before them
+    assert list(results[WARM_START_COLUMN]) == [-1, 0, 1, 2, 3]
+
+    # Same results without warm start
+    results_cold = run_doe(
+        CONFIGURATION_FILE,
+        SOURCE_FILE,
+        design_points,
+        pth.join(RESULTS_FOLDER_PATH, "doe_cold.csv"),
+        output_variables=OUTPUT_VARIABLES,
+        warm_start=False,
+    )
+
+    assert list(results_cold[WARM_START_COLUMN]) == [-1, -1, -1, -1, -1]
+    assert results_cold["data:doe_test:y1"].to_numpy() == pytest.approx(
+        results["data:doe_test:y1"].to_numpy(), rel=1e-6
+    )
+
+
+def test_doe_not_converged():
+    DOEProblemCache.clear()
+
+    # The fixed-point iteration diverges for the third point
+    design_points = pd.DataFrame(
+        {
+            "data:doe_test:a": [1.0, 1.5, 2.0, 2.5],
+            "data:doe_test:coupling": [0.5, 0.6, 3.0, 0.7],
+        }
+    )
+
+    results = run_doe(
+        CONFIGURATION_FILE,
+        SOURCE_FILE,
+        design_points,
+        pth.join(RESULTS_FOLDER_PATH, "doe_not_converged.csv"),
+        output_variables=OUTPUT_VARIABLES,
+    )
+
+    assert list(results[CONVERGED_COLUMN]) == [True, True, False, True]
+    converged = results[CONVERGED_COLUMN].to_numpy(dtype=bool)
+    assert results["data:doe_test:y1"].to_numpy()[converged] == pytest.approx(
+        expected_y1(design_points).to_numpy()[converged], rel=1e-6
+    )
+
+    # The point that did not converge is not used to start other points
+    assert 2 not in list(results[WARM_START_COLUMN])
+
+    # The options of the solver are restored after the run
+    cache_instance = next(iter(DOEProblemCache._cache.values()))
+    assert not cache_instance["problem"].model.nonlinear_solver.options["err_on_non_converge"]
+
+
+def test_doe_parallel():
+    DOEProblemCache.clear()
+
+    design_points = pd.DataFrame(
+        {
+            "data:doe_test:a": [1.0, 2.0, 3.0, 4.0],
+            "data:doe_test:coupling": [0.2, 0.4, 3.0, 0.8],
+        }
+    )
+
+    results = run_doe(
+        CONFIGURATION_FILE,
+        SOURCE_FILE,
+        design_points,
+        pth.join(RESULTS_FOLDER_PATH, "doe_parallel.csv"),
+        output_variables=OUTPUT_VARIABLES,
+        max_workers=2,
+    )
+
+    assert list(results[DESIGN_POINT_COLUMN]) == [0, 1, 2, 3]
+    assert list(results[CONVERGED_COLUMN]) == [True, True, False, True]
+    converged = results[CONVERGED_COLUMN].to_numpy(dtype=bool)
+    assert results["data:doe_test:y1"].to_numpy()[converged] == pytest.approx(
+        expected_y1(design_points).to_numpy()[converged], rel=1e-6
+    )
@@ -12,6 +12,10 @@ from IPython.display import clear_output, display
 from plotly.subplots import make_subplots
 
 from fastga_he.powertrain_builder.powertrain import PROMOTION_FROM_MISSION
+from fastga_he.models.performances.mission_vector.columnar_results import (
+    is_columnar_file,
+    read_results,
+)
 
 MARKER_DICTIONARY = {
     "sizing:main_route:climb": "circle-open",
@@ -45,11 +49,23 @@ class PerformancesViewer:
         mission_data_file_path: str = "NeFinisPasPar.csv!",
         plot_height: int = None,
         plot_width: int = None,
+        run_index: int = None,
     ):
-        if power_train_data_file_path.endswith(".csv") and not mission_data_file_path.endswith(
-            ".csv"
+        """
+        :param power_train_data_file_path: path to the power train performances, as a .csv or in
+        the columnar format (.npz).
+        :param mission_data_file_path: path to the mission performances, as a .csv or in the
+        columnar format (.npz), if not given only the power train performances are displayed.
+        :param plot_height: height of the plot.
+        :param plot_width: width of the plot.
+        :param run_index: for files in the columnar format which store several runs, index of
+        the run to display, by default the last one.
+        """
+
+        if _is_results_file(power_train_data_file_path) and not _is_results_file(
+            mission_data_file_path
         ):
-            power_train_data = pd.read_csv(power_train_data_file_path, index_col=0)
+            power_train_data = read_results(power_train_data_file_path, run_index)
             # Remove the taxi power train data because they are not stored in the mission data
             # either
             power_train_data = power_train_data.drop([0]).iloc[:-1]
@@ -58,8 +74,8 @@ class PerformancesViewer:
 
             all_data = power_train_data
 
-        elif power_train_data_file_path.endswith(".csv") and mission_data_file_path.endswith(
-            ".csv"
+        elif _is_results_file(power_train_data_file_path) and _is_results_file(
+            mission_data_file_path
         ):
             columns_to_drop = []
             for mission_variable_name in list(PROMOTION_FROM_MISSION.keys()):
@@ -70,9 +86,9 @@ class PerformancesViewer:
                     + "]"
                 )
 
-            # Read the two CSV and concatenate them so that all data can be displayed against all
-            # data
-            power_train_data = pd.read_csv(power_train_data_file_path, index_col=0)
+            # Read the two files and concatenate them so that all data can be displayed against
+            # all data
+            power_train_data = read_results(power_train_data_file_path, run_index)
             # Remove the taxi power train data because they are not stored in the mission data
             # either
             power_train_data = power_train_data.drop([0]).iloc[:-1]
@@ -80,11 +96,13 @@ class PerformancesViewer:
             power_train_data = power_train_data.set_index(np.arange(len(power_train_data.index)))
             power_train_data = power_train_data.drop(columns_to_drop, axis=1)
 
-            mission_data = pd.read_csv(mission_data_file_path, index_col=0)
+            mission_data = read_results(mission_data_file_path, run_index)
             all_data = pd.concat([power_train_data, mission_data], axis=1)
 
         else:
-            raise TypeError("Unknown type for mission and power train data, please use .csv")
+            raise TypeError(
+                "Unknown type for mission and power train data, please use .csv or .npz"
+            )
 
         # The figure displayed
         self._fig = None
@@ -297,3 +315,13 @@ class PerformancesViewer:
         """Readjusts the range of data plotted when adding a new scatter to the graph."""
         self.y_min = min(self.y_min, y.min())
         self.y_max = max(self.y_max, y.max())
+
+
+def _is_results_file(file_path: str) -> bool:
+    """
+    Returns True if the file is a csv or a columnar results file.
+
+    :param file_path: path to the file.
+    """
+
+    return file_path.endswith(".csv") or is_columnar_file(file_path)
@@ -6,6 +6,7 @@ import base64
 import logging
 from pathlib import Path
 import networkx as nx
+import numpy as np
 import bokeh.plotting as bkplot
 import bokeh.models as bkmodel
 import pandas as pd
@@ -15,6 +16,7 @@ from tornado.ioloop import IOLoop
 import webbrowser
 
 from fastga_he.powertrain_builder.powertrain import FASTGAHEPowerTrainConfigurator
+from fastga_he.models.performances.mission_vector.columnar_results import read_results
 from . import icons
 from .layout_generation import HierarchicalLayout
 
@@ -161,7 +163,8 @@ def power_train_network_viewer(
     :param port: Port for Bokeh server
     :param address: Server address
     :param refresh_rate: Monitor refresh rate
-    :param pt_watcher_path: Path to PT watcher file with performance data
+    :param pt_watcher_path: Path to PT watcher file with performance data, as a .csv or in the
+    columnar format (.npz)
     """
 
     # Build graph
@@ -183,6 +186,14 @@ def power_train_network_viewer(
         power_train_file_path, position_dict, orientation, plot_scaling
     )
 
+    # Read the PT watcher file once, its columns are indexed by component for both builders
+    if pt_watcher_path:
+        df_pt = read_results(pt_watcher_path)
+        watcher_column_index = _build_watcher_column_index(df_pt)
+    else:
+        df_pt = None
+        watcher_column_index = None
+
     # Build nodes
     (
         node_source,
@@ -205,12 +216,13 @@ def power_train_network_viewer(
         icon_factor,
         plot_scaling,
         animated_plot,
-        pt_watcher_path,
+        df_pt,
+        watcher_column_index,
     )
 
     # Build edges
     edge_source, edge_state_dict = EdgesBuilder._build_edges(
-        graph_builder.graph, position_dict, node_icons, animated_plot, pt_watcher_path
+        graph_builder.graph, position_dict, node_icons, animated_plot, df_pt, watcher_column_index
     )
 
     # Draw edges
@@ -470,72 +482,96 @@ def _create_segmented_edges(edge_x_pos, edge_y_pos, edge_colors, segments_per_ed
 # ============================================================================
 
 
-def _extract_edge_working_state(df_pt: pd.DataFrame, start: str, end: str) -> list:
+def _build_watcher_column_index(df_pt: pd.DataFrame) -> dict:
+    """
+    Build, in a single pass over the header of the PT watcher DataFrame, the index that gives the
+    watcher columns of each component. Component columns are named
+    "<component name> <variable> [<unit>]" so the component is what comes before the first space,
+    the mission variables simply never match a component.
+
+    :param df_pt: Pandas dataframe of PT watcher extract from the results file
+
+    :return: A dictionary mapping each name found in the header to the list of its columns
+    """
+    watcher_column_index = {}
+
+    for variable in df_pt.columns:
+        watcher_column_index.setdefault(str(variable).split(" ", 1)[0], []).append(variable)
+
+    return watcher_column_index
+
+
+def _extract_flow_states(df_pt: pd.DataFrame, watcher_column_index: dict) -> dict:
     """
-    Extract the working state evolution of a specified edge from the PT watcher DataFrame, returned
-    as a list of boolean values.
+    Extract whether each component transmits power at each flight point, i.e. whether any of its
+    current, torque or fuel variable is non-zero.
+
+    :param df_pt: Pandas dataframe of PT watcher extract from the results file
+    :param watcher_column_index: The index of the columns of each component, as given by
+    _build_watcher_column_index
+
+    :return: A dictionary mapping the components with such variables to a boolean array of their
+    state at each flight point
+    """
+    keys = ["current", "torque", "fuel"]
+    flow_states = {}
+
+    for name, variables in watcher_column_index.items():
+        flow_variables = [
+            variable for variable in variables if any(key in variable for key in keys)
+        ]
+
+        if flow_variables:
+            flow_states[name] = np.any(df_pt[flow_variables].to_numpy(dtype=float) >= 1e-6, axis=1)
+
+    return flow_states
 
-    :param df_pt: Pandas dataframe of PT watcher extract from the csv file
+
+def _extract_edge_working_state(flow_states: dict, start: str, end: str) -> np.ndarray:
+    """
+    Extract the working state evolution of a specified edge from the flow state of its ends,
+    returned as an array of boolean values.
+
+    :param flow_states: The flow state of each component, as given by _extract_flow_states
     :param start: The component at the source side of the connection
     :param end: The component at the target side of the connection
 
-    :return: A boolean list identifies the edge working state for each flight point
+    :return: A boolean array identifies the edge working state for each flight point, None if
+    neither end has flow variables
     """
-    watcher_variables = df_pt.columns.tolist()
-    edge_state_start = None
-    edge_state_end = None
-    keys = ["current", "torque", "fuel"]
+    edge_states = [flow_states[name] for name in (start, end) if name in flow_states]
 
-    for variable in watcher_variables:
-        if start in variable and any(key in variable for key in keys):
-            if edge_state_start is None:
-                edge_state_start = [state >= 1e-6 for state in df_pt[variable]]
-            else:
-                new_state = [state >= 1e-6 for state in df_pt[variable]]
-                edge_state_start = [
-                    state_old or state_new
-                    for state_old, state_new in zip(edge_state_start, new_state)
-                ]
-
-        if end in variable and any(key in variable for key in keys):
-            if edge_state_end is None:
-                edge_state_end = [state >= 1e-6 for state in df_pt[variable]]
-            else:
-                new_state = [state >= 1e-6 for state in df_pt[variable]]
-                edge_state_end = [
-                    state_old or state_new
-                    for state_old, state_new in zip(edge_state_end, new_state)
-                ]
-
-    # Combine results
-    if edge_state_start and edge_state_end:
-        return [state_s and state_e for state_s, state_e in zip(edge_state_start, edge_state_end)]
-    elif edge_state_start:
-        return edge_state_start
-    else:
-        return edge_state_end
+    if not edge_states:
+        return None
 
+    # The edge only works if both of its ends, when they are known, are working
+    return np.logical_and.reduce(edge_states)
 
-def _extract_component_performance(df_pt: pd.DataFrame, name: str, perf_dict: dict) -> dict:
+
+def _extract_component_performance(
+    df_pt: pd.DataFrame, watcher_column_index: dict, name: str, perf_dict: dict
+) -> dict:
     """
     Extract specific component performance data from PT watcher dataframe.
 
-    :param df_pt: Pandas dataframe of PT watcher extract from the csv file
+    :param df_pt: Pandas dataframe of PT watcher extract from the results file
+    :param watcher_column_index: The index of the columns of each component, as given by
+    _build_watcher_column_index
     :param name: The component name specified in the PT file
     :param perf_dict: The dictionary saves the performance matrice of each component
 
     :return: the performance dictionary is returned for the next component
     """
-    watcher_variables = df_pt.columns.tolist()
-
-    for variable in watcher_variables:
-        if name in variable:
-            registered_variable = variable.replace(name + " ", "")
-
-            if name not in perf_dict:
-                perf_dict[name] = {}
-
-            perf_dict[name][registered_variable] = [round(value, 3) for value in df_pt[variable]]
+    variables = watcher_column_index.get(name, [])
+
+    if variables:
+        values = np.round(df_pt[variables].to_numpy(dtype=float), 3)
+        perf_dict.setdefault(name, {}).update(
+            {
+                variable[len(name) + 1 :]: values[:, variable_idx].tolist()
+                for variable_idx, variable in enumerate(variables)
+            }
+        )
 
     return perf_dict
 
@@ -751,7 +787,8 @@ class NodesBuilder:
         icon_factor: float,
         plot_scaling: float,
         animated_plot: bool,
-        pt_watcher_file_path: str = None,
+        df_pt: pd.DataFrame = None,
+        watcher_column_index: dict = None,
     ) -> tuple:
         """
         Build complete node data structure.
@@ -765,7 +802,8 @@ class NodesBuilder:
         :param icon_factor: Factor that adjusts the icon size based on plot orientation
         :param plot_scaling: Scaling factor for the main powertrain architecture
         :param animated_plot: False for static HTML, True for interactive server
-        :param pt_watcher_file_path: Path to the PT watcher csv file
+        :param df_pt: Pandas dataframe of PT watcher extract from the results file
+        :param watcher_column_index: The index of the columns of each component in df_pt
 
         :return: Node properties and node Bokeh dataSource
         """
@@ -778,8 +816,6 @@ class NodesBuilder:
         node_om_types_list = []
         component_perf = {}
 
-        df_pt = pd.read_csv(pt_watcher_file_path) if pt_watcher_file_path else None
-
         for node in node_name_list:
             node_x.append(position_dict[node][0])
             node_y.append(position_dict[node][1])
@@ -789,7 +825,9 @@ class NodesBuilder:
             node_om_types_list.append(node_om_types[node])
 
             if df_pt is not None:
-                component_perf = _extract_component_performance(df_pt, node, component_perf)
+                component_perf = _extract_component_performance(
+                    df_pt, watcher_column_index, node, component_perf
+                )
 
         node_image_urls = NodesBuilder._get_node_image_urls(
             node_name_list, node_icons, animated_plot
@@ -836,7 +874,8 @@ class EdgesBuilder:
         position_dict: dict,
         node_icons: dict,
         animated_plot: bool,
-        pt_watcher_file_path: str = None,
+        df_pt: pd.DataFrame = None,
+        watcher_column_index: dict = None,
     ) -> tuple:
         """
         Build complete edge data structure.
@@ -844,7 +883,8 @@ class EdgesBuilder:
         :param position_dict: The component position dictionary obtained from layout generation
         :param node_icons: Dictionary mapping component names to their icon name
         :param animated_plot: False for static HTML, True for interactive server
-        :param pt_watcher_file_path: Path to the PT watcher csv file
+        :param df_pt: Pandas dataframe of PT watcher extract from the results file
+        :param watcher_column_index: The index of the columns of each component in df_pt
 
         :return: Edge properties and edge Bokeh dataSource
         """
@@ -853,7 +893,10 @@ class EdgesBuilder:
         edge_colors = []
         edge_state = {}
 
-        df_pt = pd.read_csv(pt_watcher_file_path) if pt_watcher_file_path else None
+        # Each component is usually at the end of several edges so its state is computed once
+        flow_states = (
+            _extract_flow_states(df_pt, watcher_column_index) if df_pt is not None else None
+        )
 
         for index, (start, end) in enumerate(list(graph.edges())):
             edge_x_pos.append([position_dict[start][0], position_dict[end][0]])
@@ -865,7 +908,7 @@ class EdgesBuilder:
             edge_colors.append(edge_color)
 
             if df_pt is not None:
-                edge_state[index] = _extract_edge_working_state(df_pt, start, end)
+                edge_state[index] = _extract_edge_working_state(flow_states, start, end)
 
         if not animated_plot:
             edge_source = bkmodel.ColumnDataSource(
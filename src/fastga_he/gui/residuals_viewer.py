@@ -2,6 +2,13 @@
 # Electric Aircraft.
 # Copyright (C) 2022 ISAE-SUPAERO
 
+import hashlib
+import json
+import logging
+import os
+import os.path as pth
+import tempfile
+
 import numpy as np
 import openmdao.api as om
 
@@ -9,15 +16,23 @@ import plotly.graph_objects as go
 import plotly.express as px
 
 from fastga_he.powertrain_builder.powertrain import FASTGAHEPowerTrainConfigurator
+from fastga_he.user_cache import get_user_cache_folder_path
 
 COLOR_ARRAY = px.colors.qualitative.Prism
 
+# Increment this if the content of the cache files changes
+CACHE_FORMAT_VERSION = 2
+
+_LOGGER = logging.getLogger(__name__)
+
 
 def residuals_viewer(
     recorder_data_file_path: str,
     case: str,
     power_train_file_path: str,
     what_to_plot: str = "residuals",
+    cache_folder_path: str = None,
+    use_cache: bool = True,
 ) -> go.Figure:
     """
     Creates a plot with all the interesting residuals as defined in the registered_components file.
@@ -27,6 +42,10 @@ def residuals_viewer(
     path to the nonlinear_solver to the DEPEquilibrium group.
     :param power_train_file_path: path to the powertrain file
     :param what_to_plot: what value to plot, can be "residuals" or "outputs"
+    :param cache_folder_path: folder in which the statistics of each iteration are stored so that
+    the next plot of the same recording does not need to read it again. By default, the
+    fastga_he/residuals_viewer folder of the user cache.
+    :param use_cache: if False, the statistics are neither read from nor written to the cache.
     """
     fig = go.Figure()
 
@@ -34,36 +53,23 @@ def residuals_viewer(
     configurator.load(power_train_file_path)
     components_name, residuals_name = configurator.get_residuals_watcher_elements_list()
 
-    cr = om.CaseReader(recorder_data_file_path)
-
-    solver_case = cr.get_cases(case)
-
-    residuals_mean = {}
-    residuals_min = {}
-    residuals_max = {}
-
-    for component_name, residual_name in zip(components_name, residuals_name):
-        residuals_mean[component_name + "." + residual_name] = []
-        residuals_min[component_name + "." + residual_name] = []
-        residuals_max[component_name + "." + residual_name] = []
-
-    for case in solver_case:
-        # Because I'm 99% sure that the key cycling will always be the same in all three dict,
-        # we will just do one for loop
+    variables_name = [
+        component_name + "." + residual_name
+        for component_name, residual_name in zip(components_name, residuals_name)
+    ]
 
-        if what_to_plot == "residuals":
-            data_what_to_plot = case.residuals
-        else:
-            data_what_to_plot = case.outputs
-
-        for key in residuals_mean:
-            residuals_mean[key].append(np.mean(data_what_to_plot[key]))
-            residuals_min[key].append(np.min(data_what_to_plot[key]))
-            residuals_max[key].append(np.max(data_what_to_plot[key]))
+    residuals_mean, residuals_min, residuals_max = _get_residuals_statistics(
+        recorder_data_file_path=recorder_data_file_path,
+        case=case,
+        variables_name=variables_name,
+        what_to_plot=what_to_plot,
+        cache_folder_path=cache_folder_path,
+        use_cache=use_cache,
+    )
 
     color_selector = 0
 
-    for component_name, residual_name in zip(components_name, residuals_name):
+    for variable_name in variables_name:
         color = COLOR_ARRAY[color_selector]
         if color_selector < len(COLOR_ARRAY) - 1:
             color_selector += 1
@@ -71,18 +77,18 @@ def residuals_viewer(
             color_selector = 0
 
         # Add graph, for avg, min and max
-        data_mean = residuals_mean[component_name + "." + residual_name]
-        data_min = residuals_min[component_name + "." + residual_name]
-        data_max = residuals_max[component_name + "." + residual_name]
+        data_mean = residuals_mean[variable_name]
+        data_min = residuals_min[variable_name]
+        data_max = residuals_max[variable_name]
         data_x = np.arange(len(data_mean))
 
         scatter_mean = go.Scatter(
             x=data_x,
             y=data_mean,
             mode="markers",
-            name=component_name + "." + residual_name + " : Mean residuals for variable",
-            legendgroup=component_name + "." + residual_name,
-            legendgrouptitle_text=component_name + "." + residual_name,
+            name=variable_name + " : Mean residuals for variable",
+            legendgroup=variable_name,
+            legendgrouptitle_text=variable_name,
             marker=dict(color=color, symbol="circle", size=10),
         )
         fig.add_trace(scatter_mean)
@@ -90,8 +96,8 @@ def residuals_viewer(
             x=data_x,
             y=data_min,
             mode="markers",
-            name=component_name + "." + residual_name + " : Min residuals for variable",
-            legendgroup=component_name + "." + residual_name,
+            name=variable_name + " : Min residuals for variable",
+            legendgroup=variable_name,
             marker=dict(symbol="triangle-up", color=color, size=10),
         )
         fig.add_trace(scatter_min)
@@ -99,21 +105,199 @@ def residuals_viewer(
             x=data_x,
             y=data_max,
             mode="markers",
-            name=component_name + "." + residual_name + " : Max residuals for variable",
-            legendgroup=component_name + "." + residual_name,
+            name=variable_name + " : Max residuals for variable",
+            legendgroup=variable_name,
             marker=dict(symbol="triangle-down", color=color, size=10),
         )
         fig.add_trace(scatter_max)
 
-        for x_value, y_min, y_max in zip(data_x, data_min, data_max):
-            scatter_uncertainty = go.Scatter(
-                x=[x_value, x_value],
-                y=[y_min, y_max],
-                mode="lines",
-                legendgroup=component_name + "." + residual_name,
-                line=dict(color=color),
-                showlegend=False,
-            )
-            fig.add_trace(scatter_uncertainty)
+        # All the min-max segments of the variable are drawn as a single trace, separated by
+        # None so that they are not linked to one another
+        scatter_uncertainty = go.Scatter(
+            x=np.stack((data_x, data_x, np.full(len(data_x), None)), axis=1).flatten(),
+            y=np.stack((data_min, data_max, np.full(len(data_x), None)), axis=1).flatten(),
+            mode="lines",
+            legendgroup=variable_name,
+            line=dict(color=color),
+            showlegend=False,
+        )
+        fig.add_trace(scatter_uncertainty)
 
     return fig
+
+
+def _get_residuals_statistics(
+    recorder_data_file_path: str,
+    case: str,
+    variables_name: list,
+    what_to_plot: str = "residuals",
+    cache_folder_path: str = None,
+    use_cache: bool = True,
+) -> tuple:
+    """
+    Returns the mean, min and max of the variables at each iteration of the solver as three
+    dictionaries of arrays, keyed by variable name. They are read from the cache file of the
+    recorder when it is still valid, and written to it otherwise.
+
+    :param recorder_data_file_path: path to the sql file that contains the recorder
+    :param case: name of the solver whose iterations are read
+    :param variables_name: name of the variables to read
+    :param what_to_plot: what value to read, can be "residuals" or "outputs"
+    :param cache_folder_path: folder in which the statistics are cached, by default the
+    fastga_he/residuals_viewer folder of the user cache
+    :param use_cache: if False, the statistics are neither read from nor written to the cache
+    """
+
+    cache_file_path = None
+    if use_cache:
+        if cache_folder_path is None:
+            cache_folder_path = get_user_cache_folder_path("residuals_viewer")
+        cache_file_path = _get_cache_file_path(
+            recorder_data_file_path, case, variables_name, what_to_plot, cache_folder_path
+        )
+
+    if cache_file_path is not None and pth.exists(cache_file_path):
+        try:
+            with np.load(cache_file_path, allow_pickle=False) as cache_data:
+                statistics = cache_data["mean"], cache_data["min"], cache_data["max"]
+            return tuple(dict(zip(variables_name, statistic)) for statistic in statistics)
+        except Exception as error:
+            _LOGGER.debug("Could not read the cache %s: %s", cache_file_path, error)
+
+    values = _read_solver_values(recorder_data_file_path, case, variables_name, what_to_plot)
+
+    # One (iterations x elements) array per variable so that the statistics of all the
+    # iterations are computed at once
+    statistics_mean = []
+    statistics_min = []
+    statistics_max = []
+    for variable_name in variables_name:
+        variable_values = np.array(values[variable_name], dtype=float).reshape(
+            len(values[variable_name]), -1
+        )
+        statistics_mean.append(np.mean(variable_values, axis=1))
+        statistics_min.append(np.min(variable_values, axis=1))
+        statistics_max.append(np.max(variable_values, axis=1))
+
+    if cache_file_path is not None:
+        try:
+            os.makedirs(cache_folder_path, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=pth.dirname(cache_file_path), suffix=".tmp", delete=False
+            ) as cache_file:
+                np.savez(
+                    cache_file,
+                    mean=np.array(statistics_mean),
+                    min=np.array(statistics_min),
+                    max=np.array(statistics_max),
+                )
+            os.replace(cache_file.name, cache_file_path)
+        except OSError as error:
+            _LOGGER.warning("Could not write the cache %s: %s", cache_file_path, error)
+
+    return (
+        dict(zip(variables_name, statistics_mean)),
+        dict(zip(variables_name, statistics_min)),
+        dict(zip(variables_name, statistics_max)),
+    )
+
+
+def _get_cache_file_path(
+    recorder_data_file_path: str,
+    case: str,
+    variables_name: list,
+    what_to_plot: str,
+    cache_folder_path: str,
+) -> str:
+    """
+    Returns the path to the cache file of the statistics in the cache folder. Its name contains
+    a hash of the path, size and modification time of the recorder and of what is read in it, so
+    that a new recording or a different request never uses an outdated file.
+    """
+
+    recorder_stat = os.stat(recorder_data_file_path)
+
+    cache_hash = hashlib.sha256()
+    cache_hash.update(
+        json.dumps(
+            [
+                CACHE_FORMAT_VERSION,
+                pth.abspath(recorder_data_file_path),
+                recorder_stat.st_size,
+                recorder_stat.st_mtime_ns,
+                case,
+                what_to_plot,
+                list(variables_name),
+            ]
+        ).encode()
+    )
+
+    recorder_name, _ = pth.splitext(pth.basename(recorder_data_file_path))
+
+    return pth.join(
+        cache_folder_path, recorder_name + "_residuals_" + cache_hash.hexdigest()[:16] + ".npz"
+    )
+
+
+def _read_solver_values(
+    recorder_data_file_path: str, case: str, variables_name: list, what_to_plot: str
+) -> dict:
+    """
+    Returns the value of each variable at each iteration of the solver, as a dictionary of lists
+    keyed by variable name. As in the original viewer, the cases of the solver and of its nested
+    solvers are read, in the order they were recorded. Only their ids are listed beforehand, the
+    cases are then loaded one at a time and only the requested variables are copied out of them.
+
+    This only lowers the peak memory, the read itself is not faster: the recorder stores the
+    outputs and residuals of an iteration as a whole, so loading a case still decodes all of them.
+    To make the read faster, restrict what the solver records, e.g. with the "includes" entry of
+    its recording options.
+    """
+
+    cr = om.CaseReader(recorder_data_file_path)
+
+    values = {variable_name: [] for variable_name in variables_name}
+    recorded_names = None
+
+    for case_id in cr.list_cases(case, out_stream=None):
+        solver_case = cr.get_case(case_id)
+
+        if recorded_names is None:
+            recorded_names = _get_recorded_names(
+                list(solver_case.outputs.absolute_names()), variables_name
+            )
+
+        for variable_name, recorded_name in zip(variables_name, recorded_names):
+            if what_to_plot == "residuals":
+                variable_value = solver_case.residuals[recorded_name]
+            else:
+                variable_value = solver_case.get_val(recorded_name)
+            values[variable_name].append(np.copy(variable_value))
+
+    return values
+
+
+def _get_recorded_names(recorded_names: list, variables_name: list) -> list:
+    """
+    Returns the name under which each variable is recorded. The recorder stores absolute names
+    while the variables may be given relative to the group of the solver, so a recorded name
+    that ends with the variable name is accepted if it is the only one.
+
+    :param recorded_names: names of the variables stored in the recorder
+    :param variables_name: name of the variables to read
+    """
+
+    recorded_names_set = set(recorded_names)
+
+    variables_recorded_name = []
+    for variable_name in variables_name:
+        if variable_name in recorded_names_set:
+            variables_recorded_name.append(variable_name)
+            continue
+
+        candidates = [name for name in recorded_names if name.endswith("." + variable_name)]
+        if len(candidates) != 1:
+            raise KeyError("Variable " + variable_name + " not found in the recorder")
+        variables_recorded_name.append(candidates[0])
+
+    return variables_recorded_name
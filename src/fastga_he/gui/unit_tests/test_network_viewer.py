@@ -5,9 +5,16 @@
 import os
 from shutil import rmtree
 
+import pandas as pd
 import pytest
 
-from ..power_train_network_viewer import power_train_network_viewer
+from ..power_train_network_viewer import (
+    power_train_network_viewer,
+    _build_watcher_column_index,
+    _extract_component_performance,
+    _extract_edge_working_state,
+    _extract_flow_states,
+)
 
 DATA_FOLDER_PATH = os.path.join(os.path.dirname(__file__), "data")
 RESULTS_FOLDER_PATH = os.path.join(os.path.dirname(__file__), "results")
@@ -94,3 +101,62 @@ def test_pt_network_viewer_tri_prop_two_chainz(cleanup):
 
     # Cleanup to avoid any over-clogging
     rmtree(RESULTS_FOLDER_PATH, ignore_errors=True)
+
+
+def test_pt_network_viewer_with_watcher(cleanup):
+    """
+    Basic tests for testing the power train viewer with performances data.
+    """
+
+    # Create a directory to save graph to
+    os.makedirs(RESULTS_FOLDER_PATH)
+
+    # No real way to verify the plot, we wil just check that it is created.
+    power_train_network_viewer(
+        os.path.join(DATA_FOLDER_PATH, "simple_assembly.yml"),
+        os.path.join(RESULTS_FOLDER_PATH, "network.html"),
+        pt_watcher_path=os.path.join(DATA_FOLDER_PATH, "power_train_data.csv"),
+    )
+
+    assert os.path.exists(os.path.join(RESULTS_FOLDER_PATH, "network.html"))
+
+    # Cleanup to avoid any over-clogging
+    rmtree(RESULTS_FOLDER_PATH, ignore_errors=True)
+
+
+def test_watcher_data_extraction():
+    """
+    Tests the extraction of the edges state and components performances from the PT watcher data.
+    """
+
+    df_pt = pd.read_csv(os.path.join(DATA_FOLDER_PATH, "power_train_data.csv"), index_col=0)
+    watcher_column_index = _build_watcher_column_index(df_pt)
+
+    assert watcher_column_index["dc_bus_1"] == ["dc_bus_1 dc_voltage [V]"]
+    assert "dc_bus_1" not in watcher_column_index["dc_bus_2"][0]
+
+    perf_dict = _extract_component_performance(df_pt, watcher_column_index, "harness_1", {})
+    assert list(perf_dict["harness_1"]) == [
+        "dc_current [A]",
+        "cable_temperature [degK]",
+        "conduction_losses [W]",
+    ]
+    assert perf_dict["harness_1"]["dc_current [A]"] == [
+        round(value, 3) for value in df_pt["harness_1 dc_current [A]"]
+    ]
+
+    flow_states = _extract_flow_states(df_pt, watcher_column_index)
+    # Only the components with a current, torque or fuel variable have a state
+    assert "dc_bus_1" not in flow_states
+
+    edge_state = _extract_edge_working_state(flow_states, "motor_1", "propeller_1")
+    assert list(edge_state) == [
+        torque_motor >= 1e-6 and torque_propeller >= 1e-6
+        for torque_motor, torque_propeller in zip(
+            df_pt["motor_1 torque_out [N*m]"], df_pt["propeller_1 torque_in [N*m]"]
+        )
+    ]
+    assert list(_extract_edge_working_state(flow_states, "dc_bus_1", "harness_1")) == list(
+        flow_states["harness_1"]
+    )
+    assert _extract_edge_working_state(flow_states, "dc_bus_1", "dc_bus_2") is None
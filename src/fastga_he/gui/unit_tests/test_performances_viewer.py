@@ -5,8 +5,13 @@
 import os.path as pth
 from shutil import rmtree
 
+import pandas as pd
 import pytest
 
+from fastga_he.models.performances.mission_vector.columnar_results import (
+    write_columnar_results,
+)
+
 from ..performances_viewer import PerformancesViewer
 
 DATA_FOLDER_PATH = pth.join(pth.dirname(__file__), "data")
@@ -29,3 +34,30 @@ def test_performances_viewer(cleanup):
     PerformancesViewer(
         power_train_data_file_path=pt_data_filename, mission_data_file_path=mission_data_filename
     )
+
+
+def test_performances_viewer_columnar(cleanup):
+    """
+    Tests that the performances viewer displays the same data from columnar files as from csv.
+    """
+
+    mission_data_filename = pth.join(DATA_FOLDER_PATH, "mission_data.csv")
+    pt_data_filename = pth.join(DATA_FOLDER_PATH, "power_train_data.csv")
+
+    mission_data_columnar_filename = pth.join(RESULTS_FOLDER_PATH, "mission_data.npz")
+    pt_data_columnar_filename = pth.join(RESULTS_FOLDER_PATH, "power_train_data.npz")
+
+    write_columnar_results(
+        mission_data_columnar_filename, pd.read_csv(mission_data_filename, index_col=0)
+    )
+    write_columnar_results(pt_data_columnar_filename, pd.read_csv(pt_data_filename, index_col=0))
+
+    viewer_csv = PerformancesViewer(
+        power_train_data_file_path=pt_data_filename, mission_data_file_path=mission_data_filename
+    )
+    viewer_columnar = PerformancesViewer(
+        power_train_data_file_path=pt_data_columnar_filename,
+        mission_data_file_path=mission_data_columnar_filename,
+    )
+
+    pd.testing.assert_frame_equal(viewer_csv.data, viewer_columnar.data)
@@ -3,10 +3,13 @@
 # Copyright (C) 2022 ISAE-SUPAERO
 
 import os
+from unittest.mock import patch
 
+import numpy as np
+import openmdao.api as om
 import pytest
 
-from ..residuals_viewer import residuals_viewer
+from ..residuals_viewer import residuals_viewer, _get_residuals_statistics
 
 DATA_FOLDER_PATH = os.path.join(os.path.dirname(__file__), "data")
 
@@ -28,3 +31,108 @@ def test_residuals_viewer():
     )
 
     fig.show()
+
+
+class _QuadraticComponent(om.ImplicitComponent):
+    """Simple vector implicit component whose Newton iterations are recorded."""
+
+    def setup(self):
+        self.add_input("a", val=np.array([1.0, 2.0, 3.0]))
+        self.add_output("x", val=np.array([5.0, 5.0, 5.0]))
+
+        self.declare_partials(of="x", wrt="*", rows=np.arange(3), cols=np.arange(3))
+
+    def apply_nonlinear(self, inputs, outputs, residuals):
+        residuals["x"] = outputs["x"] ** 2.0 - inputs["a"]
+
+    def linearize(self, inputs, outputs, partials):
+        partials["x", "x"] = 2.0 * outputs["x"]
+        partials["x", "a"] = -np.ones(3)
+
+
+def test_residuals_statistics(tmp_path):
+    recorder_data_file_path = str(tmp_path / "cases.sql")
+
+    problem = om.Problem(reports=False)
+    group = problem.model.add_subsystem("performances", om.Group())
+    group.add_subsystem("quadratic_1", _QuadraticComponent(), promotes=["*"])
+    group.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=10)
+    group.linear_solver = om.DirectSolver()
+    group.nonlinear_solver.add_recorder(om.SqliteRecorder(recorder_data_file_path))
+    group.nonlinear_solver.recording_options["record_solver_residuals"] = True
+    problem.setup()
+    problem.run_model()
+    problem.cleanup()
+
+    case = "root.performances.nonlinear_solver"
+    variables_name = ["quadratic_1.x"]
+
+    residuals_mean, residuals_min, residuals_max = _get_residuals_statistics(
+        recorder_data_file_path, case, variables_name, use_cache=False
+    )
+
+    # Nothing is written when the cache is not used
+    assert [path.name for path in tmp_path.iterdir()] == ["cases.sql"]
+
+    # Reference computed from the cases loaded by the case reader
+    residuals = np.array(
+        [
+            solver_case.residuals["performances.quadratic_1.x"]
+            for solver_case in om.CaseReader(recorder_data_file_path).get_cases(case)
+        ]
+    )
+
+    assert residuals_mean["quadratic_1.x"] == pytest.approx(np.mean(residuals, axis=1))
+    assert residuals_min["quadratic_1.x"] == pytest.approx(np.min(residuals, axis=1))
+    assert residuals_max["quadratic_1.x"] == pytest.approx(np.max(residuals, axis=1))
+
+    # The statistics are cached in the given folder and read from there on the next call
+    cache_folder_path = tmp_path / "cache"
+    _get_residuals_statistics(
+        recorder_data_file_path, case, variables_name, cache_folder_path=str(cache_folder_path)
+    )
+    assert len(list(cache_folder_path.glob("cases_residuals_*.npz"))) == 1
+    with patch("fastga_he.gui.residuals_viewer._read_solver_values", side_effect=AssertionError):
+        residuals_mean_cached, _, _ = _get_residuals_statistics(
+            recorder_data_file_path, case, variables_name, cache_folder_path=str(cache_folder_path)
+        )
+
+    assert residuals_mean_cached["quadratic_1.x"] == pytest.approx(residuals_mean["quadratic_1.x"])
+
+
+def test_residuals_statistics_default_cache(monkeypatch, tmp_path):
+    recorder_data_file_path = str(tmp_path / "cases.sql")
+
+    problem = om.Problem(reports=False)
+    group = problem.model.add_subsystem("performances", om.Group())
+    group.add_subsystem("quadratic_1", _QuadraticComponent(), promotes=["*"])
+    group.nonlinear_solver = om.NewtonSolver(solve_subsystems=False, maxiter=10)
+    group.linear_solver = om.DirectSolver()
+    group.nonlinear_solver.add_recorder(om.SqliteRecorder(recorder_data_file_path))
+    problem.setup()
+    problem.run_model()
+    problem.cleanup()
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "user_cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "user_cache"))
+
+    outputs_mean, _, _ = _get_residuals_statistics(
+        recorder_data_file_path,
+        "root.performances.nonlinear_solver",
+        ["quadratic_1.x"],
+        what_to_plot="outputs",
+    )
+
+    # The statistics are cached in the user cache by default
+    cache_folder_path = tmp_path / "user_cache" / "fastga_he" / "residuals_viewer"
+    assert len(list(cache_folder_path.glob("cases_residuals_*.npz"))) == 1
+
+    outputs = np.array(
+        [
+            solver_case.get_val("performances.quadratic_1.x")
+            for solver_case in om.CaseReader(recorder_data_file_path).get_cases(
+                "root.performances.nonlinear_solver"
+            )
+        ]
+    )
+    assert outputs_mean["quadratic_1.x"] == pytest.approx(np.mean(outputs, axis=1))
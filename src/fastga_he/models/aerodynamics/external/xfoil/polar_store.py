@@ -0,0 +1,259 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+"""Binary storage and lookup of the XFOIL polars saved in the resources csv files."""
+
+import functools
+import hashlib
+import logging
+import os
+import os.path as pth
+import tempfile
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+from fastga_he.user_cache import get_user_cache_folder_path
+
+_LOGGER = logging.getLogger(__name__)
+
+# Labels of the scalar values and of the values relative to the angle of attack, as written in
+# the rows of the csv files
+SCALAR_LABELS = ["mach", "reynolds", "cl_max_2d", "cl_min_2d"]
+POLAR_LABELS = ["alpha", "cl", "cd", "cdp", "cm"]
+
+# Maximum tolerated difference between the requested Mach number and the stored one
+MACH_TOLERANCE = 0.03
+# Number of parsed csv files kept in memory, there is one file per airfoil and per
+# symmetric/inviscid flags
+STORE_CACHE_SIZE = 64
+# Increment this if the content of the binary files changes
+STORE_FORMAT_VERSION = 1
+# Environment variable that overrides the folder the binary files are written to. By default,
+# they are written to the user cache folder rather than next to the csv files since the
+# resources of an installed package may be read-only
+STORE_FOLDER_ENV_VARIABLE = "FASTGA_HE_POLAR_STORE_DIR"
+
+
+class PolarStore(NamedTuple):
+    """
+    Polars of one csv file stored as typed arrays. The polars don't have the same number of
+    angles of attack so they are concatenated, the values of polar i being between offsets[i]
+    and offsets[i + 1].
+    """
+
+    mach: np.ndarray
+    reynolds: np.ndarray
+    cl_max_2d: np.ndarray
+    cl_min_2d: np.ndarray
+    offsets: np.ndarray
+    alpha: np.ndarray
+    cl: np.ndarray
+    cd: np.ndarray
+    cdp: np.ndarray
+    cm: np.ndarray
+
+    def get_polar(self, index: int) -> dict:
+        """Returns the values relative to the angle of attack of the polar at the index."""
+
+        start, end = self.offsets[index], self.offsets[index + 1]
+
+        return {label: getattr(self, label)[start:end] for label in POLAR_LABELS}
+
+
+def get_stored_polar(
+    result_file: str, mach: float, reynolds: float, store_folder_path: Optional[str] = None
+) -> Optional[dict]:
+    """
+    Returns the polar of the csv file at the Mach number and Reynolds number, as a dictionary
+    keyed by the csv labels, or None if the file doesn't exist or if the Reynolds number is not
+    bounded by the stored ones. The closest stored Mach number is used if it is within
+    MACH_TOLERANCE and the values are linearly interpolated between the closest lower and upper
+    Reynolds numbers.
+
+    :param result_file: path to the csv file of the airfoil.
+    :param mach: Mach number.
+    :param reynolds: Reynolds number.
+    :param store_folder_path: folder of the binary files, see load_polar_store.
+    """
+
+    polar_store = load_polar_store(result_file, store_folder_path)
+    if polar_store is None or len(polar_store.mach) == 0:
+        return None
+
+    distance_to_mach = np.abs(polar_store.mach - mach)
+    # First stored occurrence of the closest Mach number
+    index_closest = int(np.argmin(distance_to_mach))
+    if distance_to_mach[index_closest] >= MACH_TOLERANCE:
+        return None
+    index_mach = np.flatnonzero(polar_store.mach == polar_store.mach[index_closest])
+    reynolds_vect = polar_store.reynolds[index_mach]
+
+    index_reynolds = index_mach[reynolds_vect == reynolds]
+    if len(index_reynolds) == 1:
+        stored_polar = polar_store.get_polar(index_reynolds[0])
+        stored_polar["cl_max_2d"] = polar_store.cl_max_2d[index_reynolds[0]]
+        stored_polar["cl_min_2d"] = polar_store.cl_min_2d[index_reynolds[0]]
+
+        return stored_polar
+
+    is_lower = reynolds_vect < reynolds
+    is_upper = reynolds_vect > reynolds
+    if not (np.any(is_lower) and np.any(is_upper)):
+        return None
+
+    lower_reynolds = np.max(reynolds_vect[is_lower])
+    upper_reynolds = np.min(reynolds_vect[is_upper])
+    index_lower = index_mach[np.argmax(reynolds_vect == lower_reynolds)]
+    index_upper = index_mach[np.argmax(reynolds_vect == upper_reynolds)]
+    x_ratio = (upper_reynolds - reynolds) / (upper_reynolds - lower_reynolds)
+
+    lower_polar = polar_store.get_polar(index_lower)
+    upper_polar = polar_store.get_polar(index_upper)
+
+    # The polars are interpolated on the angles of attack computed at both Reynolds numbers
+    alpha_shared = np.intersect1d(lower_polar["alpha"], upper_polar["alpha"])
+    interpolated_polar = {"alpha": alpha_shared}
+    for label in POLAR_LABELS[1:]:
+        lower_value = np.interp(alpha_shared, lower_polar["alpha"], lower_polar[label])
+        upper_value = np.interp(alpha_shared, upper_polar["alpha"], upper_polar[label])
+        interpolated_polar[label] = lower_value * x_ratio + upper_value * (1.0 - x_ratio)
+    for label in ["cl_max_2d", "cl_min_2d"]:
+        lower_value = getattr(polar_store, label)[index_lower]
+        upper_value = getattr(polar_store, label)[index_upper]
+        interpolated_polar[label] = lower_value * x_ratio + upper_value * (1.0 - x_ratio)
+
+    return interpolated_polar
+
+
+def load_polar_store(
+    result_file: str, store_folder_path: Optional[str] = None
+) -> Optional[PolarStore]:
+    """
+    Returns the polars of the csv file, or None if it doesn't exist. The parsed files are kept in
+    memory as long as they are not modified, e.g. when XFOIL results are added to them.
+
+    :param result_file: path to the csv file of the airfoil.
+    :param store_folder_path: folder of the binary files that spare the parsing of the csv files
+    to the next processes. By default, the folder given by the FASTGA_HE_POLAR_STORE_DIR
+    environment variable or a folder of the user cache.
+    """
+
+    try:
+        result_file_stat = os.stat(result_file)
+    except OSError:
+        return None
+
+    if store_folder_path is None:
+        store_folder_path = get_default_store_folder_path()
+
+    return _load_polar_store(
+        pth.abspath(result_file),
+        result_file_stat.st_size,
+        result_file_stat.st_mtime_ns,
+        pth.abspath(store_folder_path),
+    )
+
+
+def get_default_store_folder_path() -> str:
+    """
+    Returns the folder given by the FASTGA_HE_POLAR_STORE_DIR environment variable or, if it is
+    not set, the fastga_he/xfoil_polars folder of the user cache.
+    """
+
+    store_folder_path = os.environ.get(STORE_FOLDER_ENV_VARIABLE)
+    if store_folder_path:
+        return store_folder_path
+
+    return get_user_cache_folder_path("xfoil_polars")
+
+
+@functools.lru_cache(maxsize=STORE_CACHE_SIZE)
+def _load_polar_store(
+    result_file: str, file_size: int, file_mtime_ns: int, store_folder_path: str
+) -> PolarStore:
+    """
+    Returns the polars of the csv file, read from its binary file if it was created from this
+    version of the csv file, or parsed from the csv file otherwise, in which case the binary file
+    is written for the next processes. If the binary file can't be written, e.g. if the folder is
+    read-only, the parsed polars are still returned. The size and modification time of the csv
+    file are only given so that a modified file is not read from the cache.
+    """
+
+    binary_file = _get_binary_file_path(result_file, store_folder_path)
+    source_key = np.array([STORE_FORMAT_VERSION, file_size, file_mtime_ns], dtype=np.int64)
+
+    if pth.exists(binary_file):
+        try:
+            with np.load(binary_file, allow_pickle=False) as binary_data:
+                if np.array_equal(binary_data["source_key"], source_key):
+                    return PolarStore(*(binary_data[field] for field in PolarStore._fields))
+        except Exception as error:
+            _LOGGER.debug("Could not read the polar store %s: %s", binary_file, error)
+
+    polar_store = _parse_csv(result_file)
+
+    try:
+        os.makedirs(store_folder_path, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=store_folder_path, suffix=".tmp", delete=False
+        ) as store_file:
+            np.savez(store_file, source_key=source_key, **polar_store._asdict())
+        os.replace(store_file.name, binary_file)
+    except OSError as error:
+        _LOGGER.debug("Could not write the polar store %s: %s", binary_file, error)
+
+    return polar_store
+
+
+def _get_binary_file_path(result_file: str, store_folder_path: str) -> str:
+    """
+    Returns the path of the binary file of the csv file. The name of the csv file is prefixed
+    with a hash of its path since files with the same name can be stored in different folders.
+    """
+
+    path_hash = hashlib.sha256(result_file.encode("utf-8")).hexdigest()[:16]
+    file_name = pth.splitext(pth.basename(result_file))[0]
+
+    return pth.join(store_folder_path, path_hash + "_" + file_name + ".npz")
+
+
+def _parse_csv(result_file: str) -> PolarStore:
+    """
+    Parses the csv file written by XfoilPolarMod, which contains one column per polar and one
+    row per label, the values relative to the angle of attack being written as lists.
+    """
+
+    data_saved = pd.read_csv(result_file, index_col=0, dtype=str)
+
+    scalar_values = [
+        np.array([_parse_list(value)[0] for value in data_saved.loc[label, :]])
+        for label in SCALAR_LABELS
+    ]
+
+    polar_values = {label: [] for label in POLAR_LABELS}
+    offsets = [0]
+    for column in data_saved.columns:
+        polar = [_parse_list(data_saved.loc[label, column]) for label in POLAR_LABELS]
+        # So that all the values of the polar share the same offsets
+        polar_length = min(len(value) for value in polar)
+        for label, value in zip(POLAR_LABELS, polar):
+            polar_values[label].append(value[:polar_length])
+        offsets.append(offsets[-1] + polar_length)
+
+    return PolarStore(
+        *scalar_values,
+        np.array(offsets, dtype=np.int64),
+        *(
+            np.concatenate(polar_values[label]) if polar_values[label] else np.zeros(0)
+            for label in POLAR_LABELS
+        ),
+    )
+
+
+def _parse_list(text: str) -> np.ndarray:
+    """Returns the values of a number or of a list of numbers written as a string."""
+
+    return np.fromstring(text.strip().strip("[]"), sep=",")
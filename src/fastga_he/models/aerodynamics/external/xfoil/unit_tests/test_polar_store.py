@@ -0,0 +1,120 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import glob
+import os
+import os.path as pth
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..polar_store import (
+    POLAR_LABELS,
+    STORE_FOLDER_ENV_VARIABLE,
+    PolarStore,
+    _load_polar_store,
+    get_default_store_folder_path,
+    get_stored_polar,
+    load_polar_store,
+)
+
+RESOURCES_FOLDER_PATH = pth.join(pth.dirname(pth.dirname(__file__)), "resources")
+
+CSV_FILE = pth.join(RESOURCES_FOLDER_PATH, "naca4412_30S.csv")
+
+
+def assert_stores_equal(store: PolarStore, other_store: PolarStore):
+    for field in PolarStore._fields:
+        assert np.array_equal(getattr(store, field), getattr(other_store, field)), field
+
+
+def test_csv_round_trip(tmp_path):
+    _load_polar_store.cache_clear()
+
+    store_folder_path = pth.join(tmp_path, "store")
+    polar_store = load_polar_store(CSV_FILE, store_folder_path)
+
+    # The typed arrays hold the values of the csv file
+    data_saved = pd.read_csv(CSV_FILE, index_col=0)
+    assert len(polar_store.offsets) == len(data_saved.columns) + 1
+    assert polar_store.mach == pytest.approx(data_saved.loc["mach", :].astype(float).to_numpy())
+    assert polar_store.reynolds == pytest.approx(
+        data_saved.loc["reynolds", :].astype(float).to_numpy()
+    )
+    for index, column in enumerate(data_saved.columns):
+        polar = polar_store.get_polar(index)
+        for label in POLAR_LABELS:
+            expected_value = np.array(
+                data_saved.loc[label, column].strip("[]").split(","), dtype=float
+            )
+            assert polar[label] == pytest.approx(expected_value[: len(polar[label])])
+        assert len(polar["alpha"]) == polar_store.offsets[index + 1] - polar_store.offsets[index]
+
+    # The binary file is written in the store folder, not next to the csv file, and gives the
+    # same arrays once the in-memory cache is cleared
+    assert len(glob.glob(pth.join(store_folder_path, "*naca4412_30S.npz"))) == 1
+    assert not glob.glob(pth.join(RESOURCES_FOLDER_PATH, "*.npz"))
+
+    _load_polar_store.cache_clear()
+    assert_stores_equal(load_polar_store(CSV_FILE, store_folder_path), polar_store)
+
+    # Stored points are returned as is
+    mach, reynolds = polar_store.mach[0], polar_store.reynolds[0]
+    stored_polar = get_stored_polar(CSV_FILE, mach, reynolds, store_folder_path)
+    assert stored_polar["cl"] == pytest.approx(polar_store.get_polar(0)["cl"])
+    assert stored_polar["cl_max_2d"] == pytest.approx(polar_store.cl_max_2d[0])
+
+    assert load_polar_store(pth.join(tmp_path, "missing.csv"), store_folder_path) is None
+
+
+def test_in_memory_cache(tmp_path):
+    _load_polar_store.cache_clear()
+
+    csv_file = pth.join(tmp_path, "naca4412_30S.csv")
+    shutil.copy(CSV_FILE, csv_file)
+    store_folder_path = pth.join(tmp_path, "store")
+
+    polar_store = load_polar_store(csv_file, store_folder_path)
+    assert load_polar_store(csv_file, store_folder_path) is polar_store
+    assert _load_polar_store.cache_info().hits == 1
+
+    # A modified csv file is parsed again, as is its binary file
+    data_saved = pd.read_csv(csv_file, index_col=0)
+    data_saved.iloc[:, :1].to_csv(csv_file)
+
+    modified_polar_store = load_polar_store(csv_file, store_folder_path)
+    assert modified_polar_store is not polar_store
+    assert len(modified_polar_store.mach) == 1
+    assert modified_polar_store.mach[0] == pytest.approx(polar_store.mach[0])
+
+    _load_polar_store.cache_clear()
+    assert_stores_equal(load_polar_store(csv_file, store_folder_path), modified_polar_store)
+
+
+def test_store_folder_not_writable(tmp_path):
+    _load_polar_store.cache_clear()
+
+    # The store folder can't be created since a file has its name, the polars are still parsed
+    store_folder_path = pth.join(tmp_path, "store")
+    with open(store_folder_path, "w") as file:
+        file.write("")
+
+    polar_store = load_polar_store(CSV_FILE, store_folder_path)
+
+    _load_polar_store.cache_clear()
+    assert_stores_equal(load_polar_store(CSV_FILE, pth.join(tmp_path, "other_store")), polar_store)
+
+
+def test_default_store_folder(monkeypatch, tmp_path):
+    monkeypatch.setenv(STORE_FOLDER_ENV_VARIABLE, str(tmp_path))
+    assert get_default_store_folder_path() == str(tmp_path)
+
+    monkeypatch.delenv(STORE_FOLDER_ENV_VARIABLE)
+    default_store_folder_path = get_default_store_folder_path()
+    assert pth.commonpath([default_store_folder_path, RESOURCES_FOLDER_PATH]) != (
+        RESOURCES_FOLDER_PATH
+    )
+    assert default_store_folder_path.endswith(os.path.join("fastga_he", "xfoil_polars"))
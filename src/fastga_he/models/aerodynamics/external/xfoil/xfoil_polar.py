@@ -35,6 +35,7 @@ from fastga.models.aerodynamics.external.xfoil import xfoil699
 from fastga.models.geometry.profiles.get_profile import get_profile
 from fastga.models.aerodynamics.constants import POLAR_POINT_COUNT
 from . import resources as local_resources
+from .polar_store import get_stored_polar
 
 OPTION_RESULT_POLAR_FILENAME = "result_polar_filename"
 OPTION_RESULT_FOLDER_PATH = "result_folder_path"
@@ -106,10 +107,6 @@ class XfoilPolarMod(ExternalCodeComp):
 
         # Search if data already stored for this profile and mach with reynolds values bounding
         # current value. If so, use linear interpolation with the nearest upper/lower reynolds
-        no_file = True
-        data_saved = None
-        interpolated_result = None
-
         if self.options[OPTION_COMP_NEG_AIR_SYM]:
             if not self.options["inviscid"]:
                 result_file = pth.join(
@@ -136,93 +133,9 @@ class XfoilPolarMod(ExternalCodeComp):
                 self.options["airfoil_file"].replace(".af", "") + ".csv",
             )
 
-        if pth.exists(result_file):
-            no_file = False
-            data_saved = pd.read_csv(result_file)
-            values = data_saved.to_numpy()[:, 1 : len(data_saved.to_numpy()[0])]
-            labels = data_saved.to_numpy()[:, 0].tolist()
-            data_saved = pd.DataFrame(values, index=labels)
-            saved_mach_list = data_saved.loc["mach", :].to_numpy().astype(float)
-            index_near_mach = np.where(abs(saved_mach_list - mach) < 0.03)[0]
-            near_mach = []
-            distance_to_mach = []
-            for index in index_near_mach:
-                if saved_mach_list[index] not in near_mach:
-                    near_mach.append(saved_mach_list[index])
-                    distance_to_mach.append(abs(saved_mach_list[index] - mach))
-            if not near_mach:
-                index_mach = np.where(data_saved.loc["mach", :].to_numpy() == str(mach))[0]
-            else:
-                selected_mach_index = distance_to_mach.index(min(distance_to_mach))
-                index_mach = np.where(saved_mach_list == near_mach[selected_mach_index])[0]
-            data_reduced = data_saved.loc[labels, index_mach]
-            # Search if this exact reynolds has been computed and save results
-            reynolds_vect = np.array(
-                [float(x) for x in list(data_reduced.loc["reynolds", :].to_numpy())]
-            )
-            index_reynolds = index_mach[np.where(reynolds_vect == reynolds)[0]]
-            if len(index_reynolds) == 1:
-                interpolated_result = data_reduced.loc[labels, index_reynolds]
-            # Else search for lower/upper Reynolds
-            else:
-                lower_reynolds = reynolds_vect[np.where(reynolds_vect < reynolds)[0]]
-                upper_reynolds = reynolds_vect[np.where(reynolds_vect > reynolds)[0]]
-                if not (len(lower_reynolds) == 0 or len(upper_reynolds) == 0):
-                    index_lower_reynolds = index_mach[
-                        np.where(reynolds_vect == max(lower_reynolds))[0]
-                    ]
-                    index_upper_reynolds = index_mach[
-                        np.where(reynolds_vect == min(upper_reynolds))[0]
-                    ]
-                    lower_values = data_reduced.loc[labels, index_lower_reynolds]
-                    upper_values = data_reduced.loc[labels, index_upper_reynolds]
-                    # Initialise values with lower reynolds
-                    interpolated_result = lower_values
-                    # Calculate reynolds ratio split for linear interpolation
-                    x_ratio = (min(upper_reynolds) - reynolds) / (
-                        min(upper_reynolds) - max(lower_reynolds)
-                    )
-                    # Search for common alpha range for linear interpolation
-                    alpha_lower = (
-                        np.array(
-                            np.matrix(lower_values.loc["alpha", index_lower_reynolds].to_numpy()[0])
-                        )
-                        .ravel()
-                        .tolist()
-                    )
-                    alpha_upper = (
-                        np.array(
-                            np.matrix(upper_values.loc["alpha", index_upper_reynolds].to_numpy()[0])
-                        )
-                        .ravel()
-                        .tolist()
-                    )
-                    alpha_shared = np.array(list(set(alpha_upper).intersection(alpha_lower)))
-                    interpolated_result.loc["alpha", index_lower_reynolds] = str(
-                        alpha_shared.tolist()
-                    )
-                    labels.remove("alpha")
-                    # Calculate average values (cd, cl...) with linear interpolation
-                    for label in labels:
-                        lower_value = np.array(
-                            np.matrix(lower_values.loc[label, index_lower_reynolds].to_numpy()[0])
-                        ).ravel()
-                        upper_value = np.array(
-                            np.matrix(upper_values.loc[label, index_upper_reynolds].to_numpy()[0])
-                        ).ravel()
-                        # If values relative to alpha vector, performs interpolation with shared
-                        # vector
-                        if np.size(lower_value) == len(alpha_lower):
-                            lower_value = np.interp(
-                                alpha_shared, np.array(alpha_lower), lower_value
-                            )
-                            upper_value = np.interp(
-                                alpha_shared, np.array(alpha_upper), upper_value
-                            )
-                        value = (lower_value * x_ratio + upper_value * (1 - x_ratio)).tolist()
-                        interpolated_result.loc[label, index_lower_reynolds] = str(value)
-
-        if interpolated_result is None:
+        stored_polar = get_stored_polar(result_file, mach, reynolds)
+
+        if stored_polar is None:
             # Create result folder first (if it must fail, let it fail as soon as possible)
             result_folder_path = self.options[OPTION_RESULT_FOLDER_PATH]
             if result_folder_path != "":
@@ -392,9 +305,10 @@ class XfoilPolarMod(ExternalCodeComp):
                     "cdp",
                     "cm",
                 ]
-                if no_file or (data_saved is None):
+                if not pth.exists(result_file):
                     data = pd.DataFrame(results, index=labels)
                 else:
+                    data_saved = pd.read_csv(result_file, index_col=0)
                     data = pd.DataFrame(np.c_[data_saved, results], index=labels)
                 # noinspection PyBroadException
                 try:
@@ -444,17 +358,13 @@ class XfoilPolarMod(ExternalCodeComp):
 
         else:
             # Extract results
-            cl_max_2d = np.array(
-                np.matrix(interpolated_result.loc["cl_max_2d", :].to_numpy()[0])
-            ).ravel()
-            cl_min_2d = np.array(
-                np.matrix(interpolated_result.loc["cl_min_2d", :].to_numpy()[0])
-            ).ravel()
-            ALPHA = np.array(np.matrix(interpolated_result.loc["alpha", :].to_numpy()[0])).ravel()
-            CL = np.array(np.matrix(interpolated_result.loc["cl", :].to_numpy()[0])).ravel()
-            CD = np.array(np.matrix(interpolated_result.loc["cd", :].to_numpy()[0])).ravel()
-            CDP = np.array(np.matrix(interpolated_result.loc["cdp", :].to_numpy()[0])).ravel()
-            CM = np.array(np.matrix(interpolated_result.loc["cm", :].to_numpy()[0])).ravel()
+            cl_max_2d = stored_polar["cl_max_2d"]
+            cl_min_2d = stored_polar["cl_min_2d"]
+            ALPHA = stored_polar["alpha"]
+            CL = stored_polar["cl"]
+            CD = stored_polar["cd"]
+            CDP = stored_polar["cdp"]
+            CM = stored_polar["cm"]
 
             cd_min_2d = np.min(CD)
 
@@ -466,27 +376,12 @@ class XfoilPolarMod(ExternalCodeComp):
                 cdp = np.interp(alpha, ALPHA, CDP)
                 cm = np.interp(alpha, ALPHA, CM)
             else:
-                additional_zeros = list(np.zeros(POLAR_POINT_COUNT - len(ALPHA)))
-                alpha = ALPHA.tolist()
-                alpha.extend(additional_zeros)
-                # noinspection PyTypeChecker
-                alpha = np.asarray(alpha)
-                cl = CL.tolist()
-                cl.extend(additional_zeros)
-                # noinspection PyTypeChecker
-                cl = np.asarray(cl)
-                cd = CD.tolist()
-                cd.extend(additional_zeros)
-                # noinspection PyTypeChecker
-                cd = np.asarray(cd)
-                cdp = CDP.tolist()
-                cdp.extend(additional_zeros)
-                # noinspection PyTypeChecker
-                cdp = np.asarray(cdp)
-                cm = CM.tolist()
-                cm.extend(additional_zeros)
-                # noinspection PyTypeChecker
-                cm = np.asarray(cm)
+                additional_zeros = np.zeros(POLAR_POINT_COUNT - len(ALPHA))
+                alpha = np.concatenate((ALPHA, additional_zeros))
+                cl = np.concatenate((CL, additional_zeros))
+                cd = np.concatenate((CD, additional_zeros))
+                cdp = np.concatenate((CDP, additional_zeros))
+                cm = np.concatenate((CM, additional_zeros))
 
         # Defining outputs -------------------------------------------------------------------------
         outputs["xfoil:alpha"] = alpha
@@ -175,6 +175,22 @@ class LCA(om.Group):
             "the same folder as the powertrain file and will have the same name except for a "
             "_lca suffix",
         )
+        self.options.declare(
+            name="use_disk_cache",
+            default=False,
+            types=bool,
+            desc="If true, the compiled LCA functions are saved on disk and reused by the next "
+            "processes that use an LCA configuration file with the same content, the same "
+            "brightway databases and the same impact assessment methods, instead of being "
+            "compiled again",
+        )
+        self.options.declare(
+            name="disk_cache_folder_path",
+            default="",
+            types=(str, pathlib.Path),
+            desc="Folder in which to save the compiled LCA functions. If nothing is put for this "
+            "option, they will be saved in a lca_cache folder next to the LCA configuration file",
+        )
 
     def setup(self):
         self.configurator.load(self.options["power_train_file_path"])
@@ -379,6 +395,8 @@ class LCA(om.Group):
                 electric_mix=self.options["electric_mix"],
                 write_lca_conf=self.options["write_lca_conf"],
                 lca_conf_file_path=self.options["lca_conf_file_path"],
+                use_disk_cache=self.options["use_disk_cache"],
+                disk_cache_folder_path=self.options["disk_cache_folder_path"],
             ),
             promotes=["*"],
         )
@@ -2,10 +2,14 @@
 # Electric Aircraft.
 # Copyright (C) 2022 ISAE-SUPAERO
 
+import hashlib
+import json
+import logging
+import os
 import pathlib
 import re
 import shutil
-import logging
+from importlib.metadata import version, PackageNotFoundError
 
 # To properly handle the case where the optional dependencies are not installed
 try:
@@ -18,10 +22,12 @@ try:
 except ImportError:
     LCA_AVAILABLE = False
 
+import mpmath
 import numpy as np
 import openmdao.api as om
 import pandas as pd
 import sympy as sym
+import sympy.functions.elementary.piecewise as piecewise
 import yaml
 
 from fastga_he.powertrain_builder.powertrain import FASTGAHEPowerTrainConfigurator
@@ -38,6 +44,10 @@ NAME_TO_UNIT = {
     "material": None,
 }
 
+# Version of the format of the LCA functions cached on disk. It enters the name of the cached
+# files so it must be incremented each time the format changes for the older files to be ignored.
+DISK_CACHE_FORMAT_VERSION = 2
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -62,6 +72,13 @@ class LCACore(om.ExplicitComponent):
         self.partial_lambdas_dict_dict = None
         self.parameters = None
 
+        # Compiled functions and parameters they require used to evaluate several scenarios at
+        # once, and where to put the impacts they give in the outputs, computed once in setup
+        self.batch_functions_dict = None
+        self.required_parameters_dict = None
+        self.output_indices_dict = None
+        self.sum_output_indices = None
+
         self.configurator = FASTGAHEPowerTrainConfigurator()
 
         # Seems required to do it here
@@ -146,6 +163,22 @@ class LCACore(om.ExplicitComponent):
             "the same folder as the powertrain file and will have the same name except for a "
             "_lca suffix",
         )
+        self.options.declare(
+            name="use_disk_cache",
+            default=False,
+            types=bool,
+            desc="If true, the compiled LCA functions are saved on disk and reused by the next "
+            "processes that use an LCA configuration file with the same content, the same "
+            "brightway databases and the same impact assessment methods, instead of being "
+            "compiled again",
+        )
+        self.options.declare(
+            name="disk_cache_folder_path",
+            default="",
+            types=(str, pathlib.Path),
+            desc="Folder in which to save the compiled LCA functions. If nothing is put for this "
+            "option, they will be saved in a lca_cache folder next to the LCA configuration file",
+        )
 
     @staticmethod
     def _check_existing_instance(lca_conf_file_path: pathlib.Path):
@@ -209,6 +242,221 @@ class LCACore(om.ExplicitComponent):
         }
         LCACore._cache[key] = cache_instance
 
+    @staticmethod
+    def _get_lca_data_fingerprint(model, methods) -> dict:
+        """
+        Gives a description of the brightway data the LCA functions are compiled from, other
+        than the LCA configuration file: the current project, the metadata of its databases,
+        which change when they are written again, and the metadata of the impact assessment
+        methods. The database of the model is left out as it is written again from the LCA
+        configuration file each time the model is generated.
+
+        :param model: activity of the LCA model
+        :param methods: impact assessment methods used
+        """
+
+        return {
+            "project": bw.projects.current,
+            "databases": {
+                database_name: bw.databases[database_name]
+                for database_name in sorted(bw.databases)
+                if database_name != model.key[0]
+            },
+            "methods": [
+                [list(method), bw.methods[method] if method in bw.methods else {}]
+                for method in methods
+            ],
+        }
+
+    @staticmethod
+    def _get_disk_cache_file_path(
+        lca_conf_file_path: pathlib.Path,
+        axis: list,
+        lca_data_fingerprint: dict,
+        disk_cache_folder_path="",
+    ) -> pathlib.Path:
+        """
+        Gives the path of the file in which the LCA functions compiled for this LCA configuration
+        file are saved. The name of the file contains a hash of the content of the
+        configuration file rather than relying on its time of last modification so that it can
+        be shared between processes and so that any change in the content gives a new file. The
+        hash also covers the brightway data the functions are compiled from so that functions
+        compiled with other databases or methods are not reused.
+
+        :param lca_conf_file_path: path to the LCA configuration file
+        :param axis: axis along which the results are ventilated
+        :param lca_data_fingerprint: description of the brightway databases and methods used, as
+        given by _get_lca_data_fingerprint
+        :param disk_cache_folder_path: folder in which the files are saved, by default a lca_cache
+        folder next to the configuration file
+        """
+
+        lca_conf_file_path = pathlib.Path(lca_conf_file_path)
+
+        try:
+            lca_algebraic_version = version("lca_algebraic")
+        except PackageNotFoundError:
+            lca_algebraic_version = ""
+
+        content_hash = hashlib.sha256(lca_conf_file_path.read_bytes())
+        # The functions also depend on the axis, on the brightway data and on the library which
+        # compiled them
+        content_hash.update(
+            json.dumps(
+                {
+                    "axis": list(axis),
+                    "format_version": DISK_CACHE_FORMAT_VERSION,
+                    "lca_algebraic_version": lca_algebraic_version,
+                    "lca_data": lca_data_fingerprint,
+                },
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+
+        if not disk_cache_folder_path:
+            disk_cache_folder_path = lca_conf_file_path.parent / "lca_cache"
+
+        return pathlib.Path(disk_cache_folder_path) / (
+            lca_conf_file_path.stem + "_" + content_hash.hexdigest() + ".json"
+        )
+
+    @staticmethod
+    def _load_disk_cache_instance(disk_cache_file_path: pathlib.Path, axis: list):
+        """
+        Reads the LCA functions saved on disk for each axis, returns None if there are none or
+        if they can't be read, in which case they should be compiled again.
+
+        :param disk_cache_file_path: path to the file in which the functions are saved
+        :param axis: axis along which the results are ventilated
+        """
+
+        if not disk_cache_file_path.exists():
+            return None
+
+        try:
+            with open(disk_cache_file_path, "r") as cache_file:
+                cache_instance = json.load(cache_file)
+
+            lambdas_dict = {
+                axis_name: [
+                    LCACore._deserialize_lambda(serialized_lambda)
+                    for serialized_lambda in cache_instance["lambdas_dict"][axis_name]
+                ]
+                for axis_name in axis
+            }
+            partial_lambdas_dict_dict = {
+                axis_name: {
+                    param_name: [
+                        LCACore._deserialize_lambda(serialized_lambda)
+                        for serialized_lambda in serialized_lambdas
+                    ]
+                    for param_name, serialized_lambdas in cache_instance[
+                        "partial_lambdas_dict_dict"
+                    ][axis_name].items()
+                }
+                for axis_name in axis
+            }
+
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            _LOGGER.warning(
+                "LCA module: Could not read the LCA functions cached in %s (%s), they will be "
+                "compiled again.",
+                disk_cache_file_path,
+                error,
+            )
+            return None
+
+        return lambdas_dict, partial_lambdas_dict_dict
+
+    @staticmethod
+    def _add_disk_cache_instance(
+        disk_cache_file_path: pathlib.Path, lambdas_dict, partial_lambdas_dict_dict
+    ):
+        """
+        Saves the compiled LCA functions on disk so that other processes can reuse them. Failing
+        to do so is not an error, the functions will simply be compiled again next time.
+
+        :param disk_cache_file_path: path to the file in which the functions are saved
+        :param lambdas_dict: functions giving the impacts, for each axis
+        :param partial_lambdas_dict_dict: functions giving the partials of the impacts with
+        respect to each parameter, for each axis
+        """
+
+        cache_instance = {
+            "format_version": DISK_CACHE_FORMAT_VERSION,
+            "lambdas_dict": {
+                axis_name: [LCACore._serialize_lambda(lambd) for lambd in lambdas]
+                for axis_name, lambdas in lambdas_dict.items()
+            },
+            "partial_lambdas_dict_dict": {
+                axis_name: {
+                    param_name: [LCACore._serialize_lambda(lambd) for lambd in partial_lambdas]
+                    for param_name, partial_lambdas in partial_lambdas_dict.items()
+                }
+                for axis_name, partial_lambdas_dict in partial_lambdas_dict_dict.items()
+            },
+        }
+
+        # The file is written under a temporary name, specific to this process, then renamed so
+        # that processes running in parallel never read a file that is only half written
+        temp_file_path = disk_cache_file_path.with_name(
+            disk_cache_file_path.name + "." + str(os.getpid()) + ".tmp"
+        )
+
+        try:
+            disk_cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file_path, "w") as cache_file:
+                json.dump(cache_instance, cache_file)
+            os.replace(temp_file_path, disk_cache_file_path)
+
+        except (OSError, TypeError, ValueError) as error:
+            _LOGGER.warning(
+                "LCA module: Could not save the LCA functions in %s (%s).",
+                disk_cache_file_path,
+                error,
+            )
+            if temp_file_path.exists():
+                temp_file_path.unlink()
+
+    @staticmethod
+    def _serialize_lambda(lambd) -> dict:
+        """
+        Gives a JSON compatible representation of a compiled LCA function, from the expression
+        it was compiled from.
+
+        :param lambd: agb.LambdaWithParamNames
+        """
+
+        if isinstance(lambd.expr, agb.AxisDict):
+            return {
+                "axis_dict": [
+                    [axis_tag, _serialize_expression(res)] for axis_tag, res in lambd.expr.items()
+                ]
+            }
+
+        return {"expr": _serialize_expression(lambd.expr)}
+
+    @staticmethod
+    def _deserialize_lambda(serialized_lambda: dict):
+        """
+        Compiles again an LCA function from the representation given by _serialize_lambda.
+
+        :param serialized_lambda: representation of the function
+        """
+
+        if "axis_dict" in serialized_lambda:
+            return agb.lca.LambdaWithParamNames(
+                agb.AxisDict(
+                    {
+                        axis_tag: _deserialize_expression(res)
+                        for axis_tag, res in serialized_lambda["axis_dict"]
+                    }
+                )
+            )
+
+        return agb.lca.LambdaWithParamNames(_deserialize_expression(serialized_lambda["expr"]))
+
     def setup(self):
         self.configurator.load(self.options["power_train_file_path"])
         lca_conf_file_path = self.write_lca_conf_file()
@@ -225,24 +473,49 @@ class LCACore(om.ExplicitComponent):
             _LOGGER.info("Loading cached data for LCA")
 
         else:
-            _LOGGER.info(
-                "LCA module: No cache found or configuration file has been modified. "
-                "Compiling LCA model and functions."
-            )
-
+            # The model still has to be generated as it also registers the LCA parameters, but
+            # the functions, which take the longest to compile, may be found on disk
             _, self.model, self.methods = LCAProblemConfigurator(lca_conf_file_path).generate()
 
-            # noinspection PyProtectedMember
-            self.lambdas_dict = {
-                axis: agb.lca._preMultiLCAAlgebric(self.model, self.methods, axis=axis)
-                for axis in self.axis
-            }
+            disk_cache_file_path = None
+            disk_cache_instance = None
+            if self.options["use_disk_cache"]:
+                disk_cache_file_path = self._get_disk_cache_file_path(
+                    lca_conf_file_path,
+                    self.axis,
+                    self._get_lca_data_fingerprint(self.model, self.methods),
+                    self.options["disk_cache_folder_path"],
+                )
+                disk_cache_instance = self._load_disk_cache_instance(
+                    disk_cache_file_path, self.axis
+                )
 
-            # Compile expressions for partial derivatives of impacts w.r.t. parameters
-            self.partial_lambdas_dict_dict = {
-                axis: self._preMultiLCAAlgebricPartials(self.model, self.methods, axis=axis)
-                for axis in self.axis
-            }
+            if disk_cache_instance is not None:
+                self.lambdas_dict, self.partial_lambdas_dict_dict = disk_cache_instance
+                _LOGGER.info("Loading LCA functions cached in %s", disk_cache_file_path)
+
+            else:
+                _LOGGER.info(
+                    "LCA module: No cache found or configuration file has been modified. "
+                    "Compiling LCA model and functions."
+                )
+
+                # noinspection PyProtectedMember
+                self.lambdas_dict = {
+                    axis: agb.lca._preMultiLCAAlgebric(self.model, self.methods, axis=axis)
+                    for axis in self.axis
+                }
+
+                # Compile expressions for partial derivatives of impacts w.r.t. parameters
+                self.partial_lambdas_dict_dict = {
+                    axis: self._preMultiLCAAlgebricPartials(self.model, self.methods, axis=axis)
+                    for axis in self.axis
+                }
+
+                if disk_cache_file_path is not None:
+                    self._add_disk_cache_instance(
+                        disk_cache_file_path, self.lambdas_dict, self.partial_lambdas_dict_dict
+                    )
 
             self._add_cache_instance(
                 lca_conf_file_path,
@@ -259,6 +532,25 @@ class LCACore(om.ExplicitComponent):
         # configuration
         self.parameters = agb.all_params().values()
 
+        # Compile, for each axis, a single function giving the impacts of all methods along the
+        # axis so that compute, and the studies that require many scenarios, don't have to go
+        # through lca_algebraic and pandas for each evaluation.
+        self.batch_functions_dict = {
+            axis: self._get_batch_function(self.lambdas_dict[axis], self.axis_keys_dict[axis])
+            for axis in self.axis
+        }
+
+        # Parameters the functions of each axis depend on, those which are not given are
+        # completed the same way lca_algebraic does when it evaluates the functions
+        self.required_parameters_dict = {
+            axis: sorted({name for lambd in self.lambdas_dict[axis] for name in lambd.params})
+            for axis in self.axis
+        }
+
+        # Position of each output in the impacts array computed for its axis
+        self.output_indices_dict = {axis: [] for axis in self.axis}
+        self.sum_output_indices = []
+
         for parameter in self.parameters:
             if parameter.type == "float":
                 parameter_name = parameter.name.replace(
@@ -270,13 +562,13 @@ class LCACore(om.ExplicitComponent):
                     units=self.name_to_unit[parameter_name.split(":")[-1].replace("_per_fu", "")],
                 )
 
-        for m in self.methods:
+        for method_idx, m in enumerate(self.methods):
             clean_method_name = re.sub(r": |/| ", "_", m[1])
             clean_method_name = clean_method_name.replace(",_", "")
             self.clean_method_name.add(clean_method_name)
 
             # "Phase" is always inside the axis, so we can do that
-            for phase in self.axis_keys_dict["phase"]:
+            for key_idx, phase in enumerate(self.axis_keys_dict["phase"]):
                 if phase != "_other_":
                     # For each impact assessment method we give the impact by phase regardless of
                     # the case
@@ -287,6 +579,9 @@ class LCACore(om.ExplicitComponent):
                         desc=bw.Method(m).metadata["unit"] + " for the whole " + phase + " phase",
                     )
                     self.outputs_list.append(LCA_PREFIX + clean_method_name + ":" + phase + ":sum")
+                    self.output_indices_dict["phase"].append(
+                        (LCA_PREFIX + clean_method_name + ":" + phase + ":sum", method_idx, key_idx)
+                    )
 
             self.add_output(
                 LCA_PREFIX + clean_method_name + ":sum",
@@ -295,6 +590,7 @@ class LCACore(om.ExplicitComponent):
                 desc=bw.Method(m).metadata["unit"] + " for the whole process",
             )
             self.outputs_list.append(LCA_PREFIX + clean_method_name + ":sum")
+            self.sum_output_indices.append((LCA_PREFIX + clean_method_name + ":sum", method_idx))
 
             if "component" in self.axis:
                 # Components are tagged with the phase just in case, so we can do this. However,
@@ -302,7 +598,7 @@ class LCACore(om.ExplicitComponent):
                 # component themselves. So it is actually a bit dangerous to do it like this.
                 # Beware of only putting the "component" custom attribute only for production or for
                 # phase in which the impacts can be attributed to the component themselves.
-                for component_phase in self.axis_keys_dict["component"]:
+                for key_idx, component_phase in enumerate(self.axis_keys_dict["component"]):
                     if component_phase != "_other_":
                         # Now we give the value component by component
                         clean_phase_name = component_phase.split("_")[-1]
@@ -331,6 +627,18 @@ class LCACore(om.ExplicitComponent):
                             + ":"
                             + clean_component_name
                         )
+                        self.output_indices_dict["component"].append(
+                            (
+                                LCA_PREFIX
+                                + clean_method_name
+                                + ":"
+                                + clean_phase_name
+                                + ":"
+                                + clean_component_name,
+                                method_idx,
+                                key_idx,
+                            )
+                        )
 
     def setup_partials(self):
         # Create a fake inputs list with constant value. It's not going to be relevant anyway
@@ -401,45 +709,113 @@ class LCACore(om.ExplicitComponent):
                                     )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        parameters = {name.replace(":", "__"): value[0] for name, value in inputs.items()}
+        parameters = {name.replace(":", "__"): value for name, value in inputs.items()}
 
         for axis_to_evaluate in self.axis:
-            res = self.compute_impacts_from_lambdas(
-                lambdas=self.lambdas_dict[axis_to_evaluate], axis=axis_to_evaluate, **parameters
-            )
+            # Only one scenario here
+            impacts = self.compute_impacts_batch(axis_to_evaluate, **parameters)[0]
+
+            for output_name, method_idx, key_idx in self.output_indices_dict[axis_to_evaluate]:
+                outputs[output_name] = impacts[method_idx, key_idx]
 
             if axis_to_evaluate == "phase":
-                for m in res:  # for each LCIA method
-                    clean_method_name = re.sub(r": |/| ", "_", m.split(" - ")[0])
-                    clean_method_name = clean_method_name.replace(",_", "")
+                for output_name, method_idx in self.sum_output_indices:
+                    outputs[output_name] = np.sum(impacts[method_idx])
 
-                    for phase in self.axis_keys_dict["phase"]:
-                        if phase != "_other_":
-                            outputs[LCA_PREFIX + clean_method_name + ":" + phase + ":sum"] = res[m][
-                                phase
-                            ]
+    def compute_impacts_batch(self, axis: str, **params) -> np.ndarray:
+        """
+        Computes the impacts of several scenarios at once, in a single vectorized evaluation of
+        the compiled LCA functions.
+
+        :param axis: axis along which the impacts are ventilated, "phase" or "component" if the
+        component level breakdown is enabled
+        :param **params: values of the LCA parameters, either a single value or an array with one
+        value per scenario. Names can be given with "__" as in lca_algebraic or with ":" as in
+        the inputs of this component. Parameters not given take their default value or are
+        computed from their formula, as in compute_impacts_from_lambdas
+
+        :return: impacts as an array of shape (number of scenarios, number of methods, number of
+        axis keys), methods being in the order of self.methods and keys in the order of
+        self.axis_keys_dict[axis]
+        """
 
-                    outputs[LCA_PREFIX + clean_method_name + ":sum"] = res[m]["*sum*"]
+        batch_function, argument_names = self.batch_functions_dict[axis]
 
-            if axis_to_evaluate == "component":
-                for m in res:  # for each LCIA method
-                    clean_method_name = re.sub(r": |/| ", "_", m.split(" - ")[0])
-                    clean_method_name = clean_method_name.replace(",_", "")
-
-                    # Components are tagged with the phase just in case, so we can do this
-                    for component_phase in self.axis_keys_dict["component"]:
-                        if component_phase != "_other_":
-                            # Now we give the value component by component
-                            clean_phase_name = component_phase.split("_")[-1]
-                            clean_component_name = "_".join(component_phase.split("_")[:-1])
-                            outputs[
-                                LCA_PREFIX
-                                + clean_method_name
-                                + ":"
-                                + clean_phase_name
-                                + ":"
-                                + clean_component_name
-                            ] = res[m][component_phase]
+        params = {
+            name.replace(":", "__"): np.atleast_1d(np.asarray(value, dtype=float))
+            for name, value in params.items()
+        }
+
+        number_of_scenarios = max((len(value) for value in params.values()), default=1)
+        for name, value in params.items():
+            if len(value) not in (1, number_of_scenarios):
+                raise ValueError(
+                    "Parameter "
+                    + name
+                    + " has "
+                    + str(len(value))
+                    + " values, expected 1 or "
+                    + str(number_of_scenarios)
+                )
+
+        # Single values are given as such so that lca_algebraic doesn't expand them value by value
+        params = {name: value[0] if len(value) == 1 else value for name, value in params.items()}
+
+        # Missing parameters are completed and enum parameters are expanded into one value per
+        # possible value with the same functions lca_algebraic uses when it evaluates the
+        # functions one by one
+        dbname = self.model.key[0]
+        with agb.DbContext(dbname):
+            # noinspection PyProtectedMember
+            completed_params = agb.params._complete_params(
+                params, self.required_parameters_dict[axis]
+            )
+            # noinspection PyProtectedMember
+            expanded_params = agb.params._expand_params(completed_params)
+
+        arguments = [expanded_params[name] for name in argument_names]
+        impacts_list = batch_function(*arguments)
+
+        # Expressions which don't depend on any parameter are returned as scalars, assigning
+        # them in the array takes care of the broadcast
+        impacts = np.zeros((number_of_scenarios, len(impacts_list), len(self.axis_keys_dict[axis])))
+        for method_idx, method_impacts in enumerate(impacts_list):
+            for key_idx, impact in enumerate(method_impacts):
+                impacts[:, method_idx, key_idx] = impact
+
+        return impacts
+
+    @staticmethod
+    def _get_batch_function(lambdas, axis_keys: list) -> tuple:
+        """
+        Compiles the expressions of all the LCA functions of an axis into a single numpy function
+        which returns the impacts of each method for each key of the axis. Returns that function
+        and the name of the parameters it expects, in order.
+
+        :param lambdas: List[agb.LambdaWithParamNames], one per method
+        :param axis_keys: keys of the axis, in the order in which they are to be returned
+        """
+
+        expressions = []
+        for lambd in lambdas:
+            expression_per_key = {str(key): res for key, res in lambd.expr.items()}
+            expressions.append(
+                [_with_plain_symbols(expression_per_key.get(str(key), 0)) for key in axis_keys]
+            )
+
+        argument_names = sorted(
+            {
+                str(symbol)
+                for method_expressions in expressions
+                for expression in method_expressions
+                for symbol in expression.free_symbols
+            }
+        )
+        batch_function = sym.lambdify(
+            [sym.Symbol(name) for name in argument_names], expressions, "numpy"
+        )
+
+        return batch_function, argument_names
 
     def compute_impacts_from_lambdas(
         self,
@@ -979,3 +1355,97 @@ class LCACore(om.ExplicitComponent):
                     ]
                     for param in agb.all_params().values()
                 }
+
+
+def _serialize_expression(expr):
+    """
+    Gives an exact JSON compatible representation of a sympy expression, as a tree of the
+    classes of its nodes, which _deserialize_expression turns back into the same expression
+    without evaluating any code.
+
+    LCA parameters are symbols of a class of their own that can't be rebuilt from their
+    representation. Functions are compiled from the name of the symbols only so they are saved
+    as plain symbols.
+
+    :param expr: the expression to represent
+    """
+
+    expr = sym.sympify(expr)
+
+    if isinstance(expr, sym.Symbol):
+        return {"symbol": expr.name}
+    if isinstance(expr, sym.Integer):
+        return {"integer": str(expr.p)}
+    if isinstance(expr, sym.Rational):
+        return {"rational": [str(expr.p), str(expr.q)]}
+    if isinstance(expr, sym.Float):
+        # Enough digits are written for the value to be read back exactly
+        # noinspection PyProtectedMember
+        return {
+            "float": mpmath.libmp.to_str(expr._mpf_, mpmath.libmp.repr_dps(expr._prec)),
+            "precision": expr._prec,
+        }
+    if isinstance(type(expr), sym.core.singleton.Singleton):
+        return {"singleton": type(expr).__name__}
+
+    return {
+        "function": type(expr).__name__,
+        "args": [_serialize_expression(arg) for arg in expr.args],
+    }
+
+
+def _deserialize_expression(serialized_expr: dict):
+    """
+    Rebuilds a sympy expression from the representation given by _serialize_expression. Only
+    the sympy classes are looked up by their name, nothing is evaluated, so that reading a file
+    can't run any code.
+
+    :param serialized_expr: representation of the expression
+    """
+
+    if "symbol" in serialized_expr:
+        return sym.Symbol(serialized_expr["symbol"])
+    if "integer" in serialized_expr:
+        return sym.Integer(int(serialized_expr["integer"]))
+    if "rational" in serialized_expr:
+        numerator, denominator = serialized_expr["rational"]
+        return sym.Rational(int(numerator), int(denominator))
+    if "float" in serialized_expr:
+        return sym.Float(serialized_expr["float"], precision=int(serialized_expr["precision"]))
+    if "singleton" in serialized_expr:
+        singleton = getattr(sym.S, serialized_expr["singleton"], None)
+        if not isinstance(singleton, sym.Basic):
+            raise ValueError("Unknown constant in the expression: " + str(serialized_expr))
+        return singleton
+
+    return _get_expression_class(serialized_expr["function"])(
+        *[_deserialize_expression(arg) for arg in serialized_expr["args"]]
+    )
+
+
+def _get_expression_class(class_name: str):
+    """
+    Gives the sympy class of a node of an expression from its name.
+
+    :param class_name: name of the class
+    """
+
+    for module in (sym, piecewise):
+        expression_class = getattr(module, class_name, None)
+        if isinstance(expression_class, type) and issubclass(expression_class, sym.Basic):
+            return expression_class
+
+    raise ValueError("Unknown class in the expression: " + str(class_name))
+
+
+def _with_plain_symbols(expr):
+    """
+    Replaces the symbols of an expression, such as the LCA parameters, by plain sympy symbols
+    with the same name.
+
+    :param expr: the expression in which to replace the symbols
+    """
+
+    expr = sym.sympify(expr)
+
+    return expr.xreplace({symbol: sym.Symbol(symbol.name) for symbol in expr.free_symbols})
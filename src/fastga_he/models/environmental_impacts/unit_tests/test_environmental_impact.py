@@ -2,10 +2,13 @@
 # Electric Aircraft.
 # Copyright (C) 2022 ISAE-SUPAERO
 
+import json
 import os
 import pathlib
 
+import numpy as np
 import pytest
+import sympy as sym
 
 import fastoad.api as oad
 
@@ -18,6 +21,7 @@ except ImportError:
 
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
 from ..lca import LCA
+from ..lca_core import LCACore
 from ..lca_equivalent_year_of_life import LCAEquivalentYearOfLife
 from ..lca_equivalent_flight_per_year import LCAEquivalentFlightsPerYear
 from ..lca_max_airframe_hours import LCAEquivalentMaxAirframeHours
@@ -876,12 +880,183 @@ def test_lca_pipistrel():
 
     problem.check_partials(compact_print=True)
 
-    lca_model = problem.model.component.lca_core.model
+    # The impacts of several identical scenarios evaluated at once must be those lca_algebraic
+    # gives when it evaluates the functions one by one
+    lca_core = problem.model.component.lca_core
+    parameters = {
+        name.split(".")[-1].replace(":", "__"): meta["val"][0]
+        for name, meta in lca_core.list_inputs(out_stream=None, return_format="dict").items()
+    }
+    for axis in lca_core.axis:
+        reference_impacts = lca_core.compute_impacts_from_lambdas(
+            lca_core.lambdas_dict[axis], axis, **parameters
+        )
+        impacts = lca_core.compute_impacts_batch(
+            axis, **{name: np.full(3, value) for name, value in parameters.items()}
+        )
+        assert impacts.shape == (3, len(lca_core.methods), len(lca_core.axis_keys_dict[axis]))
+        for key_idx, key in enumerate(lca_core.axis_keys_dict[axis]):
+            if key in reference_impacts.index:
+                assert impacts[:, :, key_idx] == pytest.approx(
+                    np.tile(reference_impacts.loc[key].to_numpy(dtype=float), (3, 1)), rel=1e-10
+                )
+
+    lca_model = lca_core.model
 
     if IMPORTS_LCA:
         process_tree(lca_model, outfile=os.path.join(RESULTS_FOLDER_PATH, "lca_pipistrel.html"))
 
 
+def test_lca_disk_cache():
+    import lca_algebraic as agb
+
+    # Small synthetic configuration and functions, the disk cache only cares about the content
+    # of the former and the expressions of the latter
+    lca_conf_file_path = RESULTS_FOLDER_PATH / "disk_cache" / "synthetic_lca.yml"
+    lca_conf_file_path.parent.mkdir(parents=True, exist_ok=True)
+    lca_conf_file_path.write_text("project: synthetic\n")
+    disk_cache_folder_path = RESULTS_FOLDER_PATH / "disk_cache" / "lca_cache"
+    lca_data_fingerprint = {
+        "project": "synthetic",
+        "databases": {"synthetic_background": {"number": 1, "modified": "2025-01-01T00:00:00"}},
+        "methods": [[["synthetic method", "climate change"], {"num_cfs": 1}]],
+    }
+
+    mass, factor = sym.symbols("mass_per_fu factor")
+    impact = 0.1 * mass**2 + sym.ceiling(mass / 3.3) * factor
+    lambdas_dict = {
+        "phase": [
+            agb.lca.LambdaWithParamNames(agb.AxisDict({"production": impact, "use": 2.0 * mass}))
+        ]
+    }
+    partial_lambdas_dict_dict = {
+        "phase": {
+            "mass_per_fu": [
+                agb.lca.LambdaWithParamNames(
+                    agb.AxisDict({"production": 0.2 * mass, "use": sym.Float(2.0)})
+                )
+            ],
+            "factor": [
+                agb.lca.LambdaWithParamNames(
+                    agb.AxisDict({"production": sym.ceiling(mass / 3.3), "use": sym.Integer(0)})
+                )
+            ],
+        }
+    }
+
+    disk_cache_file_path = LCACore._get_disk_cache_file_path(
+        lca_conf_file_path, ["phase"], lca_data_fingerprint, disk_cache_folder_path
+    )
+    assert LCACore._load_disk_cache_instance(disk_cache_file_path, ["phase"]) is None
+
+    LCACore._add_disk_cache_instance(disk_cache_file_path, lambdas_dict, partial_lambdas_dict_dict)
+    loaded_lambdas_dict, loaded_partial_lambdas_dict_dict = LCACore._load_disk_cache_instance(
+        disk_cache_file_path, ["phase"]
+    )
+
+    assert dict(loaded_lambdas_dict["phase"][0].expr) == dict(lambdas_dict["phase"][0].expr)
+    for param_name, partial_lambdas in partial_lambdas_dict_dict["phase"].items():
+        assert dict(loaded_partial_lambdas_dict_dict["phase"][param_name][0].expr) == dict(
+            partial_lambdas[0].expr
+        )
+
+    # Expressions which are not ventilated along an axis are saved as well
+    scalar_lambda = LCACore._deserialize_lambda(
+        LCACore._serialize_lambda(agb.lca.LambdaWithParamNames(impact))
+    )
+    assert scalar_lambda.expr == impact
+
+    # Rewriting the same content must not invalidate the cache, changing it, the axis, the
+    # databases or the methods must
+    lca_conf_file_path.write_text("project: synthetic\n")
+    assert (
+        LCACore._get_disk_cache_file_path(
+            lca_conf_file_path, ["phase"], lca_data_fingerprint, disk_cache_folder_path
+        )
+        == disk_cache_file_path
+    )
+    assert (
+        LCACore._get_disk_cache_file_path(
+            lca_conf_file_path, ["phase", "component"], lca_data_fingerprint, disk_cache_folder_path
+        )
+        != disk_cache_file_path
+    )
+    modified_database_fingerprint = dict(
+        lca_data_fingerprint,
+        databases={"synthetic_background": {"number": 2, "modified": "2025-06-01T00:00:00"}},
+    )
+    assert (
+        LCACore._get_disk_cache_file_path(
+            lca_conf_file_path, ["phase"], modified_database_fingerprint, disk_cache_folder_path
+        )
+        != disk_cache_file_path
+    )
+    modified_methods_fingerprint = dict(
+        lca_data_fingerprint,
+        methods=[[["synthetic method", "acidification"], {"num_cfs": 1}]],
+    )
+    assert (
+        LCACore._get_disk_cache_file_path(
+            lca_conf_file_path, ["phase"], modified_methods_fingerprint, disk_cache_folder_path
+        )
+        != disk_cache_file_path
+    )
+    lca_conf_file_path.write_text("project: synthetic_bis\n")
+    assert (
+        LCACore._get_disk_cache_file_path(
+            lca_conf_file_path, ["phase"], lca_data_fingerprint, disk_cache_folder_path
+        )
+        != disk_cache_file_path
+    )
+
+    # A file that can't be read is simply ignored
+    disk_cache_file_path.write_text("{")
+    assert LCACore._load_disk_cache_instance(disk_cache_file_path, ["phase"]) is None
+
+    # The content of the file is never evaluated, only sympy classes can be rebuilt
+    disk_cache_file_path.write_text(
+        json.dumps(
+            {
+                "lambdas_dict": {
+                    "phase": [
+                        {
+                            "expr": {
+                                "function": "__import__",
+                                "args": [{"symbol": "os"}],
+                            }
+                        }
+                    ]
+                },
+                "partial_lambdas_dict_dict": {"phase": {}},
+            }
+        )
+    )
+    assert LCACore._load_disk_cache_instance(disk_cache_file_path, ["phase"]) is None
+
+
+def test_lca_batch_function():
+    import lca_algebraic as agb
+
+    mass, factor = sym.symbols("mass_per_fu factor")
+    lambdas = [
+        agb.lca.LambdaWithParamNames(
+            agb.AxisDict({"production": 0.1 * mass**2 + factor, "use": 2.0 * mass})
+        ),
+        agb.lca.LambdaWithParamNames(agb.AxisDict({"production": sym.Float(3.0)})),
+    ]
+
+    batch_function, argument_names = LCACore._get_batch_function(lambdas, ["production", "use"])
+    assert argument_names == ["factor", "mass_per_fu"]
+
+    # Several scenarios are evaluated at once, missing keys have no impacts
+    mass_values = np.array([1.0, 2.0, 3.0])
+    impacts = batch_function(2.0, mass_values)
+    assert impacts[0][0] == pytest.approx(0.1 * mass_values**2.0 + 2.0, rel=1e-12)
+    assert impacts[0][1] == pytest.approx(2.0 * mass_values, rel=1e-12)
+    assert impacts[1][0] == pytest.approx(3.0, rel=1e-12)
+    assert impacts[1][1] == 0.0
+
+
 @pytest.mark.skipif(IN_GITHUB_ACTIONS, reason="This test is not meant to run in Github Actions.")
 def test_pipistrel_lca_comparison_paper():
     # The analysis we try to replicate here is not exactly the pipistrel we size and test earlier.
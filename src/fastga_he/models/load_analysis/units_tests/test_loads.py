@@ -16,10 +16,11 @@ Test load_analysis module.
 
 import numpy as np
 import pytest
+from scipy.integrate import trapezoid
 
 
-from ..wing.aerostructural_loads import AerostructuralLoadHE
-from ..wing.structural_loads import StructuralLoadsHE
+from ..wing.aerostructural_loads import AerostructuralLoadHE, PADDED_AERODYNAMIC_INPUTS
+from ..wing.structural_loads import StructuralLoadsHE, PADDED_STRUCTURAL_INPUTS
 from ..wing.aerodynamic_loads import AerodynamicLoadsHE
 from ..wing.loads import WingLoadsHE
 
@@ -29,6 +30,42 @@ from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
 XML_FILE = "data.xml"
 
 
+def check_padded_inputs_partials(problem, padded_inputs):
+    """
+    Compares the complex step partials with respect to the padded distributions to central finite
+    differences. Perturbing the padding zeros would add stations, so only the non-zero entries are
+    perturbed. The model is run directly to skip the memory cleaning of each FAST-OAD run.
+    """
+    outputs = list(problem.model.component.get_io_metadata(iotypes="output").keys())
+    totals = problem.compute_totals(of=outputs, wrt=padded_inputs)
+
+    for padded_input in padded_inputs:
+        input_value = problem.get_val(padded_input).copy()
+
+        for index in np.where(input_value != 0.0)[0]:
+            step = np.zeros_like(input_value)
+            step[index] = 1e-6 * abs(input_value[index])
+
+            problem.set_val(padded_input, input_value + step)
+            problem.model.run_solve_nonlinear()
+            outputs_plus = {output: problem.get_val(output).copy() for output in outputs}
+
+            problem.set_val(padded_input, input_value - step)
+            problem.model.run_solve_nonlinear()
+            outputs_minus = {output: problem.get_val(output).copy() for output in outputs}
+
+            for output in outputs:
+                derivative_fd = (outputs_plus[output] - outputs_minus[output]) / (2.0 * step[index])
+                derivative = totals[output, padded_input][:, index]
+                assert derivative == pytest.approx(
+                    derivative_fd, abs=1e-3 * max(np.max(np.abs(derivative_fd)), 1.0)
+                ), output + " wrt " + padded_input + " at index " + str(index)
+
+        problem.set_val(padded_input, input_value)
+
+    problem.model.run_solve_nonlinear()
+
+
 def test_compute_shear_stress():
     # Research independent input value in .xml file
     ivc = get_indep_var_comp(list_inputs(AerostructuralLoadHE()), __file__, XML_FILE)
@@ -157,6 +194,8 @@ def test_compute_shear_stress():
     weight_root_shear = weight_shear_diagram[0]
     assert weight_root_shear == pytest.approx(-21607.77, abs=1)
 
+    check_padded_inputs_partials(problem, PADDED_AERODYNAMIC_INPUTS)
+
 
 def test_compute_root_bending_moment():
     # Research independent input value in .xml file
@@ -817,6 +856,8 @@ def test_compute_structure_shear():
     distributed_mass_result = np.zeros_like(distributed_mass_array)
     assert np.max(np.abs(distributed_mass_result - distributed_mass_array)) <= 1e-1
 
+    check_padded_inputs_partials(problem, PADDED_STRUCTURAL_INPUTS)
+
 
 def test_compute_structure_bending():
     # Research independent input value in .xml file
@@ -1371,6 +1412,41 @@ def test_non_nil_distributed_masses():
     )
 
 
+def test_shear_and_bending_moment_diagrams_batched():
+    # Check the vectorized diagrams against a station by station integration, for a batch of
+    # load cases
+    y_vector = np.array([0.0, 0.5, 1.0, 1.0, 1.2, 2.5, 4.0, 5.5, 6.0])
+    force_array = np.array(
+        [
+            [1200.0, 1150.0, 1100.0, 1100.0, 1050.0, 950.0, 800.0, 500.0, 0.0],
+            [-300.0, -290.0, -280.0, -900.0, -270.0, -240.0, -200.0, -150.0, -140.0],
+            [900.0, 860.0, 820.0, 200.0, 780.0, 710.0, 600.0, 350.0, -140.0],
+        ]
+    )
+
+    shear_diagram, bending_diagram = AerostructuralLoadHE.compute_shear_and_bending_moment_diagrams(
+        y_vector, force_array
+    )
+
+    for force, shear, bending in zip(force_array, shear_diagram, bending_diagram):
+        shear_result = np.array([trapezoid(force[i:], y_vector[i:]) for i in range(len(y_vector))])
+        bending_result = np.array(
+            [
+                trapezoid(force[i:] * (y_vector[i:] - y_vector[i]), y_vector[i:])
+                for i in range(len(y_vector))
+            ]
+        )
+
+        assert shear == pytest.approx(shear_result, rel=1e-10, abs=1e-8)
+        assert bending == pytest.approx(bending_result, rel=1e-10, abs=1e-8)
+        assert AerostructuralLoadHE.compute_shear_diagram(y_vector, force) == pytest.approx(
+            shear, rel=1e-12, abs=1e-8
+        )
+        assert AerostructuralLoadHE.compute_bending_moment_diagram(
+            y_vector, force
+        ) == pytest.approx(bending, rel=1e-12, abs=1e-8)
+
+
 def test_compute_lift_distribution():
     # Research independent input value in .xml file
     ivc = get_indep_var_comp(list_inputs(AerodynamicLoadsHE()), __file__, XML_FILE)
@@ -1575,6 +1651,8 @@ def test_compute_lift_distribution():
 
     assert np.max(np.abs(lift_array - lift_result)) <= 1e-1
 
+    check_padded_inputs_partials(problem, PADDED_AERODYNAMIC_INPUTS)
+
 
 def test_load_group():
     # Research independent input value in .xml file
@@ -22,7 +22,11 @@ import openmdao.api as om
 import fastoad.api as oad
 from stdatm import Atmosphere
 
-from .aerostructural_loads import AerostructuralLoadHE, SPAN_MESH_POINT_LOADS
+from .aerostructural_loads import (
+    AerostructuralLoadHE,
+    SPAN_MESH_POINT_LOADS,
+    PADDED_AERODYNAMIC_INPUTS,
+)
 from .constants import HE_SUBMODEL_AERODYNAMIC_LOADS
 
 
@@ -212,6 +216,26 @@ class AerodynamicLoadsHE(om.ExplicitComponent):
             shape=SPAN_MESH_POINT_LOADS,
         )
 
+        self.declare_partials(
+            of="*",
+            wrt=[
+                "data:TLAR:v_cruise",
+                "data:loads:*",
+                "data:aerodynamics:slipstream:wing:cruise:prop_on:velocity",
+                "data:aerodynamics:wing:cruise:CL_ref",
+                "data:geometry:wing:root:chord",
+                "data:geometry:wing:tip:chord",
+                "data:geometry:wing:span",
+                "data:geometry:wing:area",
+                "data:geometry:landing_gear:y",
+                "data:weight:airframe:wing:punctual_mass:y_ratio",
+                "data:weight:airframe:wing:punctual_tanks:y_ratio",
+                "data:mission:sizing:main_route:cruise:altitude",
+            ]
+            + PADDED_AERODYNAMIC_INPUTS,
+            method="cs",
+        )
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         # STEP 1/XX - DEFINE OR CALCULATE INPUT DATA FOR LOAD COMPUTATION
 
@@ -241,13 +265,13 @@ class AerodynamicLoadsHE(om.ExplicitComponent):
 
         # We delete the zeros we had to add to fit the size we set in the aerodynamics module and
         # add the physic extrema that are missing, the root and the full span,
-        y_vector = AerostructuralLoadHE.delete_additional_zeros(y_vector)
-        y_vector_slip = AerostructuralLoadHE.delete_additional_zeros(y_vector_slip)
-        cl_vector = AerostructuralLoadHE.delete_additional_zeros(cl_vector, len(y_vector))
-        cl_vector_slip = AerostructuralLoadHE.delete_additional_zeros(
-            cl_vector_slip, len(y_vector_slip)
-        )
-        chord_vector = AerostructuralLoadHE.delete_additional_zeros(chord_vector, len(y_vector))
+        nb_stations = AerostructuralLoadHE.get_number_of_stations(y_vector)
+        nb_stations_slip = AerostructuralLoadHE.get_number_of_stations(y_vector_slip)
+        y_vector = y_vector[:nb_stations]
+        y_vector_slip = y_vector_slip[:nb_stations_slip]
+        cl_vector = cl_vector[:nb_stations]
+        cl_vector_slip = cl_vector_slip[:nb_stations_slip]
+        chord_vector = chord_vector[:nb_stations]
 
         y_vector, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector, 0.0)
         y_vector_slip, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector_slip, 0.0)
@@ -278,7 +302,7 @@ class AerodynamicLoadsHE(om.ExplicitComponent):
         # which is linked with the highest absolute load factor. From there we can recompute the
         # equilibrium and get the lift distribution in the most stringent case which will be what
         # we will plot
-        if load_factor_shear > load_factor_rbm:
+        if load_factor_shear.real > load_factor_rbm.real:
             mass = inputs["data:loads:max_shear:mass"]
             load_factor = load_factor_shear
         else:
@@ -18,7 +18,6 @@ Computes the aerostructural loads on the wing of the aircraft.
 import numpy as np
 import openmdao.api as om
 from scipy.integrate import trapezoid
-from scipy.interpolate import interp1d
 
 from stdatm import Atmosphere
 import fastoad.api as oad
@@ -33,6 +32,15 @@ from .constants import (
 
 SPAN_MESH_POINT_LOADS = int(1.5 * SPAN_MESH_POINT)
 
+# Aerodynamic distributions padded with additional zeros to fit the format imposed by OpenMDAO
+PADDED_AERODYNAMIC_INPUTS = [
+    "data:aerodynamics:wing:low_speed:Y_vector",
+    "data:aerodynamics:wing:low_speed:chord_vector",
+    "data:aerodynamics:wing:low_speed:CL_vector",
+    "data:aerodynamics:slipstream:wing:cruise:prop_on:Y_vector",
+    "data:aerodynamics:slipstream:wing:cruise:only_prop:CL_vector",
+]
+
 
 @oad.RegisterSubmodel(
     HE_SUBMODEL_AEROSTRUCTURAL_LOADS, "fastga_he.submodel.loads.wings.aerostructural.legacy"
@@ -217,6 +225,25 @@ class AerostructuralLoadHE(om.ExplicitComponent):
 
         self.add_output("data:loads:y_vector", units="m", shape=SPAN_MESH_POINT_LOADS)
 
+        # The y stations are refined around the point masses and the distributions are
+        # interpolated on them, so the partials are computed with the complex step. Only the real
+        # part of the inputs decides where the stations are, so the steps don't move them.
+        self.declare_partials(
+            of="*",
+            wrt=[
+                "data:TLAR:v_cruise",
+                "data:aerodynamics:slipstream:wing:cruise:prop_on:velocity",
+                "data:aerodynamics:wing:low_speed:CL_ref",
+                "data:weight:*",
+                "data:geometry:wing:span",
+                "data:geometry:wing:area",
+                "data:geometry:landing_gear:y",
+                "data:mission:*",
+            ]
+            + PADDED_AERODYNAMIC_INPUTS,
+            method="cs",
+        )
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         # STEP 1/XX - DEFINE OR CALCULATE INPUT DATA FOR LOAD COMPUTATION ##########################
         ############################################################################################
@@ -242,62 +269,47 @@ class AerostructuralLoadHE(om.ExplicitComponent):
         v_c = inputs["data:mission:sizing:cs23:characteristic_speed:vc"]
 
         factor_of_safety = inputs["data:mission:sizing:cs23:safety_factor"].item()
-        shear_max_conditions = []
-        rbm_max_conditions = []
 
         atm = Atmosphere(cruise_alt)
 
-        shear_max = 0.0
-        rbm_max = 0.0
-
         # STEP 2/XX - DELETE THE ADDITIONAL ZEROS WE HAD TO PUT TO FIT OPENMDAO AND ADD A POINT
         # AT THE ROOT (Y=0) AND AT THE VERY TIP (Y=SPAN/2) TO GET THE WHOLE SPAN OF THE WING IN
         # THE INTERPOLATION WE WILL DO LATER
 
-        # We delete the zeros
-        y_vector = AerostructuralLoadHE.delete_additional_zeros(y_vector)
-        y_vector_slip = AerostructuralLoadHE.delete_additional_zeros(y_vector_slip)
-        cl_vector = AerostructuralLoadHE.delete_additional_zeros(cl_vector, len(y_vector))
-        cl_vector_slip = AerostructuralLoadHE.delete_additional_zeros(
-            cl_vector_slip, len(y_vector_slip)
-        )
-        chord_vector = AerostructuralLoadHE.delete_additional_zeros(chord_vector, len(y_vector))
-
-        # We add the first point at the root
-        y_vector, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector, 0.0)
-        y_vector_slip, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector_slip, 0.0)
-        cl_vector = np.insert(cl_vector, 0, cl_vector[0])
-        cl_vector_slip = np.insert(cl_vector_slip, 0, cl_vector_slip[0])
-        chord_vector = np.insert(chord_vector, 0, chord_vector[0])
-
-        # And the last point at the tip
-        y_vector_orig, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector, semi_span)
-        y_vector_slip_orig, _ = AerostructuralLoadHE.insert_in_sorted_array(
-            y_vector_slip, semi_span
+        (
+            y_vector_orig,
+            y_vector_slip_orig,
+            cl_vector,
+            cl_vector_slip,
+            chord_vector,
+        ) = AerostructuralLoadHE.complete_span_vectors(
+            y_vector, y_vector_slip, cl_vector, cl_vector_slip, chord_vector, semi_span
         )
-        cl_vector = np.append(cl_vector, 0.0)
-        cl_vector_slip = np.append(cl_vector_slip, 0.0)
-        chord_vector = np.append(chord_vector, chord_vector[-1])
 
         # STEP 3/XX - WE COMPUTE THE BASELINE LIFT THAT WE ASSUME WILL SCALE WITH THE LOAD
         # FACTOR, THAT IS WHY WE COMPUTE It OUT OF THE LOOPS
 
-        y_vector, _ = self.compute_relief_force(inputs, y_vector_orig, chord_vector, wing_mass, 0.0)
+        # The relief force only depends on the sizing case through the fuel tag, so it is only
+        # computed once for each value of the tag
+        relief_force_dict = {
+            0.0: self.compute_relief_force(inputs, y_vector_orig, chord_vector, wing_mass, 0.0)
+        }
+        y_vector = relief_force_dict[0.0][0]
         cl_s = self.compute_cl_s(y_vector_orig, y_vector_orig, y_vector, cl_vector, chord_vector)
         cl_s_slip = self.compute_cl_s(
             y_vector_slip_orig, y_vector_orig, y_vector, cl_vector_slip, chord_vector
         )
 
-        lift_shear_diagram = np.zeros_like(y_vector)
-        lift_bending_diagram = np.zeros_like(y_vector)
-        weight_shear_diagram = np.zeros_like(y_vector)
-        weight_bending_diagram = np.zeros_like(y_vector)
-
         # STEP 4/XX - WE INITIALIZE THE LOOPS ON THE DIFFERENT SIZING CASE THAT WE DEFINED AND
-        # THEN LAUNCH THEM
+        # THEN LAUNCH THEM. THE Y STATIONS DO NOT DEPEND ON THE SIZING CASE SO THE LIFT AND
+        # WEIGHT OF EACH CASE ARE STORED IN 2-D ARRAYS TO COMPUTE ALL THE DIAGRAMS AT ONCE
 
         mass_tag_array = ["mtow", "mzfw"]
 
+        conditions_list = []
+        lift_section_list = []
+        weight_array_list = []
+
         for mass_tag in mass_tag_array:
             if mass_tag == "mtow":
                 mass = mtow
@@ -328,9 +340,11 @@ class AerostructuralLoadHE(om.ExplicitComponent):
             else:
                 fuel_tag = 1.0
 
-            y_vector, weight_array_orig = self.compute_relief_force(
-                inputs, y_vector_orig, chord_vector, wing_mass, fuel_tag
-            )
+            if fuel_tag not in relief_force_dict:
+                relief_force_dict[fuel_tag] = self.compute_relief_force(
+                    inputs, y_vector_orig, chord_vector, wing_mass, fuel_tag
+                )
+            y_vector, weight_array_orig = relief_force_dict[fuel_tag]
             atm.true_airspeed = cruise_v_tas
 
             atm.equivalent_airspeed = v_c
@@ -349,38 +363,42 @@ class AerostructuralLoadHE(om.ExplicitComponent):
                 )
                 weight_array = weight_array_orig * factor_of_safety * load_factor
 
-                # STEP 4.3/XX - WE COMPUTE THE SHEAR AND WEIGHT DIAGRAM WITH THE APPROPRIATE
-                # FUNCTION, IDENTIFY THE MOST EXTREME CONSTRAINTS AND SAVE THE CONDITIONS IN
-                # WHICH THEY ARE EXPERIENCED FOR LATER USE IN THE POST-PROCESSING PHASE
+                conditions_list.append([mass, load_factor])
+                lift_section_list.append(lift_section)
+                weight_array_list.append(weight_array)
 
-                tot_shear_diagram = AerostructuralLoadHE.compute_shear_diagram(
-                    y_vector, weight_array + lift_section
-                )
-                tot_bending_moment_diagram = AerostructuralLoadHE.compute_bending_moment_diagram(
-                    y_vector, weight_array + lift_section
-                )
-                root_shear_force = tot_shear_diagram[0]
-                root_bending_moment = tot_bending_moment_diagram[0]
+        lift_section_array = np.array(lift_section_list)
+        weight_array_array = np.array(weight_array_list)
 
-                if abs(root_shear_force) > shear_max:
-                    shear_max_conditions = [mass, load_factor]
-                    lift_shear_diagram = AerostructuralLoadHE.compute_shear_diagram(
-                        y_vector, lift_section
-                    )
-                    weight_shear_diagram = AerostructuralLoadHE.compute_shear_diagram(
-                        y_vector, weight_array
-                    )
-                    shear_max = abs(root_shear_force)
+        # STEP 4.3/XX - WE COMPUTE THE SHEAR AND WEIGHT DIAGRAM OF ALL CASES WITH THE APPROPRIATE
+        # FUNCTION, IDENTIFY THE MOST EXTREME CONSTRAINTS AND SAVE THE CONDITIONS IN WHICH THEY ARE
+        # EXPERIENCED FOR LATER USE IN THE POST-PROCESSING PHASE. IN CASE OF A TIE THE FIRST CASE
+        # IS KEPT
 
-                if abs(root_bending_moment) > rbm_max:
-                    rbm_max_conditions = [mass, load_factor]
-                    lift_bending_diagram = AerostructuralLoadHE.compute_bending_moment_diagram(
-                        y_vector, lift_section
-                    )
-                    weight_bending_diagram = AerostructuralLoadHE.compute_bending_moment_diagram(
-                        y_vector, weight_array
-                    )
-                    rbm_max = abs(root_bending_moment)
+        (
+            tot_shear_diagram,
+            tot_bending_moment_diagram,
+        ) = AerostructuralLoadHE.compute_shear_and_bending_moment_diagrams(
+            y_vector, weight_array_array + lift_section_array
+        )
+        idx_shear_max = np.argmax(np.abs(tot_shear_diagram[:, 0]))
+        idx_rbm_max = np.argmax(np.abs(tot_bending_moment_diagram[:, 0]))
+
+        shear_max_conditions = conditions_list[idx_shear_max]
+        lift_shear_diagram = AerostructuralLoadHE.compute_shear_diagram(
+            y_vector, lift_section_array[idx_shear_max]
+        )
+        weight_shear_diagram = AerostructuralLoadHE.compute_shear_diagram(
+            y_vector, weight_array_array[idx_shear_max]
+        )
+
+        rbm_max_conditions = conditions_list[idx_rbm_max]
+        lift_bending_diagram = AerostructuralLoadHE.compute_bending_moment_diagram(
+            y_vector, lift_section_array[idx_rbm_max]
+        )
+        weight_bending_diagram = AerostructuralLoadHE.compute_bending_moment_diagram(
+            y_vector, weight_array_array[idx_rbm_max]
+        )
 
         # STEP 5/XX - WE ADD ZEROS TO THE RESULTS ARRAYS TO MAKE THEM FIT THE OPENMDAO FORMAT
 
@@ -411,20 +429,15 @@ class AerostructuralLoadHE(om.ExplicitComponent):
 
         @param y_vector: an array containing the position of the different station at which the
         linear forces are given
-        @param force_array: an array containing the linear forces
+        @param force_array: an array containing the linear forces, can be a 2-D array in which
+        case each line is treated as a separate load case
         @return: shear_force_diagram an array representing the shear diagram of the linear forces
         given in input
         """
 
-        # We first create the array to fill
-        shear_force_diagram = np.zeros(len(y_vector))
-
         # Each station of the shear diagram is equal to the integral of the forces on all
-        # subsequent station
-        for i, _ in enumerate(y_vector):
-            shear_force_diagram[i] = trapezoid(force_array[i:], y_vector[i:])
-
-        return shear_force_diagram
+        # subsequent station, so it is the reverse cumulative sum of the integral on each interval
+        return AerostructuralLoadHE.reverse_cumulative_trapezoid(force_array, y_vector)
 
     @staticmethod
     def compute_bending_moment_diagram(y_vector, force_array):
@@ -433,22 +446,149 @@ class AerostructuralLoadHE(om.ExplicitComponent):
 
         @param y_vector: an array containing the position of the different station at which the
         linear forces are given
-        @param force_array: an array containing the linear forces
+        @param force_array: an array containing the linear forces, can be a 2-D array in which
+        case each line is treated as a separate load case
         @return: bending_moment_diagram an array representing the root bending diagram of the
         linear forces given in
         input
         """
 
-        # We first create the array to fill
-        bending_moment_diagram = np.zeros(len(y_vector))
+        return AerostructuralLoadHE.compute_shear_and_bending_moment_diagrams(
+            y_vector, force_array
+        )[1]
+
+    @staticmethod
+    def compute_shear_and_bending_moment_diagrams(y_vector, force_array):
+        """
+        Function that computes both the shear and root bending diagram of a given array with
+        linear forces in them. Meant to be used with a 2-D array of forces to treat all load
+        cases at once.
+
+        @param y_vector: an array containing the position of the different station at which the
+        linear forces are given
+        @param force_array: an array containing the linear forces, if it is a 2-D array,
+        each line is treated as a separate load case
+        @return: shear_force_diagram an array representing the shear diagram of the linear forces
+        given in input
+        @return: bending_moment_diagram an array representing the root bending diagram of the
+        linear forces given in input
+        """
+
+        shear_force_diagram = AerostructuralLoadHE.reverse_cumulative_trapezoid(
+            force_array, y_vector
+        )
 
-        # Each station of the shear diagram is equal to the root bending moment created by all
-        # subsequent stations
-        for i, _ in enumerate(y_vector):
-            lever_arm = y_vector - y_vector[i]
-            bending_moment_diagram[i] = trapezoid(force_array[i:] * lever_arm[i:], y_vector[i:])
+        # Each station of the bending diagram is equal to the integral of the forces times the
+        # lever arm y - y_i on all subsequent stations. Since the lever arm is linear in y,
+        # that integral can be split into the first moment of the forces minus y_i times the shear
+        # force, which avoids recomputing the integral for each station
+        first_moment_diagram = AerostructuralLoadHE.reverse_cumulative_trapezoid(
+            force_array * y_vector, y_vector
+        )
+        bending_moment_diagram = first_moment_diagram - y_vector * shear_force_diagram
 
-        return bending_moment_diagram
+        return shear_force_diagram, bending_moment_diagram
+
+    @staticmethod
+    def reverse_cumulative_trapezoid(array, y_vector):
+        """
+        Function that computes, for each station, the integral of the array from that station to
+        the last one using the trapezoidal rule.
+
+        @param array: an array containing the value to integrate, if it is a 2-D array, each line
+        is integrated separately
+        @param y_vector: an array containing the position of the different station at which the
+        values are given
+        @return: integral_array an array containing the integral from each station to the last
+        one, 0.0 at the last station
+        """
+
+        array = np.asarray(array)
+        interval_integral = 0.5 * (array[..., :-1] + array[..., 1:]) * np.diff(y_vector)
+
+        integral_array = np.zeros_like(array)
+        integral_array[..., :-1] = np.cumsum(interval_integral[..., ::-1], axis=-1)[..., ::-1]
+
+        return integral_array
+
+    @staticmethod
+    def reverse_cumulative_trapezoid_partials(array, y_vector):
+        """
+        Function that computes the partials of the reverse cumulative trapezoid of a 1-D array
+        with respect to the array and to the y stations. The first line of each matrix is the
+        partials of the integral on the whole span.
+
+        @param array: a 1-D array containing the value to integrate
+        @param y_vector: an array containing the position of the different station at which the
+        values are given
+        @return: d_integral_d_array a 2-D array, the line i containing the partials of the
+        integral from station i with respect to the array
+        @return: d_integral_d_y a 2-D array, the line i containing the partials of the integral
+        from station i with respect to the y stations
+        """
+
+        array = np.asarray(array, dtype=float)
+        nb_stations = len(y_vector)
+        interval_index = np.arange(nb_stations - 1)
+
+        # The integral on each interval only depends on the two stations that bound it
+        half_interval_length = 0.5 * np.diff(y_vector)
+        interval_mean = 0.5 * (array[:-1] + array[1:])
+
+        d_interval_d_array = np.zeros((nb_stations - 1, nb_stations))
+        d_interval_d_array[interval_index, interval_index] = half_interval_length
+        d_interval_d_array[interval_index, interval_index + 1] = half_interval_length
+
+        d_interval_d_y = np.zeros((nb_stations - 1, nb_stations))
+        d_interval_d_y[interval_index, interval_index] = -interval_mean
+        d_interval_d_y[interval_index, interval_index + 1] = interval_mean
+
+        # Station i sums all the intervals after it, the last one sums none
+        reverse_cumulative_sum = np.triu(np.ones((nb_stations, nb_stations - 1)))
+
+        return reverse_cumulative_sum @ d_interval_d_array, reverse_cumulative_sum @ d_interval_d_y
+
+    @staticmethod
+    def compute_bending_moment_diagram_partials(y_vector, force_array):
+        """
+        Function that computes the partials of the root bending diagram of a 1-D array of linear
+        forces with respect to the forces and to the y stations.
+
+        @param y_vector: an array containing the position of the different station at which the
+        linear forces are given
+        @param force_array: a 1-D array containing the linear forces
+        @return: d_bending_d_force a 2-D array, the line i containing the partials of the
+        bending moment at station i with respect to the linear forces
+        @return: d_bending_d_y a 2-D array, the line i containing the partials of the bending
+        moment at station i with respect to the y stations
+        """
+
+        force_array = np.asarray(force_array, dtype=float)
+
+        shear_force_diagram = AerostructuralLoadHE.reverse_cumulative_trapezoid(
+            force_array, y_vector
+        )
+        (
+            d_shear_d_force,
+            d_shear_d_y,
+        ) = AerostructuralLoadHE.reverse_cumulative_trapezoid_partials(force_array, y_vector)
+        # The partials of the first moment with respect to the product of the forces and the
+        # stations are the same as the ones of the shear with respect to the forces, only its
+        # partials with respect to the length of the intervals are needed
+        _, d_first_moment_d_interval = AerostructuralLoadHE.reverse_cumulative_trapezoid_partials(
+            force_array * y_vector, y_vector
+        )
+
+        # The bending moment at station i is the first moment minus y_i times the shear force
+        d_bending_d_force = d_shear_d_force * (y_vector[np.newaxis, :] - y_vector[:, np.newaxis])
+        d_bending_d_y = (
+            d_shear_d_force * force_array[np.newaxis, :]
+            + d_first_moment_d_interval
+            - y_vector[:, np.newaxis] * d_shear_d_y
+            - np.diag(shear_force_diagram)
+        )
+
+        return d_bending_d_force, d_bending_d_y
 
     @staticmethod
     def compute_cl_s(y_vector_cl_orig, y_vector_chord_orig, y_vector, cl_list, chord_list):
@@ -470,13 +610,9 @@ class AerostructuralLoadHE(om.ExplicitComponent):
         pressure will give you the actual lift distribution
         """
 
-        # We create the interpolation function
-        cl_inter = interp1d(y_vector_cl_orig, cl_list)
-        chord_inter = interp1d(y_vector_chord_orig, chord_list)
-
-        # We compute the new lift coefficient and
-        cl_fin = cl_inter(y_vector)
-        chord_fin = chord_inter(y_vector)
+        # We compute the new lift coefficient and chord
+        cl_fin = AerostructuralLoadHE.interpolate(y_vector_cl_orig, cl_list, y_vector)
+        chord_fin = AerostructuralLoadHE.interpolate(y_vector_chord_orig, chord_list, y_vector)
         lift_chord = np.multiply(cl_fin, chord_fin)
 
         return lift_chord
@@ -539,11 +675,11 @@ class AerostructuralLoadHE(om.ExplicitComponent):
 
         # We create the array that will store the "point mass" which we chose to represent as
         # distributed mass over a small finite interval
-        point_mass_array = np.zeros(len(y_vector))
+        point_mass_array = np.zeros_like(y_vector)
 
         # Only adding point masses when we really want them
         if len(y_ratio_punctual_mass) > 1 or (
-            len(y_ratio_punctual_mass) == 1 and punctual_mass_array != 0
+            len(y_ratio_punctual_mass) == 1 and punctual_mass_array.real != 0
         ):
             for y_ratio_punctual, punctual_mass in zip(y_ratio_punctual_mass, punctual_mass_array):
                 y_punctual_mass = y_ratio_punctual * semi_span
@@ -563,7 +699,7 @@ class AerostructuralLoadHE(om.ExplicitComponent):
 
         # Adding the punctual tanks
         if len(y_ratio_punctual_tanks) > 1 or (
-            len(y_ratio_punctual_tanks) == 1 and punctual_tanks_fuel_inside != 0
+            len(y_ratio_punctual_tanks) == 1 and punctual_tanks_fuel_inside.real != 0
         ):
             for y_ratio_punctual, punctual_fuel in zip(
                 y_ratio_punctual_tanks, punctual_tanks_fuel_inside
@@ -590,7 +726,7 @@ class AerostructuralLoadHE(om.ExplicitComponent):
             y_ratio = y_vector / semi_span
             struct_weight_distribution = 4.0 / np.pi * np.sqrt(1.0 - y_ratio**2.0)
         else:
-            struct_weight_distribution = chord_vector / max(chord_vector)
+            struct_weight_distribution = chord_vector / chord_vector[np.argmax(chord_vector.real)]
 
         readjust_struct = trapezoid(struct_weight_distribution, y_vector)
 
@@ -613,7 +749,7 @@ class AerostructuralLoadHE(om.ExplicitComponent):
                 y_ratios_start, y_ratios_end, chords_start, chord_slopes, masses
             ):
                 # If mass is nil, then do nothing
-                if mass != 0:
+                if mass.real != 0:
                     y_start = y_ratio_start * semi_span
                     y_end = y_ratio_end * semi_span
                     distributed_mass_array += AerostructuralLoadHE.distributed_mass_distribution(
@@ -671,6 +807,66 @@ class AerostructuralLoadHE(om.ExplicitComponent):
 
         return y_vector, weight_array
 
+    @staticmethod
+    def complete_span_vectors(
+        y_vector,
+        y_vector_slip,
+        cl_vector,
+        cl_vector_slip,
+        chord_vector,
+        semi_span,
+        root_chord=None,
+        tip_chord=None,
+    ):
+        """
+        Function that deletes the additional zeros we had to add to the aerodynamic span vectors
+        to fit the format imposed by OpenMDAO and adds a point at the root (y=0) and at the very
+        tip (y=semi_span) to get the whole span of the wing in the later interpolations
+
+        @param y_vector: the y stations of the low speed lift distribution, with additional zeros
+        @param y_vector_slip: the y stations of the slipstream lift distribution, with additional
+        zeros
+        @param cl_vector: the low speed lift distribution, with additional zeros
+        @param cl_vector_slip: the slipstream lift distribution, with additional zeros
+        @param chord_vector: the chord at the y stations of the low speed lift distribution,
+        with additional zeros
+        @param semi_span: the semi span of the wing
+        @param root_chord: the chord added at the root, if not specified the first chord is used
+        @param tip_chord: the chord added at the tip, if not specified the last chord is used
+        @return: y_vector, y_vector_slip, cl_vector, cl_vector_slip, chord_vector the completed
+        span vectors
+        """
+
+        # We delete the zeros
+        nb_stations = AerostructuralLoadHE.get_number_of_stations(y_vector)
+        nb_stations_slip = AerostructuralLoadHE.get_number_of_stations(y_vector_slip)
+        y_vector = y_vector[:nb_stations]
+        y_vector_slip = y_vector_slip[:nb_stations_slip]
+        cl_vector = cl_vector[:nb_stations]
+        cl_vector_slip = cl_vector_slip[:nb_stations_slip]
+        chord_vector = chord_vector[:nb_stations]
+
+        if root_chord is None:
+            root_chord = chord_vector[0]
+        if tip_chord is None:
+            tip_chord = chord_vector[-1]
+
+        # We add the first point at the root
+        y_vector, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector, 0.0)
+        y_vector_slip, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector_slip, 0.0)
+        cl_vector = np.insert(cl_vector, 0, cl_vector[0])
+        cl_vector_slip = np.insert(cl_vector_slip, 0, cl_vector_slip[0])
+        chord_vector = np.insert(chord_vector, 0, root_chord)
+
+        # And the last point at the tip
+        y_vector, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector, semi_span)
+        y_vector_slip, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector_slip, semi_span)
+        cl_vector = np.append(cl_vector, 0.0)
+        cl_vector_slip = np.append(cl_vector_slip, 0.0)
+        chord_vector = np.append(chord_vector, tip_chord)
+
+        return y_vector, y_vector_slip, cl_vector, cl_vector_slip, chord_vector
+
     @staticmethod
     def insert_in_sorted_array(array, element):
         """
@@ -703,7 +899,7 @@ class AerostructuralLoadHE(om.ExplicitComponent):
         the additional zeros deleted
         """
 
-        last_zero = np.amax(np.where(array != 0.0)) + 1
+        last_zero = np.amax(np.where(array.real != 0.0)) + 1
         if length is not None:
             final_array = array[: max(int(last_zero), length)]
         else:
@@ -711,6 +907,60 @@ class AerostructuralLoadHE(om.ExplicitComponent):
 
         return final_array
 
+    @staticmethod
+    def get_number_of_stations(y_vector) -> int:
+        """
+        Function that gives the number of y stations before the additional zeros we had to add
+        to fit the format imposed by OpenMDAO.
+
+        @param y_vector: the y stations, with additional zeros
+        @return: the number of stations without the additional zeros
+        """
+
+        return len(AerostructuralLoadHE.delete_additional_zeros(y_vector))
+
+    @staticmethod
+    def interpolate(x_array, y_array, x_new):
+        """
+        Function that linearly interpolates an array, as scipy interp1d does, but that also
+        accepts complex values so that the partials can be computed with the complex step. The
+        position of the new points in the original array only depends on the real part of the
+        abscissas.
+
+        @param x_array: a sorted array containing the abscissas of the original points
+        @param y_array: an array containing the values at the original points
+        @param x_new: the abscissas at which the array is interpolated
+        @return: y_new the interpolated values at x_new
+        """
+
+        x_new = np.asarray(x_new)
+        if np.any(x_new.real < x_array[0].real):
+            raise ValueError("A value in x_new is below the interpolation range.")
+        if np.any(x_new.real > x_array[-1].real):
+            raise ValueError("A value in x_new is above the interpolation range.")
+
+        index_high = np.clip(np.searchsorted(x_array.real, x_new.real), 1, len(x_array) - 1)
+        index_low = index_high - 1
+
+        slope = (y_array[index_high] - y_array[index_low]) / (
+            x_array[index_high] - x_array[index_low]
+        )
+
+        return slope * (x_new - x_array[index_low]) + y_array[index_low]
+
+    @staticmethod
+    def absolute_value(array):
+        """
+        Function that computes the absolute value of an array based on the sign of its real
+        part, so that, unlike abs, it keeps the complex step used to compute the partials.
+
+        @param array: an array, possibly complex
+        @return: absolute_array the array with the sign of its real part changed where it is
+        negative
+        """
+
+        return np.where(np.real(array) < 0.0, -array, array)
+
     @staticmethod
     def add_point_mass(y_vector, chord_vector, point_mass_array, y_point_mass, point_mass, inputs):
         """
@@ -739,9 +989,16 @@ class AerostructuralLoadHE(om.ExplicitComponent):
         # CREATE A VECTOR TO STOCK WHERE THE MASS ARE ADDED AND HAVE A WAY TO READJUST THE
         # AMPLITUDE
 
-        fake_point_mass_array = np.zeros(len(point_mass_array))
-        present_mass_interp = interp1d(y_vector, point_mass_array)
-        present_chord_interp = interp1d(y_vector, chord_vector)
+        fake_point_mass_array = np.zeros_like(point_mass_array)
+        y_vector_orig = y_vector
+        point_mass_array_orig = point_mass_array
+        chord_vector_orig = chord_vector
+
+        def present_mass_interp(y_new):
+            return AerostructuralLoadHE.interpolate(y_vector_orig, point_mass_array_orig, y_new)
+
+        def present_chord_interp(y_new):
+            return AerostructuralLoadHE.interpolate(y_vector_orig, chord_vector_orig, y_new)
 
         # STEP 3/XX - WE ALSO STOCK WHERE WE ADD THE Y STATION SINCE IT'LL BE LATER NECESSARY TO
         # READJUST THE AMPLITUDE
@@ -756,7 +1013,7 @@ class AerostructuralLoadHE(om.ExplicitComponent):
 
         for i in range(NB_POINTS_POINT_MASS):
             y_current = y_point_mass + (i - nb_point_side) * interval_len
-            if (y_current >= 0.0) and (y_current <= semi_span):
+            if (y_current.real >= 0.0) and (y_current.real <= semi_span.real):
                 y_added.append(y_current)
                 y_vector, idx = AerostructuralLoadHE.insert_in_sorted_array(y_vector, y_current)
                 index = int(float(idx[0]))
@@ -766,14 +1023,17 @@ class AerostructuralLoadHE(om.ExplicitComponent):
                 )
                 fake_point_mass_array = np.insert(fake_point_mass_array, index, 0.0)
 
-        y_min = min(y_added) - 1e-3
+        y_added_min = min(y_added, key=np.real)
+        y_added_max = max(y_added, key=np.real)
+
+        y_min = y_added_min - 1e-3
         y_vector, idx = AerostructuralLoadHE.insert_in_sorted_array(y_vector, y_min)
         index = int(float(idx[0]))
         chord_vector = np.insert(chord_vector, index, present_chord_interp(y_min))
         point_mass_array = np.insert(point_mass_array, index, present_mass_interp(y_min))
         fake_point_mass_array = np.insert(fake_point_mass_array, index, 0.0)
 
-        y_max = max(y_added) + 1e-3
+        y_max = y_added_max + 1e-3
         y_vector, idx = AerostructuralLoadHE.insert_in_sorted_array(y_vector, y_max)
         index = int(float(idx[0]))
         chord_vector = np.insert(chord_vector, index, present_chord_interp(y_max))
@@ -783,8 +1043,8 @@ class AerostructuralLoadHE(om.ExplicitComponent):
         # STEP 5/XX - WE NOW HAVE THE RIGHT WE JUST NEED TO SCALE IT PROPERLY WHICH IS THE POINT
         # OF THIS STEP
 
-        where_add_mass_grt = np.greater_equal(y_vector, min(y_added))
-        where_add_mass_lss = np.less_equal(y_vector, max(y_added))
+        where_add_mass_grt = np.greater_equal(y_vector.real, y_added_min.real)
+        where_add_mass_lss = np.less_equal(y_vector.real, y_added_max.real)
         where_add_mass = np.logical_and(where_add_mass_grt, where_add_mass_lss)
         where_add_mass_index = np.where(where_add_mass)
 
@@ -825,7 +1085,7 @@ class AerostructuralLoadHE(om.ExplicitComponent):
         # Create the array which will contain the tank cross section area at each section
         y_array = y_array_orig.flatten()
 
-        y_in_index = np.where((y_array >= y_start) & (y_array <= y_end))[0]
+        y_in_index = np.where((y_array.real >= y_start.real) & (y_array.real <= y_end.real))[0]
         y_in_array = y_array[y_in_index]
 
         chord_in_array = chord_start + y_in_array * chord_slope
@@ -858,7 +1118,7 @@ class AerostructuralLoadHE(om.ExplicitComponent):
         # Create the array which will contain the tank cross section area at each section
         y_array = y_array_orig.flatten()
 
-        y_in_index = np.where((y_array >= y_start) & (y_array <= y_end))[0]
+        y_in_index = np.where((y_array.real >= y_start.real) & (y_array.real <= y_end.real))[0]
         y_in_array = y_array[y_in_index]
 
         chord_in_array = chord_start + y_in_array * chord_slope
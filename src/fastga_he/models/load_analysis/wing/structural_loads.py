@@ -21,9 +21,18 @@ import openmdao.api as om
 
 import fastoad.api as oad
 
-from .aerostructural_loads import AerostructuralLoadHE, SPAN_MESH_POINT_LOADS
+from .aerostructural_loads import (
+    AerostructuralLoadHE,
+    SPAN_MESH_POINT_LOADS,
+)
 from .constants import HE_SUBMODEL_STRUCTURAL_LOADS
 
+# Only the low speed distribution is used for the structural loads
+PADDED_STRUCTURAL_INPUTS = [
+    "data:aerodynamics:wing:low_speed:Y_vector",
+    "data:aerodynamics:wing:low_speed:chord_vector",
+]
+
 
 @oad.RegisterSubmodel(
     HE_SUBMODEL_STRUCTURAL_LOADS, "fastga_he.submodel.loads.wings.structural.legacy"
@@ -231,6 +240,22 @@ class StructuralLoadsHE(om.ExplicitComponent):
             shape=SPAN_MESH_POINT_LOADS,
         )
 
+        # The y stations are refined around the point masses, so the partials are computed with
+        # the complex step
+        self.declare_partials(
+            of="*",
+            wrt=[
+                "data:loads:*",
+                "data:weight:*",
+                "data:geometry:landing_gear:y",
+                "data:geometry:wing:root:chord",
+                "data:geometry:wing:tip:chord",
+                "data:geometry:wing:span",
+            ]
+            + PADDED_STRUCTURAL_INPUTS,
+            method="cs",
+        )
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         # STEP 1/XX - DEFINE OR CALCULATE INPUT DATA FOR LOAD COMPUTATION
 
@@ -250,8 +275,9 @@ class StructuralLoadsHE(om.ExplicitComponent):
         # THE INTERPOLATION WE WILL DO LATER
 
         # Reformat the y_vector array as was done in the aerostructural component
-        y_vector = AerostructuralLoadHE.delete_additional_zeros(y_vector)
-        chord_vector = AerostructuralLoadHE.delete_additional_zeros(chord_vector)
+        nb_stations = AerostructuralLoadHE.get_number_of_stations(y_vector)
+        y_vector = y_vector[:nb_stations]
+        chord_vector = chord_vector[:nb_stations]
         y_vector, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector, 0.0)
         chord_vector = np.insert(chord_vector, 0, root_chord)
         y_vector_orig, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector, semi_span)
@@ -0,0 +1,121 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import os.path as pth
+import time
+
+import numpy as np
+from fastoad.module_management._plugins import FastoadLoader
+
+# Ensures the submodels required by the equilibrium are registered before importing the models,
+# as it is done for the tests
+FastoadLoader()
+
+from fastga_he.models.loops.wing_area_component.wing_area_cl_dep_equilibrium import (  # noqa: E402
+    UpdateWingAreaLiftDEPEquilibrium,
+)
+
+from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs  # noqa: E402
+
+TEST_FILE_PATH = pth.join(pth.dirname(__file__), "..", "units_tests", "test_loops.py")
+DATA_FOLDER_PATH = pth.join(pth.dirname(TEST_FILE_PATH), "data")
+SR22_DATA_FOLDER_PATH = pth.join(
+    pth.dirname(__file__), "..", "..", "environmental_impacts", "unit_tests", "data"
+)
+
+# Aircraft data and power train file of each case. The SR22 comes from the environmental impacts
+# tests, whose data lack the landing settings of the propeller, those of its POH are used.
+CASES = {
+    "pipistrel": (
+        pth.join(DATA_FOLDER_PATH, "pipistrel_like.xml"),
+        pth.join(DATA_FOLDER_PATH, "simple_assembly.yml"),
+        {},
+    ),
+    "sr22": (
+        pth.join(SR22_DATA_FOLDER_PATH, "sr22.xml"),
+        pth.join(SR22_DATA_FOLDER_PATH, "sr22_propulsion.yml"),
+        {
+            "data:propulsion:he_power_train:thrust_distribution_landing": (1.0, None),
+            "data:propulsion:he_power_train:propeller:propeller_1:rpm_landing": (2700.0, "1/min"),
+        },
+    ),
+    "kodiak": (
+        pth.join(DATA_FOLDER_PATH, "kodiak_100.xml"),
+        pth.join(DATA_FOLDER_PATH, "turboshaft_propulsion.yml"),
+        {},
+    ),
+}
+# Ways to find the wing area which are compared, the first one is the reference
+METHODS = [("fd", "optimizer"), ("analytic", "optimizer"), ("analytic", "newton")]
+
+# Number of times the wing area is recomputed, mimics the iterations of an outer MDA loop
+NB_LOOPS_TEST = 5
+
+
+def time_iterations(
+    xml_file_path: str,
+    pt_file_path: str,
+    additional_inputs: dict,
+    total_derivatives: str,
+    solution_method: str,
+):
+    """
+    Returns the time taken by each recomputation of the wing area when the MLW varies, as it
+    would in a sizing loop, as well as the wing areas found.
+    """
+
+    options = {
+        "propulsion_id": "fastga.wrapper.propulsion.basicIC_engine",
+        "power_train_file_path": pt_file_path,
+        "produce_simplified_pt_file": True,
+        "total_derivatives": total_derivatives,
+        "solution_method": solution_method,
+    }
+
+    inputs_list = [
+        input_name
+        for input_name in list_inputs(UpdateWingAreaLiftDEPEquilibrium(**options))
+        if input_name not in additional_inputs
+    ]
+    ivc = get_indep_var_comp(inputs_list, TEST_FILE_PATH, xml_file_path)
+    for input_name, (input_value, input_units) in additional_inputs.items():
+        ivc.add_output(input_name, val=input_value, units=input_units)
+
+    problem = run_system(UpdateWingAreaLiftDEPEquilibrium(**options), ivc)
+    mlw = problem.get_val("data:weight:aircraft:MLW", units="kg")
+
+    iteration_times = np.zeros(NB_LOOPS_TEST)
+    wing_areas = np.zeros(NB_LOOPS_TEST)
+
+    for i in range(NB_LOOPS_TEST):
+        problem.set_val("data:weight:aircraft:MLW", units="kg", val=mlw * (1.0 + 0.01 * i))
+
+        start = time.perf_counter()
+        problem.run_model()
+        iteration_times[i] = time.perf_counter() - start
+        wing_areas[i] = problem.get_val("wing_area", units="m**2")[0]
+
+    return iteration_times, wing_areas
+
+
+if __name__ == "__main__":
+    for case_name, case_files in CASES.items():
+        reference_times, reference_wing_areas = time_iterations(*case_files, *METHODS[0])
+
+        for method in METHODS:
+            times, wing_areas = time_iterations(*case_files, *method)
+
+            print(case_name, method, "timer per iteration", np.mean(times))
+            print(
+                case_name,
+                method,
+                "speedup per iteration",
+                np.mean(reference_times) / np.mean(times),
+            )
+            print(
+                case_name,
+                method,
+                "max relative difference in wing area",
+                np.max(np.abs(wing_areas / reference_wing_areas - 1.0)),
+            )
@@ -197,6 +197,91 @@ def test_advanced_cl_with_proper_submodels():
     )
 
 
+def test_advanced_cl_cached_problem():
+    xml_file = "pipistrel_like.xml"
+    propulsion_file = pth.join(DATA_FOLDER_PATH, "simple_assembly.yml")
+
+    inputs_list = list_inputs(
+        UpdateWingAreaLiftDEPEquilibrium(
+            propulsion_id="fastga.wrapper.propulsion.basicIC_engine",
+            power_train_file_path=propulsion_file,
+            produce_simplified_pt_file=True,
+        )
+    )
+    # Research independent input value in .xml file
+    ivc_loop = get_indep_var_comp(
+        inputs_list,
+        __file__,
+        xml_file,
+    )
+
+    wing_areas = {}
+    for cache_nested_problem in [True, False]:
+        problem_loop = run_system(
+            UpdateWingAreaLiftDEPEquilibrium(
+                propulsion_id="fastga.wrapper.propulsion.basicIC_engine",
+                power_train_file_path=propulsion_file,
+                produce_simplified_pt_file=True,
+                cache_nested_problem=cache_nested_problem,
+            ),
+            ivc_loop,
+        )
+        wing_areas[cache_nested_problem] = [problem_loop.get_val("wing_area", units="m**2").copy()]
+
+        # Second computation, which starts from the previous solution when the problem is cached
+        problem_loop.set_val("data:weight:aircraft:MLW", val=650.0, units="kg")
+        problem_loop.run_model()
+        wing_areas[cache_nested_problem].append(problem_loop.get_val("wing_area", units="m**2"))
+
+    assert_allclose(wing_areas[True][0], 9.97, atol=1e-2)
+    assert_allclose(wing_areas[True], wing_areas[False], rtol=1e-4)
+    # The simplified copy of the power train file is not left behind
+    assert not pth.exists(propulsion_file.replace(".yml", "_temp_copy.yml"))
+
+
+def test_advanced_cl_total_derivatives_and_newton():
+    xml_file = "pipistrel_like.xml"
+    propulsion_file = pth.join(DATA_FOLDER_PATH, "simple_assembly.yml")
+
+    inputs_list = list_inputs(
+        UpdateWingAreaLiftDEPEquilibrium(
+            propulsion_id="fastga.wrapper.propulsion.basicIC_engine",
+            power_train_file_path=propulsion_file,
+            produce_simplified_pt_file=True,
+        )
+    )
+    # Research independent input value in .xml file
+    ivc_loop = get_indep_var_comp(
+        inputs_list,
+        __file__,
+        xml_file,
+    )
+
+    wing_areas = {}
+    for total_derivatives, solution_method in [
+        ("fd", "optimizer"),
+        ("analytic", "optimizer"),
+        ("analytic", "newton"),
+    ]:
+        problem_loop = run_system(
+            UpdateWingAreaLiftDEPEquilibrium(
+                propulsion_id="fastga.wrapper.propulsion.basicIC_engine",
+                power_train_file_path=propulsion_file,
+                produce_simplified_pt_file=True,
+                total_derivatives=total_derivatives,
+                solution_method=solution_method,
+            ),
+            ivc_loop,
+        )
+        wing_areas[total_derivatives, solution_method] = problem_loop.get_val(
+            "wing_area", units="m**2"
+        )
+
+    assert_allclose(wing_areas["fd", "optimizer"], 9.97, atol=1e-2)
+    assert_allclose(wing_areas["analytic", "optimizer"], 9.97, atol=1e-2)
+    assert_allclose(wing_areas["analytic", "newton"], 9.97, atol=1e-2)
+
+
 @pytest.mark.skipif(IN_GITHUB_ACTIONS, reason="This test is not meant to run in Github Actions.")
 def test_inspect_octo_propulsion():
     propulsion_file = pth.join(DATA_FOLDER_PATH, "octo_assembly.yml")
@@ -61,6 +61,31 @@ class UpdateWingAreaGroupDEP(om.Group):
             desc="Boolean to split powertrain architecture into smaller branches",
             allow_none=False,
         )
+        self.options.declare(
+            name="cache_nested_problem",
+            default=True,
+            types=bool,
+            desc="Boolean to build the problem that finds the wing area only once and reuse it, "
+            "starting each optimization from the previous solution, rather than building it at "
+            "each computation",
+        )
+        self.options.declare(
+            name="total_derivatives",
+            default="fd",
+            values=["analytic", "fd"],
+            desc="How the optimizer gets the derivatives of the equilibrium with respect to the "
+            "wing area. With analytic, they are computed from the partials of the components. "
+            "With fd, they are approximated by finite differences of the whole equilibrium",
+        )
+        self.options.declare(
+            name="solution_method",
+            default="optimizer",
+            values=["optimizer", "newton"],
+            desc="How the wing area is found. With optimizer, the smallest wing area at the "
+            "equilibrium is found with SLSQP. With newton, the wing area for which the angle of "
+            "attack is the maximum one is found with a Newton solve, which falls back to the "
+            "optimizer if the solution does not satisfy the thrust and elevator constraints",
+        )
 
     def setup(self):
         """Adding the update groups, the selection of the maximum and the constraints."""
@@ -77,6 +102,9 @@ class UpdateWingAreaGroupDEP(om.Group):
                 power_train_file_path=self.options["power_train_file_path"],
                 sort_component=self.options["sort_component"],
                 produce_simplified_pt_file=self.options["produce_simplified_pt_file"],
+                cache_nested_problem=self.options["cache_nested_problem"],
+                total_derivatives=self.options["total_derivatives"],
+                solution_method=self.options["solution_method"],
             ),
             promotes_inputs=["*"],
             promotes_outputs=[],
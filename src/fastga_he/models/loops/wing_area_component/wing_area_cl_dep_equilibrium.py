@@ -56,6 +56,16 @@ class UpdateWingAreaLiftDEPEquilibrium(om.ExplicitComponent):
         self.simplified_file_path = None
         self.control_parameter_list = None
 
+        # Problem used to find the wing area, built at the first computation and reused for the
+        # following ones if cache_nested_problem is True. The optimization can then start from
+        # the last solution found, if it was deemed valid.
+        self._wing_area_problem = None
+        # Same for the problem that finds the wing area with a Newton solve, if it is used
+        self._wing_area_newton_problem = None
+        self._warm_start = False
+        # Problem that was run last, only that one can start from its solution
+        self._last_solution_problem = None
+
     def initialize(self):
         self.options.declare("propulsion_id", default=None, types=str, allow_none=True)
         self.options.declare(
@@ -75,8 +85,38 @@ class UpdateWingAreaLiftDEPEquilibrium(om.ExplicitComponent):
             desc="Boolean to split powertrain architecture into smaller branches",
             allow_none=False,
         )
+        self.options.declare(
+            name="cache_nested_problem",
+            default=True,
+            types=bool,
+            desc="Boolean to build the problem that finds the wing area only once and reuse it, "
+            "starting each optimization from the previous solution, rather than building it at "
+            "each computation",
+        )
+        self.options.declare(
+            name="total_derivatives",
+            default="fd",
+            values=["analytic", "fd"],
+            desc="How the optimizer gets the derivatives of the equilibrium with respect to the "
+            "wing area. With analytic, they are computed from the partials of the components. "
+            "With fd, they are approximated by finite differences of the whole equilibrium",
+        )
+        self.options.declare(
+            name="solution_method",
+            default="optimizer",
+            values=["optimizer", "newton"],
+            desc="How the wing area is found. With optimizer, the smallest wing area at the "
+            "equilibrium is found with SLSQP. With newton, the wing area for which the angle of "
+            "attack is the maximum one is found with a Newton solve, which falls back to the "
+            "optimizer if the solution does not satisfy the thrust and elevator constraints",
+        )
 
     def setup(self):
+        self._wing_area_problem = None
+        self._wing_area_newton_problem = None
+        self._warm_start = False
+        self._last_solution_problem = None
+
         if self.options["power_train_file_path"]:
             self.configurator.load(self.options["power_train_file_path"])
             if self.options["produce_simplified_pt_file"]:
@@ -149,6 +189,14 @@ class UpdateWingAreaLiftDEPEquilibrium(om.ExplicitComponent):
             os.remove(self.simplified_file_path)
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        if self.options["cache_nested_problem"]:
+            wing_area_approach = self._compute_wing_area_cached_problem(inputs)
+        else:
+            wing_area_approach = self._compute_wing_area_new_problem(inputs)
+
+        outputs["wing_area"] = wing_area_approach
+
+    def _compute_wing_area_new_problem(self, inputs):
         if self.options["power_train_file_path"]:
             if self.options["produce_simplified_pt_file"]:
                 self.simplified_file_path = self.configurator.produce_simplified_pt_file_copy()
@@ -157,11 +205,7 @@ class UpdateWingAreaLiftDEPEquilibrium(om.ExplicitComponent):
 
         # First, compute a failsafe value, in case the computation crashes because of the wrong
         # initial guesses of the problem
-        stall_speed = inputs["data:TLAR:v_approach"] / 1.3
-        mlw = inputs["data:weight:aircraft:MLW"]
-        max_cl = inputs["data:aerodynamics:aircraft:landing:CL_max"]
-
-        wing_area_landing_init_guess = 2 * mlw * g / (stall_speed**2) / (1.225 * max_cl)
+        wing_area_landing_init_guess = get_wing_area_landing_init_guess(inputs)
 
         wing_area_approach = compute_wing_area(
             inputs,
@@ -169,6 +213,8 @@ class UpdateWingAreaLiftDEPEquilibrium(om.ExplicitComponent):
             self.simplified_file_path,
             self.control_parameter_list,
             self.options["sort_component"],
+            total_derivatives=self.options["total_derivatives"],
+            solution_method=self.options["solution_method"],
         )
 
         # Again with the damned optimizer. It can sometimes happen that he simply does not care
@@ -185,12 +231,110 @@ class UpdateWingAreaLiftDEPEquilibrium(om.ExplicitComponent):
                 "Wing area too far from potential data, taking backup value for this iteration"
             )
 
-        outputs["wing_area"] = wing_area_approach
-
         if self.options["power_train_file_path"] and self.options["produce_simplified_pt_file"]:
             # We can now delete the temp .yml we created, just to avoid over-clogging the repo
             os.remove(self.simplified_file_path)
 
+        return wing_area_approach
+
+    def _compute_wing_area_cached_problem(self, inputs):
+        # To deactivate all the logging messages from matplotlib
+        logging.getLogger("matplotlib.font_manager").disabled = True
+        logging.getLogger("matplotlib.pyplot").disabled = True
+
+        wing_area_landing_init_guess = get_wing_area_landing_init_guess(inputs)
+
+        try:
+            wing_area_approach = None
+
+            if self.options["solution_method"] == "newton":
+                if self._wing_area_newton_problem is None:
+                    self._wing_area_newton_problem = self._build_cached_problem(
+                        build_wing_area_newton_problem, inputs
+                    )
+
+                wing_area_approach = run_wing_area_newton_problem(
+                    self._wing_area_newton_problem,
+                    inputs,
+                    warm_start=self._warm_start
+                    and self._last_solution_problem is self._wing_area_newton_problem,
+                )
+                self._last_solution_problem = self._wing_area_newton_problem
+
+            # The optimizer is only built if it is needed, i.e. if it is the solution method or
+            # if the Newton solve did not find a valid solution
+            if wing_area_approach is None:
+                if self._wing_area_problem is None:
+                    self._wing_area_problem = self._build_cached_problem(
+                        build_wing_area_problem,
+                        inputs,
+                        total_derivatives=self.options["total_derivatives"],
+                    )
+
+                wing_area_approach = run_wing_area_problem(
+                    self._wing_area_problem,
+                    inputs,
+                    warm_start=self._warm_start
+                    and self._last_solution_problem is self._wing_area_problem,
+                )
+                self._last_solution_problem = self._wing_area_problem
+
+            is_valid_solution = np.all(np.isfinite(wing_area_approach))
+
+        except RuntimeError:
+            wing_area_approach = wing_area_landing_init_guess
+            is_valid_solution = False
+
+        # To reactivate them
+        logging.getLogger("matplotlib.font_manager").disabled = False
+        logging.getLogger("matplotlib.pyplot").disabled = False
+
+        # Same filter as when building a new problem, a solution that was filtered out is not
+        # used as a starting point for the next computation
+        if (
+            wing_area_approach > 1.2 * wing_area_landing_init_guess
+            or wing_area_approach < 1.1 * MIN_WING_AREA
+        ):
+            wing_area_approach = wing_area_landing_init_guess
+            is_valid_solution = False
+            _LOGGER.info(
+                "Wing area too far from potential data, taking backup value for this iteration"
+            )
+
+        self._warm_start = bool(is_valid_solution)
+
+        return wing_area_approach
+
+    def _build_cached_problem(self, build_function, inputs, **kwargs) -> om.Problem:
+        """
+        Builds one of the problems that find the wing area with the options of the component.
+        The power train file is only read during the setup of the problem, so the simplified
+        copy is created for it and deleted right after.
+
+        :param build_function: build_wing_area_problem or build_wing_area_newton_problem.
+        :param inputs: inputs of the wing area component.
+        :param kwargs: additional arguments of the build function.
+        """
+
+        if self.options["power_train_file_path"]:
+            if self.options["produce_simplified_pt_file"]:
+                self.simplified_file_path = self.configurator.produce_simplified_pt_file_copy()
+            else:
+                self.simplified_file_path = self.options["power_train_file_path"]
+
+        try:
+            return build_function(
+                inputs,
+                self.options["propulsion_id"],
+                self.simplified_file_path,
+                self.control_parameter_list,
+                self.options["sort_component"],
+                **kwargs,
+            )
+        finally:
+            if self.options["power_train_file_path"] and self.options["produce_simplified_pt_file"]:
+                os.remove(self.simplified_file_path)
+
 
 @oad.RegisterSubmodel(
     SUBMODEL_WING_AREA_AERO_CONS,
@@ -256,12 +400,369 @@ class _IDThrustRate(om.ExplicitComponent):
 
 
 def compute_wing_area(
-    inputs, propulsion_id, pt_file_path, control_parameter_list, sort_component
+    inputs,
+    propulsion_id,
+    pt_file_path,
+    control_parameter_list,
+    sort_component,
+    total_derivatives: str = "fd",
+    solution_method: str = "optimizer",
 ) -> float:
     # To deactivate all the logging messages from matplotlib
     logging.getLogger("matplotlib.font_manager").disabled = True
     logging.getLogger("matplotlib.pyplot").disabled = True
 
+    # For some reasons that I don't understand, the driver can sometime fail even with
+    # coherent value (at the 6 iteration of the MDA) while it works with absurd value (first
+    # and second iteration). Yes I'm salty and I don't know where the debug message linked
+    # with matplotlib come from
+
+    try:
+        wing_area_approach = None
+
+        if solution_method == "newton":
+            problem = build_wing_area_newton_problem(
+                inputs, propulsion_id, pt_file_path, control_parameter_list, sort_component
+            )
+            wing_area_approach = run_wing_area_newton_problem(problem, inputs, warm_start=False)
+
+        if wing_area_approach is None:
+            problem = build_wing_area_problem(
+                inputs,
+                propulsion_id,
+                pt_file_path,
+                control_parameter_list,
+                sort_component,
+                total_derivatives=total_derivatives,
+            )
+            wing_area_approach = run_wing_area_problem(problem, inputs, warm_start=False)
+
+    except RuntimeError:
+        wing_area_approach = get_wing_area_landing_init_guess(inputs)
+
+    # To reactivate them
+    logging.getLogger("matplotlib.font_manager").disabled = False
+    logging.getLogger("matplotlib.pyplot").disabled = False
+
+    return wing_area_approach
+
+
+def get_wing_area_landing_init_guess(inputs) -> float:
+    """
+    Returns the wing area needed to reach the approach speed with the maximum lift coefficient
+    in landing configuration, without accounting for the equilibrium.
+    """
+
+    stall_speed = inputs["data:TLAR:v_approach"] / 1.3
+    mlw = inputs["data:weight:aircraft:MLW"]
+    max_cl = inputs["data:aerodynamics:aircraft:landing:CL_max"]
+
+    return 2 * mlw * g / (stall_speed**2) / (1.225 * max_cl)
+
+
+def build_wing_area_problem(
+    inputs,
+    propulsion_id,
+    pt_file_path,
+    control_parameter_list,
+    sort_component,
+    total_derivatives: str = "fd",
+) -> om.Problem:
+    """
+    Builds and sets up the problem that finds the minimum wing area for which the aircraft is at
+    the equilibrium at approach speed. The value of the inputs and the bounds of the design
+    variable and constraints are only set when running it, so that the same problem can be
+    reused for different inputs.
+
+    :param inputs: inputs of the wing area component, used for the shape of the variables.
+    :param propulsion_id: ID of propulsion wrapped to be used for computation of equilibrium.
+    :param pt_file_path: Path to the powertrain file.
+    :param control_parameter_list: a list of control parameters to rename.
+    :param sort_component: Option for powertrain component sorting.
+    :param total_derivatives: "fd" to approximate the derivatives of the constraints with
+    respect to the wing area by finite differences of the whole model, as the component does by
+    default, "analytic" to compute them from the partials of the components.
+    """
+
+    problem = _build_equilibrium_problem(
+        inputs, propulsion_id, pt_file_path, control_parameter_list, sort_component
+    )
+
+    # SLSQP uses gradient ?
+    problem.driver = om.ScipyOptimizeDriver()
+    problem.driver.options["disp"] = False
+    problem.driver.options["optimizer"] = "SLSQP"
+    problem.driver.options["maxiter"] = 100
+    problem.driver.options["tol"] = 1e-4
+
+    # Bounds are placeholders, they depend on the inputs and are set before each run
+    problem.model.add_design_var(
+        name="data:geometry:wing:area", units="m**2", lower=MIN_WING_AREA, upper=np.inf
+    )
+
+    problem.model.add_objective(name="data:geometry:wing:area", units="m**2")
+
+    problem.model.add_constraint(name="alpha", units="deg", lower=0.0, upper=np.inf)
+    problem.model.add_constraint(name="thrust_rate", lower=0.0, upper=1.0)
+    problem.model.add_constraint(name="delta_m", lower=-np.inf, upper=np.inf)
+
+    if total_derivatives == "fd":
+        problem.model.approx_totals()
+        problem.setup()
+    else:
+        # The model is feed-forward around the equilibrium, whose own direct solver handles the
+        # coupling, so the default linear solver of the model is enough. There is only one
+        # design variable for four responses so the forward mode needs a single linear solve.
+        problem.setup(mode="fwd")
+
+    return problem
+
+
+def build_wing_area_newton_problem(
+    inputs, propulsion_id, pt_file_path, control_parameter_list, sort_component
+) -> om.Problem:
+    """
+    Builds and sets up the problem that finds, with a Newton solve, the wing area for which the
+    aircraft is at the equilibrium at approach speed with the maximum angle of attack. This is
+    the solution of the problem built by build_wing_area_problem when the angle of attack is the
+    active constraint, which is checked when running it. The value of the inputs and of the
+    maximum angle of attack are only set when running it.
+
+    :param inputs: inputs of the wing area component, used for the shape of the variables.
+    :param propulsion_id: ID of propulsion wrapped to be used for computation of equilibrium.
+    :param pt_file_path: Path to the powertrain file.
+    :param control_parameter_list: a list of control parameters to rename.
+    :param sort_component: Option for powertrain component sorting.
+    """
+
+    problem = _build_equilibrium_problem(
+        inputs,
+        propulsion_id,
+        pt_file_path,
+        control_parameter_list,
+        sort_component,
+        add_alpha_max=True,
+    )
+    model = problem.model
+
+    wing_area_balance = om.BalanceComp()
+    wing_area_balance.add_balance(
+        "data:geometry:wing:area",
+        val=10.0,
+        units="m**2",
+        eq_units="deg",
+        lhs_name="alpha",
+        rhs_name="alpha_max",
+        lower=MIN_WING_AREA,
+    )
+    model.add_subsystem("wing_area_balance", wing_area_balance, promotes=["*"])
+
+    model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
+    model.nonlinear_solver.linesearch = om.BoundsEnforceLS()
+    model.nonlinear_solver.options["iprint"] = 0
+    model.nonlinear_solver.options["maxiter"] = 30
+    model.nonlinear_solver.options["rtol"] = 1e-8
+    model.nonlinear_solver.options["atol"] = 1e-8
+    model.nonlinear_solver.options["err_on_non_converge"] = True
+    model.linear_solver = om.DirectSolver()
+
+    problem.setup()
+
+    return problem
+
+
+def _build_equilibrium_problem(
+    inputs,
+    propulsion_id,
+    pt_file_path,
+    control_parameter_list,
+    sort_component,
+    add_alpha_max: bool = False,
+) -> om.Problem:
+    """
+    Returns a problem, not yet set up, that computes the equilibrium of the aircraft at approach
+    speed for a given wing area.
+
+    :param inputs: inputs of the wing area component, used for the shape of the variables.
+    :param propulsion_id: ID of propulsion wrapped to be used for computation of equilibrium.
+    :param pt_file_path: Path to the powertrain file.
+    :param control_parameter_list: a list of control parameters to rename.
+    :param sort_component: Option for powertrain component sorting.
+    :param add_alpha_max: if True, the maximum angle of attack is added to the inputs.
+    """
+
+    input_zip, inputs_name_for_promotion = zip_equilibrium_input(
+        propulsion_id, pt_file_path, sort_component, control_parameter_list
+    )
+
+    ivc = om.IndepVarComp()
+    for var_names, var_unit, _, _, _, _ in input_zip:
+        if var_names[:5] == "data:" and var_names != "data:geometry:wing:area":
+            ivc.add_output(
+                name=var_names,
+                val=inputs[var_names],
+                units=var_unit,
+                shape=np.shape(inputs[var_names]),
+            )
+
+    ivc.add_output(name="d_vx_dt", val=np.array([0.0]), units="m/s**2")
+    ivc.add_output(name="mass", val=np.array([np.nan]), units="kg")
+    # x_cg should be evaluated at the worst case scenario so either max aft or max fwd
+    ivc.add_output(name="x_cg", val=np.array([np.nan]), units="m")
+    ivc.add_output(name="gamma", val=np.array([0.0]), units="deg")
+    ivc.add_output(name="altitude", val=np.array([0.0]), units="m")
+    ivc.add_output(name="density", val=Atmosphere(np.array([0.0])).density, units="kg/m**3")
+    ivc.add_output(name="exterior_temperature", val=Atmosphere(0.0).temperature, units="degK")
+    # Time step is not important since we don't care about the fuel consumption
+    ivc.add_output(name="time_step", val=np.array([0.1]), units="s")
+    ivc.add_output(name="true_airspeed", val=np.array([np.nan]), units="m/s")
+    ivc.add_output(name="engine_setting", val=np.array([EngineSetting.TAKEOFF]))
+    if add_alpha_max:
+        ivc.add_output(name="alpha_max", val=np.array([np.nan]), units="deg")
+
+    problem = om.Problem(reports=False)
+    model = problem.model
+
+    model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
+
+    option_equilibrium = {
+        "number_of_points": 1,
+        "promotes_all_variables": True,
+        "propulsion_id": propulsion_id,
+        "power_train_file_path": pt_file_path,
+        "flaps_position": "landing",
+        "sort_component": sort_component,
+        "low_speed_aero": True,
+    }
+    model.add_subsystem(
+        "equilibrium",
+        oad.RegisterSubmodel.get_submodel(HE_SUBMODEL_EQUILIBRIUM, options=option_equilibrium),
+        promotes_inputs=inputs_name_for_promotion,
+        promotes_outputs=["*"],
+    )
+    model.add_subsystem("thrust_rate_id", _IDThrustRate(), promotes=["*"])
+
+    if pt_file_path:
+        configurator = FASTGAHEPowerTrainConfigurator()
+        configurator.load(pt_file_path)
+        slip_ins, perf_outs = configurator.get_performances_to_slipstream_element_lists()
+
+        for perf_out, slip_in in zip(perf_outs, slip_ins):
+            model.connect("power_train_performances." + perf_out, slip_in)
+
+    model.equilibrium.nonlinear_solver.options["rtol"] = 1e-8
+    model.equilibrium.nonlinear_solver.options["atol"] = 1e-8
+
+    return problem
+
+
+def run_wing_area_problem(problem: om.Problem, inputs, warm_start: bool) -> float:
+    """
+    Runs the problem built by build_wing_area_problem for the given inputs and returns the wing
+    area in approach conditions.
+
+    :param problem: the problem to run, already set up.
+    :param inputs: inputs of the wing area component.
+    :param warm_start: if True, the optimization starts from the solution of the previous run of
+    the problem (wing area, angle of attack, elevator angle and thrust), otherwise from the
+    default initial guesses.
+    """
+
+    approach_conditions = _set_approach_conditions(problem, inputs, warm_start)
+    alpha_max = approach_conditions["alpha_max"]
+    min_elevator_angle = approach_conditions["min_elevator_angle"]
+
+    problem.model.set_design_var_options(
+        "data:geometry:wing:area",
+        lower=MIN_WING_AREA,
+        upper=2.0 * approach_conditions["wing_area_landing_init_guess"],
+    )
+    problem.model.set_constraint_options("alpha", lower=0.0, upper=alpha_max)
+    problem.model.set_constraint_options(
+        "delta_m",
+        lower=min_elevator_angle,
+        upper=abs(min_elevator_angle),
+    )
+
+    # This cause the logger to log a bunch of useless matplotlib information, question is,
+    # how to turn it off
+    problem.run_driver()
+
+    wing_area_approach = problem.get_val("data:geometry:wing:area", units="m**2")
+    print("Wing area in approach conditions", wing_area_approach)
+    print(
+        "Constraints: alpha/alpha_max; thrust; delta/delta_max: delta_cl",
+        problem["alpha"] / alpha_max,
+        problem["thrust_rate"],
+        problem["delta_m"] / min_elevator_angle,
+        problem["delta_Cl"],
+    )
+
+    return wing_area_approach
+
+
+def run_wing_area_newton_problem(problem: om.Problem, inputs, warm_start: bool):
+    """
+    Runs the problem built by build_wing_area_newton_problem for the given inputs and returns the
+    wing area in approach conditions. Returns None if the Newton solve does not converge or if
+    the solution does not satisfy the thrust rate and elevator angle constraints, in which case
+    the wing area has to be found with the optimizer.
+
+    :param problem: the problem to run, already set up.
+    :param inputs: inputs of the wing area component.
+    :param warm_start: if True, the Newton solve starts from the solution of the previous run of
+    the problem (wing area, angle of attack, elevator angle and thrust), otherwise from the
+    default initial guesses.
+    """
+
+    approach_conditions = _set_approach_conditions(problem, inputs, warm_start)
+    min_elevator_angle = approach_conditions["min_elevator_angle"]
+
+    problem.set_val(
+        "alpha_max", np.array([approach_conditions["alpha_max"]]).flatten(), units="deg"
+    )
+
+    try:
+        problem.run_model()
+    except om.AnalysisError:
+        _LOGGER.info("Newton solve of the wing area did not converge, using the optimizer instead")
+        return None
+
+    wing_area_approach = problem.get_val("data:geometry:wing:area", units="m**2")
+    thrust_rate = problem.get_val("thrust_rate")
+    delta_m = problem.get_val("delta_m", units="deg")
+
+    if (
+        np.any(thrust_rate < 0.0)
+        or np.any(thrust_rate > 1.0)
+        or np.any(delta_m < min_elevator_angle)
+        or np.any(delta_m > abs(min_elevator_angle))
+        or not np.all(np.isfinite(wing_area_approach))
+    ):
+        _LOGGER.info(
+            "Angle of attack is not the active constraint of the wing area, using the optimizer "
+            "instead"
+        )
+        return None
+
+    _LOGGER.debug("Wing area in approach conditions: %s", wing_area_approach)
+
+    return wing_area_approach
+
+
+def _set_approach_conditions(problem: om.Problem, inputs, warm_start: bool) -> dict:
+    """
+    Sets the inputs and the initial guesses of one of the problems that find the wing area and
+    returns the approach conditions computed from the inputs: maximum angle of attack, minimum
+    elevator angle and wing area without equilibrium.
+
+    :param problem: the problem to run, already set up.
+    :param inputs: inputs of the wing area component.
+    :param warm_start: if True, the wing area, angle of attack, elevator angle and thrust of the
+    previous run are kept as initial guesses, the wing area being only brought back within its
+    bounds.
+    """
+
     # First, setup an initial guess
     stall_speed = inputs["data:TLAR:v_approach"] / 1.3
     mlw = inputs["data:weight:aircraft:MLW"]
@@ -286,129 +787,33 @@ def compute_wing_area(
         inputs["data:mission:sizing:takeoff:elevator_angle"],
     )
 
-    wing_area_landing_init_guess = 2 * mlw * g / (stall_speed**2) / (1.225 * max_cl)
+    wing_area_landing_init_guess = get_wing_area_landing_init_guess(inputs)
 
-    # For some reasons that I don't understand, the driver can sometime fail even with
-    # coherent value (at the 6 iteration of the MDA) while it works with absurd value (first
-    # and second iteration). Yes I'm salty and I don't know where the debug message linked
-    # with matplotlib come from
+    for var_name in problem.model.ivc.get_io_metadata(iotypes="output", metadata_keys=[]):
+        if var_name[:5] == "data:":
+            problem.set_val(var_name, inputs[var_name])
 
-    try:
-        input_zip, inputs_name_for_promotion = zip_equilibrium_input(
-            propulsion_id, pt_file_path, sort_component, control_parameter_list
-        )
-
-        ivc = om.IndepVarComp()
-        for var_names, var_unit, _, _, _, _ in input_zip:
-            if var_names[:5] == "data:" and var_names != "data:geometry:wing:area":
-                ivc.add_output(
-                    name=var_names,
-                    val=inputs[var_names],
-                    units=var_unit,
-                    shape=np.shape(inputs[var_names]),
-                )
-
-        ivc.add_output(name="d_vx_dt", val=np.array([0.0]), units="m/s**2")
-        ivc.add_output(name="mass", val=np.array([mlw]), units="kg")
-        # x_cg should be evaluated at the worst case scenario so either max aft or max fwd
-        ivc.add_output(name="x_cg", val=np.array([cg_max_fwd]), units="m")
-        ivc.add_output(name="gamma", val=np.array([0.0]), units="deg")
-        ivc.add_output(name="altitude", val=np.array([0.0]), units="m")
-        ivc.add_output(name="density", val=Atmosphere(np.array([0.0])).density, units="kg/m**3")
-        ivc.add_output(name="exterior_temperature", val=Atmosphere(0.0).temperature, units="degK")
-        # Time step is not important since we don't care about the fuel consumption
-        ivc.add_output(name="time_step", val=np.array([0.1]), units="s")
-        ivc.add_output(name="true_airspeed", val=np.array([stall_speed]), units="m/s")
-        ivc.add_output(name="engine_setting", val=np.array([EngineSetting.TAKEOFF]))
-
-        problem = om.Problem(reports=False)
-        model = problem.model
-
-        model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
-
-        option_equilibrium = {
-            "number_of_points": 1,
-            "promotes_all_variables": True,
-            "propulsion_id": propulsion_id,
-            "power_train_file_path": pt_file_path,
-            "flaps_position": "landing",
-            "sort_component": sort_component,
-            "low_speed_aero": True,
-        }
-        model.add_subsystem(
-            "equilibrium",
-            oad.RegisterSubmodel.get_submodel(HE_SUBMODEL_EQUILIBRIUM, options=option_equilibrium),
-            promotes_inputs=inputs_name_for_promotion,
-            promotes_outputs=["*"],
-        )
-        model.add_subsystem("thrust_rate_id", _IDThrustRate(), promotes=["*"])
-
-        if pt_file_path:
-            configurator = FASTGAHEPowerTrainConfigurator()
-            configurator.load(pt_file_path)
-            slip_ins, perf_outs = configurator.get_performances_to_slipstream_element_lists()
-
-            for perf_out, slip_in in zip(perf_outs, slip_ins):
-                model.connect("power_train_performances." + perf_out, slip_in)
-
-        # SLSQP uses gradient ?
-        problem.driver = om.ScipyOptimizeDriver()
-        problem.driver.options["disp"] = False
-        problem.driver.options["optimizer"] = "SLSQP"
-        problem.driver.options["maxiter"] = 100
-        problem.driver.options["tol"] = 1e-4
-
-        problem.model.equilibrium.nonlinear_solver.options["rtol"] = 1e-8
-        problem.model.equilibrium.nonlinear_solver.options["atol"] = 1e-8
-
-        problem.model.add_design_var(
-            name="data:geometry:wing:area",
-            units="m**2",
-            lower=MIN_WING_AREA,
-            upper=2.0 * wing_area_landing_init_guess,
-        )
-
-        problem.model.add_objective(name="data:geometry:wing:area", units="m**2")
+    problem.set_val("mass", np.array([mlw]).flatten(), units="kg")
+    problem.set_val("x_cg", np.array([cg_max_fwd]).flatten(), units="m")
+    problem.set_val("true_airspeed", np.array([stall_speed]).flatten(), units="m/s")
 
-        problem.model.add_constraint(name="alpha", units="deg", lower=0.0, upper=alpha_max)
-        problem.model.add_constraint(name="thrust_rate", lower=0.0, upper=1.0)
-        problem.model.add_constraint(
-            name="delta_m",
-            lower=min_elevator_angle,
-            upper=abs(min_elevator_angle),
+    if warm_start:
+        # The previous solution is kept, the wing area is only brought back within its new
+        # bounds
+        problem["data:geometry:wing:area"] = np.clip(
+            problem["data:geometry:wing:area"], MIN_WING_AREA, 2.0 * wing_area_landing_init_guess
         )
-
-        problem.model.approx_totals()
-
-        problem.setup()
-
+    else:
         problem["data:geometry:wing:area"] = wing_area_landing_init_guess
         problem["delta_m"] = np.array(0.9 * min_elevator_angle)
         problem["alpha"] = np.array(0.9 * alpha_max)
         problem["thrust"] = np.array(mlw / 1.3)
 
-        # This cause the logger to log a bunch of useless matplotlib information, question is,
-        # how to turn it off
-        problem.run_driver()
-
-        wing_area_approach = problem.get_val("data:geometry:wing:area", units="m**2")
-        print("Wing area in approach conditions", wing_area_approach)
-        print(
-            "Constraints: alpha/alpha_max; thrust; delta/delta_max: delta_cl",
-            problem["alpha"] / alpha_max,
-            problem["thrust_rate"],
-            problem["delta_m"] / min_elevator_angle,
-            problem["delta_Cl"],
-        )
-
-    except RuntimeError:
-        wing_area_approach = wing_area_landing_init_guess
-
-    # To reactivate them
-    logging.getLogger("matplotlib.font_manager").disabled = False
-    logging.getLogger("matplotlib.pyplot").disabled = False
-
-    return wing_area_approach
+    return {
+        "alpha_max": alpha_max,
+        "min_elevator_angle": min_elevator_angle,
+        "wing_area_landing_init_guess": wing_area_landing_init_guess,
+    }
 
 
 def zip_equilibrium_input(propulsion_id, pt_file_path, sort_component, control_parameter_list=None):
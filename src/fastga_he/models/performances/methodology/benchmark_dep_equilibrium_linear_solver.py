@@ -0,0 +1,154 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import os.path as pth
+import time
+
+import numpy as np
+import openmdao.api as om
+from fastoad.module_management._plugins import FastoadLoader
+
+# Ensures the submodels required by the mission are registered before importing the models, as
+# it is done for the tests
+FastoadLoader()
+
+from fastga_he.models.performances.mission_vector.mission_vector import MissionVector  # noqa: E402
+from fastga_he.models.propulsion.assemblers.sizing_from_pt_file import (  # noqa: E402
+    PowerTrainSizingFromFile,
+)
+
+from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs  # noqa: E402
+
+TEST_FILE_PATH = pth.join(pth.dirname(__file__), "..", "units_tests", "test_mission_vector.py")
+DATA_FOLDER_PATH = pth.join(pth.dirname(TEST_FILE_PATH), "data")
+XML_FILE = "sample_turboshaft_propulsion.xml"
+PT_FILE = "turboshaft_propulsion.yml"
+
+# Number of points in each phase of the mission
+NB_POINTS_PER_PHASE_LIST = [50, 100, 250, 500]
+
+# Linear solvers compared on each mission
+LINEAR_SOLVER_TYPE_LIST = ["sparse", "point_block"]
+
+# The dense matrix is built with one linear operation per unknown and grows with the square of
+# the number of points, it already takes about four minutes per run with 10 points per phase so
+# it is only run with that number of points as a reference
+NB_POINTS_PER_PHASE_DENSE = 10
+
+# Number of times the mission is rerun once the problem is set up
+NB_LOOPS_TEST = 1
+
+
+def get_mission_group(nb_points_per_phase: int, linear_solver_type: str) -> om.Group:
+    """
+    Returns a group with the sizing of the powertrain and the mission, each phase of the mission
+    having the same number of points.
+    """
+
+    pt_file_path = pth.join(DATA_FOLDER_PATH, PT_FILE)
+
+    group = om.Group()
+    group.add_subsystem(
+        "pt_sizing", PowerTrainSizingFromFile(power_train_file_path=pt_file_path), promotes=["*"]
+    )
+    group.add_subsystem(
+        "mission_vector",
+        MissionVector(
+            number_of_points_climb=nb_points_per_phase,
+            number_of_points_cruise=nb_points_per_phase,
+            number_of_points_descent=nb_points_per_phase,
+            number_of_points_reserve=nb_points_per_phase,
+            power_train_file_path=pt_file_path,
+            use_linesearch=False,
+            linear_solver_type=linear_solver_type,
+        ),
+        promotes=["*"],
+    )
+
+    return group
+
+
+def time_mission(nb_points_per_phase: int, linear_solver_type: str):
+    """
+    Returns the mean time taken to run the mission once the problem is set up, the part of that
+    time spent in the linearization of the equilibrium (which includes the factorization) and in
+    the linear solves, as well as the fuel consumed to check that the results are the same.
+    """
+
+    ivc = get_indep_var_comp(
+        list_inputs(get_mission_group(nb_points_per_phase, linear_solver_type)),
+        TEST_FILE_PATH,
+        XML_FILE,
+    )
+    problem = run_system(get_mission_group(nb_points_per_phase, linear_solver_type), ivc)
+
+    equilibrium = problem.model.component.mission_vector.solve_equilibrium.compute_dep_equilibrium
+    linear_solver = equilibrium.linear_solver
+
+    linearize_time = np.zeros(1)
+    solve_time = np.zeros(1)
+
+    original_linearize = linear_solver._linearize
+    original_solve = linear_solver.solve
+
+    def timed_linearize():
+        start = time.perf_counter()
+        original_linearize()
+        linearize_time[0] += time.perf_counter() - start
+
+    def timed_solve(*args, **kwargs):
+        start = time.perf_counter()
+        original_solve(*args, **kwargs)
+        solve_time[0] += time.perf_counter() - start
+
+    linear_solver._linearize = timed_linearize
+    linear_solver.solve = timed_solve
+
+    start = time.perf_counter()
+    for _ in range(NB_LOOPS_TEST):
+        problem.run_model()
+    run_time = (time.perf_counter() - start) / NB_LOOPS_TEST
+
+    fuel = problem.get_val("data:mission:sizing:fuel", units="kg")[0]
+
+    return (
+        run_time,
+        linearize_time[0] / NB_LOOPS_TEST,
+        solve_time[0] / NB_LOOPS_TEST,
+        fuel,
+    )
+
+
+def print_timer(nb_points_per_phase: int, linear_solver_type: str):
+    """
+    Prints the timers of the mission with the given number of points and linear solver.
+    """
+
+    mean_run, mean_linearize, mean_solve, fuel_mission = time_mission(
+        nb_points_per_phase, linear_solver_type
+    )
+    print(
+        "Timer for "
+        + str(nb_points_per_phase)
+        + " points per phase with the "
+        + linear_solver_type
+        + " linear solver, run: "
+        + str(mean_run)
+        + " s, linearization: "
+        + str(mean_linearize)
+        + " s, linear solves: "
+        + str(mean_solve)
+        + " s, fuel: "
+        + str(fuel_mission)
+        + " kg"
+    )
+
+
+if __name__ == "__main__":
+    for linear_solver_type_test in ["dense"] + LINEAR_SOLVER_TYPE_LIST:
+        print_timer(NB_POINTS_PER_PHASE_DENSE, linear_solver_type_test)
+
+    for nb_points_per_phase_test in NB_POINTS_PER_PHASE_LIST:
+        for linear_solver_type_test in LINEAR_SOLVER_TYPE_LIST:
+            print_timer(nb_points_per_phase_test, linear_solver_type_test)
@@ -0,0 +1,111 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import os.path as pth
+import time
+from typing import Tuple
+
+import numpy as np
+import fastoad.api as oad
+from fastoad.module_management._plugins import FastoadLoader
+
+# Ensures the submodels required by the payload range are registered before importing the
+# models, as it is done for the tests
+FastoadLoader()
+
+from fastga_he.models.performances.payload_range.payload_range import ComputePayloadRange  # noqa: E402
+from fastga_he.models.performances.payload_range.op_mission_problem_cache import (  # noqa: E402
+    OperationalMissionProblemCache,
+)
+from fastga_he.models.performances.payload_range.mission_range_from_fuel import (  # noqa: E402
+    OperationalMissionVectorWithTargetFuel,
+)
+
+from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs  # noqa: E402
+
+TEST_FILE_PATH = pth.join(pth.dirname(__file__), "..", "units_tests", "test_mission_vector.py")
+DATA_FOLDER_PATH = pth.join(pth.dirname(TEST_FILE_PATH), "data")
+XML_FILE = "input_payload_range_fuel.xml"
+PT_FILE = "turboshaft_propulsion_for_payload_range.yml"
+
+# Same options as the one used in the payload range computation
+MISSION_OPTIONS = {
+    "number_of_points_climb": 30,
+    "number_of_points_cruise": 30,
+    "number_of_points_descent": 20,
+    "number_of_points_reserve": 10,
+    "pre_condition_pt": True,
+    "use_linesearch": False,
+    "use_apply_nonlinear": False,
+    "variable_name_threshold_fuel": "data:mission:payload_range:target_fuel",
+}
+
+# Number of times the payload range is recomputed, mimics the iterations of an outer MDA loop
+NB_LOOPS_TEST = 5
+
+
+def time_iterations(cache_nested_problem: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the time taken by each recomputation of the payload range when the MTOW varies, as
+    it would in a sizing loop, as well as the part of that time spent preparing the nested
+    operational mission problem.
+    """
+
+    OperationalMissionProblemCache.clear()
+
+    pt_file_path = pth.join(DATA_FOLDER_PATH, PT_FILE)
+    component = ComputePayloadRange(
+        power_train_file_path=pt_file_path, cache_nested_problem=cache_nested_problem
+    )
+
+    ivc = get_indep_var_comp(
+        list_inputs(ComputePayloadRange(power_train_file_path=pt_file_path)),
+        TEST_FILE_PATH,
+        XML_FILE,
+    )
+
+    problem = run_system(component, ivc)
+    mtow = problem.get_val("data:weight:aircraft:MTOW", units="kg")
+
+    iteration_times = np.zeros(NB_LOOPS_TEST)
+    preparation_times = np.zeros(NB_LOOPS_TEST)
+
+    for i in range(NB_LOOPS_TEST):
+        problem.set_val("data:weight:aircraft:MTOW", units="kg", val=mtow * (1.0 + 0.01 * i))
+
+        start = time.perf_counter()
+        problem.run_model()
+        iteration_times[i] = time.perf_counter() - start
+
+        # Same call as the one done at the start of the compute of the payload range
+        inputs = {
+            var_name: problem.get_val(var_name, units=var_unit)
+            for var_name, var_unit in component._nested_input_metadata
+        }
+        start = time.perf_counter()
+        OperationalMissionProblemCache.get_problem(
+            mission_class=OperationalMissionVectorWithTargetFuel,
+            mission_options=MISSION_OPTIONS | {"power_train_file_path": pt_file_path},
+            input_metadata=component._nested_input_metadata,
+            inputs=inputs,
+            model_options=problem.model_options,
+            use_cache=cache_nested_problem,
+        )
+        preparation_times[i] = time.perf_counter() - start
+
+    return iteration_times, preparation_times
+
+
+if __name__ == "__main__":
+    oad.RegisterSubmodel.active_models["submodel.performances.mission_vector.climb_speed"] = None
+    oad.RegisterSubmodel.active_models["submodel.performances.mission_vector.descent_speed"] = None
+
+    times_without_cache, preparation_without_cache = time_iterations(cache_nested_problem=False)
+    times_with_cache, preparation_with_cache = time_iterations(cache_nested_problem=True)
+
+    print("Timer for nested problem preparation without cache", np.mean(preparation_without_cache))
+    print("Timer for nested problem preparation with cache", np.mean(preparation_with_cache))
+    print("Timer per iteration without nested problem cache", np.mean(times_without_cache))
+    print("Timer per iteration with nested problem cache", np.mean(times_with_cache))
+    print("Speedup per iteration", np.mean(times_without_cache) / np.mean(times_with_cache))
@@ -0,0 +1,135 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import os.path as pth
+import tempfile
+import time
+
+import numpy as np
+from fastoad.module_management._plugins import FastoadLoader
+
+# Ensures the components are registered before importing the configurator, as it is done for the
+# tests
+FastoadLoader()
+
+from fastga_he.powertrain_builder.powertrain import FASTGAHEPowerTrainConfigurator  # noqa: E402
+
+# Number of branches of the synthetic architectures, each branch has 4 components and there are 2
+# more components for the bus and the battery, so this goes from 10 to 502 components
+NB_BRANCHES_LIST = [2, 5, 10, 25, 50, 125]
+
+# Number of points in the mission, same order of magnitude as in the mission vector
+NB_POINTS = 90
+
+# Number of times the power is propagated for each architecture, mimics the iterations of the
+# mission solver
+NB_LOOPS_TEST = 20
+
+
+def write_synthetic_architecture(nb_branches: int, file_path: str):
+    """
+    Writes a powertrain file with nb_branches propeller/motor/inverter/sspc branches all fed by
+    the same battery through a bus.
+
+    :param nb_branches: number of propulsive branches in the architecture.
+    :param file_path: path where to write the powertrain file.
+    """
+
+    lines = [
+        "title: Synthetic power train file for the benchmark of the power propagation",
+        "",
+        "power_train_components:",
+    ]
+
+    for i in range(1, nb_branches + 1):
+        lines += [
+            "  propeller_" + str(i) + ":",
+            "    id: fastga_he.pt_component.propeller",
+            "  motor_" + str(i) + ":",
+            "    id: fastga_he.pt_component.pmsm",
+            "  inverter_" + str(i) + ":",
+            "    id: fastga_he.pt_component.inverter",
+            "  dc_sspc_" + str(i) + ":",
+            "    id: fastga_he.pt_component.dc_sspc",
+            "    closed_by_default: True",
+        ]
+
+    lines += [
+        "  dc_bus_1:",
+        "    id: fastga_he.pt_component.dc_bus",
+        "    options:",
+        "      number_of_inputs: 1",
+        "      number_of_outputs: " + str(nb_branches),
+        "  battery_pack_1:",
+        "    id: fastga_he.pt_component.battery_pack",
+        "",
+        "component_connections:",
+    ]
+
+    for i in range(1, nb_branches + 1):
+        lines += [
+            "  - source: propeller_" + str(i),
+            "    target: motor_" + str(i),
+            "  - source: motor_" + str(i),
+            "    target: inverter_" + str(i),
+            "  - source: inverter_" + str(i),
+            "    target: dc_sspc_" + str(i),
+            "  - source: dc_sspc_" + str(i),
+            "    target: [dc_bus_1, " + str(i) + "]",
+        ]
+
+    lines += [
+        "  - source: [dc_bus_1, 1]",
+        "    target: battery_pack_1",
+        "",
+    ]
+
+    with open(file_path, "w") as file:
+        file.write("\n".join(lines))
+
+
+def time_power_propagation(nb_branches: int, folder_path: str):
+    """
+    Returns the time taken by the first propagation of the power in the synthetic architecture,
+    which includes the computation of the propagation plan, and the mean time taken by the
+    following ones.
+
+    :param nb_branches: number of propulsive branches in the architecture.
+    :param folder_path: path to the folder where to write the powertrain file.
+    """
+
+    pt_file_path = pth.join(folder_path, "synthetic_power_train_" + str(nb_branches) + ".yml")
+    write_synthetic_architecture(nb_branches, pt_file_path)
+
+    power_train_configurator = FASTGAHEPowerTrainConfigurator(power_train_file_path=pt_file_path)
+
+    propulsive_power_dict = {
+        "propeller_" + str(i): np.linspace(50e3, 20e3, NB_POINTS) for i in range(1, nb_branches + 1)
+    }
+
+    start = time.perf_counter()
+    power_train_configurator.get_power_to_set(None, propulsive_power_dict)
+    first_call_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(NB_LOOPS_TEST):
+        power_train_configurator.get_power_to_set(None, propulsive_power_dict)
+    mean_call_time = (time.perf_counter() - start) / NB_LOOPS_TEST
+
+    return first_call_time, mean_call_time
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_folder_path:
+        for nb_branches_test in NB_BRANCHES_LIST:
+            first_call, mean_call = time_power_propagation(nb_branches_test, tmp_folder_path)
+            print(
+                "Timer for "
+                + str(4 * nb_branches_test + 2)
+                + " components, first call: "
+                + str(first_call)
+                + " s, following calls: "
+                + str(mean_call)
+                + " s"
+            )
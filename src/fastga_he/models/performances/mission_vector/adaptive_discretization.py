@@ -0,0 +1,264 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import logging
+import os
+import pathlib
+import tempfile
+import time
+from typing import Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+import openmdao.api as om
+import pandas as pd
+from ruamel.yaml import YAML
+
+import fastoad.api as oad
+
+_LOGGER = logging.getLogger(__name__)
+
+# Phases of the mission whose number of points can be refined, the option of the mission that
+# sets their number of points is "number_of_points_" + phase
+PHASES = ["climb", "cruise", "descent", "reserve"]
+
+# Number of points of each phase the refinement starts from
+DEFAULT_INITIAL_NUMBER_OF_POINTS = {"climb": 10, "cruise": 10, "descent": 5, "reserve": 1}
+# Number of points of each phase above which it is not refined anymore, default number of points
+# of the mission except for the reserve
+DEFAULT_MAX_NUMBER_OF_POINTS = {"climb": 100, "cruise": 100, "descent": 50, "reserve": 10}
+
+# Quantities of each phase whose variation is used to estimate the discretization error, the name
+# of the variable is the prefix, the phase and the quantity, e.g.
+# data:mission:sizing:main_route:climb:fuel
+PHASE_QUANTITIES = {"fuel": "kg", "energy": "W*h"}
+
+
+def refine_mission_discretization(
+    run_mission: Callable[[Dict[str, int]], om.Problem],
+    tolerance: float = 1e-3,
+    initial_number_of_points: Optional[Dict[str, int]] = None,
+    max_number_of_points: Optional[Dict[str, int]] = None,
+    monitored_variables: Optional[Dict[str, str]] = None,
+    max_iterations: int = 5,
+    variable_prefix: str = "data:mission:sizing:main_route:",
+) -> Tuple[om.Problem, pd.DataFrame]:
+    """
+    Adapts the number of points of each phase of the mission to the accuracy it requires. The
+    mission is first run on a coarse discretization, then the number of points of all the phases
+    that have not converged yet is doubled and the mission is run again. The discretization
+    error of a phase is estimated as the change in its fuel and energy consumption between the
+    two runs, relative to the consumption of the whole mission. A phase whose error is below the
+    tolerance keeps its number of points for the following runs, the others are refined again,
+    until all the phases have converged or reached their maximum number of points.
+
+    The variables in monitored_variables, e.g. the minimum SOC of a battery, must also have
+    changed by less than the tolerance, relative to their value, for the phases to be
+    considered converged.
+
+    :param run_mission: function that runs the mission with the number of points it is given, as
+    a dictionary of the options of the mission, e.g. {"number_of_points_climb": 10, ...}, and
+    returns the problem.
+    :param tolerance: maximum relative discretization error of each phase.
+    :param initial_number_of_points: number of points of each phase the refinement starts from,
+    keyed by phase. The phases that are not given use the value in
+    DEFAULT_INITIAL_NUMBER_OF_POINTS.
+    :param max_number_of_points: number of points of each phase above which it is not refined,
+    keyed by phase. The phases that are not given use the value in DEFAULT_MAX_NUMBER_OF_POINTS.
+    :param monitored_variables: units of the additional variables whose convergence is checked,
+    keyed by variable name.
+    :param max_iterations: maximum number of refinements.
+    :param variable_prefix: prefix of the variables that contain the consumption of each phase.
+    :return: the problem run with the final number of points and the history of the
+    refinement, with one row per run containing the number of points of each phase, the
+    quantities of each phase, the estimated error of each phase and the time the run took.
+    """
+
+    number_of_points = dict(DEFAULT_INITIAL_NUMBER_OF_POINTS)
+    number_of_points.update(initial_number_of_points or {})
+    max_points = dict(DEFAULT_MAX_NUMBER_OF_POINTS)
+    max_points.update(max_number_of_points or {})
+    monitored_variables = monitored_variables or {}
+
+    converged = {phase: False for phase in PHASES}
+    history = []
+
+    problem, values, run_time = _run_and_read(
+        run_mission, number_of_points, monitored_variables, variable_prefix
+    )
+    history.append(_get_history_row(number_of_points, values, {}, run_time))
+
+    for _ in range(max_iterations):
+        phases_to_refine = [
+            phase
+            for phase in PHASES
+            if not converged[phase] and 2 * number_of_points[phase] <= max_points[phase]
+        ]
+        if not phases_to_refine:
+            break
+
+        refined_number_of_points = dict(number_of_points)
+        for phase in phases_to_refine:
+            refined_number_of_points[phase] = 2 * number_of_points[phase]
+
+        refined_problem, refined_values, run_time = _run_and_read(
+            run_mission, refined_number_of_points, monitored_variables, variable_prefix
+        )
+        errors = _get_phase_errors(values, refined_values)
+        history.append(_get_history_row(refined_number_of_points, refined_values, errors, run_time))
+
+        monitored_converged = all(
+            abs(refined_values[name] - values[name])
+            <= tolerance * max(abs(refined_values[name]), np.finfo(float).eps)
+            for name in monitored_variables
+        )
+        for phase in phases_to_refine:
+            converged[phase] = monitored_converged and errors[phase] <= tolerance
+
+        problem, values, number_of_points = (
+            refined_problem,
+            refined_values,
+            refined_number_of_points,
+        )
+
+        if all(converged.values()):
+            break
+
+    not_converged = [phase for phase in PHASES if not converged[phase]]
+    if not_converged:
+        _LOGGER.warning(
+            "Discretization of the %s phase(s) did not reach the tolerance %g within the "
+            "maximum number of points or of iterations",
+            ", ".join(not_converged),
+            tolerance,
+        )
+    _LOGGER.info(
+        "Final number of points of the mission: %s",
+        ", ".join(phase + ": " + str(number_of_points[phase]) for phase in PHASES),
+    )
+
+    return problem, pd.DataFrame(history)
+
+
+def run_adaptive_mission(
+    configuration_file_path: Union[str, pathlib.Path],
+    mission_path: str = "performances",
+    **kwargs,
+) -> Tuple[oad.FASTOADProblem, pd.DataFrame]:
+    """
+    Runs the problem described by a configuration file with the number of points of each phase
+    of its mission adapted to the accuracy it requires, see refine_mission_discretization. The
+    problem is built again for each number of points, which replaces the options of the mission
+    in a copy of the configuration file so that the configuration file does not need to be
+    modified. Its inputs are read from the input file of the configuration file.
+
+    :param configuration_file_path: path to the configuration file of the problem.
+    :param mission_path: path of the mission in the model section of the configuration file,
+    with dots between the names of the nested groups, e.g. "performances".
+    :param kwargs: arguments of refine_mission_discretization, except run_mission.
+    :return: the problem run with the final number of points and the history of the
+    refinement.
+    """
+
+    configuration_file_path = pathlib.Path(configuration_file_path)
+    yaml = YAML()
+    with open(configuration_file_path, "r", encoding="utf-8") as configuration_file:
+        configuration = yaml.load(configuration_file)
+
+    mission_definition = configuration["model"]
+    for system_name in mission_path.split("."):
+        mission_definition = mission_definition[system_name]
+
+    def run_mission(mission_options: Dict[str, int]) -> oad.FASTOADProblem:
+        mission_definition.update(mission_options)
+
+        # FAST-OAD sets the options of the configuration file at setup, so the number of points
+        # can't be given as model options. The copy is written next to the configuration file
+        # so that the relative paths it contains stay valid.
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=configuration_file_path.parent,
+            prefix=configuration_file_path.stem + "_",
+            suffix=configuration_file_path.suffix,
+            delete=False,
+            encoding="utf-8",
+        ) as adapted_configuration_file:
+            yaml.dump(configuration, adapted_configuration_file)
+        try:
+            configurator = oad.FASTOADProblemConfigurator(adapted_configuration_file.name)
+        finally:
+            os.remove(adapted_configuration_file.name)
+
+        problem = configurator.get_problem(read_inputs=True)
+        problem.setup()
+        problem.run_model()
+
+        return problem
+
+    return refine_mission_discretization(run_mission, **kwargs)
+
+
+def _run_and_read(
+    run_mission: Callable[[Dict[str, int]], om.Problem],
+    number_of_points: Dict[str, int],
+    monitored_variables: Dict[str, str],
+    variable_prefix: str,
+) -> Tuple[om.Problem, Dict[str, float], float]:
+    """
+    Runs the mission with the number of points of each phase and returns the problem, the value
+    of the quantities of each phase and of the monitored variables, and the time the run took.
+    """
+
+    mission_options = {
+        "number_of_points_" + phase: int(number_of_points[phase]) for phase in PHASES
+    }
+
+    start = time.perf_counter()
+    problem = run_mission(mission_options)
+    run_time = time.perf_counter() - start
+
+    values = {}
+    for phase in PHASES:
+        for quantity, units in PHASE_QUANTITIES.items():
+            values[phase + ":" + quantity] = float(
+                problem.get_val(variable_prefix + phase + ":" + quantity, units=units)[0]
+            )
+    for name, units in monitored_variables.items():
+        values[name] = float(np.ravel(problem.get_val(name, units=units))[0])
+
+    return problem, values, run_time
+
+
+def _get_phase_errors(values: Dict[str, float], refined_values: Dict[str, float]) -> dict:
+    """
+    Returns the discretization error of each phase, estimated as the largest change of its
+    quantities between the two runs, relative to the total of this quantity over the mission. A
+    quantity that is not consumed during the mission, e.g. the fuel of an electric aircraft, is
+    not taken into account.
+    """
+
+    errors = dict.fromkeys(PHASES, 0.0)
+
+    for quantity in PHASE_QUANTITIES:
+        total = sum(abs(refined_values[phase + ":" + quantity]) for phase in PHASES)
+        if total <= 0.0:
+            continue
+
+        for phase in PHASES:
+            name = phase + ":" + quantity
+            errors[phase] = max(errors[phase], abs(refined_values[name] - values[name]) / total)
+
+    return errors
+
+
+def _get_history_row(
+    number_of_points: Dict[str, int], values: Dict[str, float], errors: dict, run_time: float
+) -> dict:
+    """Returns the row of the history of the refinement that describes a run."""
+
+    row = {"number_of_points_" + phase: number_of_points[phase] for phase in PHASES}
+    row.update(values)
+    row.update({phase + ":error": errors.get(phase, np.nan) for phase in PHASES})
+    row["run_time (s)"] = run_time
+
+    return row
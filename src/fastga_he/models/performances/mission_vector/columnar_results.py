@@ -0,0 +1,241 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import os
+import os.path as pth
+import re
+import zipfile
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Results saved in a file with this extension are written in the columnar format rather than as
+# a csv file
+COLUMNAR_FILE_EXTENSION = ".npz"
+
+# A columnar file is a compressed numpy archive which can contain the results of several runs.
+# For each run, the archive contains the name and units of the columns and one array per column,
+# all prefixed by the index of the run, e.g. "run_0/columns", "run_0/units", "run_0/column_0"...
+# Since each column is its own array, only the columns needed are decompressed when reading.
+_RUN_PREFIX = "run_"
+_COLUMNS_KEY = "columns"
+_UNITS_KEY = "units"
+_COLUMN_KEY = "column_"
+
+_RUN_KEY_PATTERN = re.compile(r"^" + _RUN_PREFIX + r"(\d+)/" + _COLUMNS_KEY + r"\.npy$")
+
+
+def is_columnar_file(file_path: str) -> bool:
+    """
+    Returns True if the results in the file are, or are to be, written in the columnar format.
+
+    :param file_path: path to the results file.
+    """
+
+    return str(file_path).endswith(COLUMNAR_FILE_EXTENSION)
+
+
+def write_columnar_results(
+    file_path: str,
+    results_df: pd.DataFrame,
+    units: Optional[List[Optional[str]]] = None,
+    run_index: Optional[int] = None,
+) -> int:
+    """
+    Writes the results of a run in the columnar format and returns the index of the run.
+
+    If no run index is given, the file is overwritten and only contains this run, with index 0,
+    which is what is done for the csv files. Otherwise, the run is appended to the file, which is
+    created if needed, without rewriting the runs already in it.
+
+    :param file_path: path to the file to write.
+    :param results_df: results of the run, one column per variable and one row per point.
+    :param units: units of each column, None if the column has no units.
+    :param run_index: index under which to store the run, must not be in the file already.
+    """
+
+    if units is None:
+        units = [None] * len(results_df.columns)
+
+    if len(units) != len(results_df.columns):
+        raise ValueError(
+            "Got "
+            + str(len(units))
+            + " units for "
+            + str(len(results_df.columns))
+            + " columns, please provide one unit per column"
+        )
+
+    directory = pth.dirname(file_path)
+    if directory and not pth.exists(directory):
+        os.makedirs(directory)
+
+    arrays = {
+        _COLUMNS_KEY: np.array([str(column) for column in results_df.columns]),
+        _UNITS_KEY: np.array(["" if unit is None else str(unit) for unit in units]),
+    }
+    for column_idx, column in enumerate(results_df.columns):
+        column_values = results_df.iloc[:, column_idx].to_numpy()
+        # String columns are stored as fixed length strings so that no pickling is needed
+        if column_values.dtype == object:
+            column_values = column_values.astype(str)
+        arrays[_COLUMN_KEY + str(column_idx)] = column_values
+
+    if run_index is None:
+        run_index = 0
+        # The run is written in a temporary file which then replaces the old one, so that the
+        # results are never half written
+        temp_file_path = file_path + ".tmp"
+        _write_run(temp_file_path, "w", run_index, arrays)
+        os.replace(temp_file_path, file_path)
+
+    else:
+        if pth.exists(file_path) and run_index in get_run_indices(file_path):
+            raise ValueError(
+                "Run "
+                + str(run_index)
+                + " is already stored in "
+                + file_path
+                + ", can't replace it"
+            )
+        _write_run(file_path, "a", run_index, arrays)
+
+    return run_index
+
+
+def append_run_to_store(
+    store_file_path: str, results_file_path: str, run_index: Optional[int] = None
+) -> int:
+    """
+    Appends the results of a run, read from a csv or a columnar file, to a columnar file that
+    stores several runs, and returns the index of the run in the store. If the results file
+    contains several runs, the last one is appended.
+
+    :param store_file_path: path to the columnar file in which runs are stored, created if needed.
+    :param results_file_path: path to the results of the run, as written by ToCSV or the power
+    train performances watcher.
+    :param run_index: index under which to store the run, by default the one following the last
+    run of the store.
+    """
+
+    results_df = read_results(results_file_path)
+
+    # Units are only known for the columnar files
+    units = None
+    if is_columnar_file(results_file_path):
+        units_dict = read_columnar_units(results_file_path)
+        units = [units_dict[column] for column in results_df.columns]
+
+    if run_index is None:
+        run_indices = get_run_indices(store_file_path) if pth.exists(store_file_path) else []
+        run_index = max(run_indices) + 1 if run_indices else 0
+
+    return write_columnar_results(store_file_path, results_df, units, run_index)
+
+
+def get_run_indices(file_path: str) -> list:
+    """
+    Returns the sorted indices of the runs stored in a columnar file.
+
+    :param file_path: path to the columnar file.
+    """
+
+    with zipfile.ZipFile(file_path, "r") as archive:
+        return sorted(
+            int(match.group(1))
+            for match in map(_RUN_KEY_PATTERN.match, archive.namelist())
+            if match
+        )
+
+
+def read_columnar_results(
+    file_path: str, run_index: Optional[int] = None, columns: Optional[list] = None
+) -> pd.DataFrame:
+    """
+    Reads the results of a run from a columnar file.
+
+    :param file_path: path to the columnar file.
+    :param run_index: index of the run to read, by default the last one.
+    :param columns: name of the columns to read, by default all of them. Only the columns
+    asked for are decompressed.
+    """
+
+    prefix = _get_run_prefix(file_path, run_index)
+
+    with np.load(file_path, allow_pickle=False) as archive:
+        column_names = [str(column) for column in archive[prefix + _COLUMNS_KEY]]
+
+        if columns is None:
+            columns = column_names
+        else:
+            unknown_columns = [column for column in columns if column not in column_names]
+            if unknown_columns:
+                raise KeyError(
+                    "Columns " + ", ".join(unknown_columns) + " are not in " + str(file_path)
+                )
+
+        return pd.DataFrame(
+            {
+                column: archive[prefix + _COLUMN_KEY + str(column_names.index(column))]
+                for column in columns
+            },
+            columns=columns,
+        )
+
+
+def read_columnar_units(file_path: str, run_index: Optional[int] = None) -> dict:
+    """
+    Returns the units of each column of a run in a columnar file, None for the columns without
+    units.
+
+    :param file_path: path to the columnar file.
+    :param run_index: index of the run to read, by default the last one.
+    """
+
+    prefix = _get_run_prefix(file_path, run_index)
+
+    with np.load(file_path, allow_pickle=False) as archive:
+        return {
+            str(column): str(unit) if unit else None
+            for column, unit in zip(archive[prefix + _COLUMNS_KEY], archive[prefix + _UNITS_KEY])
+        }
+
+
+def read_results(file_path: str, run_index: Optional[int] = None) -> pd.DataFrame:
+    """
+    Reads the results written by ToCSV or the power train performances watcher, either as a csv
+    or in the columnar format.
+
+    :param file_path: path to the results file.
+    :param run_index: for columnar files, index of the run to read, by default the last one.
+    """
+
+    if is_columnar_file(file_path):
+        return read_columnar_results(file_path, run_index)
+
+    return pd.read_csv(file_path, index_col=0)
+
+
+def _get_run_prefix(file_path: str, run_index: Optional[int]) -> str:
+    run_indices = get_run_indices(file_path)
+
+    if not run_indices:
+        raise ValueError("No run is stored in " + str(file_path))
+
+    if run_index is None:
+        run_index = run_indices[-1]
+    elif run_index not in run_indices:
+        raise KeyError("Run " + str(run_index) + " is not stored in " + str(file_path))
+
+    return _RUN_PREFIX + str(run_index) + "/"
+
+
+def _write_run(file_path: str, mode: str, run_index: int, arrays: dict):
+    prefix = _RUN_PREFIX + str(run_index) + "/"
+
+    with zipfile.ZipFile(file_path, mode, compression=zipfile.ZIP_DEFLATED) as archive:
+        for key, array in arrays.items():
+            with archive.open(prefix + key + ".npy", "w", force_zip64=True) as array_file:
+                np.lib.format.write_array(array_file, np.asanyarray(array), allow_pickle=False)
@@ -22,6 +22,12 @@ class InitializeTimeAndDistance(om.ExplicitComponent):
         self.descent_idx = None
         self.reserve_idx = None
 
+        # Contains the index of the points of the climb and descent phases, as well as the
+        # sparsity pattern of the partials with respect to the altitude and horizontal speed,
+        # expressed with the position of the input in that array
+        self.climb_descent_idx = None
+        self.partials_pattern = {}
+
     def initialize(self):
         self.options.declare(
             "number_of_points_climb", default=1, desc="number of equilibrium to be treated in climb"
@@ -133,28 +139,53 @@ class InitializeTimeAndDistance(om.ExplicitComponent):
         self.declare_partials(
             of=["time", "position"],
             wrt="data:mission:sizing:main_route:climb:climb_rate:sea_level",
-            method="fd",
+            method="exact",
         )
         self.declare_partials(
             of=["time", "position"],
             wrt="data:mission:sizing:main_route:climb:climb_rate:cruise_level",
-            method="fd",
+            method="exact",
         )
         self.declare_partials(
             of=["time", "position"],
             wrt="data:mission:sizing:main_route:descent:descent_rate",
-            method="fd",
+            method="exact",
             rows=np.concatenate((self.cruise_idx, self.descent_idx, self.reserve_idx)),
             cols=np.zeros(
                 number_of_points_cruise + number_of_points_descent + number_of_points_reserve
             ),
         )
 
-        self.declare_partials(
-            of=["time", "position"],
-            wrt=["horizontal_speed", "altitude"],
-            method="fd",
-        )
+        # Only the altitude and horizontal speed during climb and descent have an influence as
+        # they drive the time and distance needed for those phases. The climb points only
+        # depend on the climb, the points after it depend on both the climb and the descent
+        # except for the position which doesn't depend on the climb anymore once the descent has
+        # started, and doesn't depend on anything during the reserve.
+        self.climb_descent_idx = np.concatenate((self.climb_idx, self.descent_idx))
+        is_climb_col = np.arange(len(self.climb_descent_idx)) < number_of_points_climb
+        after_climb = np.arange(number_of_points) >= number_of_points_climb
+
+        climb_block = np.outer(~after_climb, is_climb_col)
+        time_pattern_speed = np.outer(after_climb, np.ones_like(is_climb_col))
+        position_pattern = climb_block.copy()
+        position_pattern[self.cruise_idx, :] = True
+        position_pattern[np.ix_(self.descent_idx, ~is_climb_col)] = True
+
+        self.partials_pattern = {
+            ("time", "altitude"): np.nonzero(climb_block | time_pattern_speed),
+            ("time", "horizontal_speed"): np.nonzero(time_pattern_speed),
+            ("position", "altitude"): np.nonzero(position_pattern),
+            ("position", "horizontal_speed"): np.nonzero(position_pattern),
+        }
+
+        for (output_name, input_name), (rows, cols) in self.partials_pattern.items():
+            self.declare_partials(
+                of=output_name,
+                wrt=input_name,
+                method="exact",
+                rows=rows,
+                cols=self.climb_descent_idx[cols],
+            )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         number_of_points_cruise = self.options["number_of_points_cruise"]
@@ -352,3 +383,197 @@ class InitializeTimeAndDistance(om.ExplicitComponent):
             / v_tas_cruise**2.0
         )
         partials["time", "data:TLAR:v_cruise"] = d_time_d_cruise_v_tas
+
+        # Derivatives of the time and position increments on each climb segment with respect to
+        # the altitude and horizontal speed of the climb points
+        climb_segment_idx = np.arange(number_of_points_climb - 1)
+        max_altitude_climb = max(altitude_climb)
+        climb_rate_slope = (climb_rate_cl - climb_rate_sl) / max_altitude_climb
+
+        d_mid_climb_rate_d_altitude = np.zeros((number_of_points_climb - 1, number_of_points_climb))
+        d_mid_climb_rate_d_altitude[climb_segment_idx, climb_segment_idx] = climb_rate_slope / 2.0
+        d_mid_climb_rate_d_altitude[climb_segment_idx, climb_segment_idx + 1] = (
+            climb_rate_slope / 2.0
+        )
+        # The altitude at the top of climb also appears in the interpolation of the climb rate
+        d_mid_climb_rate_d_altitude[:, np.argmax(altitude_climb)] -= (
+            climb_rate_slope * mid_altitude_climb / max_altitude_climb
+        )
+        d_altitude_step_climb_d_altitude = np.zeros(
+            (number_of_points_climb - 1, number_of_points_climb)
+        )
+        d_altitude_step_climb_d_altitude[climb_segment_idx, climb_segment_idx] = -1.0
+        d_altitude_step_climb_d_altitude[climb_segment_idx, climb_segment_idx + 1] = 1.0
+
+        d_time_step_climb_d_altitude = (
+            d_altitude_step_climb_d_altitude
+            - time_to_climb_step[:, np.newaxis] * d_mid_climb_rate_d_altitude
+        ) / mid_climb_rate[:, np.newaxis]
+        d_position_step_climb_d_altitude = (
+            mid_horizontal_speed_climb[:, np.newaxis] * d_time_step_climb_d_altitude
+        )
+        d_position_step_climb_d_speed = np.zeros(
+            (number_of_points_climb - 1, number_of_points_climb)
+        )
+        d_position_step_climb_d_speed[climb_segment_idx, climb_segment_idx] = (
+            time_to_climb_step / 2.0
+        )
+        d_position_step_climb_d_speed[climb_segment_idx, climb_segment_idx + 1] = (
+            time_to_climb_step / 2.0
+        )
+
+        d_time_step_climb_d_climb_rate_sl = (
+            -time_to_climb_step / mid_climb_rate * (1.0 - mid_altitude_climb / max_altitude_climb)
+        )
+        d_time_step_climb_d_climb_rate_cl = (
+            -time_to_climb_step / mid_climb_rate * mid_altitude_climb / max_altitude_climb
+        )
+
+        # Same thing for the descent segments
+        descent_segment_idx = np.arange(number_of_points_descent - 1)
+        altitude_step_sign = np.sign(altitude_descent[1:] - altitude_descent[:-1])
+
+        d_time_step_descent_d_altitude = np.zeros(
+            (number_of_points_descent - 1, number_of_points_descent)
+        )
+        d_time_step_descent_d_altitude[descent_segment_idx, descent_segment_idx] = (
+            -altitude_step_sign / mid_descent_rate
+        )
+        d_time_step_descent_d_altitude[descent_segment_idx, descent_segment_idx + 1] = (
+            altitude_step_sign / mid_descent_rate
+        )
+        d_position_step_descent_d_altitude = (
+            mid_horizontal_speed_descent[:, np.newaxis] * d_time_step_descent_d_altitude
+        )
+        d_position_step_descent_d_speed = np.zeros(
+            (number_of_points_descent - 1, number_of_points_descent)
+        )
+        d_position_step_descent_d_speed[descent_segment_idx, descent_segment_idx] = (
+            time_to_descend_step / 2.0
+        )
+        d_position_step_descent_d_speed[descent_segment_idx, descent_segment_idx + 1] = (
+            time_to_descend_step / 2.0
+        )
+
+        d_time_step_descent_d_descent_rate = (
+            -time_to_descend_step / mid_descent_rate * np.sign(descent_rate)
+        )
+
+        # Columns of the derivatives with respect to the altitude and speed are the climb points
+        # followed by the descent points
+        zeros_climb = np.zeros((number_of_points_climb - 1, number_of_points_descent))
+        zeros_descent = np.zeros((number_of_points_descent - 1, number_of_points_climb))
+
+        d_time_d_altitude, d_position_d_altitude = self.propagate_increments_partials(
+            inputs,
+            np.hstack((d_time_step_climb_d_altitude, zeros_climb)),
+            np.hstack((d_position_step_climb_d_altitude, zeros_climb)),
+            np.hstack((zeros_descent, d_time_step_descent_d_altitude)),
+            np.hstack((zeros_descent, d_position_step_descent_d_altitude)),
+        )
+        d_time_d_speed, d_position_d_speed = self.propagate_increments_partials(
+            inputs,
+            np.zeros((number_of_points_climb - 1, len(self.climb_descent_idx))),
+            np.hstack((d_position_step_climb_d_speed, zeros_climb)),
+            np.zeros((number_of_points_descent - 1, len(self.climb_descent_idx))),
+            np.hstack((zeros_descent, d_position_step_descent_d_speed)),
+        )
+
+        for (output_name, input_name), partials_value in zip(
+            self.partials_pattern.keys(),
+            [d_time_d_altitude, d_time_d_speed, d_position_d_altitude, d_position_d_speed],
+        ):
+            partials[output_name, input_name] = partials_value[
+                self.partials_pattern[output_name, input_name]
+            ]
+
+        zeros_climb = np.zeros((number_of_points_climb - 1, 1))
+        zeros_descent = np.zeros((number_of_points_descent - 1, 1))
+
+        for climb_rate_name, d_time_step_climb_d_climb_rate in zip(
+            [
+                "data:mission:sizing:main_route:climb:climb_rate:sea_level",
+                "data:mission:sizing:main_route:climb:climb_rate:cruise_level",
+            ],
+            [d_time_step_climb_d_climb_rate_sl, d_time_step_climb_d_climb_rate_cl],
+        ):
+            d_time_d_climb_rate, d_position_d_climb_rate = self.propagate_increments_partials(
+                inputs,
+                d_time_step_climb_d_climb_rate[:, np.newaxis],
+                (mid_horizontal_speed_climb * d_time_step_climb_d_climb_rate)[:, np.newaxis],
+                zeros_descent,
+                zeros_descent,
+            )
+            partials["time", climb_rate_name] = d_time_d_climb_rate[:, 0]
+            partials["position", climb_rate_name] = d_position_d_climb_rate[:, 0]
+
+        d_time_d_descent_rate, d_position_d_descent_rate = self.propagate_increments_partials(
+            inputs,
+            zeros_climb,
+            zeros_climb,
+            d_time_step_descent_d_descent_rate[:, np.newaxis],
+            (mid_horizontal_speed_descent * d_time_step_descent_d_descent_rate)[:, np.newaxis],
+        )
+        partials["time", "data:mission:sizing:main_route:descent:descent_rate"] = (
+            d_time_d_descent_rate[number_of_points_climb:, 0]
+        )
+        partials["position", "data:mission:sizing:main_route:descent:descent_rate"] = (
+            d_position_d_descent_rate[number_of_points_climb:, 0]
+        )
+
+    def propagate_increments_partials(
+        self,
+        inputs,
+        d_time_step_climb,
+        d_position_step_climb,
+        d_time_step_descent,
+        d_position_step_descent,
+    ):
+        """
+        Computes the partials of the time and position at each point of the mission from the
+        partials of the time and position increments on each segment of the climb and descent.
+        Each column of the arrays corresponds to one of the variables the partials are taken
+        with respect to.
+
+        :param inputs: inputs of the component.
+        :param d_time_step_climb: partials of the time spent on each climb segment.
+        :param d_position_step_climb: partials of the distance covered on each climb segment.
+        :param d_time_step_descent: partials of the time spent on each descent segment.
+        :param d_position_step_descent: partials of the distance covered on each descent segment.
+        """
+
+        number_of_points_cruise = self.options["number_of_points_cruise"]
+        number_of_points_reserve = self.options["number_of_points_reserve"]
+
+        v_tas_cruise = inputs["data:TLAR:v_cruise"]
+
+        nb_cols = d_time_step_climb.shape[1]
+        zeros_row = np.zeros((1, nb_cols))
+
+        d_time_climb = np.concatenate((zeros_row, np.cumsum(d_time_step_climb, axis=0)))
+        d_position_climb = np.concatenate((zeros_row, np.cumsum(d_position_step_climb, axis=0)))
+        d_time_descent = np.concatenate((zeros_row, np.cumsum(d_time_step_descent, axis=0)))
+        d_position_descent = np.concatenate((zeros_row, np.cumsum(d_position_step_descent, axis=0)))
+
+        d_cruise_range = -d_position_climb[-1] - d_position_descent[-1]
+        cruise_ratio = np.linspace(
+            1.0 / (number_of_points_cruise + 1),
+            1.0 - 1.0 / (number_of_points_cruise + 1),
+            number_of_points_cruise,
+        )[:, np.newaxis]
+
+        d_time_cruise = cruise_ratio * d_cruise_range / v_tas_cruise + d_time_climb[-1]
+        d_position_cruise = d_position_climb[-1] + cruise_ratio * d_cruise_range
+
+        d_time_descent = d_time_descent + d_time_climb[-1] + d_cruise_range / v_tas_cruise
+        d_position_descent = d_position_descent + d_position_climb[-1] + d_cruise_range
+
+        d_time_reserve = np.tile(d_time_descent[-1], (number_of_points_reserve, 1))
+        d_position_reserve = np.tile(d_position_descent[-1], (number_of_points_reserve, 1))
+
+        d_time = np.concatenate((d_time_climb, d_time_cruise, d_time_descent, d_time_reserve))
+        d_position = np.concatenate(
+            (d_position_climb, d_position_cruise, d_position_descent, d_position_reserve)
+        )
+
+        return d_time, d_position
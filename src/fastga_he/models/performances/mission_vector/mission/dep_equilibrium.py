@@ -16,6 +16,29 @@ from ..constants import (
 from ..mission.energy_consumption_preparation import PrepareForEnergyConsumption
 from .equilibrium_alpha import EquilibriumAlpha
 from .equilibrium_thrust import EquilibriumThrust
+from .point_block_direct_solver import PointBlockDirectSolver
+
+
+def declare_linear_solver_type_option(options: om.OptionsDictionary):
+    """
+    Declares the option choosing the linear solver of the equilibrium, shared by the mission
+    groups that pass it down to the equilibrium.
+
+    :param options: the options of the group to declare the option in.
+    """
+
+    options.declare(
+        name="linear_solver_type",
+        default="sparse",
+        values=["dense", "sparse", "point_block"],
+        desc="Linear solver used in the Newton loop of the equilibrium. With sparse, the "
+        "Jacobian is assembled as a CSC matrix and factorized with a sparse LU, which is what the "
+        "equilibrium used before the option was added. With dense, it is not assembled and is "
+        "built as a dense matrix factorized with a dense LU. With point_block, the sparse "
+        "Jacobian is first reordered to be block triangular with one block per point, which "
+        "makes its factorization much cheaper for long missions",
+        allow_none=False,
+    )
 
 
 @oad.RegisterSubmodel(HE_SUBMODEL_EQUILIBRIUM, "fastga_he.submodel.performances.equilibrium.legacy")
@@ -79,6 +102,7 @@ class DEPEquilibrium(om.Group):
             desc="Boolean to sort the component with proper order for adding subsystem operations",
             allow_none=False,
         )
+        declare_linear_solver_type_option(self.options)
         self.options.declare(
             "low_speed_aero",
             default=False,
@@ -92,6 +116,16 @@ class DEPEquilibrium(om.Group):
         if self.options["use_linesearch"]:
             self.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
 
+        # The assembled Jacobian of the group is stored as a CSC matrix by default, in which case
+        # the DirectSolver factorizes it with scipy's sparse LU. Without it, the dense matrix is
+        # built column by column with one linear operation per unknown.
+        if self.options["linear_solver_type"] == "dense":
+            self.linear_solver.options["assemble_jac"] = False
+        elif self.options["linear_solver_type"] == "sparse":
+            self.linear_solver.options["assemble_jac"] = True
+        else:
+            self.linear_solver = PointBlockDirectSolver(assemble_jac=True)
+
         if self.options["promotes_all_variables"]:
             self.add_subsystem(
                 "compute_equilibrium_alpha",
@@ -7,6 +7,7 @@ import openmdao.api as om
 import fastoad.api as oad
 
 from ..constants import HE_SUBMODEL_EQUILIBRIUM
+from ..mission.dep_equilibrium import declare_linear_solver_type_option
 from ..mission.performance_per_phase import PerformancePerPhase
 from ..mission.sizing_energy import SizingEnergy
 from ..mission.sizing_time import SizingDuration
@@ -64,6 +65,7 @@ class MissionCore(om.Group):
             "ensuring components are executed in the right order",
             allow_none=False,
         )
+        declare_linear_solver_type_option(self.options)
 
     def setup(self):
         number_of_points_climb = self.options["number_of_points_climb"]
@@ -96,6 +98,7 @@ class MissionCore(om.Group):
             "use_linesearch": self.options["use_linesearch"],
             "pre_condition_pt": self.options["pre_condition_pt"],
             "sort_component": self.options["sort_component"],
+            "linear_solver_type": self.options["linear_solver_type"],
         }
         self.add_subsystem(
             "compute_dep_equilibrium",
@@ -0,0 +1,280 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import logging
+
+import networkx as nx
+import numpy as np
+import openmdao
+import openmdao.api as om
+import scipy.sparse as sp
+import scipy.sparse.linalg as sp_linalg
+from scipy.sparse.csgraph import connected_components, min_weight_full_bipartite_matching
+
+_LOGGER = logging.getLogger(__name__)
+
+# Range of OpenMDAO versions, lower bound included and upper bound excluded, whose DirectSolver
+# internals are known to the adapter below
+_SUPPORTED_OPENMDAO_VERSIONS = ((3, 27), (3, 39))
+
+
+class PointBlockDirectSolver(om.DirectSolver):
+    """
+    Direct solver for the equilibrium of the mission which takes advantage of the structure of its
+    Jacobian. Each point of the mission is only coupled to itself and to the points before it
+    (through the mass and the integrated quantities), so once the unknowns are properly reordered
+    the Jacobian is block lower triangular with blocks the size of one point.
+
+    The reordering is computed once for a given sparsity pattern: a matching that puts the
+    largest possible terms on the diagonal, followed by a sort of the strongly connected
+    components of the Jacobian graph so that a point only depends on the ones before it. The
+    factorization is then done with the sparse LU without any further permutation of the
+    columns. Partial pivoting is kept so that a small term left on the diagonal by the matching
+    doesn't spoil the accuracy of the solve, but since the matching puts the largest terms on the
+    diagonal, the pivots seldom leave it and the fill-in stays mostly inside the point blocks. If
+    the pattern can't be reordered this way, or if the internals of the OpenMDAO DirectSolver are
+    not the expected ones, it falls back on the standard sparse LU.
+    """
+
+    SOLVER = "LN: PointBlockDirect"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # Sparsity pattern for which the reordering was computed, along with the row and
+        # column permutations and the permutation of the data of the matrix it corresponds to
+        self._reordering = None
+
+    def _linearize(self):
+        adapter = _DirectSolverAdapter(self)
+        matrix = adapter.get_assembled_matrix()
+
+        if not isinstance(matrix, sp.csc_matrix):
+            super()._linearize()
+            return
+
+        reordering = self._get_reordering(matrix)
+
+        if reordering is None:
+            super()._linearize()
+            return
+
+        row_perm, col_perm, data_perm, indices, indptr = reordering
+        reordered_matrix = sp.csc_matrix(
+            (matrix.data[data_perm], indices, indptr), shape=matrix.shape
+        )
+
+        try:
+            lu = sp_linalg.splu(reordered_matrix, permc_spec="NATURAL")
+        except RuntimeError:
+            raise RuntimeError(adapter.format_singular_error(matrix))
+
+        adapter.set_factorization(PermutedLU(lu, row_perm, col_perm))
+
+    def _get_reordering(self, matrix: sp.csc_matrix):
+        """
+        Returns the permutations that put the matrix in block lower triangular form, computing
+        them if the sparsity pattern changed since the last call. Returns None if no such
+        reordering exists.
+
+        :param matrix: the assembled Jacobian, in CSC format.
+        """
+
+        if self._reordering is not None:
+            pattern, reordering = self._reordering
+            if (
+                pattern[0] == matrix.shape
+                and np.array_equal(pattern[1], matrix.indptr)
+                and np.array_equal(pattern[2], matrix.indices)
+            ):
+                return reordering
+
+        reordering = compute_block_triangular_reordering(matrix)
+
+        if reordering is None:
+            _LOGGER.debug(
+                "Could not put the Jacobian of %s in block triangular form, using the standard "
+                "sparse LU instead.",
+                self._system().pathname,
+            )
+
+        self._reordering = (
+            (matrix.shape, matrix.indptr.copy(), matrix.indices.copy()),
+            reordering,
+        )
+
+        return reordering
+
+
+class _DirectSolverAdapter:
+    """
+    Gathers the accesses to the private attributes of the OpenMDAO DirectSolver needed to replace
+    its factorization. When the version of OpenMDAO is not a supported one or its internals are
+    not the expected ones, no matrix is returned so that the solver uses the standard
+    linearization.
+    """
+
+    def __init__(self, solver: om.DirectSolver):
+        self.solver = solver
+
+    @staticmethod
+    def is_supported_version() -> bool:
+        """Returns True if the installed OpenMDAO version is one the adapter was written for."""
+
+        try:
+            version = tuple(int(number) for number in openmdao.__version__.split(".")[:2])
+        except ValueError:
+            return False
+
+        lower_bound, upper_bound = _SUPPORTED_OPENMDAO_VERSIONS
+
+        return lower_bound <= version < upper_bound
+
+    def get_assembled_matrix(self):
+        """
+        Returns the assembled Jacobian of the system of the solver, or None if it is not
+        assembled or can't be accessed.
+        """
+
+        if not self.is_supported_version():
+            return None
+
+        if not all(hasattr(self.solver, name) for name in ("_lu", "_lin_rhs_checker")):
+            return None
+
+        assembled_jac = getattr(self.solver, "_assembled_jac", None)
+        int_mtx = getattr(assembled_jac, "_int_mtx", None)
+
+        return getattr(int_mtx, "_matrix", None)
+
+    def set_factorization(self, lu):
+        """
+        Replaces the factorization the solver uses to solve the linear systems.
+
+        :param lu: object with the same solve method as the one returned by splu.
+        """
+
+        self.solver._lu = lu
+
+        if self.solver._lin_rhs_checker is not None:
+            self.solver._lin_rhs_checker.clear()
+
+    def format_singular_error(self, matrix: sp.csc_matrix) -> str:
+        """
+        Returns the error message of the DirectSolver for a singular matrix.
+
+        :param matrix: the assembled Jacobian that could not be factorized.
+        """
+
+        system = self.solver._system()
+
+        try:
+            from openmdao.solvers.linear.direct import format_singular_error
+        except ImportError:
+            return f"Singular entry found in the Jacobian of '{system.pathname}'."
+
+        return format_singular_error(system, matrix)
+
+
+class PermutedLU:
+    """
+    Sparse LU factorization of a matrix whose rows and columns were permuted before the
+    factorization. Exposes the same solve method as the object returned by splu so it can be
+    used in place of it in the DirectSolver.
+    """
+
+    def __init__(self, lu, row_perm: np.ndarray, col_perm: np.ndarray):
+        self.lu = lu
+        self.row_perm = row_perm
+        self.col_perm = col_perm
+
+    def solve(self, rhs: np.ndarray, trans: str = "N") -> np.ndarray:
+        """
+        Solves the system with the original matrix or its transpose.
+
+        :param rhs: right hand side of the system, the first axis corresponds to the rows of the
+        matrix.
+        :param trans: "N" to solve with the matrix, "T" to solve with its transpose.
+        """
+
+        solution = np.empty_like(rhs)
+
+        if trans == "N":
+            solution[self.col_perm] = self.lu.solve(rhs[self.row_perm], "N")
+        else:
+            solution[self.row_perm] = self.lu.solve(rhs[self.col_perm], "T")
+
+        return solution
+
+
+def compute_block_triangular_reordering(matrix: sp.csc_matrix):
+    """
+    Computes the row and column permutations that put a square matrix in block lower triangular
+    form with a zero-free diagonal. The diagonal is chosen so as to maximize the product of the
+    magnitude of its terms, relative to the largest term of each column, which makes it unlikely
+    that the pivoting of the factorization moves the pivots away from the diagonal.
+
+    Returns the row permutation, the column permutation, the permutation of the data array of
+    the matrix in CSC format and the indices and index pointers of the reordered matrix, or None
+    if the matrix is structurally singular.
+
+    :param matrix: the matrix to reorder, in CSC format.
+    """
+
+    size = matrix.shape[0]
+
+    # Only the terms that are actually non-zero are considered for the diagonal, explicit zeros
+    # are kept in the pattern to be able to reuse it
+    weights = matrix.copy()
+    weights.eliminate_zeros()
+    if np.any(np.diff(weights.indptr) == 0):
+        return None
+
+    abs_data = np.abs(weights.data)
+    column_max = np.maximum.reduceat(abs_data, weights.indptr[:-1])
+    weights.data = np.log(np.repeat(column_max, np.diff(weights.indptr))) - np.log(abs_data) + 1.0
+
+    try:
+        matched_rows, matched_columns = min_weight_full_bipartite_matching(weights)
+    except ValueError:
+        return None
+
+    diagonal_rows = np.empty(size, dtype=int)
+    diagonal_rows[matched_columns] = matched_rows
+
+    # Row i of the matched matrix is now the equation whose diagonal term is variable i, so the
+    # graph of the dependencies between variables is the pattern of that matrix
+    matched_matrix = matrix.tocsr()[diagonal_rows]
+    nb_blocks, block_id = connected_components(matched_matrix, directed=True, connection="strong")
+
+    # A variable depends on the variables of the same block and of the blocks before it. The
+    # labelling of the strongly connected components usually already respects that order, if
+    # it doesn't, the blocks are sorted topologically.
+    coo = matched_matrix.tocoo()
+    block_row = block_id[coo.row]
+    block_col = block_id[coo.col]
+    if np.any(block_row < block_col):
+        inter_block = block_row != block_col
+        block_graph = nx.DiGraph()
+        block_graph.add_nodes_from(range(nb_blocks))
+        block_graph.add_edges_from(zip(block_col[inter_block], block_row[inter_block]))
+        block_rank = np.empty(nb_blocks, dtype=int)
+        block_rank[list(nx.topological_sort(block_graph))] = np.arange(nb_blocks)
+        block_id = block_rank[block_id]
+
+    order = np.argsort(block_id, kind="stable")
+    row_perm = diagonal_rows[order]
+    col_perm = order
+
+    # Permutation of the data array, obtained by reordering a matrix that contains the position
+    # of each term in the original data array
+    positions = sp.csc_matrix(
+        (np.arange(1, matrix.nnz + 1, dtype=float), matrix.indices, matrix.indptr),
+        shape=matrix.shape,
+    )
+    reordered_positions = positions[row_perm][:, col_perm].tocsc()
+    reordered_positions.sort_indices()
+    data_perm = reordered_positions.data.astype(int) - 1
+
+    return row_perm, col_perm, data_perm, reordered_positions.indices, reordered_positions.indptr
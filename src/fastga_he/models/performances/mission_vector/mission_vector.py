@@ -19,12 +19,14 @@ import importlib.util
 
 from .initialization.initialize import Initialize
 from .mission.mission_core import MissionCore
+from .mission.dep_equilibrium import declare_linear_solver_type_option
 from .to_csv import ToCSV
 
 from fastga_he.powertrain_builder.powertrain import FASTGAHEPowerTrainConfigurator
 from fastga_he.models.propulsion.assemblers.performances_watcher import (
     PowerTrainPerformancesWatcher,
 )
+from fastga_he.models.propulsion.assemblers.profiling import profile_power_train_components
 
 from fastga_he.models.performances.mission_vector.constants import (
     HE_SUBMODEL_ENERGY_CONSUMPTION,
@@ -135,6 +137,16 @@ class MissionVector(om.Group):
             desc="Boolean to sort the component with proper order for adding subsystem operations",
             allow_none=False,
         )
+        declare_linear_solver_type_option(self.options)
+        self.options.declare(
+            name="power_train_profiling_file_path",
+            default="",
+            types=str,
+            desc="Path to the json file in which the wall time, number of calls and allocated "
+            "memory blocks of each kernel of the power train components of the mission are "
+            "written at the end of the process. If empty, the components are only profiled if "
+            "the FASTGA_HE_POWER_TRAIN_PROFILING_FILE environment variable is set",
+        )
 
     def setup(self):
         number_of_points_climb = self.options["number_of_points_climb"]
@@ -178,6 +190,7 @@ class MissionVector(om.Group):
                 use_linesearch=self.options["use_linesearch"],
                 pre_condition_pt=self.options["pre_condition_pt"],
                 sort_component=self.options["sort_component"],
+                linear_solver_type=self.options["linear_solver_type"],
             ),
             promotes=["data:*", "convergence:*", "settings:*"],
         )
@@ -470,6 +483,12 @@ class MissionVector(om.Group):
                 + " service"
             )
 
+    def configure(self):
+        # Only the power train components of the mission are profiled with the file of the
+        # option, the assemblers have set them up by now
+        if self.options["power_train_profiling_file_path"]:
+            profile_power_train_components(self, self.options["power_train_profiling_file_path"])
+
     def guess_nonlinear(
         self, inputs, outputs, residuals, discrete_inputs=None, discrete_outputs=None
     ):
@@ -10,6 +10,12 @@ import openmdao.api as om
 import pandas as pd
 from stdatm import Atmosphere
 
+from .columnar_results import (
+    COLUMNAR_FILE_EXTENSION,
+    is_columnar_file,
+    write_columnar_results,
+)
+
 CSV_DATA_LABELS = [
     "time",
     "altitude",
@@ -43,6 +49,28 @@ CSV_DATA_LABELS = [
     "name",
 ]
 
+# Units of the columns, only saved when the results are written in the columnar format
+CSV_DATA_UNITS = {
+    "time": "s",
+    "altitude": "m",
+    "ground_distance": "m",
+    "mass": "kg",
+    "x_cg": "m",
+    "true_airspeed": "m/s",
+    "equivalent_airspeed": "m/s",
+    "d_vx_dt": "m/s**2",
+    "density": "kg/m**3",
+    "exterior_temperature": "degK",
+    "gamma": "deg",
+    "alpha": "deg",
+    "delta_m": "deg",
+    "thrust (N)": "N",
+    "tsfc (kg/s/N)": "kg/s/N",
+    "fuel_flow (kg/s)": "kg/s",
+    "energy_consumed (W*h)": "W*h",
+    "time step (s)": "s",
+}
+
 _LOGGER = logging.getLogger(__name__)  # Logger for this module
 
 
@@ -71,7 +99,14 @@ class ToCSV(om.ExplicitComponent):
             default=1,
             desc="number of equilibrium to be treated in reserve",
         )
-        self.options.declare("out_file", default="", types=str)
+        self.options.declare(
+            "out_file",
+            default="",
+            types=str,
+            desc="Path to the file in which to save the mission results. If it ends with "
+            + COLUMNAR_FILE_EXTENSION
+            + " results are written in the columnar format rather than as a csv",
+        )
 
     def setup(self):
         number_of_points_climb = self.options["number_of_points_climb"]
@@ -279,13 +314,21 @@ class ToCSV(om.ExplicitComponent):
             # only save the results when the component is actually used
 
             if self.iter_count_apply == self.previous_iter_count_apply:
-                if os.path.exists(self.options["out_file"]):
-                    os.remove(self.options["out_file"])
+                if is_columnar_file(self.options["out_file"]):
+                    write_columnar_results(
+                        self.options["out_file"],
+                        results_df,
+                        units=[CSV_DATA_UNITS.get(label) for label in CSV_DATA_LABELS],
+                    )
+
+                else:
+                    if os.path.exists(self.options["out_file"]):
+                        os.remove(self.options["out_file"])
 
-                if not os.path.exists(os.path.dirname(self.options["out_file"])):
-                    os.mkdir(os.path.dirname(self.options["out_file"]))
+                    if not os.path.exists(os.path.dirname(self.options["out_file"])):
+                        os.mkdir(os.path.dirname(self.options["out_file"]))
 
-                results_df.to_csv(self.options["out_file"])
+                    results_df.to_csv(self.options["out_file"])
 
                 _LOGGER.info("Saved mission results in %s", self.options["out_file"])
 
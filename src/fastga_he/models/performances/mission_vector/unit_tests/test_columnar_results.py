@@ -0,0 +1,97 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import os
+import os.path as pth
+from shutil import rmtree
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ..columnar_results import (
+    append_run_to_store,
+    get_run_indices,
+    is_columnar_file,
+    read_columnar_results,
+    read_columnar_units,
+    read_results,
+    write_columnar_results,
+)
+
+RESULTS_FOLDER_PATH = pth.join(pth.dirname(__file__), "results")
+
+
+@pytest.fixture(scope="module")
+def cleanup():
+    rmtree(RESULTS_FOLDER_PATH, ignore_errors=True)
+    os.makedirs(RESULTS_FOLDER_PATH)
+
+
+def get_results_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "propeller_1 rpm [1/min]": np.linspace(2000.0, 2500.0, 10),
+            "propeller_1 efficiency [-]": np.linspace(0.6, 0.85, 10),
+            "battery_pack_1 state_of_charge [%]": np.linspace(100.0, 40.0, 10),
+        }
+    )
+
+
+def test_columnar_results_file(cleanup):
+    """
+    Tests the writing and reading of a single run in a columnar file.
+    """
+
+    results_df = get_results_df()
+    units = ["1/min", None, "percent"]
+
+    run_filename = pth.join(RESULTS_FOLDER_PATH, "run.npz")
+    assert is_columnar_file(run_filename)
+    assert not is_columnar_file(pth.join(RESULTS_FOLDER_PATH, "run.csv"))
+
+    # A run written without index replaces the content of the file
+    write_columnar_results(run_filename, results_df.iloc[:5], units=units)
+    write_columnar_results(run_filename, results_df, units=units)
+
+    assert get_run_indices(run_filename) == [0]
+    pd.testing.assert_frame_equal(read_columnar_results(run_filename), results_df)
+    pd.testing.assert_frame_equal(read_results(run_filename), results_df)
+    assert read_columnar_units(run_filename) == dict(zip(results_df.columns, units))
+
+
+def test_columnar_results_store(cleanup):
+    """
+    Tests the storage of several runs in a single columnar file.
+    """
+
+    results_df = get_results_df()
+    units = ["1/min", None, "percent"]
+
+    csv_filename = pth.join(RESULTS_FOLDER_PATH, "store_run.csv")
+    results_df.to_csv(csv_filename)
+    run_filename = pth.join(RESULTS_FOLDER_PATH, "store_run.npz")
+    write_columnar_results(run_filename, results_df, units=units)
+
+    store_filename = pth.join(RESULTS_FOLDER_PATH, "store.npz")
+    assert append_run_to_store(store_filename, csv_filename) == 0
+    assert append_run_to_store(store_filename, run_filename) == 1
+    assert append_run_to_store(store_filename, run_filename, run_index=5) == 5
+    assert get_run_indices(store_filename) == [0, 1, 5]
+
+    # Runs can't be overwritten in a store
+    with pytest.raises(ValueError):
+        append_run_to_store(store_filename, run_filename, run_index=1)
+
+    # Units are only known for the runs coming from columnar files
+    assert read_columnar_units(store_filename, run_index=0)[results_df.columns[0]] is None
+    assert read_columnar_units(store_filename, run_index=1)[results_df.columns[0]] == "1/min"
+
+    pd.testing.assert_frame_equal(read_results(store_filename, run_index=0), results_df)
+
+    selected_columns = list(results_df.columns[[2, 0]])
+    pd.testing.assert_frame_equal(
+        read_columnar_results(store_filename, run_index=1, columns=selected_columns),
+        results_df[selected_columns],
+    )
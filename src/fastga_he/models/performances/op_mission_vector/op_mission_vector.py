@@ -17,6 +17,9 @@ from typing import Tuple
 
 from fastga_he.models.performances.mission_vector.initialization.initialize import Initialize
 from fastga_he.models.performances.mission_vector.mission.mission_core import MissionCore
+from fastga_he.models.performances.mission_vector.mission.dep_equilibrium import (
+    declare_linear_solver_type_option,
+)
 from fastga_he.models.performances.mission_vector.to_csv import ToCSV
 from fastga_he.models.weight.cg.op_cg_variation import OperationalInFlightCGVariation
 from fastga_he.models.performances.op_mission_vector.update_tow import UpdateTOW
@@ -109,6 +112,7 @@ class OperationalMissionVectorSuper(om.Group):
             desc="Boolean to sort the component with proper order for adding subsystem operations",
             allow_none=False,
         )
+        declare_linear_solver_type_option(self.options)
 
     def setup(self):
         self.add_subsystem(
@@ -125,6 +129,7 @@ class OperationalMissionVectorSuper(om.Group):
                 pre_condition_pt=self.options["pre_condition_pt"],
                 use_apply_nonlinear=self.options["use_apply_nonlinear"],
                 sort_component=self.options["sort_component"],
+                linear_solver_type=self.options["linear_solver_type"],
             ),
             promotes=["*"],
         )
@@ -207,6 +212,7 @@ class OperationalMissionVector(om.Group):
             desc="Boolean to sort the component with proper order for adding subsystem operations",
             allow_none=False,
         )
+        declare_linear_solver_type_option(self.options)
 
     def setup(self):
         number_of_points_climb = self.options["number_of_points_climb"]
@@ -354,6 +360,7 @@ class OperationalMissionVector(om.Group):
                 use_linesearch=self.options["use_linesearch"],
                 pre_condition_pt=self.options["pre_condition_pt"],
                 sort_component=self.options["sort_component"],
+                linear_solver_type=self.options["linear_solver_type"],
             ),
             promotes_inputs=[
                 "data:aerodynamics:*",
@@ -797,6 +804,14 @@ class OperationalMissionVector(om.Group):
                 + " service"
             )
 
+    def reset_guess_state(self):
+        """
+        Forgets the take-off weight of the previous run, so that the initial guesses are redone
+        at the next run as on a freshly set up problem.
+        """
+
+        self._last_tow = 0.0
+
     def guess_nonlinear(
         self, inputs, outputs, residuals, discrete_inputs=None, discrete_outputs=None
     ):
@@ -0,0 +1,204 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import logging
+import pathlib
+
+import numpy as np
+import openmdao.api as om
+
+import fastoad.api as oad
+
+from fastga_he.problem_outputs import get_problem_state, set_problem_state
+
+_LOGGER = logging.getLogger(__name__)
+
+# Maximum number of set up problems kept in the cache, each of them holds a full operational
+# mission so they can't be kept indefinitely
+MAX_CACHED_PROBLEMS = 8
+
+
+class OperationalMissionProblemCache:
+    """
+    Cache for the operational mission problems nested inside the payload range computations.
+
+    Building and setting up the nested problem is much more expensive than running it, so it is
+    done once per powertrain file, mission class and mission options (which contain the number of
+    points). Subsequent calls only push the new input values into the existing problem, after
+    having restored its state right after setup (inputs, outputs, residuals and the take-off
+    weight the initial guesses were done for), so that results are the same as with a freshly set
+    up problem and do not depend on the previous calls. An instance is invalidated if the powertrain file has been modified or
+    if the signature of the inputs (name, units and shape), the model options or the active
+    submodels have changed. At most MAX_CACHED_PROBLEMS problems are kept, the least recently
+    used one being discarded first.
+    """
+
+    # Cache for storing the set up problems, keyed by powertrain file, mission class and mission
+    # options, from the least recently used to the most recently used
+    _cache = {}
+
+    @staticmethod
+    def _get_key(mission_class, mission_options: dict) -> tuple:
+        """
+        Returns the key under which the problem built with the given mission class and options
+        is stored.
+        """
+
+        return (
+            str(mission_options["power_train_file_path"]),
+            mission_class.__name__,
+            tuple(sorted((name, str(value)) for name, value in mission_options.items())),
+        )
+
+    @staticmethod
+    def _get_signature(input_metadata: list, inputs, model_options) -> tuple:
+        """
+        Returns the signature of the inputs pushed in the problem, along with the model options
+        and the active submodels as they change the content of the problem. If it changes, the
+        problem has to be set up again.
+        """
+
+        return (
+            tuple(
+                (var_name, var_unit, np.shape(inputs[var_name]))
+                for var_name, var_unit in input_metadata
+            ),
+            repr(model_options),
+            repr(sorted(oad.RegisterSubmodel.active_models.items())),
+        )
+
+    @staticmethod
+    def _check_existing_instance(key: tuple, signature: tuple) -> bool:
+        """
+        Checks the cache to see if an instance of the problem already exists and is usable.
+        Usable means there was no modification to the powertrain file nor to the inputs
+        signature.
+        """
+
+        # If cache is empty, or there is no instance for that key, no instance is usable.
+        if key not in OperationalMissionProblemCache._cache:
+            return False
+
+        cache_instance = OperationalMissionProblemCache._cache[key]
+
+        if cache_instance["last_mod_time"] != pathlib.Path(key[0]).lstat().st_mtime:
+            return False
+
+        if cache_instance["signature"] != signature:
+            return False
+
+        return True
+
+    @staticmethod
+    def _get_cache_instance(key: tuple) -> dict:
+        """
+        Returns the instance stored under the key and moves it to the end of the cache as it is
+        now the most recently used.
+        """
+
+        cache_instance = OperationalMissionProblemCache._cache.pop(key)
+        OperationalMissionProblemCache._cache[key] = cache_instance
+
+        return cache_instance
+
+    @staticmethod
+    def _add_cache_instance(key: tuple, signature: tuple, problem: om.Problem, initial_state: dict):
+        """
+        In the case where no instance were usable and the problem had to be set up, we add it to
+        the cache.
+        """
+
+        cache = OperationalMissionProblemCache._cache
+        cache.pop(key, None)
+        while len(cache) >= MAX_CACHED_PROBLEMS:
+            # Dictionaries keep the insertion order so the first key is the least recently used
+            del cache[next(iter(cache))]
+
+        cache[key] = {
+            "last_mod_time": pathlib.Path(key[0]).lstat().st_mtime,
+            "signature": signature,
+            "problem": problem,
+            "initial_state": initial_state,
+        }
+
+    @staticmethod
+    def clear():
+        """
+        Empties the cache. Mainly useful for tests and benchmarks.
+        """
+
+        OperationalMissionProblemCache._cache = {}
+
+    @staticmethod
+    def get_problem(
+        mission_class,
+        mission_options: dict,
+        input_metadata: list,
+        inputs,
+        model_options: dict = None,
+        use_cache: bool = True,
+    ) -> om.Problem:
+        """
+        Returns a set up problem containing the operational mission with the inputs values set
+        to the one provided. The problem is taken from the cache if a usable instance exists,
+        otherwise it is built, set up and added to the cache.
+
+        :param mission_class: Class of the operational mission to nest in the problem.
+        :param mission_options: Options to give to the operational mission, must contain the
+        powertrain file path.
+        :param input_metadata: List of the names and units of the inputs to push into the
+        problem.
+        :param inputs: Mapping containing the value of the inputs to push into the problem.
+        :param model_options: Model options to give to the problem before its setup.
+        :param use_cache: If False, a new problem is built and set up regardless of the cache
+        content, and it is not stored.
+        """
+
+        key = OperationalMissionProblemCache._get_key(mission_class, mission_options)
+        signature = OperationalMissionProblemCache._get_signature(
+            input_metadata, inputs, model_options
+        )
+
+        if use_cache and OperationalMissionProblemCache._check_existing_instance(key, signature):
+            cache_instance = OperationalMissionProblemCache._get_cache_instance(key)
+            problem = cache_instance["problem"]
+            set_problem_state(problem, cache_instance["initial_state"])
+            for var_name, var_unit in input_metadata:
+                problem.set_val(var_name, inputs[var_name], units=var_unit)
+
+            return problem
+
+        _LOGGER.debug("No usable cached operational mission problem found, setting it up.")
+
+        ivc = om.IndepVarComp()
+        for var_name, var_unit in input_metadata:
+            ivc.add_output(
+                name=var_name,
+                val=inputs[var_name],
+                units=var_unit,
+                shape=np.shape(inputs[var_name]),
+            )
+
+        problem = om.Problem(reports=False)
+        model = problem.model
+
+        model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
+        model.add_subsystem("op_mission", mission_class(**mission_options), promotes=["*"])
+
+        if model_options is not None:
+            problem.model_options = model_options
+        problem.setup()
+        problem.final_setup()
+
+        if use_cache:
+            # The setup of the mission can add entries to the model options, so the signature is
+            # taken after it
+            signature = OperationalMissionProblemCache._get_signature(
+                input_metadata, inputs, model_options
+            )
+            OperationalMissionProblemCache._add_cache_instance(
+                key, signature, problem, get_problem_state(problem)
+            )
+
+        return problem
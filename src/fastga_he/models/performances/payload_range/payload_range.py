@@ -22,6 +22,7 @@ from fastga_he.models.performances.mission_vector.constants import (
 )
 from .mission_range_from_soc import OperationalMissionVectorWithTargetSoC
 from .mission_range_from_fuel import OperationalMissionVectorWithTargetFuel
+from .op_mission_problem_cache import OperationalMissionProblemCache
 
 
 @oad.RegisterOpenMDAOSystem("fastga_he.payload_range.outer", domain=ModelDomain.PERFORMANCE)
@@ -37,6 +38,7 @@ class ComputePayloadRange(om.ExplicitComponent):
         self.configurator = FASTGAHEPowerTrainConfigurator()
 
         self._input_zip = None
+        self._nested_input_metadata = None
         self.cached_problem = None
 
     def initialize(self):
@@ -45,6 +47,13 @@ class ComputePayloadRange(om.ExplicitComponent):
             default="",
             desc="Path to the file containing the description of the power",
         )
+        self.options.declare(
+            name="cache_nested_problem",
+            types=bool,
+            default=True,
+            desc="If True, the nested operational mission problem is only set up once per "
+            "powertrain file and reused at each compute, otherwise it is set up at each compute",
+        )
 
     def setup(self):
         # I'm not really happy with doing it here, but for that model to work we need to ensure
@@ -59,6 +68,7 @@ class ComputePayloadRange(om.ExplicitComponent):
         self.configurator.load(self.options["power_train_file_path"])
 
         self._input_zip = zip_op_mission_input(self.options["power_train_file_path"])
+        self._nested_input_metadata = []
 
         for (
             var_names,
@@ -70,6 +80,8 @@ class ComputePayloadRange(om.ExplicitComponent):
         ) in self._input_zip:
             var_prefix = var_names.split(":")[0]
             if var_prefix == "data" or var_prefix == "settings" or var_prefix == "convergence":
+                if var_names != "data:mission:operational:range":
+                    self._nested_input_metadata.append((var_names, var_unit))
                 if var_shape_by_conn:
                     self.add_input(
                         name=var_names,
@@ -97,6 +109,10 @@ class ComputePayloadRange(om.ExplicitComponent):
 
         else:
             self.add_input("data:mission:payload_range:threshold_SoC", val=np.nan, units="percent")
+            # Add it manually
+            self._nested_input_metadata.append(
+                ("data:mission:payload_range:threshold_SoC", "percent")
+            )
 
         self.add_input("data:weight:aircraft:max_payload", val=np.nan, units="kg")
         self.add_input("data:weight:aircraft:MTOW", val=np.nan, units="kg")
@@ -122,75 +138,44 @@ class ComputePayloadRange(om.ExplicitComponent):
         self.declare_partials(of="*", wrt="*", method="exact")
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
-        self._input_zip = zip_op_mission_input(self.options["power_train_file_path"])
-
-        ivc = om.IndepVarComp()
-        for var_names, var_unit, _, _, _, _ in self._input_zip:
-            var_prefix = var_names.split(":")[0]
-            if var_prefix == "data" or var_prefix == "settings" or var_prefix == "convergence":
-                if var_names != "data:mission:operational:range":
-                    ivc.add_output(
-                        name=var_names,
-                        val=inputs[var_names],
-                        units=var_unit,
-                        shape=np.shape(inputs[var_names]),
-                    )
-
-        # Add it manually
-        if not self.configurator.will_aircraft_mass_vary():
-            ivc.add_output(
-                name="data:mission:payload_range:threshold_SoC",
-                val=inputs["data:mission:payload_range:threshold_SoC"],
-                units="percent",
-                shape=np.shape(inputs["data:mission:payload_range:threshold_SoC"]),
-            )
-        else:
+        if self.configurator.will_aircraft_mass_vary():
             tank_names, tank_types = self.configurator.get_fuel_tank_list()
             mfw = 0.0
             for tank_name, tank_type in zip(tank_names, tank_types):
                 mfw += inputs[PT_DATA_PREFIX + tank_type + ":" + tank_name + ":capacity"]
 
-        self.cached_problem = om.Problem(reports=False)
-        model = self.cached_problem.model
-
-        model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
-        if self.configurator.will_aircraft_mass_vary():
-            model.add_subsystem(
-                "op_mission",
-                OperationalMissionVectorWithTargetFuel(
-                    number_of_points_climb=30,
-                    number_of_points_cruise=30,
-                    number_of_points_descent=20,
-                    number_of_points_reserve=10,
-                    power_train_file_path=self.options["power_train_file_path"],
-                    pre_condition_pt=True,
-                    use_linesearch=False,
-                    use_apply_nonlinear=False,
-                    variable_name_threshold_fuel="data:mission:payload_range:target_fuel",
-                ),
-                promotes=["*"],
-            )
+            mission_class = OperationalMissionVectorWithTargetFuel
+            mission_options = {
+                "variable_name_threshold_fuel": "data:mission:payload_range:target_fuel",
+            }
         else:
-            model.add_subsystem(
-                "op_mission",
-                OperationalMissionVectorWithTargetSoC(
-                    number_of_points_climb=30,
-                    number_of_points_cruise=30,
-                    number_of_points_descent=20,
-                    number_of_points_reserve=10,
-                    power_train_file_path=self.options["power_train_file_path"],
-                    pre_condition_pt=True,
-                    use_linesearch=False,
-                    use_apply_nonlinear=False,
-                    variable_name_target_SoC="data:propulsion:he_power_train:battery_pack:battery_pack_1:SOC_min",
-                    variable_name_threshold_SoC="data:mission:payload_range:threshold_SoC",
-                ),
-                promotes=["*"],
-            )
+            mission_class = OperationalMissionVectorWithTargetSoC
+            mission_options = {
+                "variable_name_target_SoC": "data:propulsion:he_power_train:battery_pack:"
+                "battery_pack_1:SOC_min",
+                "variable_name_threshold_SoC": "data:mission:payload_range:threshold_SoC",
+            }
+
+        mission_options.update(
+            number_of_points_climb=30,
+            number_of_points_cruise=30,
+            number_of_points_descent=20,
+            number_of_points_reserve=10,
+            power_train_file_path=self.options["power_train_file_path"],
+            pre_condition_pt=True,
+            use_linesearch=False,
+            use_apply_nonlinear=False,
+        )
 
         # TODO: find a way to do this that doesn't involve accessing private attribute
-        self.cached_problem.model_options = self._problem_meta["model_options"]
-        self.cached_problem.setup()
+        self.cached_problem = OperationalMissionProblemCache.get_problem(
+            mission_class=mission_class,
+            mission_options=mission_options,
+            input_metadata=self._nested_input_metadata,
+            inputs=inputs,
+            model_options=self._problem_meta["model_options"],
+            use_cache=self.options["cache_nested_problem"],
+        )
 
         # There are four points in the payload range as computed by this framework. Points A, B,
         # D and E. Yes, I know.
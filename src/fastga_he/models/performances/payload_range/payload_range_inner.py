@@ -2,11 +2,15 @@
 # Electric Aircraft.
 # Copyright (C) 2025 ISAE-SUPAERO
 
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+
 import openmdao.api as om
 import numpy as np
 import fastoad.api as oad
 
 from fastga_he.powertrain_builder.powertrain import FASTGAHEPowerTrainConfigurator
+from fastga_he.problem_outputs import get_problem_state, set_problem_state
 from fastga_he.models.performances.op_mission_vector.op_mission_vector import (
     OperationalMissionVector,
 )
@@ -16,6 +20,7 @@ from fastga_he.models.performances.mission_vector.constants import (
 )
 
 from .payload_range import zip_op_mission_input
+from .op_mission_problem_cache import OperationalMissionProblemCache
 
 # Need to fill the vector with an specific value in case the requested payload range point is
 # outside the bound (Can happen when we use the sampling from a different aircraft). Can't  use
@@ -35,6 +40,7 @@ class ComputePayloadRangeInner(om.ExplicitComponent):
         self.configurator = FASTGAHEPowerTrainConfigurator()
 
         self._input_zip = None
+        self._nested_input_metadata = None
         self.cached_problem = None
 
     def initialize(self):
@@ -43,8 +49,39 @@ class ComputePayloadRangeInner(om.ExplicitComponent):
             default="",
             desc="Path to the file containing the description of the power",
         )
+        self.options.declare(
+            name="max_workers",
+            types=int,
+            default=1,
+            desc="Number of processes among which the points inside the payload range envelope "
+            "are spread. With 1, they are computed serially in the current process. With more, "
+            "warm_start must be False",
+        )
+        self.options.declare(
+            name="warm_start",
+            types=bool,
+            default=True,
+            desc="If True, each point starts from the solution of the previous one, which is only "
+            "possible when they are computed serially. If False, each point starts from the state "
+            "of a freshly set up problem, so the results are the same whatever the number of "
+            "processes, but differ from the warm started ones by up to the tolerance of the "
+            "mission solvers",
+        )
+        self.options.declare(
+            name="cache_nested_problem",
+            types=bool,
+            default=True,
+            desc="If True, the nested operational mission problem is only set up once per "
+            "powertrain file and reused at each compute, otherwise it is set up at each compute",
+        )
 
     def setup(self):
+        if self.options["max_workers"] > 1 and self.options["warm_start"]:
+            raise ValueError(
+                "The points of the inner payload range can't be warm started when spread among "
+                "several processes, set the warm_start option to False to use max_workers > 1"
+            )
+
         # I'm not really happy with doing it here, but for that model to work we need to ensure
         # those submodels are active
         oad.RegisterSubmodel.active_models[HE_SUBMODEL_ENERGY_CONSUMPTION] = (
@@ -57,6 +94,7 @@ class ComputePayloadRangeInner(om.ExplicitComponent):
         self.configurator.load(self.options["power_train_file_path"])
 
         self._input_zip = zip_op_mission_input(self.options["power_train_file_path"])
+        self._nested_input_metadata = []
 
         for (
             var_names,
@@ -68,6 +106,8 @@ class ComputePayloadRangeInner(om.ExplicitComponent):
         ) in self._input_zip:
             var_prefix = var_names.split(":")[0]
             if var_prefix == "data" or var_prefix == "settings" or var_prefix == "convergence":
+                if var_names != "data:mission:operational:range":
+                    self._nested_input_metadata.append((var_names, var_unit))
                 if var_shape_by_conn:
                     self.add_input(
                         name=var_names,
@@ -154,84 +194,90 @@ class ComputePayloadRangeInner(om.ExplicitComponent):
         inner_emissions_array = np.zeros_like(inner_payload_array)
         inner_emission_factor_array = np.zeros_like(inner_payload_array)
 
-        self._input_zip = zip_op_mission_input(self.options["power_train_file_path"])
-
-        ivc = om.IndepVarComp()
-        for var_names, var_unit, _, _, _, _ in self._input_zip:
-            var_prefix = var_names.split(":")[0]
-            if var_prefix == "data" or var_prefix == "settings" or var_prefix == "convergence":
-                if var_names != "data:mission:operational:range":
-                    ivc.add_output(
-                        name=var_names,
-                        val=inputs[var_names],
-                        units=var_unit,
-                        shape=np.shape(inputs[var_names]),
-                    )
-
-        self.cached_problem = om.Problem(reports=False)
-        model = self.cached_problem.model
-
-        model.add_subsystem("ivc", ivc, promotes_outputs=["*"])
-        model.add_subsystem(
-            "op_mission",
-            OperationalMissionVector(
-                number_of_points_climb=30,
-                number_of_points_cruise=30,
-                number_of_points_descent=20,
-                number_of_points_reserve=10,
-                power_train_file_path=self.options["power_train_file_path"],
-                pre_condition_pt=True,
-                use_linesearch=False,
-                use_apply_nonlinear=False,
-            ),
-            promotes=["*"],
+        in_envelope = np.array(
+            [
+                self.is_in_payload_range_envelope(
+                    payload_envelope=outer_payload_array,
+                    range_envelope=outer_range_array,
+                    payload_point=payload_value,
+                    range_point=range_value,
+                )
+                for payload_value, range_value in zip(inner_payload_array, inner_range_array)
+            ],
+            dtype=bool,
         )
+        idx_in_envelope = np.where(in_envelope)[0]
+
+        mission_options = {
+            "number_of_points_climb": 30,
+            "number_of_points_cruise": 30,
+            "number_of_points_descent": 20,
+            "number_of_points_reserve": 10,
+            "power_train_file_path": self.options["power_train_file_path"],
+            "pre_condition_pt": True,
+            "use_linesearch": False,
+            "use_apply_nonlinear": False,
+        }
+        nested_inputs = {
+            var_name: inputs[var_name].copy() for var_name, _ in self._nested_input_metadata
+        }
+
+        max_workers = min(self.options["max_workers"], len(idx_in_envelope))
+
+        if max_workers > 1:
+            # Each worker gets a contiguous share of the points and sets up its own problem once
+            idx_per_worker = np.array_split(idx_in_envelope, max_workers)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        _compute_inner_points_in_worker,
+                        mission_options,
+                        self._nested_input_metadata,
+                        nested_inputs,
+                        inner_payload_array[idx_that_worker],
+                        inner_range_array[idx_that_worker],
+                        dict(oad.RegisterSubmodel.active_models),
+                        self.options["cache_nested_problem"],
+                    )
+                    for idx_that_worker in idx_per_worker
+                ]
+                for idx_that_worker, future in zip(idx_per_worker, futures):
+                    fuel_that_worker, energy_that_worker = future.result()
+                    inner_fuel_array[idx_that_worker] = fuel_that_worker
+                    inner_energy_array[idx_that_worker] = energy_that_worker
 
-        self.cached_problem.setup()
-
-        for idx, range_value in enumerate(inner_range_array):
-            if self.is_in_payload_range_envelope(
-                payload_envelope=outer_payload_array,
-                range_envelope=outer_range_array,
-                payload_point=inner_payload_array[idx],
-                range_point=range_value,
-            ):
-                self.cached_problem.set_val(
-                    "data:mission:operational:payload:mass",
-                    inner_payload_array[idx],
-                    units="kg",
-                )
-                self.cached_problem.set_val(
-                    "data:mission:operational:range",
-                    range_value,
-                    units="NM",
-                )
-                self.cached_problem.run_model()
-
-                fuel_that_mission = self.cached_problem.get_val(
-                    "data:mission:operational:fuel", units="kg"
-                )[0]
-                energy_that_mission = self.cached_problem.get_val(
-                    "data:mission:operational:energy", units="kW*h"
-                )[0]
-                emission_that_mission = (
-                    fuel_that_mission * carbon_intensity_fuel
-                    + energy_that_mission * 3.6 * carbon_intensity_electricity
-                )
-                emission_factor_that_mission = (
-                    emission_that_mission / inner_payload_array[idx] / (range_value * 1.852)
-                )
+        else:
+            self.cached_problem = OperationalMissionProblemCache.get_problem(
+                mission_class=OperationalMissionVector,
+                mission_options=mission_options,
+                input_metadata=self._nested_input_metadata,
+                inputs=nested_inputs,
+                use_cache=self.options["cache_nested_problem"],
+            )
+            (
+                inner_fuel_array[idx_in_envelope],
+                inner_energy_array[idx_in_envelope],
+            ) = compute_inner_points(
+                self.cached_problem,
+                inner_payload_array[idx_in_envelope],
+                inner_range_array[idx_in_envelope],
+                warm_start=self.options["warm_start"],
+            )
 
-                inner_fuel_array[idx] = fuel_that_mission
-                inner_energy_array[idx] = energy_that_mission
-                inner_emissions_array[idx] = emission_that_mission.item()
-                inner_emission_factor_array[idx] = emission_factor_that_mission.item()
+        inner_emissions_array[idx_in_envelope] = (
+            inner_fuel_array[idx_in_envelope] * carbon_intensity_fuel
+            + inner_energy_array[idx_in_envelope] * 3.6 * carbon_intensity_electricity
+        )
+        inner_emission_factor_array[idx_in_envelope] = (
+            inner_emissions_array[idx_in_envelope]
+            / inner_payload_array[idx_in_envelope]
+            / (inner_range_array[idx_in_envelope] * 1.852)
+        )
 
-            else:
-                inner_fuel_array[idx] = INVALID_COMPUTATION_RESULT
-                inner_energy_array[idx] = INVALID_COMPUTATION_RESULT
-                inner_emissions_array[idx] = INVALID_COMPUTATION_RESULT
-                inner_emission_factor_array[idx] = INVALID_COMPUTATION_RESULT
+        inner_fuel_array[~in_envelope] = INVALID_COMPUTATION_RESULT
+        inner_energy_array[~in_envelope] = INVALID_COMPUTATION_RESULT
+        inner_emissions_array[~in_envelope] = INVALID_COMPUTATION_RESULT
+        inner_emission_factor_array[~in_envelope] = INVALID_COMPUTATION_RESULT
 
         outputs["data:mission:inner_payload_range:fuel"] = inner_fuel_array
         outputs["data:mission:inner_payload_range:energy"] = inner_energy_array
@@ -259,3 +305,73 @@ class ComputePayloadRangeInner(om.ExplicitComponent):
                 return False
             else:
                 return True
+
+
+def compute_inner_points(
+    problem: om.Problem,
+    payload_array: np.ndarray,
+    range_array: np.ndarray,
+    warm_start: bool = True,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the fuel and energy consumed on each of the payload range points given, reusing the
+    same operational mission problem.
+
+    :param problem: Set up problem containing the operational mission.
+    :param payload_array: Payload of each point, in kg.
+    :param range_array: Range of each point, in NM.
+    :param warm_start: If True, each point starts from the solution of the previous one,
+    otherwise the state the problem is in when given, which should be the one of a freshly set up
+    problem, is restored before each point so that the results do not depend on the order in
+    which points are computed.
+    :return: the fuel consumed in kg and energy consumed in kW*h on each point.
+    """
+
+    fuel_array = np.zeros_like(payload_array)
+    energy_array = np.zeros_like(payload_array)
+
+    initial_state = None if warm_start else get_problem_state(problem)
+
+    for idx, (payload_value, range_value) in enumerate(zip(payload_array, range_array)):
+        if not warm_start:
+            set_problem_state(problem, initial_state)
+
+        problem.set_val("data:mission:operational:payload:mass", payload_value, units="kg")
+        problem.set_val("data:mission:operational:range", range_value, units="NM")
+        problem.run_model()
+
+        fuel_array[idx] = problem.get_val("data:mission:operational:fuel", units="kg")[0]
+        energy_array[idx] = problem.get_val("data:mission:operational:energy", units="kW*h")[0]
+
+    return fuel_array, energy_array
+
+
+def _compute_inner_points_in_worker(
+    mission_options: dict,
+    input_metadata: list,
+    inputs: dict,
+    payload_array: np.ndarray,
+    range_array: np.ndarray,
+    active_models: dict,
+    use_cache: bool,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Function executed by each worker of the process pool. The operational mission problem is
+    taken from the cache of the worker process if it exists, so it is only set up once per
+    worker. The problem is returned in the state of a freshly set up one, even if the worker
+    inherited an already run problem from the parent process, and points are computed without
+    warm start so that the results do not depend on how they are spread among the workers.
+    """
+
+    # Submodels may have been activated at runtime in the parent process
+    oad.RegisterSubmodel.active_models.update(active_models)
+
+    problem = OperationalMissionProblemCache.get_problem(
+        mission_class=OperationalMissionVector,
+        mission_options=mission_options,
+        input_metadata=input_metadata,
+        inputs=inputs,
+        use_cache=use_cache,
+    )
+
+    return compute_inner_points(problem, payload_array, range_array, warm_start=False)
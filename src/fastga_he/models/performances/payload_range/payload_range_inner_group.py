@@ -36,6 +36,21 @@ class ComputePayloadRangeInnerGroup(om.Group):
             default=12,
             desc="Number of sample inside the payload range envelope",
         )
+        self.options.declare(
+            name="max_workers",
+            types=int,
+            default=1,
+            desc="Number of processes among which the points inside the payload range envelope "
+            "are spread. With 1, they are computed serially in the current process. With more, "
+            "warm_start must be False",
+        )
+        self.options.declare(
+            name="warm_start",
+            types=bool,
+            default=True,
+            desc="If True, each point inside the payload range envelope starts from the solution "
+            "of the previous one, which is only possible when they are computed serially",
+        )
 
     def setup(self):
         if self.options["generate_sample"]:
@@ -51,6 +66,8 @@ class ComputePayloadRangeInnerGroup(om.Group):
             name="compute_payload_range_inner",
             subsys=ComputePayloadRangeInner(
                 power_train_file_path=self.options["power_train_file_path"],
+                max_workers=self.options["max_workers"],
+                warm_start=self.options["warm_start"],
             ),
             promotes=["*"],
         )
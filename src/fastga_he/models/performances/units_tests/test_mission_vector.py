@@ -22,8 +22,10 @@ import warnings
 
 import numpy as np
 import openmdao.api as om
+import scipy.sparse as sp
 
 import plotly.graph_objects as go
+from scipy.sparse.linalg import splu
 
 import fastoad.api as oad
 
@@ -78,7 +80,21 @@ from fastga_he.models.performances.mission_vector.constants import (
 
 from fastga_he.models.performances.mission_vector.initialization.initialize_cg import InitializeCoG
 from fastga_he.models.performances.mission_vector.mission_vector import MissionVector
+from fastga_he.models.performances.mission_vector.adaptive_discretization import (
+    PHASES,
+    refine_mission_discretization,
+    run_adaptive_mission,
+)
+from fastga_he.models.performances.mission_vector.mission.point_block_direct_solver import (
+    PointBlockDirectSolver,
+    PermutedLU,
+    compute_block_triangular_reordering,
+)
 from fastga_he.models.propulsion.assemblers.sizing_from_pt_file import PowerTrainSizingFromFile
+from fastga_he.models.propulsion.assemblers.profiling import (
+    get_power_train_profiler,
+    PROFILING_ENVIRONMENT_VARIABLE,
+)
 from fastga_he.models.performances.op_mission_vector.update_tow import UpdateTOW
 
 from fastga_he.models.performances.payload_range.payload_range import ComputePayloadRange
@@ -93,6 +109,10 @@ from fastga_he.models.performances.payload_range.payload_range_inner import Comp
 from fastga_he.models.performances.payload_range.payload_range_inner_group import (
     ComputePayloadRangeInnerGroup,
 )
+from fastga_he.models.performances.payload_range.op_mission_problem_cache import (
+    OperationalMissionProblemCache,
+    MAX_CACHED_PROBLEMS,
+)
 from fastga_he.models.performances.energy_specific_air_range import EnergySpecificAirRange
 
 from fastga_he.gui.power_train_network_viewer import power_train_network_viewer
@@ -1735,6 +1755,241 @@ def test_mission_vector_from_yml():
     assert pt_mass == pytest.approx(1254.45, abs=1e-2)
 
 
+def test_mission_vector_linear_solver_type():
+    pt_file_path = pth.join(DATA_FOLDER_PATH, "turboshaft_propulsion.yml")
+
+    def get_group(linear_solver_type):
+        group = om.Group()
+        group.add_subsystem(
+            "pt_sizing",
+            PowerTrainSizingFromFile(power_train_file_path=pt_file_path),
+            promotes=["*"],
+        )
+        group.add_subsystem(
+            "mission_vector",
+            MissionVector(
+                number_of_points_climb=10,
+                number_of_points_cruise=10,
+                number_of_points_descent=10,
+                number_of_points_reserve=10,
+                power_train_file_path=pt_file_path,
+                use_linesearch=False,
+                linear_solver_type=linear_solver_type,
+            ),
+            promotes=["*"],
+        )
+
+        return group
+
+    ivc = get_indep_var_comp(
+        list_inputs(get_group("sparse")), __file__, "sample_turboshaft_propulsion.xml"
+    )
+
+    # The sparse solver, with the Jacobian assembled as a CSC matrix, is the one the equilibrium
+    # used before the option was added so it serves as reference
+    problem_sparse = run_system(get_group("sparse"), ivc)
+    problem_dense = run_system(get_group("dense"), ivc)
+    problem_point_block = run_system(get_group("point_block"), ivc)
+
+    equilibrium = problem_sparse.model.component.mission_vector.solve_equilibrium
+    assert equilibrium.compute_dep_equilibrium.linear_solver.options["assemble_jac"]
+    equilibrium = problem_dense.model.component.mission_vector.solve_equilibrium
+    assert not equilibrium.compute_dep_equilibrium.linear_solver.options["assemble_jac"]
+    equilibrium = problem_point_block.model.component.mission_vector.solve_equilibrium
+    assert isinstance(equilibrium.compute_dep_equilibrium.linear_solver, PointBlockDirectSolver)
+
+    for var_name in [
+        "data:mission:sizing:fuel",
+        "data:mission:sizing:duration",
+        "data:mission:sizing:energy",
+        "data:propulsion:he_power_train:turboshaft:turboshaft_1:power_max",
+    ]:
+        assert problem_dense.get_val(var_name) == pytest.approx(
+            problem_sparse.get_val(var_name), rel=1e-6
+        )
+        assert problem_point_block.get_val(var_name) == pytest.approx(
+            problem_sparse.get_val(var_name), rel=1e-6
+        )
+
+
+def test_mission_vector_power_train_profiling(tmp_path):
+    pt_file_path = pth.join(DATA_FOLDER_PATH, "turboshaft_propulsion.yml")
+    profiling_file_path = str(tmp_path / "profiling.json")
+
+    group = om.Group()
+    group.add_subsystem(
+        "pt_sizing",
+        PowerTrainSizingFromFile(power_train_file_path=pt_file_path),
+        promotes=["*"],
+    )
+    group.add_subsystem(
+        "mission_vector",
+        MissionVector(
+            number_of_points_climb=5,
+            number_of_points_cruise=5,
+            number_of_points_descent=5,
+            number_of_points_reserve=1,
+            power_train_file_path=pt_file_path,
+            use_linesearch=False,
+            power_train_profiling_file_path=profiling_file_path,
+        ),
+        promotes=["*"],
+    )
+
+    ivc = get_indep_var_comp(list_inputs(group), __file__, "sample_turboshaft_propulsion.xml")
+
+    profiler = get_power_train_profiler(profiling_file_path)
+    profiler.reset()
+
+    run_system(group, ivc)
+
+    # The option does not leak to the other problems of the process
+    assert PROFILING_ENVIRONMENT_VARIABLE not in os.environ
+
+    # Only the performances of the mission are profiled, the components that are groups, like
+    # the turboshaft, are split into their own components
+    table = profiler.get_table()
+    assert "PerformancesTurboshaft" in set(table["type"])
+    assert not any(table["type"].str.startswith("Sizing"))
+    turboshaft_kernels = set(table.loc[table["type"] == "PerformancesTurboshaft", "kernel"])
+    assert "solve_nonlinear" in turboshaft_kernels
+    assert any(kernel.endswith(".compute") for kernel in turboshaft_kernels)
+
+    profiler.reset()
+
+
+def test_mission_vector_adaptive_discretization():
+    pt_file_path = pth.join(DATA_FOLDER_PATH, "turboshaft_propulsion.yml")
+
+    def get_group(**mission_options):
+        group = om.Group()
+        group.add_subsystem(
+            "pt_sizing",
+            PowerTrainSizingFromFile(power_train_file_path=pt_file_path),
+            promotes=["*"],
+        )
+        group.add_subsystem(
+            "mission_vector",
+            MissionVector(
+                power_train_file_path=pt_file_path, use_linesearch=False, **mission_options
+            ),
+            promotes=["*"],
+        )
+
+        return group
+
+    ivc = get_indep_var_comp(list_inputs(get_group()), __file__, "sample_turboshaft_propulsion.xml")
+
+    max_number_of_points = {"climb": 40, "cruise": 40, "descent": 20, "reserve": 8}
+
+    problem, history = refine_mission_discretization(
+        lambda mission_options: run_system(get_group(**mission_options), ivc),
+        tolerance=5e-3,
+        initial_number_of_points={"climb": 5, "cruise": 5, "descent": 5, "reserve": 1},
+        max_number_of_points=max_number_of_points,
+    )
+
+    problem_fine = run_system(
+        get_group(
+            **{
+                "number_of_points_" + phase: number_of_points
+                for phase, number_of_points in max_number_of_points.items()
+            }
+        ),
+        ivc,
+    )
+
+    # The adapted discretization is within tolerance of the fine one with fewer points
+    assert problem.get_val("data:mission:sizing:fuel", units="kg") == pytest.approx(
+        problem_fine.get_val("data:mission:sizing:fuel", units="kg"), rel=1e-2
+    )
+    final_number_of_points = history.iloc[-1]
+    assert sum(
+        final_number_of_points["number_of_points_" + phase] for phase in max_number_of_points
+    ) < sum(max_number_of_points.values())
+    assert len(history) >= 2
+
+
+def test_run_adaptive_mission():
+    # Define used files depending on options
+    xml_file_name = "sample_turboshaft_propulsion.xml"
+    process_file_name = "turboshaft_propulsion_mission_vector.yml"
+
+    configuration_file_path = pth.join(DATA_FOLDER_PATH, process_file_name)
+    configurator = oad.FASTOADProblemConfigurator(configuration_file_path)
+
+    # Create inputs
+    ref_inputs = pth.join(DATA_FOLDER_PATH, xml_file_name)
+    problem_uniform = configurator.get_problem()
+    problem_uniform.write_needed_inputs(ref_inputs)
+    problem_uniform.read_inputs()
+    problem_uniform.setup()
+    problem_uniform.run_model()
+
+    initial_number_of_points = {"climb": 5, "cruise": 5, "descent": 5, "reserve": 1}
+    max_number_of_points = {"climb": 30, "cruise": 30, "descent": 20, "reserve": 10}
+
+    problem, history = run_adaptive_mission(
+        configuration_file_path,
+        mission_path="performances",
+        tolerance=5e-3,
+        initial_number_of_points=initial_number_of_points,
+        max_number_of_points=max_number_of_points,
+    )
+
+    # The number of points of each phase starts from the initial one, is doubled at each
+    # refinement and is used by the mission of the problem that is returned
+    assert list(history["number_of_points_climb"]) == [5, 10, 20]
+    assert list(history["number_of_points_cruise"]) == [5, 10, 20]
+    assert list(history["number_of_points_descent"]) == [5, 10, 20]
+    assert list(history["number_of_points_reserve"]) == [1, 2, 2]
+    for phase in PHASES:
+        assert (
+            problem.model.performances.options["number_of_points_" + phase]
+            == history["number_of_points_" + phase].iloc[-1]
+        )
+
+    # Same fuel as the mission with the uniform discretization of the configuration file
+    assert problem.get_val("data:mission:sizing:fuel", units="kg") == pytest.approx(
+        problem_uniform.get_val("data:mission:sizing:fuel", units="kg"), rel=5e-3
+    )
+
+
+def test_block_triangular_reordering():
+    # Block lower triangular matrix whose rows and columns have been shuffled, as the
+    # Jacobian of the mission would be
+    rng = np.random.default_rng(0)
+    nb_blocks = 20
+    block_size = 4
+    size = nb_blocks * block_size
+
+    matrix = np.zeros((size, size))
+    for i in range(nb_blocks):
+        block = slice(i * block_size, (i + 1) * block_size)
+        matrix[block, block] = rng.random((block_size, block_size)) + np.eye(block_size)
+        if i > 0:
+            matrix[block, : i * block_size] = rng.random((block_size, i * block_size)) * (
+                rng.random((block_size, i * block_size)) < 0.1
+            )
+
+    row_shuffle = rng.permutation(size)
+    col_shuffle = rng.permutation(size)
+    matrix = sp.csc_matrix(matrix[row_shuffle][:, col_shuffle])
+
+    row_perm, col_perm, data_perm, indices, indptr = compute_block_triangular_reordering(matrix)
+    reordered_matrix = sp.csc_matrix((matrix.data[data_perm], indices, indptr), shape=(size, size))
+
+    assert np.array_equal(reordered_matrix.toarray(), matrix.toarray()[row_perm][:, col_perm])
+    # Fill-in of the factorization is confined to the diagonal blocks, which have at most the
+    # size of the original ones
+    assert np.count_nonzero(np.triu(reordered_matrix.toarray(), k=block_size)) == 0
+
+    lu = PermutedLU(splu(reordered_matrix, permc_spec="NATURAL"), row_perm, col_perm)
+    rhs = rng.random(size)
+    assert matrix @ lu.solve(rhs) == pytest.approx(rhs, rel=1e-8)
+    assert matrix.T @ lu.solve(rhs, "T") == pytest.approx(rhs, rel=1e-8)
+
+
 def test_op_mission_vector_from_yml():
     # Define used files depending on options
     xml_file_name = "op_mission_inputs.xml"
@@ -2627,6 +2882,79 @@ def test_payload_range_hybrid():
     assert ef_array == pytest.approx([0.0, 1.9887, 3.6624, 0.0], rel=1e-3)
 
 
+def test_payload_range_cached_problem():
+    oad.RegisterSubmodel.active_models["submodel.performances.mission_vector.climb_speed"] = None
+    oad.RegisterSubmodel.active_models["submodel.performances.mission_vector.descent_speed"] = None
+
+    xml_file = "input_payload_range_fuel.xml"
+    pt_file_path = pth.join(DATA_FOLDER_PATH, "turboshaft_propulsion_for_payload_range.yml")
+
+    OperationalMissionProblemCache.clear()
+
+    input_list = list_inputs(ComputePayloadRange(power_train_file_path=pt_file_path))
+
+    # Research independent input value in .xml file
+    ivc = get_indep_var_comp(
+        input_list,
+        __file__,
+        xml_file,
+    )
+
+    problem = run_system(ComputePayloadRange(power_train_file_path=pt_file_path), ivc)
+
+    nested_problem = problem.model.component.cached_problem
+    assert len(OperationalMissionProblemCache._cache) == 1
+    cached_instance = next(iter(OperationalMissionProblemCache._cache.values()))
+    assert cached_instance["problem"] is nested_problem
+
+    # Second run, the nested problem should be reused and only the values should be updated
+    problem.set_val("data:weight:aircraft:MTOW", units="kg", val=3400.0)
+    problem.run_model()
+
+    assert problem.model.component.cached_problem is nested_problem
+    assert len(OperationalMissionProblemCache._cache) == 1
+
+    # Results should be identical to the one obtained with a freshly set up problem
+    problem_no_cache = run_system(
+        ComputePayloadRange(power_train_file_path=pt_file_path, cache_nested_problem=False),
+        ivc,
+    )
+    problem_no_cache.set_val("data:weight:aircraft:MTOW", units="kg", val=3400.0)
+    problem_no_cache.run_model()
+
+    assert problem.get_val("data:mission:payload_range:range", units="NM") == pytest.approx(
+        problem_no_cache.get_val("data:mission:payload_range:range", units="NM"), rel=1e-8
+    )
+    assert problem.get_val("data:mission:payload_range:payload", units="kg") == pytest.approx(
+        problem_no_cache.get_val("data:mission:payload_range:payload", units="kg"), rel=1e-8
+    )
+
+
+def test_payload_range_cached_problem_bounded():
+    pt_file_path = pth.join(DATA_FOLDER_PATH, "turboshaft_propulsion_for_payload_range.yml")
+
+    OperationalMissionProblemCache.clear()
+
+    keys = [(pt_file_path, "mission_" + str(i), ()) for i in range(MAX_CACHED_PROBLEMS + 2)]
+    for key in keys[:MAX_CACHED_PROBLEMS]:
+        OperationalMissionProblemCache._add_cache_instance(key, (), om.Problem(), {})
+
+    # Using the first problem makes the second one the least recently used
+    assert OperationalMissionProblemCache._check_existing_instance(keys[0], ())
+    OperationalMissionProblemCache._get_cache_instance(keys[0])
+
+    for key in keys[MAX_CACHED_PROBLEMS:]:
+        OperationalMissionProblemCache._add_cache_instance(key, (), om.Problem(), {})
+
+    assert len(OperationalMissionProblemCache._cache) == MAX_CACHED_PROBLEMS
+    assert keys[0] in OperationalMissionProblemCache._cache
+    assert keys[1] not in OperationalMissionProblemCache._cache
+    assert keys[2] not in OperationalMissionProblemCache._cache
+    assert keys[-1] in OperationalMissionProblemCache._cache
+
+    OperationalMissionProblemCache.clear()
+
+
 def test_sample_payload_range_space():
     xml_file = "input_payload_range_hybrid.xml"
 
@@ -2983,6 +3311,54 @@ def test_payload_range_inner_with_impossible_ranges():
     )
 
 
+def test_payload_range_inner_parallel():
+    oad.RegisterSubmodel.active_models["submodel.performances.mission_vector.climb_speed"] = None
+    oad.RegisterSubmodel.active_models["submodel.performances.mission_vector.descent_speed"] = None
+
+    xml_file = "input_payload_range_fuel.xml"
+    pt_file_path = pth.join(DATA_FOLDER_PATH, "turboshaft_propulsion_for_payload_range.yml")
+
+    input_list = list_inputs(ComputePayloadRangeInner(power_train_file_path=pt_file_path))
+
+    # Research independent input value in .xml file
+    ivc = get_indep_var_comp(
+        input_list,
+        __file__,
+        xml_file,
+    )
+
+    problem_serial = run_system(ComputePayloadRangeInner(power_train_file_path=pt_file_path), ivc)
+    problem_serial_cold = run_system(
+        ComputePayloadRangeInner(power_train_file_path=pt_file_path, warm_start=False), ivc
+    )
+    problem_parallel = run_system(
+        ComputePayloadRangeInner(
+            power_train_file_path=pt_file_path, max_workers=3, warm_start=False
+        ),
+        ivc,
+    )
+
+    for output_name in [
+        "data:mission:inner_payload_range:fuel",
+        "data:mission:inner_payload_range:energy",
+        "data:mission:inner_payload_range:emissions",
+        "data:mission:inner_payload_range:emission_factor",
+    ]:
+        # Without warm start the points are independent, so the results should not depend on
+        # how they are spread
+        np.testing.assert_array_equal(
+            problem_serial_cold.get_val(output_name), problem_parallel.get_val(output_name)
+        )
+        # With the default warm start, they only differ by the tolerance of the mission solvers
+        assert problem_parallel.get_val(output_name) == pytest.approx(
+            problem_serial.get_val(output_name), rel=1e-3
+        )
+
+    # Points spread among processes can't start from the solution of the previous one
+    with pytest.raises(ValueError):
+        run_system(ComputePayloadRangeInner(power_train_file_path=pt_file_path, max_workers=3), ivc)
+
+
 def test_payload_range_inner_with_builtin_sampling():
     oad.RegisterSubmodel.active_models["submodel.performances.mission_vector.climb_speed"] = None
     oad.RegisterSubmodel.active_models["submodel.performances.mission_vector.descent_speed"] = None
@@ -16,6 +16,7 @@ from .constants import (
     SUBMODEL_POWER_TRAIN_DELTA_CM,
     SUBMODEL_POWER_TRAIN_DELTA_CD,
 )
+from .profiling import profile_power_train_components, register_power_train_component
 from fastga_he.models.performances.mission_vector.constants import HE_SUBMODEL_DEP_EFFECT
 
 DEP_EFFECT_FROM_PT_FILE = "fastga_he.submodel.performances.dep_effect.from_pt_file"
@@ -131,7 +132,7 @@ class AerodynamicDeltasFromPTFile(om.Group):
             # universal and thus comes from the SPT field
             self.add_subsystem(
                 name=component_name,
-                subsys=local_sub_sys,
+                subsys=register_power_train_component(local_sub_sys, component_name),
                 promotes_inputs=component_slipstream_promotes,
                 promotes_outputs=[],
             )
@@ -185,6 +186,10 @@ class AerodynamicDeltasFromPTFile(om.Group):
                 "delta_cds_summer." + component_name + "_delta_Cd",
             )
 
+    def configure(self):
+        # The components that are groups only have their subsystems once set up
+        profile_power_train_components(self)
+
 
 class SlipstreamAirframeLiftClean(om.ExplicitComponent):
     """
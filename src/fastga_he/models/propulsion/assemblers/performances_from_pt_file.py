@@ -15,6 +15,7 @@ from fastga_he.models.propulsion.assemblers.energy_consumption_from_pt_file impo
 import fastga_he.models.propulsion.components as he_comp
 
 from .constants import SUBMODEL_POWER_TRAIN_PERF, SUBMODEL_THRUST_DISTRIBUTOR
+from .profiling import profile_power_train_components, register_power_train_component
 
 PERFORMANCE_FROM_PT_FILE = "fastga_he.submodel.propulsion.performances.from_pt_file"
 oad.RegisterSubmodel.active_models[SUBMODEL_POWER_TRAIN_PERF] = PERFORMANCE_FROM_PT_FILE
@@ -176,7 +177,7 @@ class PowerTrainPerformancesFromFile(om.Group):
 
             self.add_subsystem(
                 name=component_name,
-                subsys=local_sub_sys,
+                subsys=register_power_train_component(local_sub_sys, component_name),
                 promotes=["data:*"] + component_promote,
             )
 
@@ -219,6 +220,10 @@ class PowerTrainPerformancesFromFile(om.Group):
         # The performances watcher was moved at the same level as the mission performances
         # watcher so that it is not opened as much, they could be merged eventually
 
+    def configure(self):
+        # The components that are groups only have their subsystems once set up
+        profile_power_train_components(self)
+
     def guess_nonlinear(
         self, inputs, outputs, residuals, discrete_inputs=None, discrete_outputs=None
     ):
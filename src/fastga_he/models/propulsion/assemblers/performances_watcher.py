@@ -17,6 +17,10 @@ from fastga_he.powertrain_builder.powertrain import (
 )
 
 from fastga_he.models.performances.mission_vector.constants import HE_SUBMODEL_DEP_EFFECT
+from fastga_he.models.performances.mission_vector.columnar_results import (
+    is_columnar_file,
+    write_columnar_results,
+)
 from fastga_he.models.propulsion.assemblers.delta_from_pt_file import DEP_EFFECT_FROM_PT_FILE
 
 
@@ -26,6 +30,8 @@ class PowerTrainPerformancesWatcher(om.ExplicitComponent):
 
         self.configurator = FASTGAHEPowerTrainConfigurator()
         self.header_name = []
+        # Units of each column, only saved when the results are written in the columnar format
+        self.header_units = []
 
         self.right_submodel_slip_effect = False
 
@@ -49,6 +55,10 @@ class PowerTrainPerformancesWatcher(om.ExplicitComponent):
 
         number_of_points = self.options["number_of_points"]
 
+        # The columns are listed again at each setup
+        self.header_name = []
+        self.header_units = []
+
         self.configurator.load(self.options["power_train_file_path"])
 
         # See mission_vector.py for the reason why we need this boolean
@@ -78,6 +88,8 @@ class PowerTrainPerformancesWatcher(om.ExplicitComponent):
                 shape=number_of_points,
             )
 
+            self.header_units.append(component_performances_watcher_unit)
+
             if component_performances_watcher_unit is None:
                 component_performances_watcher_unit = "-"
 
@@ -101,6 +113,7 @@ class PowerTrainPerformancesWatcher(om.ExplicitComponent):
             self.header_name.append(
                 mission_variable_name + " [" + PROMOTION_FROM_MISSION[mission_variable_name] + "]"
             )
+            self.header_units.append(PROMOTION_FROM_MISSION[mission_variable_name])
 
         if self.right_submodel_slip_effect:
             (
@@ -128,6 +141,8 @@ class PowerTrainPerformancesWatcher(om.ExplicitComponent):
                 # using slipstream effect for taxi but for the performances we need it so the
                 # quick fix is to do that. More shenanigans to follow
 
+                self.header_units.append(components_slip_performances_watchers_unit)
+
                 if components_slip_performances_watchers_unit is None:
                     components_slip_performances_watchers_unit = "-"
 
@@ -145,11 +160,13 @@ class PowerTrainPerformancesWatcher(om.ExplicitComponent):
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         file_path = self.configurator.get_watcher_file_path()
 
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        # The columnar writer takes care of replacing the file
+        if not is_columnar_file(file_path):
+            if os.path.exists(file_path):
+                os.remove(file_path)
 
-        if not os.path.exists(os.path.dirname(file_path)):
-            os.mkdir(os.path.dirname(file_path))
+            if not os.path.exists(os.path.dirname(file_path)):
+                os.mkdir(os.path.dirname(file_path))
 
         (
             components_name,
@@ -199,4 +216,7 @@ class PowerTrainPerformancesWatcher(om.ExplicitComponent):
 
             results_df[corresponding_header] = value_to_save
 
-        results_df.to_csv(file_path)
+        if is_columnar_file(file_path):
+            write_columnar_results(file_path, results_df, units=self.header_units)
+        else:
+            results_df.to_csv(file_path)
@@ -0,0 +1,310 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import atexit
+import functools
+import json
+import logging
+import multiprocessing
+import multiprocessing.util
+import os
+import os.path as pth
+import sys
+import time
+import weakref
+
+import pandas as pd
+import openmdao.api as om
+from openmdao.core.system import System
+
+_LOGGER = logging.getLogger(__name__)
+
+# Environment variable containing the path to the json file in which the profiling of the power
+# train components of the assemblers is written at the end of the process, if not set, they are
+# only profiled where a file is given, e.g. by the option of the mission. An environment variable
+# is used so that it can be set without modifying the problem, and so that child processes, e.g.
+# the workers of a parallel DOE, inherit it.
+PROFILING_ENVIRONMENT_VARIABLE = "FASTGA_HE_POWER_TRAIN_PROFILING_FILE"
+
+# Methods of the components that are timed
+COMPONENT_KERNELS = (
+    "compute",
+    "compute_partials",
+    "apply_nonlinear",
+    "solve_nonlinear",
+    "linearize",
+    "guess_nonlinear",
+)
+# Kernel under which the nonlinear solver of the components that are groups is reported. It
+# includes the time spent in their subsystems and in the solver itself, e.g. the internal Newton
+# of the inverter.
+GROUP_SOLVER_KERNEL = "solve_nonlinear"
+
+COLUMNS = ["component", "type", "kernel", "calls", "wall_time", "allocated_blocks"]
+
+
+class PowerTrainProfiler:
+    """
+    Aggregates, for each power train component and each of its kernels (compute,
+    compute_partials, ...), the number of calls, the wall time and the number of memory blocks
+    still allocated by the interpreter when the kernel returns.
+    """
+
+    def __init__(self):
+        # (component name, component type, kernel) -> [calls, wall time, allocated blocks]
+        self.records = {}
+        # Systems whose kernels are already timed, so that they are not timed twice
+        self._wrapped_systems = weakref.WeakSet()
+
+    def reset(self):
+        """Removes all the records."""
+
+        self.records = {}
+
+    def wrap(self, system: System, component_name: str) -> System:
+        """
+        Replaces the kernels of the system by timed ones and returns it. The type of the
+        component is the name of its class, e.g. "PerformancesBatteryPack". If the component is a
+        group, the kernels of each of its components are timed and reported under their path in
+        the group, e.g. "efficiency.compute", along with its nonlinear solver.
+
+        :param system: OpenMDAO system of the component, once set up so that the components of a
+        group exist.
+        :param component_name: name of the component in the power train file.
+        """
+
+        if system in self._wrapped_systems:
+            return system
+        self._wrapped_systems.add(system)
+
+        component_type = type(system).__name__
+
+        if not isinstance(system, om.Group):
+            self._wrap_kernels(system, (component_name, component_type), "")
+            return system
+
+        solver = system.nonlinear_solver
+        solver.solve = self._timed(
+            solver.solve, (component_name, component_type, GROUP_SOLVER_KERNEL)
+        )
+
+        for subsystem in system.system_iter(recurse=True):
+            if isinstance(subsystem, om.Group):
+                continue
+            kernel_prefix = subsystem.pathname[len(system.pathname) + 1 :] + "."
+            self._wrap_kernels(subsystem, (component_name, component_type), kernel_prefix)
+
+        return system
+
+    def _wrap_kernels(self, component, key: tuple, kernel_prefix: str):
+        """
+        Replaces the public kernels of the component by timed ones, recorded under the key
+        completed by the prefixed name of the kernel.
+        """
+
+        for kernel in COMPONENT_KERNELS:
+            method = getattr(component, kernel, None)
+            if method is None:
+                continue
+
+            setattr(component, kernel, self._timed(method, key + (kernel_prefix + kernel,)))
+
+    def _timed(self, method, key: tuple):
+        """Returns the method wrapped so that each call is recorded under the key."""
+
+        @functools.wraps(method)
+        def timed_method(*args, **kwargs):
+            allocated_blocks_start = sys.getallocatedblocks()
+            time_start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                wall_time = time.perf_counter() - time_start
+                allocated_blocks = sys.getallocatedblocks() - allocated_blocks_start
+
+                # The records can be reset between the creation of the wrapper and the call
+                record = self.records.setdefault(key, [0, 0.0, 0])
+                record[0] += 1
+                record[1] += wall_time
+                record[2] += max(allocated_blocks, 0)
+
+        return timed_method
+
+    def get_table(self, by: str = "kernel", sort_by: str = "wall_time") -> pd.DataFrame:
+        """
+        Returns the records as a table sorted in descending order.
+
+        :param by: level of aggregation, "kernel" for one row per component and kernel,
+        "component" for one row per component and "type" for one row per type of component.
+        :param sort_by: column used to sort the table, e.g. "wall_time" or "calls".
+        """
+
+        table = pd.DataFrame(
+            [list(key) + list(record) for key, record in self.records.items()], columns=COLUMNS
+        )
+
+        if by == "component":
+            table = table.groupby(["component", "type"], as_index=False)[
+                ["calls", "wall_time", "allocated_blocks"]
+            ].sum()
+        elif by == "type":
+            table = table.groupby("type", as_index=False)[
+                ["calls", "wall_time", "allocated_blocks"]
+            ].sum()
+        elif by != "kernel":
+            raise ValueError("Unknown aggregation " + by + ", please use kernel, component or type")
+
+        table["wall_time_per_call"] = table["wall_time"] / table["calls"].clip(lower=1)
+
+        return table.sort_values(sort_by, ascending=False, ignore_index=True)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the records organised by component and by type of component, with the time in
+        seconds, so that they can be saved and compared between versions of the code.
+        """
+
+        profiling = {"components": {}, "types": {}}
+
+        for (component_name, component_type, kernel), record in sorted(self.records.items()):
+            record_dict = dict(zip(COLUMNS[3:], record))
+
+            component_dict = profiling["components"].setdefault(
+                component_name + " (" + component_type + ")",
+                {"component": component_name, "type": component_type, "kernels": {}},
+            )
+            component_dict["kernels"][kernel] = record_dict
+
+            type_kernels = profiling["types"].setdefault(component_type, {})
+            type_record = type_kernels.setdefault(kernel, dict.fromkeys(COLUMNS[3:], 0))
+            for column, value in record_dict.items():
+                type_record[column] += value
+
+        return profiling
+
+    def save(self, file_path: str):
+        """
+        Writes the records in a json file.
+
+        :param file_path: path to the json file.
+        """
+
+        directory = pth.dirname(file_path)
+        if directory and not pth.exists(directory):
+            os.makedirs(directory)
+
+        with open(file_path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+
+# Profiler of each json file the records are written in
+_PROFILERS = {}
+# Name, in the power train file, of the systems created by the assemblers
+_POWER_TRAIN_COMPONENTS = weakref.WeakKeyDictionary()
+# Pid of the process in which the results are set to be written at exit, a forked process
+# inherits it but still has to register its own writing
+_SAVE_AT_EXIT_PID = None
+
+
+def get_power_train_profiler(profiling_file_path=None) -> PowerTrainProfiler:
+    """
+    Returns the profiler in which the power train components of this process are recorded.
+
+    :param profiling_file_path: path to the json file the records are written in, by default the
+    one given by the environment variable.
+    """
+
+    if profiling_file_path is None:
+        profiling_file_path = os.environ.get(PROFILING_ENVIRONMENT_VARIABLE) or None
+
+    return _PROFILERS.setdefault(profiling_file_path, PowerTrainProfiler())
+
+
+def set_power_train_profiling_file(profiling_file_path=None):
+    """
+    Turns the profiling of the power train components on or off for all the assemblers. The
+    components set up afterward are profiled and the results are written at the end of the
+    process. The path is given through an environment variable so that it is also used by the
+    processes started afterward, which write their results in a file suffixed with their pid.
+
+    :param profiling_file_path: path to the json file, if None the components are not profiled.
+    """
+
+    if profiling_file_path is None:
+        os.environ.pop(PROFILING_ENVIRONMENT_VARIABLE, None)
+    else:
+        os.environ[PROFILING_ENVIRONMENT_VARIABLE] = str(profiling_file_path)
+
+
+def register_power_train_component(system: System, component_name: str) -> System:
+    """
+    Marks the system as a power train component so that it can be profiled once set up, and
+    returns it.
+
+    :param system: OpenMDAO system of the component, before it is added to its parent.
+    :param component_name: name of the component in the power train file.
+    """
+
+    _POWER_TRAIN_COMPONENTS[system] = component_name
+
+    return system
+
+
+def profile_power_train_components(group: om.Group, profiling_file_path=None):
+    """
+    Times the kernels of the power train components in the group, if the profiling is turned
+    on. Meant to be called from the configure method of the group, once its subsystems are set
+    up.
+
+    :param group: OpenMDAO group, its power train components are searched recursively.
+    :param profiling_file_path: path to the json file the records are written in, by default the
+    one given by the environment variable. If none is given, the components are not profiled.
+    """
+
+    global _SAVE_AT_EXIT_PID
+
+    if profiling_file_path is None:
+        profiling_file_path = os.environ.get(PROFILING_ENVIRONMENT_VARIABLE) or None
+    if profiling_file_path is None:
+        return
+
+    if _SAVE_AT_EXIT_PID != os.getpid():
+        if multiprocessing.parent_process() is None:
+            atexit.register(_save_at_exit)
+        else:
+            # The child processes of multiprocessing don't run the atexit functions, and the
+            # records a forked process inherits are the ones of its parent
+            multiprocessing.util.Finalize(None, _save_at_exit, exitpriority=0)
+            for profiler in _PROFILERS.values():
+                profiler.reset()
+        _SAVE_AT_EXIT_PID = os.getpid()
+
+    profiler = get_power_train_profiler(profiling_file_path)
+
+    for system in group.system_iter(include_self=True, recurse=True):
+        component_name = _POWER_TRAIN_COMPONENTS.get(system)
+        if component_name is not None:
+            profiler.wrap(system, component_name)
+
+
+def _save_at_exit():
+    """Writes the records of the process in the file of each profiler."""
+
+    for profiling_file_path, profiler in _PROFILERS.items():
+        if not profiling_file_path or not profiler.records:
+            continue
+
+        # So that the workers of a parallel run do not overwrite each other's results
+        if multiprocessing.parent_process() is not None:
+            root, extension = pth.splitext(profiling_file_path)
+            profiling_file_path = root + "_" + str(os.getpid()) + extension
+
+        try:
+            profiler.save(profiling_file_path)
+        except OSError as error:
+            _LOGGER.warning(
+                "Could not write the profiling of the power train in %s: %s",
+                profiling_file_path,
+                error,
+            )
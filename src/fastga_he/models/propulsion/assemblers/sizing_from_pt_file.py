@@ -19,6 +19,7 @@ from .constants import (
     SUBMODEL_POWER_TRAIN_WING_DISTRIBUTED_LOADS,
     SUBMODEL_POWER_TRAIN_WING_DISTRIBUTED_TANKS,
 )
+from .profiling import profile_power_train_components, register_power_train_component
 
 
 @oad.RegisterOpenMDAOSystem("fastga_he.power_train.sizing", domain=ModelDomain.OTHER)
@@ -73,7 +74,11 @@ class PowerTrainSizingFromFile(om.Group):
             if component_position:
                 local_sub_sys.options["position"] = component_position
 
-            self.add_subsystem(name=component_name, subsys=local_sub_sys, promotes=["*"])
+            self.add_subsystem(
+                name=component_name,
+                subsys=register_power_train_component(local_sub_sys, component_name),
+                promotes=["*"],
+            )
 
         option_pt_file = {"power_train_file_path": self.options["power_train_file_path"]}
         self.add_subsystem(
@@ -125,3 +130,7 @@ class PowerTrainSizingFromFile(om.Group):
             ),
             promotes=["*"],
         )
+
+    def configure(self):
+        # The components that are groups only have their subsystems once set up
+        profile_power_train_components(self)
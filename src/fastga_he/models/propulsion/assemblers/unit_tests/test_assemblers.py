@@ -2,9 +2,11 @@
 # Electric Aircraft.
 # Copyright (C) 2022 ISAE-SUPAERO
 
+import json
 import os.path as pth
 
 import numpy as np
+import openmdao.api as om
 import pytest
 
 from ..delta_from_pt_file import SlipstreamAirframeLiftClean, SlipstreamAirframeLift
@@ -13,6 +15,13 @@ from ..wing_punctual_tanks_from_pt_file import PowerTrainPunctualTanksFromFile
 from ..wing_distributed_loads_from_pt_file import PowerTrainDistributedLoadsFromFile
 from ..wing_distributed_tanks_from_pt_file import PowerTrainDistributedTanksFromFile
 from ..fuel_cg_from_pt_file import FuelCGFromPTFile
+from ..performances_watcher import PowerTrainPerformancesWatcher
+from ..profiling import (
+    get_power_train_profiler,
+    profile_power_train_components,
+    register_power_train_component,
+    set_power_train_profiling_file,
+)
 
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
 
@@ -223,3 +232,117 @@ def test_fuel_cg_from_pt_file():
     )
 
     problem.check_partials(compact_print=True)
+
+
+def test_performances_watcher_setup_twice():
+    problem = om.Problem(reports=False)
+    problem.model.add_subsystem(
+        "watcher",
+        PowerTrainPerformancesWatcher(
+            power_train_file_path=pth.join(pth.dirname(__file__), PROPULSION_FILE_TANKS),
+            number_of_points=NB_POINTS_TEST,
+        ),
+        promotes=["*"],
+    )
+
+    problem.setup()
+    header_name = list(problem.model.watcher.header_name)
+    header_units = list(problem.model.watcher.header_units)
+    assert len(header_units) == len(header_name)
+
+    # The columns must not be duplicated when the problem is set up again
+    problem.setup()
+    assert problem.model.watcher.header_name == header_name
+    assert problem.model.watcher.header_units == header_units
+
+
+def _get_profiled_lift_problem(component, profiling_file_path=None):
+    """
+    Returns a problem in which the component is registered as the "wing_1" power train
+    component and profiled once set up.
+    """
+
+    ivc = get_indep_var_comp(
+        list_inputs(SlipstreamAirframeLiftClean(number_of_points=NB_POINTS_TEST)),
+        __file__,
+        XML_FILE,
+    )
+    ivc.add_output("alpha", val=np.full(NB_POINTS_TEST, 5.0), units="deg")
+    ivc.add_output("altitude", val=np.full(NB_POINTS_TEST, 0.0), units="ft")
+
+    problem = om.Problem(reports=False)
+    problem.model.add_subsystem("inputs", ivc, promotes=["*"])
+    problem.model.add_subsystem(
+        "wing_1", register_power_train_component(component, "wing_1"), promotes=["*"]
+    )
+    problem.setup()
+    profile_power_train_components(problem.model, profiling_file_path)
+    problem.run_model()
+    problem.compute_totals("cl_wing_clean", "alpha")
+
+    return problem
+
+
+def test_power_train_profiling(tmp_path):
+    profiler = get_power_train_profiler(pth.join(tmp_path, "profiling.json"))
+    profiler.reset()
+
+    # Not profiled as long as the profiling is not turned on
+    problem = _get_profiled_lift_problem(
+        SlipstreamAirframeLiftClean(number_of_points=NB_POINTS_TEST)
+    )
+    assert "compute" not in vars(problem.model.wing_1)
+
+    set_power_train_profiling_file(pth.join(tmp_path, "profiling.json"))
+
+    try:
+        problem = _get_profiled_lift_problem(
+            SlipstreamAirframeLiftClean(number_of_points=NB_POINTS_TEST)
+        )
+    finally:
+        set_power_train_profiling_file(None)
+
+    # Profiling does not change the results
+    assert problem.get_val("cl_wing_clean") == pytest.approx(
+        np.full(NB_POINTS_TEST, 0.6533), rel=1e-3
+    )
+
+    table = profiler.get_table()
+    assert set(table["kernel"]) == {"compute", "compute_partials"}
+    assert all(table["component"] == "wing_1")
+    assert all(table["type"] == "SlipstreamAirframeLiftClean")
+    assert all(table["calls"] >= 1)
+    assert table["wall_time"].is_monotonic_decreasing
+
+    table_type = profiler.get_table(by="type", sort_by="calls")
+    assert len(table_type) == 1
+    assert table_type["calls"][0] == table["calls"].sum()
+
+    profiler.save(pth.join(tmp_path, "profiling.json"))
+    with open(pth.join(tmp_path, "profiling.json")) as file:
+        profiling = json.load(file)
+
+    assert profiling == json.loads(json.dumps(profiler.to_dict()))
+    assert set(profiling["components"]["wing_1 (SlipstreamAirframeLiftClean)"]["kernels"]) == {
+        "compute",
+        "compute_partials",
+    }
+
+    profiler.reset()
+
+
+class _LiftGroup(om.Group):
+    """Power train component that is a group, as the inverter is."""
+
+    def setup(self):
+        self.add_subsystem(
+            "lift", SlipstreamAirframeLiftClean(number_of_points=NB_POINTS_TEST), promotes=["*"]
+        )
+
+
+def test_power_train_profiling_group(tmp_path):
+    # The file is given directly rather than through the environment variable, so only the
+    # components of that problem are profiled
+    profiling_file_path = pth.join(tmp_path, "profiling_group.json")
+    profiler = get_power_train_profiler(profiling_file_path)
+    profiler.reset()
@@ -0,0 +1,26 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+
+def chain_rule(*terms) -> dict:
+    """
+    Applies the chain rule, to assemble the partials of components that gather a chain of
+    computations. Derivatives with respect to the inputs of the component are stored in
+    dictionaries keyed by the input names.
+
+    :param terms: tuples of the derivative of a quantity with respect to an intermediate variable
+    and of the dictionary of the derivatives of that intermediate variable with respect to the
+    inputs. An input of the component is itself given with a dictionary like {input_name: 1.0}.
+    :return: the dictionary of the derivatives of the quantity with respect to the inputs.
+    """
+
+    derivatives = {}
+
+    for local_derivative, variable_derivatives in terms:
+        for input_name, derivative in variable_derivatives.items():
+            derivatives[input_name] = derivatives.get(input_name, 0.0) + (
+                local_derivative * derivative
+            )
+
+    return derivatives
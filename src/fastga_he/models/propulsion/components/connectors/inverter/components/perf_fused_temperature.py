@@ -0,0 +1,784 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import numpy as np
+import openmdao.api as om
+
+from fastga_he.models.propulsion.components.chain_rule import chain_rule
+
+# Settings of the Newton solving the junction temperatures point by point, the system is linear
+# as long as the gate voltages are not clipped so it normally converges in one iteration
+MAX_ITERATIONS_JUNCTION_TEMPERATURE = 50
+TOLERANCE_JUNCTION_TEMPERATURE = 1e-10
+
+
+class PerformancesInverterFusedTemperature(om.ExplicitComponent):
+    """
+    Computation of the junction temperatures, resistances, gate voltages and losses of the IGBTs
+    and diodes of the inverter and of the temperature of its casing in a single component. Gives
+    the same results as PerformancesJunctionTemperature and the chain going from
+    PerformancesResistance to PerformancesCasingTemperature. The loop between the temperatures
+    and the losses, which otherwise requires a Newton solver on the group, is solved point by point
+    inside this component and its partials are obtained with the implicit function theorem.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            "number_of_points", default=1, desc="number of equilibrium to be treated"
+        )
+        self.options.declare(
+            name="inverter_id",
+            default=None,
+            desc="Identifier of the inverter",
+            allow_none=False,
+        )
+
+    def setup(self):
+        inverter_id = self.options["inverter_id"]
+        number_of_points = self.options["number_of_points"]
+
+        self.add_input("modulation_index", val=np.full(number_of_points, np.nan))
+        self.add_input(
+            "ac_current_rms_out_one_phase", units="A", val=np.full(number_of_points, np.nan)
+        )
+        self.add_input(
+            "switching_losses_diode",
+            units="W",
+            val=np.full(number_of_points, np.nan),
+            shape=number_of_points,
+        )
+        self.add_input(
+            "switching_losses_IGBT",
+            units="W",
+            val=np.full(number_of_points, np.nan),
+            shape=number_of_points,
+        )
+        self.add_input(
+            "heat_sink_temperature",
+            val=np.full(number_of_points, np.nan),
+            units="degK",
+            desc="temperature inside of the heat sink",
+            shape=number_of_points,
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":power_factor",
+            val=1.0,
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:resistance",
+            val=np.nan,
+            units="ohm",
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:resistance",
+            val=np.nan,
+            units="ohm",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:resistance_temperature_scale_factor:igbt",
+            val=0.0041,
+            units="degK**-1",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:resistance_temperature_scale_factor:diode",
+            val=0.0033,
+            units="degK**-1",
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:gate_voltage",
+            units="V",
+            val=np.nan,
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:gate_voltage",
+            units="V",
+            val=np.nan,
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:voltage_temperature_scale_factor:igbt",
+            val=-0.00105,
+            units="degK**-1",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:voltage_temperature_scale_factor:diode",
+            val=-0.0022,
+            units="degK**-1",
+        )
+        self.add_input(
+            name="settings:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":reference_temperature",
+            val=293.15,
+            units="degK",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":casing:thermal_resistance",
+            units="K/W",
+            val=np.nan,
+            desc="Thermal resistance between the casing and the heat sink",
+        )
+
+        self.add_input(
+            name="data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":igbt:thermal_resistance",
+            units="K/W",
+            val=np.nan,
+            desc="Thermal resistance between the casing and the IGBT",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":diode:thermal_resistance",
+            units="K/W",
+            val=np.nan,
+            desc="Thermal resistance between the casing and the heat sink",
+        )
+
+        self.add_output(
+            "diode_temperature",
+            val=np.full(number_of_points, 273.15),
+            units="degK",
+            desc="Temperature of the diodes inside the module",
+            shape=number_of_points,
+        )
+        self.add_output(
+            "IGBT_temperature",
+            val=np.full(number_of_points, 273.15),
+            units="degK",
+            desc="Temperature of the IGBTs inside the module",
+            shape=number_of_points,
+        )
+
+        self.add_output(
+            "resistance_igbt",
+            val=np.full(number_of_points, 1.0e-3),
+            units="ohm",
+            shape=number_of_points,
+        )
+        self.add_output(
+            "resistance_diode",
+            val=np.full(number_of_points, 1.0e-3),
+            units="ohm",
+            shape=number_of_points,
+        )
+        self.add_output(
+            "gate_voltage_igbt",
+            val=np.full(number_of_points, 1.0),
+            units="V",
+            shape=number_of_points,
+        )
+        self.add_output(
+            "gate_voltage_diode",
+            val=np.full(number_of_points, 1.0),
+            units="V",
+            shape=number_of_points,
+        )
+        self.add_output(
+            "conduction_losses_diode",
+            units="W",
+            val=np.full(number_of_points, 0.0),
+            shape=number_of_points,
+        )
+        self.add_output(
+            "conduction_losses_IGBT",
+            units="W",
+            val=np.full(number_of_points, 0.0),
+            shape=number_of_points,
+        )
+        self.add_output(
+            "losses_inverter",
+            units="W",
+            val=np.full(number_of_points, 0.0),
+            shape=number_of_points,
+        )
+        self.add_output(
+            "casing_temperature",
+            val=np.full(number_of_points, 273.15),
+            units="degK",
+            desc="Temperature of the inverter casing",
+            shape=number_of_points,
+        )
+
+    def setup_partials(self):
+        inverter_id = self.options["inverter_id"]
+        number_of_points = self.options["number_of_points"]
+
+        reference_temperature_name = (
+            "settings:propulsion:he_power_train:inverter:" + inverter_id + ":reference_temperature"
+        )
+        power_factor_name = (
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":power_factor"
+        )
+        casing_thermal_resistance_name = (
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":casing:thermal_resistance"
+        )
+        resistance_igbt_names = [
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:resistance",
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:resistance_temperature_scale_factor:igbt",
+        ]
+        resistance_diode_names = [
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:resistance",
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:resistance_temperature_scale_factor:diode",
+        ]
+        gate_voltage_igbt_names = [
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:gate_voltage",
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:voltage_temperature_scale_factor:igbt",
+        ]
+        gate_voltage_diode_names = [
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:gate_voltage",
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:voltage_temperature_scale_factor:diode",
+        ]
+        losses_names = (
+            resistance_igbt_names
+            + resistance_diode_names
+            + gate_voltage_igbt_names
+            + gate_voltage_diode_names
+            + [reference_temperature_name, power_factor_name]
+        )
+        losses_inputs = [
+            "modulation_index",
+            "ac_current_rms_out_one_phase",
+            "switching_losses_diode",
+            "switching_losses_IGBT",
+        ]
+
+        diagonal = np.arange(number_of_points)
+        column = np.zeros(number_of_points)
+
+        # Through the junction temperatures, each output depends on all the inputs
+        self.declare_partials(
+            of="*",
+            wrt=losses_inputs + ["heat_sink_temperature"],
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            of="*",
+            wrt=losses_names
+            + [
+                casing_thermal_resistance_name,
+                "data:propulsion:he_power_train:inverter:"
+                + inverter_id
+                + ":igbt:thermal_resistance",
+                "data:propulsion:he_power_train:inverter:"
+                + inverter_id
+                + ":diode:thermal_resistance",
+            ],
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        inverter_id = self.options["inverter_id"]
+
+        diode_temperature, igbt_temperature = self._solve_junction_temperatures(inputs)
+        outputs["diode_temperature"] = diode_temperature
+        outputs["IGBT_temperature"] = igbt_temperature
+
+        losses = self._compute_losses(inputs, diode_temperature, igbt_temperature)
+
+        losses_inverter = 6.0 * (
+            inputs["switching_losses_IGBT"]
+            + inputs["switching_losses_diode"]
+            + losses["conduction_losses_IGBT"]
+            + losses["conduction_losses_diode"]
+        )
+
+        for output_name, value in losses.items():
+            outputs[output_name] = value
+        outputs["losses_inverter"] = losses_inverter
+        outputs["casing_temperature"] = (
+            inputs["heat_sink_temperature"]
+            + losses_inverter
+            / 3.0
+            * inputs[
+                "data:propulsion:he_power_train:inverter:"
+                + inverter_id
+                + ":casing:thermal_resistance"
+            ]
+        )
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        inverter_id = self.options["inverter_id"]
+
+        reference_temperature_name = (
+            "settings:propulsion:he_power_train:inverter:" + inverter_id + ":reference_temperature"
+        )
+        power_factor_name = (
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":power_factor"
+        )
+        casing_thermal_resistance_name = (
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":casing:thermal_resistance"
+        )
+        reference_resistance_igbt_name = (
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:resistance"
+        )
+        reference_resistance_diode_name = (
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:resistance"
+        )
+        alpha_igbt_name = (
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:resistance_temperature_scale_factor:igbt"
+        )
+        alpha_diode_name = (
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:resistance_temperature_scale_factor:diode"
+        )
+        reference_gate_voltage_igbt_name = (
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:gate_voltage"
+        )
+        reference_gate_voltage_diode_name = (
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:gate_voltage"
+        )
+        alpha_v_igbt_name = (
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:voltage_temperature_scale_factor:igbt"
+        )
+        alpha_v_diode_name = (
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:voltage_temperature_scale_factor:diode"
+        )
+
+        diode_temperature, igbt_temperature = self._solve_junction_temperatures(inputs)
+
+        inverter_reference_temperature = inputs[reference_temperature_name]
+        cos_phi = inputs[power_factor_name]
+        r_th_cs = inputs[casing_thermal_resistance_name]
+        reference_resistance_igbt = inputs[reference_resistance_igbt_name]
+        reference_resistance_diode = inputs[reference_resistance_diode_name]
+        alpha_igbt = inputs[alpha_igbt_name]
+        alpha_diode = inputs[alpha_diode_name]
+        reference_gate_voltage_igbt = inputs[reference_gate_voltage_igbt_name]
+        reference_gate_voltage_diode = inputs[reference_gate_voltage_diode_name]
+        alpha_v_igbt = inputs[alpha_v_igbt_name]
+        alpha_v_diode = inputs[alpha_v_diode_name]
+        current = inputs["ac_current_rms_out_one_phase"]
+        beta = np.clip(inputs["modulation_index"], 0.0, 1.001)
+
+        losses = self._compute_losses(inputs, diode_temperature, igbt_temperature)
+        v_ce0 = losses["gate_voltage_igbt"]
+        v_d0 = losses["gate_voltage_diode"]
+        r_igbt = losses["resistance_igbt"]
+        r_d = losses["resistance_diode"]
+        losses_inverter = 6.0 * (
+            inputs["switching_losses_IGBT"]
+            + inputs["switching_losses_diode"]
+            + losses["conduction_losses_IGBT"]
+            + losses["conduction_losses_diode"]
+        )
+
+        # Derivatives of each step with respect to its own inputs, taken as in the decomposed
+        # components so that both give the same jacobian. The junction temperatures are first
+        # treated as inputs.
+        d_igbt_temperature = {"IGBT_temperature": 1.0}
+        d_diode_temperature = {"diode_temperature": 1.0}
+
+        d_resistance_igbt = chain_rule(
+            (
+                1.0 + alpha_igbt * (igbt_temperature - inverter_reference_temperature),
+                {reference_resistance_igbt_name: 1.0},
+            ),
+            (
+                reference_resistance_igbt * (igbt_temperature - inverter_reference_temperature),
+                {alpha_igbt_name: 1.0},
+            ),
+            (reference_resistance_igbt * alpha_igbt, d_igbt_temperature),
+            (-reference_resistance_igbt * alpha_igbt, {reference_temperature_name: 1.0}),
+        )
+        d_resistance_diode = chain_rule(
+            (
+                1.0 + alpha_diode * (diode_temperature - inverter_reference_temperature),
+                {reference_resistance_diode_name: 1.0},
+            ),
+            (
+                reference_resistance_diode * (diode_temperature - inverter_reference_temperature),
+                {alpha_diode_name: 1.0},
+            ),
+            (reference_resistance_diode * alpha_diode, d_diode_temperature),
+            (-reference_resistance_diode * alpha_diode, {reference_temperature_name: 1.0}),
+        )
+        # As in PerformancesGateVoltage, the lower bound of the gate voltages is not accounted
+        # for in the derivatives
+        d_gate_voltage_igbt = chain_rule(
+            (
+                1.0 + alpha_v_igbt * (igbt_temperature - inverter_reference_temperature),
+                {reference_gate_voltage_igbt_name: 1.0},
+            ),
+            (
+                (igbt_temperature - inverter_reference_temperature) * reference_gate_voltage_igbt,
+                {alpha_v_igbt_name: 1.0},
+            ),
+            (reference_gate_voltage_igbt * alpha_v_igbt, d_igbt_temperature),
+            (-reference_gate_voltage_igbt * alpha_v_igbt, {reference_temperature_name: 1.0}),
+        )
+        d_gate_voltage_diode = chain_rule(
+            (
+                1.0 + alpha_v_diode * (diode_temperature - inverter_reference_temperature),
+                {reference_gate_voltage_diode_name: 1.0},
+            ),
+            (
+                (diode_temperature - inverter_reference_temperature) * reference_gate_voltage_diode,
+                {alpha_v_diode_name: 1.0},
+            ),
+            (reference_gate_voltage_diode * alpha_v_diode, d_diode_temperature),
+            (-reference_gate_voltage_diode * alpha_v_diode, {reference_temperature_name: 1.0}),
+        )
+
+        d_beta = {
+            "modulation_index": np.where(beta == inputs["modulation_index"], 1.0, 0.0),
+        }
+        d_conduction_losses_diode = chain_rule(
+            (current / (2.0 * np.pi) * (1.0 - np.pi / 4.0 * beta * cos_phi), d_gate_voltage_diode),
+            (current**2.0 / 8.0 * (1.0 - 8.0 / (3.0 * np.pi) * beta * cos_phi), d_resistance_diode),
+            (
+                -beta * (v_d0 * current / 8.0 + r_d * current**2.0 / (3.0 * np.pi)),
+                {power_factor_name: 1.0},
+            ),
+            (-cos_phi * (v_d0 * current / 8.0 + r_d * current**2.0 / (3.0 * np.pi)), d_beta),
+            (
+                v_d0 / (2.0 * np.pi) * (1.0 - np.pi / 4.0 * beta * cos_phi)
+                + r_d * current / 4.0 * (1.0 - 8.0 / (3.0 * np.pi) * beta * cos_phi),
+                {"ac_current_rms_out_one_phase": 1.0},
+            ),
+        )
+        d_conduction_losses_igbt = chain_rule(
+            (current / (2.0 * np.pi) * (1.0 + np.pi / 4.0 * beta * cos_phi), d_gate_voltage_igbt),
+            (current**2.0 / 8.0 * (1.0 + 8.0 / (3.0 * np.pi) * beta * cos_phi), d_resistance_igbt),
+            (
+                beta * (v_ce0 * current / 8.0 + r_igbt * current**2.0 / (3.0 * np.pi)),
+                {power_factor_name: 1.0},
+            ),
+            (cos_phi * (v_ce0 * current / 8.0 + r_igbt * current**2.0 / (3.0 * np.pi)), d_beta),
+            (
+                v_ce0 / (2.0 * np.pi) * (1.0 + np.pi / 4.0 * beta * cos_phi)
+                + r_igbt * current / 4.0 * (1.0 + 8.0 / (3.0 * np.pi) * beta * cos_phi),
+                {"ac_current_rms_out_one_phase": 1.0},
+            ),
+        )
+
+        d_losses_inverter = chain_rule(
+            (6.0, d_conduction_losses_diode),
+            (6.0, d_conduction_losses_igbt),
+            (6.0, {"switching_losses_diode": 1.0, "switching_losses_IGBT": 1.0}),
+        )
+        d_casing_temperature = chain_rule(
+            (r_th_cs / 3.0, d_losses_inverter),
+            (losses_inverter / 3.0, {casing_thermal_resistance_name: 1.0}),
+            (1.0, {"heat_sink_temperature": 1.0}),
+        )
+
+        derivatives = {
+            "resistance_igbt": d_resistance_igbt,
+            "resistance_diode": d_resistance_diode,
+            "gate_voltage_igbt": d_gate_voltage_igbt,
+            "gate_voltage_diode": d_gate_voltage_diode,
+            "conduction_losses_diode": d_conduction_losses_diode,
+            "conduction_losses_IGBT": d_conduction_losses_igbt,
+            "losses_inverter": d_losses_inverter,
+            "casing_temperature": d_casing_temperature,
+        }
+
+        r_th_jc_igbt_name = (
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:thermal_resistance"
+        )
+        r_th_jc_diode_name = (
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:thermal_resistance"
+        )
+        r_th_jc_igbt = inputs[r_th_jc_igbt_name]
+        r_th_jc_diode = inputs[r_th_jc_diode_name]
+
+        # Derivatives of the residuals of PerformancesJunctionTemperature, i.e. the junction
+        # temperatures minus the ones computed from the losses
+        d_residual_diode = chain_rule(
+            (1.0, d_diode_temperature),
+            (-1.0, d_casing_temperature),
+            (-r_th_jc_diode, d_conduction_losses_diode),
+            (-r_th_jc_diode, {"switching_losses_diode": 1.0}),
+            (
+                -(inputs["switching_losses_diode"] + losses["conduction_losses_diode"]),
+                {r_th_jc_diode_name: 1.0},
+            ),
+        )
+        d_residual_igbt = chain_rule(
+            (1.0, d_igbt_temperature),
+            (-1.0, d_casing_temperature),
+            (-r_th_jc_igbt, d_conduction_losses_igbt),
+            (-r_th_jc_igbt, {"switching_losses_IGBT": 1.0}),
+            (
+                -(inputs["switching_losses_IGBT"] + losses["conduction_losses_IGBT"]),
+                {r_th_jc_igbt_name: 1.0},
+            ),
+        )
+
+        # Implicit function theorem, the 2x2 system of each point is inverted explicitly
+        j_dd = d_residual_diode.pop("diode_temperature")
+        j_di = d_residual_diode.pop("IGBT_temperature")
+        j_id = d_residual_igbt.pop("diode_temperature")
+        j_ii = d_residual_igbt.pop("IGBT_temperature")
+        determinant = j_dd * j_ii - j_di * j_id
+
+        d_diode_temperature = chain_rule(
+            (-j_ii / determinant, d_residual_diode),
+            (j_di / determinant, d_residual_igbt),
+        )
+        d_igbt_temperature = chain_rule(
+            (j_id / determinant, d_residual_diode),
+            (-j_dd / determinant, d_residual_igbt),
+        )
+
+        for output_name, output_derivatives in derivatives.items():
+            derivatives[output_name] = chain_rule(
+                (
+                    1.0,
+                    {
+                        input_name: derivative
+                        for input_name, derivative in output_derivatives.items()
+                        if input_name not in ["diode_temperature", "IGBT_temperature"]
+                    },
+                ),
+                (output_derivatives.get("diode_temperature", 0.0), d_diode_temperature),
+                (output_derivatives.get("IGBT_temperature", 0.0), d_igbt_temperature),
+            )
+
+        derivatives["diode_temperature"] = d_diode_temperature
+        derivatives["IGBT_temperature"] = d_igbt_temperature
+
+        for output_name, output_derivatives in derivatives.items():
+            for input_name, derivative in output_derivatives.items():
+                partials[output_name, input_name] = derivative
+
+    def _compute_losses(self, inputs, diode_temperature, igbt_temperature) -> dict:
+        """
+        Computes the resistances, gate voltages and conduction losses of the IGBTs and diodes as
+        in PerformancesResistance, PerformancesGateVoltage and PerformancesConductionLosses.
+        """
+
+        inverter_id = self.options["inverter_id"]
+
+        inverter_reference_temperature = inputs[
+            "settings:propulsion:he_power_train:inverter:" + inverter_id + ":reference_temperature"
+        ]
+        cos_phi = inputs["data:propulsion:he_power_train:inverter:" + inverter_id + ":power_factor"]
+        reference_resistance_igbt = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:resistance"
+        ]
+        reference_resistance_diode = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:resistance"
+        ]
+        alpha_igbt = inputs[
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:resistance_temperature_scale_factor:igbt"
+        ]
+        alpha_diode = inputs[
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:resistance_temperature_scale_factor:diode"
+        ]
+        reference_gate_voltage_igbt = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:gate_voltage"
+        ]
+        reference_gate_voltage_diode = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:gate_voltage"
+        ]
+        alpha_v_igbt = inputs[
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:voltage_temperature_scale_factor:igbt"
+        ]
+        alpha_v_diode = inputs[
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:voltage_temperature_scale_factor:diode"
+        ]
+
+        r_igbt = reference_resistance_igbt * (
+            1.0 + alpha_igbt * (igbt_temperature - inverter_reference_temperature)
+        )
+        r_d = reference_resistance_diode * (
+            1.0 + alpha_diode * (diode_temperature - inverter_reference_temperature)
+        )
+
+        # To prevent reaching unfeasible value during the loops
+        v_ce0 = np.maximum(
+            reference_gate_voltage_igbt
+            * (1.0 + alpha_v_igbt * (igbt_temperature - inverter_reference_temperature)),
+            reference_gate_voltage_igbt / 3,
+        )
+        v_d0 = np.maximum(
+            reference_gate_voltage_diode
+            * (1.0 + alpha_v_diode * (diode_temperature - inverter_reference_temperature)),
+            reference_gate_voltage_diode / 3,
+        )
+
+        # To avoid irrelevant values
+        beta = np.clip(inputs["modulation_index"], 0.0, 1.001)
+        current = inputs["ac_current_rms_out_one_phase"]
+
+        conduction_loss_diode = v_d0 * current / (2.0 * np.pi) * (
+            1.0 - np.pi / 4.0 * beta * cos_phi
+        ) + r_d * current**2.0 / 8.0 * (1.0 - 8.0 / (3.0 * np.pi) * beta * cos_phi)
+        conduction_loss_igbt = v_ce0 * current / (2.0 * np.pi) * (
+            1.0 + np.pi / 4.0 * beta * cos_phi
+        ) + r_igbt * current**2.0 / 8.0 * (1.0 + 8.0 / (3.0 * np.pi) * beta * cos_phi)
+
+        return {
+            "resistance_igbt": r_igbt,
+            "resistance_diode": r_d,
+            "gate_voltage_igbt": v_ce0,
+            "gate_voltage_diode": v_d0,
+            "conduction_losses_diode": conduction_loss_diode,
+            "conduction_losses_IGBT": conduction_loss_igbt,
+        }
+
+    def _solve_junction_temperatures(self, inputs) -> tuple:
+        """
+        Solves, for each point, the junction temperatures of the diodes and IGBTs for which the
+        losses they cause give back those temperatures, as in PerformancesJunctionTemperature.
+        Returns the diode and IGBT temperatures.
+        """
+
+        inverter_id = self.options["inverter_id"]
+
+        cos_phi = inputs["data:propulsion:he_power_train:inverter:" + inverter_id + ":power_factor"]
+        reference_resistance_igbt = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:resistance"
+        ]
+        reference_resistance_diode = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:resistance"
+        ]
+        alpha_igbt = inputs[
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:resistance_temperature_scale_factor:igbt"
+        ]
+        alpha_diode = inputs[
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:resistance_temperature_scale_factor:diode"
+        ]
+        reference_gate_voltage_igbt = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:gate_voltage"
+        ]
+        reference_gate_voltage_diode = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:gate_voltage"
+        ]
+        alpha_v_igbt = inputs[
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:voltage_temperature_scale_factor:igbt"
+        ]
+        alpha_v_diode = inputs[
+            "data:propulsion:he_power_train:inverter:"
+            + inverter_id
+            + ":properties:voltage_temperature_scale_factor:diode"
+        ]
+        r_th_cs = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":casing:thermal_resistance"
+        ]
+        r_th_jc_igbt = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":igbt:thermal_resistance"
+        ]
+        r_th_jc_diode = inputs[
+            "data:propulsion:he_power_train:inverter:" + inverter_id + ":diode:thermal_resistance"
+        ]
+        switching_losses_igbt = inputs["switching_losses_IGBT"]
+        switching_losses_diode = inputs["switching_losses_diode"]
+        temp_hs = inputs["heat_sink_temperature"]
+
+        beta = np.clip(inputs["modulation_index"], 0.0, 1.001)
+        current = inputs["ac_current_rms_out_one_phase"]
+
+        # Derivatives of the conduction losses with respect to the gate voltages and resistances,
+        # which don't depend on the temperatures
+        d_loss_diode_d_v_d0 = current / (2.0 * np.pi) * (1.0 - np.pi / 4.0 * beta * cos_phi)
+        d_loss_diode_d_r_d = current**2.0 / 8.0 * (1.0 - 8.0 / (3.0 * np.pi) * beta * cos_phi)
+        d_loss_igbt_d_v_ce0 = current / (2.0 * np.pi) * (1.0 + np.pi / 4.0 * beta * cos_phi)
+        d_loss_igbt_d_r_igbt = current**2.0 / 8.0 * (1.0 + 8.0 / (3.0 * np.pi) * beta * cos_phi)
+
+        diode_temperature = np.copy(temp_hs)
+        igbt_temperature = np.copy(temp_hs)
+
+        for _ in range(MAX_ITERATIONS_JUNCTION_TEMPERATURE):
+            losses = self._compute_losses(inputs, diode_temperature, igbt_temperature)
+
+            casing_temperature = temp_hs + 2.0 * r_th_cs * (
+                switching_losses_igbt
+                + switching_losses_diode
+                + losses["conduction_losses_IGBT"]
+                + losses["conduction_losses_diode"]
+            )
+            residual_diode = (
+                diode_temperature
+                - casing_temperature
+                - (switching_losses_diode + losses["conduction_losses_diode"]) * r_th_jc_diode
+            )
+            residual_igbt = (
+                igbt_temperature
+                - casing_temperature
+                - (switching_losses_igbt + losses["conduction_losses_IGBT"]) * r_th_jc_igbt
+            )
+
+            # Contrary to the partials, the lower bound of the gate voltages is accounted for
+            # here so that the iterations converge even when it is reached
+            d_loss_diode_d_temperature = d_loss_diode_d_r_d * (
+                reference_resistance_diode * alpha_diode
+            ) + d_loss_diode_d_v_d0 * np.where(
+                losses["gate_voltage_diode"] > reference_gate_voltage_diode / 3,
+                reference_gate_voltage_diode * alpha_v_diode,
+                0.0,
+            )
+            d_loss_igbt_d_temperature = d_loss_igbt_d_r_igbt * (
+                reference_resistance_igbt * alpha_igbt
+            ) + d_loss_igbt_d_v_ce0 * np.where(
+                losses["gate_voltage_igbt"] > reference_gate_voltage_igbt / 3,
+                reference_gate_voltage_igbt * alpha_v_igbt,
+                0.0,
+            )
+
+            j_dd = 1.0 - (2.0 * r_th_cs + r_th_jc_diode) * d_loss_diode_d_temperature
+            j_di = -2.0 * r_th_cs * d_loss_igbt_d_temperature
+            j_id = -2.0 * r_th_cs * d_loss_diode_d_temperature
+            j_ii = 1.0 - (2.0 * r_th_cs + r_th_jc_igbt) * d_loss_igbt_d_temperature
+            determinant = j_dd * j_ii - j_di * j_id
+
+            step_diode = (j_ii * residual_diode - j_di * residual_igbt) / determinant
+            step_igbt = (j_dd * residual_igbt - j_id * residual_diode) / determinant
+
+            diode_temperature = diode_temperature - step_diode
+            igbt_temperature = igbt_temperature - step_igbt
+
+            if np.all(
+                np.abs(step_diode) <= TOLERANCE_JUNCTION_TEMPERATURE * np.abs(diode_temperature)
+            ) and np.all(
+                np.abs(step_igbt) <= TOLERANCE_JUNCTION_TEMPERATURE * np.abs(igbt_temperature)
+            ):
+                break
+
+        return diode_temperature, igbt_temperature
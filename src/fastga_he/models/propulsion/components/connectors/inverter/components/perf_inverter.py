@@ -18,8 +18,10 @@ from .perf_casing_temperature import PerformancesCasingTemperature
 from .perf_dc_current import PerformancesDCCurrent
 from .perf_ac_power_out import PerformancesACPowerOut
 from .perf_maximum import PerformancesMaximum
+from .perf_fused_temperature import PerformancesInverterFusedTemperature
 
 from .perf_junction_temperature_fixed import SUBMODEL_INVERTER_JUNCTION_TEMPERATURE_FIXED
+from .perf_junction_temperature import SUBMODEL_INVERTER_JUNCTION_TEMPERATURE_FROM_LOSSES
 
 from ..constants import SUBMODEL_INVERTER_JUNCTION_TEMPERATURE, SUBMODEL_INVERTER_EFFICIENCY
 
@@ -35,6 +37,15 @@ class PerformancesInverter(om.Group):
             desc="Identifier of the inverter",
             allow_none=False,
         )
+        self.options.declare(
+            name="fused",
+            default=False,
+            types=bool,
+            desc="If True and if the junction temperatures are computed from the losses, the loop "
+            "between the temperatures and the losses of the inverter is replaced by a single "
+            "component giving the same results, which is faster since it doesn't require a Newton "
+            "solver",
+        )
 
     def setup(self):
         inverter_id = self.options["inverter_id"]
@@ -69,7 +80,9 @@ class PerformancesInverter(om.Group):
         self.add_subsystem(
             "temperature_profile",
             PerformancesInverterTemperature(
-                inverter_id=inverter_id, number_of_points=number_of_points
+                inverter_id=inverter_id,
+                number_of_points=number_of_points,
+                fused=self.options["fused"],
             ),
             promotes=["*"],
         )
@@ -105,10 +118,12 @@ class PerformancesInverterTemperature(om.Group):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        # Solvers setup, if temperature is fixed, there is no loop so we can omit it
+        # Solvers setup, if temperature is fixed, there is no loop so we can omit it. The same
+        # goes if the loop is solved inside the fused component
         if (
             oad.RegisterSubmodel.active_models[SUBMODEL_INVERTER_JUNCTION_TEMPERATURE]
             != SUBMODEL_INVERTER_JUNCTION_TEMPERATURE_FIXED
+            and not self._junction_temperature_in_fused_component()
         ):
             self.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
             self.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
@@ -129,49 +144,81 @@ class PerformancesInverterTemperature(om.Group):
             desc="Identifier of the inverter",
             allow_none=False,
         )
+        self.options.declare(
+            name="fused",
+            default=False,
+            types=bool,
+            desc="If True and if the junction temperatures are computed from the losses, the loop "
+            "between the temperatures and the losses of the inverter is replaced by a single "
+            "component giving the same results, which is faster since it doesn't require a Newton "
+            "solver",
+        )
 
     def setup(self):
         inverter_id = self.options["inverter_id"]
         number_of_points = self.options["number_of_points"]
 
-        junction_temperature_option = {
-            "inverter_id": inverter_id,
-            "number_of_points": number_of_points,
-        }
-
-        self.add_subsystem(
-            "temperature_junction",
-            oad.RegisterSubmodel.get_submodel(
-                SUBMODEL_INVERTER_JUNCTION_TEMPERATURE, options=junction_temperature_option
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "resistance",
-            PerformancesResistance(inverter_id=inverter_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "gate_voltage",
-            PerformancesGateVoltage(inverter_id=inverter_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "conduction_losses",
-            PerformancesConductionLosses(
-                inverter_id=inverter_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "total_losses",
-            PerformancesLosses(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "temperature_casing",
-            PerformancesCasingTemperature(
-                inverter_id=inverter_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
+        if self._junction_temperature_in_fused_component():
+            self.add_subsystem(
+                "temperature_and_losses",
+                PerformancesInverterFusedTemperature(
+                    inverter_id=inverter_id, number_of_points=number_of_points
+                ),
+                promotes=["*"],
+            )
+
+        else:
+            junction_temperature_option = {
+                "inverter_id": inverter_id,
+                "number_of_points": number_of_points,
+            }
+
+            self.add_subsystem(
+                "temperature_junction",
+                oad.RegisterSubmodel.get_submodel(
+                    SUBMODEL_INVERTER_JUNCTION_TEMPERATURE, options=junction_temperature_option
+                ),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "resistance",
+                PerformancesResistance(inverter_id=inverter_id, number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "gate_voltage",
+                PerformancesGateVoltage(inverter_id=inverter_id, number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "conduction_losses",
+                PerformancesConductionLosses(
+                    inverter_id=inverter_id, number_of_points=number_of_points
+                ),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "total_losses",
+                PerformancesLosses(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "temperature_casing",
+                PerformancesCasingTemperature(
+                    inverter_id=inverter_id, number_of_points=number_of_points
+                ),
+                promotes=["*"],
+            )
+
+    def _junction_temperature_in_fused_component(self) -> bool:
+        """
+        Returns True if the junction temperatures are computed from the losses inside of the
+        fused component, in which case the group has no loop to solve. Otherwise, the junction
+        temperature submodel and the chain of components are kept.
+        """
+
+        return (
+            self.options["fused"]
+            and oad.RegisterSubmodel.active_models[SUBMODEL_INVERTER_JUNCTION_TEMPERATURE]
+            == SUBMODEL_INVERTER_JUNCTION_TEMPERATURE_FROM_LOSSES
         )
@@ -1538,6 +1538,89 @@ def test_performances_inverter_tot():
     problem.check_partials(compact_print=True)
 
 
+def test_performances_inverter_fused():
+    oad.RegisterSubmodel.active_models[SUBMODEL_INVERTER_EFFICIENCY] = (
+        "fastga_he.submodel.propulsion.inverter.efficiency.from_losses"
+    )
+
+    # With the fixed junction temperatures, there is no loop to fuse and the chain of components
+    # is kept, with the temperatures computed from the losses, the Newton of the group is replaced
+    for junction_temperature_submodel, tolerance in [
+        ("fastga_he.submodel.propulsion.inverter.junction_temperature.fixed", 1e-6),
+        ("fastga_he.submodel.propulsion.inverter.junction_temperature.from_losses", 1e-4),
+    ]:
+        oad.RegisterSubmodel.active_models[SUBMODEL_INVERTER_JUNCTION_TEMPERATURE] = (
+            junction_temperature_submodel
+        )
+
+        problems = []
+        for fused in [False, True]:
+            ivc = get_indep_var_comp(
+                list_inputs(
+                    PerformancesInverter(
+                        inverter_id="inverter_1", number_of_points=NB_POINTS_TEST, fused=fused
+                    )
+                ),
+                __file__,
+                XML_FILE,
+            )
+
+            ivc.add_output(
+                "ac_current_rms_out_one_phase",
+                np.linspace(200.0, 500.0, NB_POINTS_TEST),
+                units="A",
+            )
+            ivc.add_output("dc_voltage_in", units="V", val=np.full(NB_POINTS_TEST, 1000.0))
+            ivc.add_output(
+                "ac_voltage_peak_out",
+                units="V",
+                val=np.array(
+                    [710.4, 728.5, 747.6, 767.2, 787.1, 807.5, 827.9, 848.6, 869.6, 890.5]
+                ),
+            )
+            ivc.add_output(
+                name="ac_voltage_rms_out",
+                val=np.array(
+                    [580.0, 594.8, 610.4, 626.4, 642.7, 659.3, 676.0, 692.9, 710.0, 727.1]
+                ),
+                units="V",
+            )
+            if junction_temperature_submodel.endswith("fixed"):
+                ivc.add_output(
+                    "data:propulsion:he_power_train:inverter:inverter_1:junction_temperature_mission",
+                    val=np.linspace(350.0, 450.0, NB_POINTS_TEST),
+                    units="degK",
+                )
+
+            problems.append(
+                run_system(
+                    PerformancesInverter(
+                        inverter_id="inverter_1", number_of_points=NB_POINTS_TEST, fused=fused
+                    ),
+                    ivc,
+                    add_solvers=True,
+                )
+            )
+
+        problem, problem_fused = problems
+
+        for output_name in [
+            "IGBT_temperature",
+            "diode_temperature",
+            "conduction_losses_IGBT",
+            "conduction_losses_diode",
+            "losses_inverter",
+            "casing_temperature",
+            "efficiency",
+            "dc_current_in",
+        ]:
+            assert problem_fused.get_val(output_name) == pytest.approx(
+                problem.get_val(output_name), rel=tolerance
+            )
+
+        problem_fused.check_partials(compact_print=True)
+
+
 def test_weight_per_fu():
     inputs_list = [
         "data:propulsion:he_power_train:inverter:inverter_1:mass",
@@ -0,0 +1,801 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import numpy as np
+import openmdao.api as om
+import scipy.constants as sc
+
+from stdatm import AtmosphereWithPartials
+
+from fastga_he.models.propulsion.components.chain_rule import chain_rule
+
+from .perf_efficiency import CUTOFF_ETA_MIN, CUTOFF_ETA_MAX
+from .perf_resistance import COPPER_TEMPERATURE_COEFF
+from ..constants import DEFAULT_DYNAMIC_VISCOSITY
+
+# Coefficients of the surrogate model of the iron losses used in PerformancesIronLosses, the
+# rows correspond to the exponents of the electrical frequency and the columns to the exponents
+# of the air gap flux density
+IRON_LOSSES_EXPONENTS = np.array([0.5, 1.0, 1.5, 2.0])
+IRON_LOSSES_COEFFICIENTS = np.array(
+    [
+        [530.850444, -1660.22877, 1676.66819, -540.045900],
+        [-40.4065802, 126.706523, -127.987721, 41.0664456],
+        [0.843378999, -2.63865343, 2.65237021, -0.840175850],
+        [-0.00435714286, 0.0135660947, -0.0135585345, 0.00425562126],
+    ]
+)
+
+
+class PerformancesSMPMSMFusedLosses(om.ExplicitComponent):
+    """
+    Computation of the iron, Joule and mechanical losses of the SM PMSM and of the resulting
+    efficiency in a single component. Gives the same results as the chain going from
+    PerformancesAirDynamicViscosity to PerformancesEfficiency but saves the transfers between
+    those components, which are significant when the number of points is high.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            name="motor_id", default=None, desc="Identifier of the motor", allow_none=False
+        )
+        self.options.declare(
+            "number_of_points", default=1, desc="number of equilibrium to be treated"
+        )
+
+    def setup(self):
+        motor_id = self.options["motor_id"]
+        number_of_points = self.options["number_of_points"]
+
+        self.add_input("rpm", units="min**-1", val=np.nan, shape=number_of_points)
+        self.add_input("altitude", units="m", val=np.zeros(number_of_points))
+        self.add_input("density", shape=number_of_points, val=np.nan, units="kg/m**3")
+        self.add_input("shaft_power_out", units="W", val=np.nan, shape=number_of_points)
+        self.add_input(
+            "ac_current_rms_in_one_phase",
+            units="A",
+            val=np.full(number_of_points, np.nan),
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":rotor_diameter",
+            val=np.nan,
+            units="m",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":air_gap_thickness",
+            val=np.nan,
+            units="m",
+            desc="The distance between the rotor and the stator bore",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":active_length",
+            val=np.nan,
+            units="m",
+            desc="The length of electromagnetism active part of SM PMSM",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":end_winding_coeff",
+            val=np.nan,
+            desc="The factor to account for extra length at the end of the winding",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":shaft_diameter",
+            val=np.nan,
+            units="m",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":bearing_diameter",
+            units="m",
+            val=0.03,
+            desc="The motor bearing bore diameter",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:"
+            + motor_id
+            + ":bearing_friction_coefficient",
+            val=0.0015,
+            desc="friction coefficient of the motor that house the shaft, the ball bearing is set "
+            "to default",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":rotor_mass",
+            val=np.nan,
+            units="kg",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":pole_pairs_number",
+            val=np.nan,
+            desc="Number of the north and south pole pairs in the SM PMSM",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:"
+            + motor_id
+            + ":design_air_gap_flux_density",
+            val=0.9,
+            units="T",
+            desc="The design air gap magnetic flux density",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":mass",
+            val=np.nan,
+            units="kg",
+        )
+        self.add_input(
+            name="data:propulsion:he_power_train:SM_PMSM:"
+            + motor_id
+            + ":conductor_temperature_mission",
+            val=np.nan,
+            units="degK",
+            desc="Performances of the conductor will be computed assuming it has a constant "
+            "temperature",
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:SM_PMSM:"
+            + motor_id
+            + ":reference_conductor_resistance",
+            units="ohm",
+            val=np.nan,
+            desc="The conductor's reference electric resistance at 293.15K",
+        )
+        self.add_input(
+            "settings:propulsion:he_power_train:SM_PMSM:" + motor_id + ":k_efficiency",
+            val=1.0,
+            desc="K factor for the SM PMSM efficiency",
+        )
+
+        self.add_output(
+            name="dynamic_viscosity",
+            units="kg/m/s",
+            val=np.full(number_of_points, DEFAULT_DYNAMIC_VISCOSITY),
+        )
+        self.add_output("angular_speed", units="rad/s", val=0.0, shape=number_of_points)
+        self.add_output(
+            "air_gap_reynolds_number",
+            val=np.full(number_of_points, 3e4),
+            desc="The Reynold's number of the air gap between the rotor and stator",
+        )
+        self.add_output(
+            "rotor_end_reynolds_number",
+            val=np.full(number_of_points, 9e5),
+            desc="The Reynold's number of the gap two rotor ends and the casing",
+        )
+        self.add_output("air_gap_friction_coeff", val=np.zeros(number_of_points))
+        self.add_output("rotor_end_friction_coeff", val=np.zeros(number_of_points))
+        self.add_output(
+            "electrical_frequency",
+            units="Hz",
+            val=0.0,
+            shape=number_of_points,
+            desc="The oscillation frequency of the SM PMSM AC current",
+        )
+        self.add_output(
+            "iron_power_losses",
+            units="kW",
+            val=0.0,
+            shape=number_of_points,
+            desc="Iron losses of the SM PMSM due to altering magnetic flux",
+        )
+        self.add_output(
+            "winding_temperature",
+            val=np.full(number_of_points, 293.15),
+            units="degK",
+            desc="temperature of the conductor winding",
+            shape=number_of_points,
+            lower=1.0,
+        )
+        self.add_output("resistance", units="ohm", val=1.0e-4, shape=number_of_points)
+        self.add_output("joule_power_losses", units="W", val=0.0, shape=number_of_points)
+        self.add_output("air_gap_windage_losses", units="W", val=0.0, shape=number_of_points)
+        self.add_output("rotor_windage_losses", units="W", val=0.0, shape=number_of_points)
+        self.add_output("bearing_friction_losses", units="W", val=0.0, shape=number_of_points)
+        self.add_output("mechanical_power_losses", units="kW", val=0.0, shape=number_of_points)
+        self.add_output("power_losses", units="kW", val=0.0, shape=number_of_points)
+        self.add_output("efficiency", val=np.full(number_of_points, 0.95), shape=number_of_points)
+
+    def setup_partials(self):
+        motor_id = self.options["motor_id"]
+        number_of_points = self.options["number_of_points"]
+
+        rotor_diameter_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":rotor_diameter"
+        )
+        air_gap_thickness_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":air_gap_thickness"
+        )
+        shaft_diameter_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":shaft_diameter"
+        )
+        temperature_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":conductor_temperature_mission"
+        )
+        air_gap_length_names = [
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":active_length",
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":end_winding_coeff",
+        ]
+        bearing_names = [
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":rotor_mass",
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":bearing_diameter",
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":bearing_friction_coefficient",
+        ]
+        iron_names = [
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":pole_pairs_number",
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":design_air_gap_flux_density",
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":mass",
+        ]
+        resistance_names = [
+            temperature_name,
+            "data:propulsion:he_power_train:SM_PMSM:"
+            + motor_id
+            + ":reference_conductor_resistance",
+        ]
+        mechanical_names = (
+            [rotor_diameter_name, air_gap_thickness_name, shaft_diameter_name]
+            + air_gap_length_names
+            + bearing_names
+        )
+
+        diagonal = np.arange(number_of_points)
+        column = np.zeros(number_of_points)
+        # The windage depends on the operating point through the rotation speed and the air
+        windage_inputs = ["rpm", "density", "altitude"]
+
+        self.declare_partials(
+            of="dynamic_viscosity", wrt="altitude", method="exact", rows=diagonal, cols=diagonal
+        )
+        self.declare_partials(
+            of="angular_speed",
+            wrt="rpm",
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+            val=2.0 * np.pi / 60.0,
+        )
+
+        self.declare_partials(
+            of=[
+                "air_gap_reynolds_number",
+                "rotor_end_reynolds_number",
+                "air_gap_friction_coeff",
+                "rotor_end_friction_coeff",
+                "air_gap_windage_losses",
+                "rotor_windage_losses",
+                "mechanical_power_losses",
+            ],
+            wrt=windage_inputs,
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            of=[
+                "air_gap_reynolds_number",
+                "rotor_end_reynolds_number",
+                "air_gap_friction_coeff",
+                "rotor_end_friction_coeff",
+                "air_gap_windage_losses",
+                "rotor_windage_losses",
+            ],
+            wrt=rotor_diameter_name,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of=["air_gap_reynolds_number", "air_gap_friction_coeff", "air_gap_windage_losses"],
+            wrt=air_gap_thickness_name,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of="air_gap_windage_losses",
+            wrt=air_gap_length_names,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of="rotor_windage_losses",
+            wrt=shaft_diameter_name,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+
+        self.declare_partials(
+            of=["electrical_frequency", "iron_power_losses", "bearing_friction_losses"],
+            wrt="rpm",
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            of="electrical_frequency",
+            wrt=iron_names[0],
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of="iron_power_losses", wrt=iron_names, method="exact", rows=diagonal, cols=column
+        )
+        self.declare_partials(
+            of="bearing_friction_losses",
+            wrt=bearing_names,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of="mechanical_power_losses",
+            wrt=mechanical_names,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+
+        self.declare_partials(
+            of="winding_temperature",
+            wrt=temperature_name,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+            val=1.0,
+        )
+        self.declare_partials(
+            of=["resistance", "joule_power_losses"],
+            wrt=resistance_names,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of="joule_power_losses",
+            wrt="ac_current_rms_in_one_phase",
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+
+        self.declare_partials(
+            of=["power_losses", "efficiency"],
+            wrt=windage_inputs + ["ac_current_rms_in_one_phase"],
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            of=["power_losses", "efficiency"],
+            wrt=mechanical_names + iron_names + resistance_names,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of="efficiency", wrt="shaft_power_out", method="exact", rows=diagonal, cols=diagonal
+        )
+        self.declare_partials(
+            of="efficiency",
+            wrt="settings:propulsion:he_power_train:SM_PMSM:" + motor_id + ":k_efficiency",
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        motor_id = self.options["motor_id"]
+
+        rpm = inputs["rpm"]
+        rho_air = inputs["density"]
+        i_rms = inputs["ac_current_rms_in_one_phase"]
+        shaft_power = inputs["shaft_power_out"]
+        rotor_radius = (
+            inputs["data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":rotor_diameter"] / 2.0
+        )
+        shaft_radius = (
+            inputs["data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":shaft_diameter"] / 2.0
+        )
+        air_gap_thickness = inputs[
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":air_gap_thickness"
+        ]
+        air_gap_length = (
+            inputs["data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":active_length"]
+            * inputs["data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":end_winding_coeff"]
+        )
+        rotor_mass = inputs["data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":rotor_mass"]
+        cf_bearing = inputs[
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":bearing_friction_coefficient"
+        ]
+        bearing_diameter = inputs[
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":bearing_diameter"
+        ]
+        pole_pairs_number = inputs[
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":pole_pairs_number"
+        ]
+        air_gap_flux_density = inputs[
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":design_air_gap_flux_density"
+        ]
+        mass = inputs["data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":mass"]
+        winding_temperature = inputs[
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":conductor_temperature_mission"
+        ]
+        reference_resistance = inputs[
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":reference_conductor_resistance"
+        ]
+        k_eff = inputs["settings:propulsion:he_power_train:SM_PMSM:" + motor_id + ":k_efficiency"]
+
+        mu_air = AtmosphereWithPartials(
+            inputs["altitude"], altitude_in_feet=False
+        ).dynamic_viscosity
+        omega = 2.0 * np.pi * rpm / 60.0
+
+        re_air_gap = rho_air * rotor_radius * air_gap_thickness * omega / mu_air
+        re_rotor = rho_air * rotor_radius**2.0 * omega / mu_air
+        cf_air_gap = np.where(
+            re_air_gap >= 1.0e4,
+            0.0325 * (air_gap_thickness / rotor_radius) ** 0.3 * (re_air_gap**-0.2),
+            0.515 * (air_gap_thickness / rotor_radius) ** 0.3 * (re_air_gap**-0.5),
+        )
+        cf_rotor = np.where(re_rotor < 3.0e5, 3.87 / re_rotor**0.5, 0.146 / re_rotor**0.2)
+
+        electrical_frequency = rpm * pole_pairs_number / 60.0
+        iron_losses = (
+            mass
+            * (electrical_frequency[:, np.newaxis] ** IRON_LOSSES_EXPONENTS)
+            @ IRON_LOSSES_COEFFICIENTS
+            @ (air_gap_flux_density**IRON_LOSSES_EXPONENTS)
+            / 1000.0
+        )
+
+        resistance = reference_resistance * (
+            1.0 + COPPER_TEMPERATURE_COEFF * (winding_temperature - 293.15)
+        )
+        joule_losses = 3.0 * resistance * i_rms**2.0
+
+        air_gap_windage_losses = (
+            cf_air_gap * np.pi * rho_air * rotor_radius**4.0 * omega**3.0 * air_gap_length
+        )
+        rotor_windage_losses = (
+            0.5 * cf_rotor * np.pi * rho_air * omega**3.0 * (rotor_radius**5.0 - shaft_radius**5.0)
+        )
+        bearing_losses = 0.5 * cf_bearing * rotor_mass * sc.g * bearing_diameter * omega
+        mechanical_losses = (
+            air_gap_windage_losses + 2.0 * rotor_windage_losses + 2.0 * bearing_losses
+        ) / 1000.0
+
+        power_losses = mechanical_losses + iron_losses + joule_losses / 1000.0
+
+        unclipped_efficiency = np.divide(
+            k_eff * shaft_power,
+            shaft_power + power_losses * 1000.0,
+            out=np.ones_like(shaft_power),
+            where=shaft_power != 0,
+        )
+
+        outputs["dynamic_viscosity"] = mu_air
+        outputs["angular_speed"] = omega
+        outputs["air_gap_reynolds_number"] = re_air_gap
+        outputs["rotor_end_reynolds_number"] = re_rotor
+        outputs["air_gap_friction_coeff"] = cf_air_gap
+        outputs["rotor_end_friction_coeff"] = cf_rotor
+        outputs["electrical_frequency"] = electrical_frequency
+        outputs["iron_power_losses"] = iron_losses
+        outputs["winding_temperature"] = winding_temperature
+        outputs["resistance"] = resistance
+        outputs["joule_power_losses"] = joule_losses
+        outputs["air_gap_windage_losses"] = air_gap_windage_losses
+        outputs["rotor_windage_losses"] = rotor_windage_losses
+        outputs["bearing_friction_losses"] = bearing_losses
+        outputs["mechanical_power_losses"] = mechanical_losses
+        outputs["power_losses"] = power_losses
+        outputs["efficiency"] = np.clip(unclipped_efficiency, CUTOFF_ETA_MIN, CUTOFF_ETA_MAX)
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        motor_id = self.options["motor_id"]
+
+        rotor_diameter_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":rotor_diameter"
+        )
+        shaft_diameter_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":shaft_diameter"
+        )
+        air_gap_thickness_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":air_gap_thickness"
+        )
+        active_length_name = "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":active_length"
+        end_winding_coeff_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":end_winding_coeff"
+        )
+        rotor_mass_name = "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":rotor_mass"
+        cf_bearing_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":bearing_friction_coefficient"
+        )
+        bearing_diameter_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":bearing_diameter"
+        )
+        pole_pairs_number_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":pole_pairs_number"
+        )
+        air_gap_flux_density_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":design_air_gap_flux_density"
+        )
+        mass_name = "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":mass"
+        temperature_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":conductor_temperature_mission"
+        )
+        reference_resistance_name = (
+            "data:propulsion:he_power_train:SM_PMSM:" + motor_id + ":reference_conductor_resistance"
+        )
+        k_eff_name = "settings:propulsion:he_power_train:SM_PMSM:" + motor_id + ":k_efficiency"
+
+        rpm = inputs["rpm"]
+        rho_air = inputs["density"]
+        i_rms = inputs["ac_current_rms_in_one_phase"]
+        shaft_power = inputs["shaft_power_out"]
+        rotor_diameter = inputs[rotor_diameter_name]
+        rotor_radius = rotor_diameter / 2.0
+        shaft_radius = inputs[shaft_diameter_name] / 2.0
+        air_gap_thickness = inputs[air_gap_thickness_name]
+        active_length = inputs[active_length_name]
+        end_winding_coeff = inputs[end_winding_coeff_name]
+        air_gap_length = active_length * end_winding_coeff
+        rotor_mass = inputs[rotor_mass_name]
+        cf_bearing = inputs[cf_bearing_name]
+        bearing_diameter = inputs[bearing_diameter_name]
+        pole_pairs_number = inputs[pole_pairs_number_name]
+        air_gap_flux_density = inputs[air_gap_flux_density_name]
+        mass = inputs[mass_name]
+        winding_temperature = inputs[temperature_name]
+        reference_resistance = inputs[reference_resistance_name]
+        k_eff = inputs[k_eff_name]
+
+        # Values, recomputed as in compute
+        atmosphere = AtmosphereWithPartials(inputs["altitude"], altitude_in_feet=False)
+        mu_air = atmosphere.dynamic_viscosity
+        omega = 2.0 * np.pi * rpm / 60.0
+        re_air_gap = rho_air * rotor_radius * air_gap_thickness * omega / mu_air
+        re_rotor = rho_air * rotor_radius**2.0 * omega / mu_air
+        cf_air_gap = np.where(
+            re_air_gap >= 1.0e4,
+            0.0325 * (air_gap_thickness / rotor_radius) ** 0.3 * (re_air_gap**-0.2),
+            0.515 * (air_gap_thickness / rotor_radius) ** 0.3 * (re_air_gap**-0.5),
+        )
+        cf_rotor = np.where(re_rotor < 3.0e5, 3.87 / re_rotor**0.5, 0.146 / re_rotor**0.2)
+        electrical_frequency = rpm * pole_pairs_number / 60.0
+        frequency_terms = electrical_frequency[:, np.newaxis] ** IRON_LOSSES_EXPONENTS
+        flux_density_terms = air_gap_flux_density**IRON_LOSSES_EXPONENTS
+        resistance = reference_resistance * (
+            1.0 + COPPER_TEMPERATURE_COEFF * (winding_temperature - 293.15)
+        )
+        rotor_windage_radii = rotor_radius**5.0 - shaft_radius**5.0
+        power_losses = (
+            (
+                cf_air_gap * np.pi * rho_air * rotor_radius**4.0 * omega**3.0 * air_gap_length
+                + cf_rotor * np.pi * rho_air * omega**3.0 * rotor_windage_radii
+                + cf_bearing * rotor_mass * sc.g * bearing_diameter * omega
+            )
+            + mass * frequency_terms @ IRON_LOSSES_COEFFICIENTS @ flux_density_terms
+            + 3.0 * resistance * i_rms**2.0
+        )
+        unclipped_efficiency = np.divide(
+            k_eff * shaft_power,
+            shaft_power + power_losses,
+            out=np.ones_like(shaft_power),
+            where=shaft_power != 0,
+        )
+
+        # Derivatives of each step with respect to its own inputs, taken as in the decomposed
+        # components so that both give the same jacobian
+        d_omega = {"rpm": 2.0 * np.pi / 60.0}
+        d_mu = {"altitude": atmosphere.partial_dynamic_viscosity_altitude}
+
+        d_re_air_gap = chain_rule(
+            (rho_air * rotor_radius * air_gap_thickness / mu_air, d_omega),
+            (-re_air_gap / mu_air, d_mu),
+            (rotor_radius * air_gap_thickness * omega / mu_air, {"density": 1.0}),
+            (0.5 * rho_air * air_gap_thickness * omega / mu_air, {rotor_diameter_name: 1.0}),
+            (rho_air * rotor_radius * omega / mu_air, {air_gap_thickness_name: 1.0}),
+        )
+        d_re_rotor = chain_rule(
+            (rho_air * rotor_radius**2.0 / mu_air, d_omega),
+            (-re_rotor / mu_air, d_mu),
+            (rotor_radius**2.0 * omega / mu_air, {"density": 1.0}),
+            (rho_air * rotor_radius * omega / mu_air, {rotor_diameter_name: 1.0}),
+        )
+
+        d_cf_air_gap = chain_rule(
+            (
+                np.where(
+                    re_air_gap >= 1.0e4,
+                    -0.0065 * (air_gap_thickness / rotor_radius) ** 0.3 * re_air_gap**-1.2,
+                    -0.2575 * (air_gap_thickness / rotor_radius) ** 0.3 * re_air_gap**-1.5,
+                ),
+                d_re_air_gap,
+            ),
+            (
+                np.where(
+                    re_air_gap >= 1.0e4,
+                    0.00975 * air_gap_thickness**-0.7 * rotor_radius**-0.3 * re_air_gap**-0.2,
+                    0.1545 * air_gap_thickness**-0.7 * rotor_radius**-0.3 * re_air_gap**-0.5,
+                ),
+                {air_gap_thickness_name: 1.0},
+            ),
+            (
+                np.where(
+                    re_air_gap >= 1.0e4,
+                    -0.00975
+                    * (2.0 * air_gap_thickness) ** 0.3
+                    * rotor_diameter**-1.3
+                    * re_air_gap**-0.2,
+                    -0.1545
+                    * (2.0 * air_gap_thickness) ** 0.3
+                    * rotor_diameter**-1.3
+                    * re_air_gap**-0.5,
+                ),
+                {rotor_diameter_name: 1.0},
+            ),
+        )
+        d_cf_rotor = chain_rule(
+            (
+                np.where(re_rotor < 3.0e5, -1.935 / re_rotor**1.5, -0.0292 / re_rotor**1.2),
+                d_re_rotor,
+            )
+        )
+
+        d_electrical_frequency = chain_rule(
+            (pole_pairs_number / 60.0, {"rpm": 1.0}),
+            (rpm / 60.0, {pole_pairs_number_name: 1.0}),
+        )
+        d_iron_losses = chain_rule(
+            (
+                mass
+                * (
+                    IRON_LOSSES_EXPONENTS
+                    * electrical_frequency[:, np.newaxis] ** (IRON_LOSSES_EXPONENTS - 1.0)
+                )
+                @ IRON_LOSSES_COEFFICIENTS
+                @ flux_density_terms
+                / 1000.0,
+                d_electrical_frequency,
+            ),
+            (
+                mass
+                * frequency_terms
+                @ IRON_LOSSES_COEFFICIENTS
+                @ (IRON_LOSSES_EXPONENTS * air_gap_flux_density ** (IRON_LOSSES_EXPONENTS - 1.0))
+                / 1000.0,
+                {air_gap_flux_density_name: 1.0},
+            ),
+            (
+                frequency_terms @ IRON_LOSSES_COEFFICIENTS @ flux_density_terms / 1000.0,
+                {mass_name: 1.0},
+            ),
+        )
+
+        d_resistance = chain_rule(
+            (
+                1.0 + COPPER_TEMPERATURE_COEFF * (winding_temperature - 293.15),
+                {reference_resistance_name: 1.0},
+            ),
+            (COPPER_TEMPERATURE_COEFF * reference_resistance, {temperature_name: 1.0}),
+        )
+        d_joule_losses = chain_rule(
+            (3.0 * i_rms**2.0, d_resistance),
+            (6.0 * resistance * i_rms, {"ac_current_rms_in_one_phase": 1.0}),
+        )
+
+        d_air_gap_windage_losses = chain_rule(
+            (np.pi * rho_air * rotor_radius**4.0 * omega**3.0 * air_gap_length, d_cf_air_gap),
+            (
+                3.0
+                * cf_air_gap
+                * np.pi
+                * rho_air
+                * rotor_radius**4.0
+                * omega**2.0
+                * air_gap_length,
+                d_omega,
+            ),
+            (
+                cf_air_gap * np.pi * rotor_radius**4.0 * omega**3.0 * air_gap_length,
+                {"density": 1.0},
+            ),
+            (
+                2.0
+                * cf_air_gap
+                * np.pi
+                * rho_air
+                * rotor_radius**3.0
+                * omega**3.0
+                * air_gap_length,
+                {rotor_diameter_name: 1.0},
+            ),
+            (
+                cf_air_gap * np.pi * rho_air * rotor_radius**4.0 * omega**3.0 * end_winding_coeff,
+                {active_length_name: 1.0},
+            ),
+            (
+                cf_air_gap * np.pi * rho_air * rotor_radius**4.0 * omega**3.0 * active_length,
+                {end_winding_coeff_name: 1.0},
+            ),
+        )
+        d_rotor_windage_losses = chain_rule(
+            (0.5 * np.pi * rho_air * omega**3.0 * rotor_windage_radii, d_cf_rotor),
+            (1.5 * cf_rotor * np.pi * rho_air * omega**2.0 * rotor_windage_radii, d_omega),
+            (0.5 * cf_rotor * np.pi * omega**3.0 * rotor_windage_radii, {"density": 1.0}),
+            (
+                1.25 * cf_rotor * np.pi * rho_air * omega**3.0 * rotor_radius**4.0,
+                {rotor_diameter_name: 1.0},
+            ),
+            (
+                -1.25 * cf_rotor * np.pi * rho_air * omega**3.0 * shaft_radius**4.0,
+                {shaft_diameter_name: 1.0},
+            ),
+        )
+        d_bearing_losses = chain_rule(
+            (0.5 * cf_bearing * rotor_mass * sc.g * bearing_diameter, d_omega),
+            (0.5 * cf_bearing * sc.g * bearing_diameter * omega, {rotor_mass_name: 1.0}),
+            (0.5 * cf_bearing * rotor_mass * sc.g * omega, {bearing_diameter_name: 1.0}),
+            (0.5 * rotor_mass * sc.g * bearing_diameter * omega, {cf_bearing_name: 1.0}),
+        )
+        d_mechanical_losses = chain_rule(
+            (1.0 / 1000.0, d_air_gap_windage_losses),
+            (2.0 / 1000.0, d_rotor_windage_losses),
+            (2.0 / 1000.0, d_bearing_losses),
+        )
+
+        d_power_losses = chain_rule(
+            (1.0, d_mechanical_losses),
+            (1.0, d_iron_losses),
+            (1.0 / 1000.0, d_joule_losses),
+        )
+
+        efficiency_not_clipped = (unclipped_efficiency <= CUTOFF_ETA_MAX) & (
+            unclipped_efficiency >= CUTOFF_ETA_MIN
+        )
+        # The power losses are in kW in the decomposed components while the efficiency takes them
+        # in W, hence the conversion
+        d_efficiency = chain_rule(
+            (
+                np.where(
+                    efficiency_not_clipped,
+                    -(k_eff * shaft_power / (shaft_power + power_losses) ** 2.0),
+                    1e-6,
+                )
+                * 1000.0,
+                d_power_losses,
+            ),
+            (
+                np.where(
+                    efficiency_not_clipped,
+                    k_eff * power_losses / (shaft_power + power_losses) ** 2.0,
+                    1e-6,
+                ),
+                {"shaft_power_out": 1.0},
+            ),
+            (
+                np.where(efficiency_not_clipped, shaft_power / (shaft_power + power_losses), 1e-6),
+                {k_eff_name: 1.0},
+            ),
+        )
+
+        for output_name, derivatives in (
+            ("dynamic_viscosity", d_mu),
+            ("air_gap_reynolds_number", d_re_air_gap),
+            ("rotor_end_reynolds_number", d_re_rotor),
+            ("air_gap_friction_coeff", d_cf_air_gap),
+            ("rotor_end_friction_coeff", d_cf_rotor),
+            ("electrical_frequency", d_electrical_frequency),
+            ("iron_power_losses", d_iron_losses),
+            ("resistance", d_resistance),
+            ("joule_power_losses", d_joule_losses),
+            ("air_gap_windage_losses", d_air_gap_windage_losses),
+            ("rotor_windage_losses", d_rotor_windage_losses),
+            ("bearing_friction_losses", d_bearing_losses),
+            ("mechanical_power_losses", d_mechanical_losses),
+            ("power_losses", d_power_losses),
+            ("efficiency", d_efficiency),
+        ):
+            for input_name, derivative in derivatives.items():
+                partials[output_name, input_name] = derivative
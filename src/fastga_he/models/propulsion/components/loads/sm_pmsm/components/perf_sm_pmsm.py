@@ -22,6 +22,7 @@ from .perf_maximum import PerformancesMaximum
 from .perf_electrical_frequency import PerformancesElectricalFrequency
 from .perf_resistance import PerformancesResistance
 from .perf_temperature_constant import PerformancesTemperatureConstant
+from .perf_fused_losses import PerformancesSMPMSMFusedLosses
 from ...pmsm.components.perf_torque import PerformancesTorque
 from ...pmsm.components.perf_active_power import PerformancesActivePower
 from ...pmsm.components.perf_current_rms_phase import PerformancesCurrentRMS1Phase
@@ -37,6 +38,14 @@ class PerformancesSMPMSM(om.Group):
         self.options.declare(
             "number_of_points", default=1, desc="number of equilibrium to be treated"
         )
+        self.options.declare(
+            name="fused",
+            default=False,
+            types=bool,
+            desc="If True, the chain of components computing the losses and efficiency of the "
+            "motor is replaced by a single component giving the same results, which is faster "
+            "when the number of points is high",
+        )
 
     def setup(self):
         motor_id = self.options["motor_id"]
@@ -48,37 +57,40 @@ class PerformancesSMPMSM(om.Group):
             promotes=["*"],
         )
 
-        self.add_subsystem(
-            "dynamic_viscosity",
-            PerformancesAirDynamicViscosity(number_of_points=number_of_points),
-            promotes=["*"],
-        )
+        if not self.options["fused"]:
+            self.add_subsystem(
+                "dynamic_viscosity",
+                PerformancesAirDynamicViscosity(number_of_points=number_of_points),
+                promotes=["*"],
+            )
 
-        self.add_subsystem(
-            "angular_speed",
-            PerformancesAngularSpeed(number_of_points=number_of_points),
-            promotes=["*"],
-        )
+            self.add_subsystem(
+                "angular_speed",
+                PerformancesAngularSpeed(number_of_points=number_of_points),
+                promotes=["*"],
+            )
 
-        self.add_subsystem(
-            "windage_reynold",
-            PerformancesWindageReynolds(motor_id=motor_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
+            self.add_subsystem(
+                "windage_reynold",
+                PerformancesWindageReynolds(motor_id=motor_id, number_of_points=number_of_points),
+                promotes=["*"],
+            )
 
-        self.add_subsystem(
-            "windage_friction_coeff",
-            PerformancesWindageFrictionCoefficient(
-                motor_id=motor_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
+            self.add_subsystem(
+                "windage_friction_coeff",
+                PerformancesWindageFrictionCoefficient(
+                    motor_id=motor_id, number_of_points=number_of_points
+                ),
+                promotes=["*"],
+            )
 
-        self.add_subsystem(
-            "electrical_frequency",
-            PerformancesElectricalFrequency(motor_id=motor_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
+            self.add_subsystem(
+                "electrical_frequency",
+                PerformancesElectricalFrequency(
+                    motor_id=motor_id, number_of_points=number_of_points
+                ),
+                promotes=["*"],
+            )
 
         self.add_subsystem(
             "current_rms",
@@ -92,65 +104,76 @@ class PerformancesSMPMSM(om.Group):
             promotes=["*"],
         )
 
-        self.add_subsystem(
-            "iron_losses",
-            PerformancesIronLosses(motor_id=motor_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
-
-        self.add_subsystem(
-            "conductor_temperature",
-            PerformancesTemperatureConstant(motor_id=motor_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
-
-        self.add_subsystem(
-            "electrical_resistance",
-            PerformancesResistance(motor_id=motor_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
-
-        self.add_subsystem(
-            "joule_losses",
-            PerformancesJouleLosses(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-
-        self.add_subsystem(
-            "air_gap_windage_losses",
-            PerformancesAirGapWindageLosses(motor_id=motor_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
-
-        self.add_subsystem(
-            "rotor_windage_losses",
-            PerformancesRotorWindageLoss(motor_id=motor_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
-
-        self.add_subsystem(
-            "bearing_friction_losses",
-            PerformancesBearingLosses(motor_id=motor_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
-
-        self.add_subsystem(
-            "mechanical_losses",
-            PerformancesMechanicalLosses(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-
-        self.add_subsystem(
-            "power_losses",
-            PerformancesPowerLosses(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-
-        self.add_subsystem(
-            "efficiency",
-            PerformancesEfficiency(motor_id=motor_id, number_of_points=number_of_points),
-            promotes=["*"],
-        )
+        if self.options["fused"]:
+            self.add_subsystem(
+                "losses",
+                PerformancesSMPMSMFusedLosses(motor_id=motor_id, number_of_points=number_of_points),
+                promotes=["*"],
+            )
+        else:
+            self.add_subsystem(
+                "iron_losses",
+                PerformancesIronLosses(motor_id=motor_id, number_of_points=number_of_points),
+                promotes=["*"],
+            )
+
+            self.add_subsystem(
+                "conductor_temperature",
+                PerformancesTemperatureConstant(
+                    motor_id=motor_id, number_of_points=number_of_points
+                ),
+                promotes=["*"],
+            )
+
+            self.add_subsystem(
+                "electrical_resistance",
+                PerformancesResistance(motor_id=motor_id, number_of_points=number_of_points),
+                promotes=["*"],
+            )
+
+            self.add_subsystem(
+                "joule_losses",
+                PerformancesJouleLosses(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+
+            self.add_subsystem(
+                "air_gap_windage_losses",
+                PerformancesAirGapWindageLosses(
+                    motor_id=motor_id, number_of_points=number_of_points
+                ),
+                promotes=["*"],
+            )
+
+            self.add_subsystem(
+                "rotor_windage_losses",
+                PerformancesRotorWindageLoss(motor_id=motor_id, number_of_points=number_of_points),
+                promotes=["*"],
+            )
+
+            self.add_subsystem(
+                "bearing_friction_losses",
+                PerformancesBearingLosses(motor_id=motor_id, number_of_points=number_of_points),
+                promotes=["*"],
+            )
+
+            self.add_subsystem(
+                "mechanical_losses",
+                PerformancesMechanicalLosses(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+
+            self.add_subsystem(
+                "power_losses",
+                PerformancesPowerLosses(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+
+            self.add_subsystem(
+                "efficiency",
+                PerformancesEfficiency(motor_id=motor_id, number_of_points=number_of_points),
+                promotes=["*"],
+            )
 
         self.add_subsystem(
             "active_power",
@@ -48,6 +48,13 @@ class SizingSMPMSM(om.Group):
             + ", ".join(POSSIBLE_POSITION),
             allow_none=False,
         )
+        self.options.declare(
+            name="fused",
+            default=False,
+            types=bool,
+            desc="If True, some chains of components of the performances are replaced by a "
+            "single component giving the same results",
+        )
 
     def setup(self):
         motor_id = self.options["motor_id"]
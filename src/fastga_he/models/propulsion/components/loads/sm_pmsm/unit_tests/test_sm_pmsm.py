@@ -1149,6 +1149,45 @@ def test_performance_SM_PMSM():
     problem.check_partials(compact_print=True)
 
 
+def test_performance_SM_PMSM_fused():
+    options = {"motor_id": "motor_1", "number_of_points": NB_POINTS_TEST}
+
+    ivc = get_indep_var_comp(
+        list_inputs(PerformancesSMPMSM(**options)),
+        __file__,
+        XML_FILE,
+    )
+
+    # Operating points spanning both friction coefficient regimes and the efficiency clipping
+    ivc.add_output("shaft_power_out", np.linspace(1.0, 1432.6, NB_POINTS_TEST), units="kW")
+    ivc.add_output("rpm", np.linspace(500, 15970, NB_POINTS_TEST), units="min**-1")
+    ivc.add_output("altitude", val=np.linspace(0.0, 5000.0, NB_POINTS_TEST), units="m")
+    ivc.add_output("density", np.linspace(1.225, 0.736, NB_POINTS_TEST), units="kg/m**3")
+
+    # Run problem with the decomposed and the fused components
+    problem = run_system(PerformancesSMPMSM(**options), ivc)
+    problem_fused = run_system(PerformancesSMPMSM(**options, fused=True), ivc)
+
+    for output_name in [
+        "angular_speed",
+        "air_gap_friction_coeff",
+        "rotor_end_friction_coeff",
+        "iron_power_losses",
+        "joule_power_losses",
+        "mechanical_power_losses",
+        "power_losses",
+        "efficiency",
+        "ac_current_rms_in",
+        "ac_voltage_peak_in",
+        "data:propulsion:he_power_train:SM_PMSM:motor_1:shaft_power_max",
+    ]:
+        assert problem_fused.get_val(output_name) == pytest.approx(
+            problem.get_val(output_name), rel=1e-6
+        )
+
+    problem_fused.check_partials(compact_print=True)
+
+
 def test_sizing_SM_PMSM():
     ivc = get_indep_var_comp(list_inputs(SizingSMPMSM(motor_id="motor_1")), __file__, XML_FILE)
 
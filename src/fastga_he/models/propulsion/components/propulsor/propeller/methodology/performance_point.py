@@ -12,6 +12,13 @@ from fastga.models.aerodynamics.external.propeller_code.propeller_core import Pr
 from fastga.models.aerodynamics.constants import POLAR_POINT_COUNT
 from fastga_he.models.aerodynamics.external.xfoil.xfoil_polar import XfoilPolarMod
 
+# Maximum number of iterations of the vectorized Newton method used to solve the BEM vs. disk
+# theory system of equations, relative tolerance on the induced speeds to consider it converged
+# and relative step used to compute its Jacobian
+BEM_MAX_ITERATIONS = 50
+BEM_TOLERANCE = 1e-6
+FD_STEP = 1.49e-8
+
 
 class ComputePropellerPointPerformance(om.Group):
     """Computes propeller profiles aerodynamic coefficient and propeller behaviour."""
@@ -313,7 +320,8 @@ class _ComputePropellerPointPerformance(PropellerCoreModule):
     ):
         """
         This function calculates the thrust, efficiency and power at a given flight speed,
-        altitude h and propeller angular speed.
+        altitude h and propeller angular speed. Relies on the vectorized computation with a
+        single operating point.
 
         :param inputs: structure of data relative to the blade geometry available from setup
         :param theta_75: pitch defined at r = 0.75*R radial position [deg].
@@ -336,6 +344,62 @@ class _ComputePropellerPointPerformance(PropellerCoreModule):
         :return: thrust [N], eta (efficiency) [-] and power [W].
         """
 
+        thrust, eta, torque = self.compute_pitch_performance_vect(
+            inputs,
+            theta_75,
+            v_inf,
+            altitude,
+            omega,
+            radius,
+            alpha_list,
+            cl_list,
+            cd_list,
+            cl_inv_list,
+            cd_min_list,
+        )
+
+        return float(thrust[0]), float(eta[0]), torque[0]
+
+    def compute_pitch_performance_vect(
+        self,
+        inputs,
+        theta_75,
+        v_inf,
+        altitude,
+        omega,
+        radius,
+        alpha_list,
+        cl_list,
+        cd_list,
+        cl_inv_list,
+        cd_min_list,
+    ):
+        """
+        This function calculates the thrust, efficiency and torque for several operating points
+        at once. For each blade element, the BEM vs. disk theory system of equations is solved
+        for all operating points at the same time with a vectorized Newton method. Points on
+        which it does not converge are solved one by one with fsolve.
+
+        :param inputs: structure of data relative to the blade geometry available from setup
+        :param theta_75: pitch defined at r = 0.75*R radial position for each point [deg].
+        :param v_inf: flight speed for each point [m/s].
+        :param altitude: flight altitude for each point [m].
+        :param omega: angular velocity of the propeller for each point [RPM].
+        :param radius: array of radius of discretized blade elements [m].
+        :param alpha_list: angle of attack list for aerodynamic coefficient of profile at
+        discretized blade element [deg], must be the same for all elements.
+        :param cl_list: cl list for aerodynamic coefficient of profile at discretized blade
+        element [-].
+        :param cd_list: cd list for aerodynamic coefficient of profile at discretized blade
+        element [-].
+        :param cl_inv_list: cl list for inviscid aerodynamic coefficient of profile at discretized
+        blade element [-].
+        :param cd_min_list: cd_min list for aerodynamic coefficient of profile at discretized blade
+        element [-].
+
+        :return: arrays of thrust [N], eta (efficiency) [-] and torque [N*m] at each point.
+        """
+
         blades_number = inputs["data:geometry:propeller:blades_number"]
         radius_min = inputs["data:geometry:propeller:hub_diameter"] / 2.0
         radius_max = inputs["data:geometry:propeller:diameter"] / 2.0
@@ -346,90 +410,369 @@ class _ComputePropellerPointPerformance(PropellerCoreModule):
         reference_reynolds = inputs["reference_reynolds"]
         length = radius_max - radius_min
         element_length = length / self.options["elements_number"]
+
+        # Operating points are along the first axis, blade elements along the second one
+        theta_75, v_inf, altitude, omega = (
+            np.reshape(array, (-1, 1))
+            for array in np.broadcast_arrays(
+                np.ravel(theta_75), np.ravel(v_inf), np.ravel(altitude), np.ravel(omega)
+            )
+        )
         omega = omega * np.pi / 30.0
         atm = Atmosphere(altitude, altitude_in_feet=False)
 
         theta_75_ref = np.interp(0.75, radius_ratio_vect, twist_vect)
 
-        # Initialise vectors
-        vi_vect = np.zeros_like(radius)
-        vt_vect = np.zeros_like(radius)
-        thrust_element_vector = np.zeros_like(radius)
-        torque_element_vector = np.zeros_like(radius)
-        alpha_vect = np.zeros_like(radius)
-        speed_vect = np.array([0.1 * float(v_inf), 1.0])
-
         chord = np.interp(radius / radius_max, radius_ratio_vect, chord_vect)
-
         theta = np.interp(radius / radius_max, radius_ratio_vect, twist_vect) + (
             theta_75 - theta_75_ref
         )
         sweep = np.interp(radius / radius_max, radius_ratio_vect, sweep_vect)
 
-        # Loop on element number to compute equations
-        for idx, _ in enumerate(radius):
-            # Solve BEM vs. disk theory system of equations
-            speed_vect = fsolve(
-                self.delta_mod,
-                speed_vect,
-                (
-                    radius[idx],
-                    radius_min,
-                    radius_max,
-                    chord[idx],
-                    blades_number,
-                    sweep[idx],
-                    omega,
-                    v_inf,
-                    theta[idx],
-                    alpha_list[idx, :],
-                    cl_list[idx, :],
-                    cd_list[idx, :],
-                    cl_inv_list[idx, :],
-                    cd_min_list[idx],
-                    atm,
-                    reference_reynolds,
-                ),
-                xtol=1e-3,
-            )
-            vi_vect[idx] = speed_vect[0]
-            vt_vect[idx] = speed_vect[1]
+        polar_interpolant = _PolarInterpolant(
+            alpha_list[0, :], cl_list, cd_list, cl_inv_list, cd_min_list
+        )
 
-            results = self.bem_theory_mod(
-                speed_vect,
-                radius[idx],
-                chord[idx],
+        # Restricting the polars to one element is done once and for all
+        element_polar_interpolants = [
+            polar_interpolant[idx_element : idx_element + 1] for idx_element in range(len(radius))
+        ]
+
+        def residuals(v_i, v_t, idx_element):
+            element_slice = slice(idx_element, idx_element + 1)
+            thrust_bem, _, _, _ = self.bem_theory_vect(
+                v_i,
+                v_t,
+                radius[element_slice],
+                chord[element_slice],
                 blades_number,
-                sweep[idx],
+                sweep[element_slice],
                 omega,
                 v_inf,
-                theta[idx],
-                alpha_list[idx, :],
-                cl_list[idx, :],
-                cd_list[idx, :],
-                cl_inv_list[idx, :],
-                cd_min_list[idx],
+                theta[:, element_slice],
+                element_polar_interpolants[idx_element],
                 atm,
                 reference_reynolds,
             )
-            out_of_polars = results[3]
+            thrust_disk, torque_disk = self.disk_theory_vect(
+                v_i,
+                v_t,
+                radius[element_slice],
+                radius_min,
+                radius_max,
+                blades_number,
+                sweep[element_slice],
+                omega,
+                v_inf,
+            )
+            # Same system as in delta_mod
+            return thrust_bem - thrust_disk, thrust_bem - torque_disk
+
+        # Solve BEM vs. disk theory system of equations. As in the original method, each element
+        # starts from the solution of the previous one, which matters when the system has several
+        # solutions, e.g. when windmilling. All operating points are solved at once though.
+        v_i = np.zeros_like(theta)
+        v_t = np.zeros_like(theta)
+        v_i_element = 0.1 * v_inf
+        v_t_element = np.ones_like(v_inf)
+
+        for idx_element in range(len(radius)):
+            element_slice = slice(idx_element, idx_element + 1)
+            v_i_element, v_t_element, failed = self.solve_induced_speeds(
+                v_i_element,
+                v_t_element,
+                lambda v_i_try, v_t_try: residuals(v_i_try, v_t_try, idx_element),
+            )
 
-            if out_of_polars:
-                thrust_element_vector[idx] = 0.0
-                torque_element_vector[idx] = 0.0
-                # print(out_of_polars)
-            else:
-                thrust_element_vector[idx] = results[0] * element_length * atm.density
-                torque_element_vector[idx] = results[1] * element_length * atm.density
-            alpha_vect[idx] = results[2]
+            # Points on which the Newton method failed are solved one by one
+            for idx_point in np.nonzero(failed[:, 0])[0]:
+                speed_vect = fsolve(
+                    self.delta_mod,
+                    np.array([0.1 * float(v_inf[idx_point, 0]), 1.0]),
+                    (
+                        radius[idx_element],
+                        radius_min,
+                        radius_max,
+                        chord[idx_element],
+                        blades_number,
+                        sweep[idx_element],
+                        omega[idx_point, 0],
+                        v_inf[idx_point, 0],
+                        theta[idx_point, idx_element],
+                        alpha_list[idx_element, :],
+                        cl_list[idx_element, :],
+                        cd_list[idx_element, :],
+                        cl_inv_list[idx_element, :],
+                        cd_min_list[idx_element],
+                        Atmosphere(altitude[idx_point, 0], altitude_in_feet=False),
+                        reference_reynolds,
+                    ),
+                    xtol=1e-3,
+                )
+                v_i_element[idx_point, 0] = speed_vect[0]
+                v_t_element[idx_point, 0] = speed_vect[1]
+
+            v_i[:, element_slice] = v_i_element
+            v_t[:, element_slice] = v_t_element
+
+        thrust_element, torque_element, _, out_of_polars = self.bem_theory_vect(
+            v_i,
+            v_t,
+            radius,
+            chord,
+            blades_number,
+            sweep,
+            omega,
+            v_inf,
+            theta,
+            polar_interpolant,
+            atm,
+            reference_reynolds,
+        )
 
-        torque = np.sum(torque_element_vector)
-        thrust = float(np.sum(thrust_element_vector))
-        power = float(torque * omega)
-        eta = float(v_inf * thrust / power)
+        density = np.reshape(atm.density, (-1, 1))
+        thrust_element_vector = np.where(
+            out_of_polars, 0.0, thrust_element * element_length * density
+        )
+        torque_element_vector = np.where(
+            out_of_polars, 0.0, torque_element * element_length * density
+        )
+
+        torque = np.sum(torque_element_vector, axis=1)
+        thrust = np.sum(thrust_element_vector, axis=1)
+        power = torque * omega[:, 0]
+        eta = v_inf[:, 0] * thrust / power
 
         return thrust, eta, torque
 
+    @staticmethod
+    def solve_induced_speeds(v_i, v_t, residuals):
+        """
+        Solves the BEM vs. disk theory system of equations with a vectorized Newton method,
+        each entry of the arrays being an independent 2x2 system. Entries stop being updated
+        once they have converged.
+
+        :param v_i: initial guess for the axial induced speed [m/s]
+        :param v_t: initial guess for the tangential induced speed [m/s]
+        :param residuals: function returning the residuals of the two equations for given axial
+        and tangential induced speeds, must accept arrays with an additional leading axis
+
+        :return: the axial and tangential induced speeds and a mask of the entries for which
+        the method failed.
+        """
+
+        v_i = np.array(v_i, dtype=float)
+        v_t = np.array(v_t, dtype=float)
+        converged = np.zeros_like(v_i, dtype=bool)
+        failed = np.zeros_like(v_i, dtype=bool)
+
+        for _ in range(BEM_MAX_ITERATIONS):
+            active = ~(converged | failed)
+            if not np.any(active):
+                break
+
+            # Jacobian of each system with forward finite differences, the residuals and the
+            # perturbed residuals are evaluated in a single call to limit the overhead
+            step_i = FD_STEP * np.maximum(np.abs(v_i), 1.0)
+            step_t = FD_STEP * np.maximum(np.abs(v_t), 1.0)
+            (res_i, res_i_di, res_i_dt), (res_t, res_t_di, res_t_dt) = residuals(
+                np.stack((v_i, v_i + step_i, v_i)), np.stack((v_t, v_t, v_t + step_t))
+            )
+            jac_ii = (res_i_di - res_i) / step_i
+            jac_ti = (res_t_di - res_t) / step_i
+            jac_it = (res_i_dt - res_i) / step_t
+            jac_tt = (res_t_dt - res_t) / step_t
+
+            determinant = jac_ii * jac_tt - jac_it * jac_ti
+            with np.errstate(divide="ignore", invalid="ignore"):
+                delta_v_i = -(jac_tt * res_i - jac_it * res_t) / determinant
+                delta_v_t = -(jac_ii * res_t - jac_ti * res_i) / determinant
+
+            # Entries for which the Newton step can't be computed are flagged as failed
+            failed |= active & ~(np.isfinite(delta_v_i) & np.isfinite(delta_v_t))
+            active &= ~failed
+
+            v_i = np.where(active, v_i + delta_v_i, v_i)
+            v_t = np.where(active, v_t + delta_v_t, v_t)
+
+            converged |= active & (
+                (np.abs(delta_v_i) <= BEM_TOLERANCE * (np.abs(v_i) + BEM_TOLERANCE))
+                & (np.abs(delta_v_t) <= BEM_TOLERANCE * (np.abs(v_t) + BEM_TOLERANCE))
+            )
+
+        res_i, res_t = residuals(v_i, v_t)
+        failed |= ~(converged & np.isfinite(res_i) & np.isfinite(res_t))
+
+        return v_i, v_t, failed
+
+    @staticmethod
+    def bem_theory_vect(
+        v_i: np.ndarray,
+        v_t: np.ndarray,
+        radius: np.ndarray,
+        chord: np.ndarray,
+        blades_number: float,
+        sweep: np.ndarray,
+        omega: np.ndarray,
+        v_inf: np.ndarray,
+        theta: np.ndarray,
+        polar_interpolant,
+        atm: Atmosphere,
+        reference_reynolds: float,
+    ):
+        """
+        Vectorized version of bem_theory_mod, computes the thrust and torque of all the elements
+        for all operating points at once. Element quantities are given along the last axis and
+        operating point quantities along the first one.
+
+        :param v_i: axial induced speed [m/s]
+        :param v_t: tangential induced speed [m/s]
+        :param radius: radius position of the elements center  [m]
+        :param chord: chord at the center of elements [m]
+        :param blades_number: number of blades [-]
+        :param sweep: sweep angle of the elements [deg.]
+        :param omega: angular speed of propeller [rad/sec]
+        :param v_inf: flight speed [m/s]
+        :param theta: profile angle relative to aircraft airflow v_inf [deg.]
+        :param polar_interpolant: pre-tabulated polars of the elements
+        :param atm: atmosphere properties at each operating point
+        :param reference_reynolds: Reynolds number at which the aerodynamic properties were computed
+
+        :return: The calculated dT/(rho*dr) and dQ/(rho*dr) increments with BEM method, the angle
+        of attack of each element and whether it is out of the polars.
+        """
+
+        # Calculate speed composition and relative air angle (in deg.)
+        v_ax = v_inf + v_i
+        v_t = (omega * radius - v_t) * np.cos(sweep * np.pi / 180.0)
+        rel_fluid_speed = np.sqrt(v_ax**2.0 + v_t**2.0)
+        with np.errstate(divide="ignore"):
+            phi = np.arctan(v_ax / v_t)
+        alpha = theta - phi * 180.0 / np.pi
+
+        # Compute local mach
+        mach_local = rel_fluid_speed / np.reshape(atm.speed_of_sound, (-1, 1))
+
+        # Apply the compressibility corrections for cl and cd
+        out_of_polars = (alpha > polar_interpolant.alpha_max) | (
+            alpha < polar_interpolant.alpha_min
+        )
+
+        c_l, c_l_inv, c_d = polar_interpolant(alpha)
+        cd_min_element = polar_interpolant.cd_min
+
+        subsonic = mach_local < 1
+        with np.errstate(invalid="ignore"):
+            beta = np.where(subsonic, np.sqrt(1 - mach_local**2.0), np.sqrt(mach_local**2.0 - 1))
+        correction = np.where(subsonic, mach_local**2.0 / (2.0 + 2.0 * beta), 0.0)
+        c_l = c_l / (beta + c_l * correction)
+        c_l_inv = c_l_inv / (beta + c_l_inv * correction)
+        c_d = c_d / (beta + c_d * correction)
+        c_d_min = cd_min_element / (beta + cd_min_element * correction)
+
+        reynolds = chord * rel_fluid_speed / np.reshape(atm.kinematic_viscosity, (-1, 1))
+        f_re = (3.46 * np.log(reynolds) - 5.6) ** -2
+        f_re_t = (3.46 * np.log(reference_reynolds) - 5.6) ** -2
+        c_d = c_d * (f_re / f_re_t)
+        c_d_min = c_d_min * (f_re / f_re_t)
+
+        delta_c_l = c_l_inv - c_l
+        delta_c_d = c_d - c_d_min
+
+        c_l_3d = c_l + 3.0 * (chord / radius) ** 2.0 * np.cos(theta) ** 4.0 * delta_c_l
+        c_d_3d = c_d + 3.0 * (chord / radius) ** 2.0 * np.cos(theta) ** 4.0 * delta_c_d
+
+        # Calculate force and momentum
+        thrust_element = (
+            0.5
+            * blades_number
+            * chord
+            * rel_fluid_speed**2.0
+            * (c_l_3d * np.cos(phi) - c_d_3d * np.sin(phi))
+        )
+        torque_element = (
+            0.5
+            * blades_number
+            * chord
+            * rel_fluid_speed**2.0
+            * (c_l_3d * np.sin(phi) + c_d_3d * np.cos(phi))
+            * radius
+        )
+
+        return thrust_element, torque_element, alpha, out_of_polars
+
+    @staticmethod
+    def disk_theory_vect(
+        v_i: np.ndarray,
+        v_t: np.ndarray,
+        radius: np.ndarray,
+        radius_min: float,
+        radius_max: float,
+        blades_number: float,
+        sweep: np.ndarray,
+        omega: np.ndarray,
+        v_inf: np.ndarray,
+    ):
+        """
+        Vectorized version of disk_theory_mod, computes the thrust and torque of all the
+        elements for all operating points at once. Element quantities are given along the last
+        axis and operating point quantities along the first one.
+
+        :param v_i: axial induced speed [m/s]
+        :param v_t: tangential induced speed [m/s]
+        :param radius: radius position of the elements center  [m]
+        :param radius_min: Hub radius [m]
+        :param radius_max: Max radius [m]
+        :param blades_number: number of blades [-]
+        :param sweep: sweep angle of the elements [deg.]
+        :param omega: angular speed of propeller [rad/sec]
+        :param v_inf: flight speed [m/s]
+
+        :return: The calculated dT/(rho*dr) and dQ/(rho*dr) increments with disk theory method.
+        """
+
+        # Calculate speed composition and relative air angle (in deg.)
+        v_ax = v_inf + v_i
+        # Needed for the computation of the hub lost factor
+        phi = np.arctan2(
+            v_ax, np.maximum((omega * radius - v_t) * np.cos(sweep * np.pi / 180.0), 1e-6)
+        )
+
+        # f_tip is the tip loss factor
+        f_tip = (
+            2
+            / np.pi
+            * np.arccos(
+                np.exp(
+                    -blades_number
+                    / 2
+                    * (
+                        (radius_max - radius)
+                        / radius
+                        * np.sqrt(1 + (omega * radius / (v_ax + 1e-12 * (v_ax == 0.0))) ** 2.0)
+                    )
+                )
+            )
+        )
+
+        # f_hub is the hub loss factor
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            f_hub = np.clip(
+                2
+                / np.pi
+                * np.arccos(
+                    np.exp(-blades_number / 2 * (radius - radius_min) / (radius * np.sin(phi)))
+                ),
+                0.0,
+                1.0,
+            )
+
+        # Calculate force and momentum
+        thrust_element = 4.0 * np.pi * radius * (v_inf + v_i) * v_i * f_tip * f_hub
+        torque_element = 4.0 * np.pi * radius**2.0 * (v_inf + v_i) * v_t * f_tip * f_hub
+
+        return thrust_element, torque_element
+
     @staticmethod
     def bem_theory_mod(
         speed_vect: np.array,
@@ -695,3 +1038,60 @@ class _ComputePropellerPointPerformance(PropellerCoreModule):
         )
 
         return bem_result[0:1] - adt_result
+
+
+class _PolarInterpolant:
+    """
+    Pre-tabulated polars of the blade elements, allows to interpolate the aerodynamic
+    coefficients of all elements at once. The angle of attack table must be the same for all
+    elements and sorted, which is the case for the tables built in the compute of the
+    performance point.
+    """
+
+    def __init__(self, alpha, cl_list, cd_list, cl_inv_list, cd_min_list):
+        self.alpha = alpha
+        self.alpha_min = np.min(alpha)
+        self.alpha_max = np.max(alpha)
+        self.cl_list = cl_list
+        self.cd_list = cd_list
+        self.cl_inv_list = cl_inv_list
+        self.cd_min = cd_min_list
+
+        self._element_index = np.arange(np.shape(cl_list)[0])
+
+    def __getitem__(self, element_slice):
+        """
+        Returns the interpolant restricted to a slice of the elements.
+
+        :param element_slice: slice of the elements to keep
+        """
+
+        return _PolarInterpolant(
+            self.alpha,
+            self.cl_list[element_slice],
+            self.cd_list[element_slice],
+            self.cl_inv_list[element_slice],
+            self.cd_min[element_slice],
+        )
+
+    def __call__(self, alpha):
+        """
+        Returns the lift, inviscid lift and drag coefficients of each element, same as np.interp
+        would, for an array of angle of attack with elements along its last axis.
+
+        :param alpha: angle of attack of the elements [deg]
+        """
+
+        alpha_clipped = np.clip(alpha, self.alpha_min, self.alpha_max)
+        index = np.clip(
+            np.searchsorted(self.alpha, alpha_clipped, side="right") - 1, 0, len(self.alpha) - 2
+        )
+        weight = (alpha_clipped - self.alpha[index]) / (self.alpha[index + 1] - self.alpha[index])
+
+        coefficients = []
+        for table in (self.cl_list, self.cl_inv_list, self.cd_list):
+            lower_value = table[self._element_index, index]
+            upper_value = table[self._element_index, index + 1]
+            coefficients.append(lower_value + weight * (upper_value - lower_value))
+
+        return tuple(coefficients)
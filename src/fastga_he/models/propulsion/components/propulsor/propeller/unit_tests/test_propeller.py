@@ -66,7 +66,9 @@ from ..components.perf_propeller import PerformancesPropeller
 from ..components.sizing_propeller import SizingPropeller
 
 from ..constants import POSSIBLE_POSITION
+from ..methodology.performance_point import _ComputePropellerPointPerformance
 
+from scipy.optimize import fsolve
 from stdatm import Atmosphere
 
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
@@ -1627,3 +1629,118 @@ def test_operational_cost():
     ) == pytest.approx(517.0, rel=1e-3)
 
     problem.check_partials(compact_print=True)
+
+
+def test_point_performance_vectorized():
+    elements_number = 20
+    component = _ComputePropellerPointPerformance(
+        elements_number=elements_number,
+        sections_profile_position_list=[0.0],
+        sections_profile_name_list=["naca4430"],
+    )
+
+    radius_ratio = np.array([0.0, 0.197, 0.297, 0.4, 0.584, 0.597, 0.708, 0.803, 0.9, 0.949, 0.99])
+    twist = np.array([45.0, 40.0, 35.0, 30.0, 24.0, 23.5, 20.0, 17.0, 14.5, 13.0, 12.0])
+    chord = np.array([0.11, 0.11, 0.14, 0.16, 0.16, 0.16, 0.15, 0.13, 0.11, 0.10, 0.09])
+    inputs = {
+        "data:geometry:propeller:blades_number": np.array([3.0]),
+        "data:geometry:propeller:hub_diameter": np.array([0.4]),
+        "data:geometry:propeller:diameter": np.array([2.0]),
+        "data:geometry:propeller:sweep_vect": np.zeros_like(radius_ratio),
+        "data:geometry:propeller:chord_vect": chord,
+        "data:geometry:propeller:twist_vect": twist,
+        "data:geometry:propeller:radius_ratio_vect": radius_ratio,
+        "reference_reynolds": np.array([1e6]),
+    }
+
+    radius_min = 0.2
+    radius_max = 1.0
+    element_length = (radius_max - radius_min) / elements_number
+    radius = radius_min + (np.arange(elements_number) + 0.5) * element_length
+
+    # Simple linear polar, identical for all elements
+    alpha = np.linspace(-20.0, 25.0, 91)
+    cl = np.clip(0.11 * (alpha + 2.0), -1.2, 1.5)
+    alpha_list = np.tile(alpha, (elements_number, 1))
+    cl_list = np.tile(cl, (elements_number, 1))
+    cd_list = np.tile(0.008 + 0.012 * cl**2.0, (elements_number, 1))
+    cl_inv_list = 1.05 * cl_list
+    cd_min_list = np.full(elements_number, 0.008)
+
+    theta_75 = np.array([20.0, 25.0, 30.0, 35.0])
+    v_inf = np.array([30.0, 50.0, 70.0, 90.0])
+    altitude = np.array([0.0, 1000.0, 2000.0, 3000.0])
+    rpm = np.array([2000.0, 2200.0, 2400.0, 2500.0])
+
+    thrust, _, torque = component.compute_pitch_performance_vect(
+        inputs,
+        theta_75,
+        v_inf,
+        altitude,
+        rpm,
+        radius,
+        alpha_list,
+        cl_list,
+        cd_list,
+        cl_inv_list,
+        cd_min_list,
+    )
+
+    # Reference computed point by point, solving the system of each element with fsolve on the
+    # scalar version of the equations
+    theta_75_ref = np.interp(0.75, radius_ratio, twist)
+    chord_element = np.interp(radius / radius_max, radius_ratio, chord)
+    for idx_point in range(len(theta_75)):
+        omega = rpm[idx_point] * np.pi / 30.0
+        atm = Atmosphere(altitude[idx_point], altitude_in_feet=False)
+        theta = np.interp(radius / radius_max, radius_ratio, twist) + (
+            theta_75[idx_point] - theta_75_ref
+        )
+
+        speed_vect = np.array([0.1 * v_inf[idx_point], 1.0])
+        thrust_ref = 0.0
+        torque_ref = 0.0
+        for idx in range(elements_number):
+            polar = (
+                alpha_list[idx, :],
+                cl_list[idx, :],
+                cd_list[idx, :],
+                cl_inv_list[idx, :],
+                cd_min_list[idx],
+                atm,
+                1e6,
+            )
+            speed_vect = fsolve(
+                component.delta_mod,
+                speed_vect,
+                (
+                    radius[idx],
+                    radius_min,
+                    radius_max,
+                    chord_element[idx],
+                    3.0,
+                    0.0,
+                    omega,
+                    v_inf[idx_point],
+                    theta[idx],
+                )
+                + polar,
+                xtol=1e-3,
+            )
+            results = component.bem_theory_mod(
+                speed_vect,
+                radius[idx],
+                chord_element[idx],
+                3.0,
+                0.0,
+                omega,
+                v_inf[idx_point],
+                theta[idx],
+                *polar,
+            )
+            if not results[3]:
+                thrust_ref += results[0] * element_length * atm.density
+                torque_ref += results[1] * element_length * atm.density
+
+        assert thrust[idx_point] == pytest.approx(thrust_ref, rel=1e-4)
+        assert torque[idx_point] == pytest.approx(torque_ref, rel=1e-4)
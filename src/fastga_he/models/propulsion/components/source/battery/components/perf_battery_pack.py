@@ -31,6 +31,8 @@ from ..components.perf_battery_energy_consumed import PerformancesEnergyConsumed
 from ..components.perf_battery_energy_consumed_main_route import PerformancesEnergyConsumedMainRoute
 from ..components.perf_soc_end_main_route import PerformancesSOCEndMainRoute
 from ..components.perf_inflight_emissions import PerformancesBatteryPackInFlightEmissions
+from ..components.perf_fused_state_of_charge import PerformancesBatteryFusedStateOfCharge
+from ..components.perf_fused_voltage_and_losses import PerformancesBatteryFusedVoltageAndLosses
 
 from ..constants import SERVICE_BATTERY_OCV, SERVICE_BATTERY_R_INT
 
@@ -59,6 +61,14 @@ class PerformancesBatteryPack(om.Group):
             desc="If the battery is directly connected to a bus, a special mode is required to "
             "interface the two",
         )
+        self.options.declare(
+            name="fused",
+            default=False,
+            types=bool,
+            desc="If True, the chains of components computing the state of charge and the "
+            "voltage and losses of the battery are each replaced by a single component giving "
+            "the same results, which is faster when the number of points is high",
+        )
 
     def setup(self):
         number_of_points = self.options["number_of_points"]
@@ -88,38 +98,48 @@ class PerformancesBatteryPack(om.Group):
                 promotes=["*"],
             )
 
-        self.add_subsystem(
-            "current_per_module",
-            PerformancesModuleCurrent(
-                number_of_points=number_of_points, battery_pack_id=battery_pack_id
-            ),
-            promotes=["*"],
-        )
+        if self.options["fused"]:
+            self.add_subsystem(
+                "state_of_charge",
+                PerformancesBatteryFusedStateOfCharge(
+                    number_of_points=number_of_points, battery_pack_id=battery_pack_id
+                ),
+                promotes=["*"],
+            )
+        else:
+            self.add_subsystem(
+                "current_per_module",
+                PerformancesModuleCurrent(
+                    number_of_points=number_of_points, battery_pack_id=battery_pack_id
+                ),
+                promotes=["*"],
+            )
+
+            self.add_subsystem(
+                "battery_c_rate",
+                PerformancesModuleCRate(
+                    number_of_points=number_of_points, battery_pack_id=battery_pack_id
+                ),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "battery_relative_capacity",
+                PerformancesRelativeCapacity(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "battery_soc_decrease",
+                PerformancesSOCDecrease(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "update_soc",
+                PerformancesUpdateSOC(
+                    number_of_points=number_of_points, battery_pack_id=battery_pack_id
+                ),
+                promotes=["*"],
+            )
 
-        self.add_subsystem(
-            "battery_c_rate",
-            PerformancesModuleCRate(
-                number_of_points=number_of_points, battery_pack_id=battery_pack_id
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "battery_relative_capacity",
-            PerformancesRelativeCapacity(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "battery_soc_decrease",
-            PerformancesSOCDecrease(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "update_soc",
-            PerformancesUpdateSOC(
-                number_of_points=number_of_points, battery_pack_id=battery_pack_id
-            ),
-            promotes=["*"],
-        )
         # Though these variable depends on variables that are looped on, they don't affect the
         # value that we loop on hence why they are put here to save time.
 
@@ -138,80 +158,92 @@ class PerformancesBatteryPack(om.Group):
             oad.RegisterSubmodel.get_submodel(SERVICE_BATTERY_R_INT, options=options_battery_pack),
             promotes=["*"],
         )
-        self.add_subsystem(
-            "cell_voltage",
-            PerformancesCellVoltage(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "module_voltage",
-            PerformancesModuleVoltage(
-                number_of_points=number_of_points,
-                battery_pack_id=battery_pack_id,
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "battery_voltage",
-            PerformancesBatteryVoltage(
-                number_of_points=number_of_points, direct_bus_connection=direct_bus_connection
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "joule_losses_cell",
-            PerformancesCellJouleLosses(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "entropic_heat_coefficient",
-            PerformancesEntropicHeatCoefficient(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "entropic_losses_cell",
-            PerformancesCellEntropicLosses(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "losses_cell",
-            PerformancesCellLosses(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "battery_losses",
-            PerformancesBatteryLosses(
-                number_of_points=number_of_points, battery_pack_id=battery_pack_id
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "battery_power",
-            PerformancesBatteryPower(number_of_points=number_of_points),
-            promotes=["*"],
-        )
+        if self.options["fused"]:
+            self.add_subsystem(
+                "voltage_and_losses",
+                PerformancesBatteryFusedVoltageAndLosses(
+                    number_of_points=number_of_points,
+                    battery_pack_id=battery_pack_id,
+                    direct_bus_connection=direct_bus_connection,
+                ),
+                promotes=["*"],
+            )
+        else:
+            self.add_subsystem(
+                "cell_voltage",
+                PerformancesCellVoltage(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "module_voltage",
+                PerformancesModuleVoltage(
+                    number_of_points=number_of_points,
+                    battery_pack_id=battery_pack_id,
+                ),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "battery_voltage",
+                PerformancesBatteryVoltage(
+                    number_of_points=number_of_points, direct_bus_connection=direct_bus_connection
+                ),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "joule_losses_cell",
+                PerformancesCellJouleLosses(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "entropic_heat_coefficient",
+                PerformancesEntropicHeatCoefficient(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "entropic_losses_cell",
+                PerformancesCellEntropicLosses(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "losses_cell",
+                PerformancesCellLosses(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "battery_losses",
+                PerformancesBatteryLosses(
+                    number_of_points=number_of_points, battery_pack_id=battery_pack_id
+                ),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "battery_power",
+                PerformancesBatteryPower(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "efficiency",
+                PerformancesBatteryEfficiency(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "energy_consumption",
+                PerformancesEnergyConsumption(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                "energy_consumed",
+                PerformancesEnergyConsumed(
+                    number_of_points=number_of_points, battery_pack_id=battery_pack_id
+                ),
+                promotes=["*"],
+            )
+
         self.add_subsystem(
             "maximum",
             PerformancesMaximum(number_of_points=number_of_points, battery_pack_id=battery_pack_id),
             promotes=["*"],
         )
-        self.add_subsystem(
-            "efficiency",
-            PerformancesBatteryEfficiency(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "energy_consumption",
-            PerformancesEnergyConsumption(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            "energy_consumed",
-            PerformancesEnergyConsumed(
-                number_of_points=number_of_points, battery_pack_id=battery_pack_id
-            ),
-            promotes=["*"],
-        )
         if number_of_points_reserve:
             self.add_subsystem(
                 "energy_consumed_main_route",
@@ -253,8 +285,15 @@ class PerformancesBatteryPack(om.Group):
         number_of_points = self.options["number_of_points"]
         battery_pack_id = self.options["battery_pack_id"]
 
+        # The number of cells is an input of a different subsystem depending on the mode
+        if self.options["fused"]:
+            subsystem_name = "voltage_and_losses"
+        else:
+            subsystem_name = "module_voltage"
+
         number_of_cells_module = inputs[
-            "module_voltage.data:propulsion:he_power_train:battery_pack:"
+            subsystem_name
+            + ".data:propulsion:he_power_train:battery_pack:"
             + battery_pack_id
             + ":module:number_cells"
         ]
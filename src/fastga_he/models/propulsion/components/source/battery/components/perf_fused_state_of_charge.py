@@ -0,0 +1,298 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import openmdao.api as om
+import numpy as np
+
+
+class PerformancesBatteryFusedStateOfCharge(om.ExplicitComponent):
+    """
+    Computation of the current in each module, its c-rate and relative capacity and the resulting
+    evolution of the state of charge of the battery in a single component. Gives the same results
+    as the chain of PerformancesModuleCurrent, PerformancesModuleCRate,
+    PerformancesRelativeCapacity, PerformancesSOCDecrease and PerformancesUpdateSOC but saves
+    the transfers between those components, which are significant when the number of points is
+    high.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.poly = None
+        self.der_poly = None
+
+    def initialize(self):
+        self.options.declare(
+            "number_of_points", default=1, desc="number of equilibrium to be treated"
+        )
+        self.options.declare(
+            name="battery_pack_id",
+            default=None,
+            desc="Identifier of the battery pack",
+            allow_none=False,
+        )
+        self.options.declare(
+            name="cell_capacity_ref",
+            types=float,
+            default=3.35,
+            desc="Capacity of the reference cell for the battery construction [A*h]",
+        )
+        self.options.declare(
+            "reference_curve_current",
+            default=[680, 3400, 6800, 8000],
+            desc="Data for the relative capacity curve of the reference cell, in mA",
+        )
+        self.options.declare(
+            "reference_curve_relative_capacity",
+            default=[1, 0.97, 0.95, 0.92],
+            desc="Data for the relative capacity curve of the reference cell",
+        )
+
+    def setup(self):
+        number_of_points = self.options["number_of_points"]
+        battery_pack_id = self.options["battery_pack_id"]
+
+        self.add_input("dc_current_out", units="A", val=np.full(number_of_points, np.nan))
+        self.add_input("time_step", units="h", val=np.full(number_of_points, np.nan))
+        self.add_input(
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":number_modules",
+            val=np.nan,
+            desc="Number of modules in parallel inside the battery pack",
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":state_of_health",
+            val=100.0,
+            units="percent",
+            desc="State of Health of the battery, i.e. capacity with respect to nominal capacity",
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":SOC_mission_start",
+            val=100.0,
+            units="percent",
+            desc="State-of-Charge of the battery at the start of the mission",
+        )
+
+        self.add_output("current_one_module", units="A", val=np.full(number_of_points, 20.0))
+        self.add_output(
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":cell:capacity",
+            val=self.options["cell_capacity_ref"],
+            units="A*h",
+            desc="Capacity of the cell used for the assembly of the battery pack",
+        )
+        self.add_output("c_rate", units="h**-1", val=np.full(number_of_points, 1.0))
+        self.add_output("relative_capacity", val=np.full(number_of_points, 1.0))
+        self.add_output(
+            "state_of_charge_decrease",
+            units="percent",
+            val=np.full(number_of_points, 80.0 / number_of_points),
+        )
+        self.add_output("state_of_charge", units="percent", val=np.full(number_of_points, 100.0))
+
+        self.poly = np.polyfit(
+            self.options["reference_curve_current"],
+            self.options["reference_curve_relative_capacity"],
+            3,
+        )
+        self.der_poly = np.polyder(self.poly)
+
+    def setup_partials(self):
+        number_of_points = self.options["number_of_points"]
+        battery_pack_id = self.options["battery_pack_id"]
+
+        number_modules_name = (
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":number_modules"
+        )
+        soh_name = (
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":state_of_health"
+        )
+
+        diagonal = np.arange(number_of_points)
+        column = np.zeros(number_of_points)
+        # The state of charge at one point depends on the decrease at all the previous points
+        rows_lower, cols_lower = np.tril_indices(number_of_points, -1)
+
+        self.declare_partials(
+            of=["current_one_module", "c_rate", "relative_capacity", "state_of_charge_decrease"],
+            wrt="dc_current_out",
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            of=["current_one_module", "c_rate", "relative_capacity", "state_of_charge_decrease"],
+            wrt=number_modules_name,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of=["c_rate", "state_of_charge_decrease"],
+            wrt=soh_name,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of="state_of_charge_decrease",
+            wrt="time_step",
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            of="data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":cell:capacity",
+            wrt=soh_name,
+            method="exact",
+            val=self.options["cell_capacity_ref"] / 100.0,
+        )
+
+        self.declare_partials(
+            of="state_of_charge",
+            wrt=["dc_current_out", "time_step"],
+            method="exact",
+            rows=rows_lower,
+            cols=cols_lower,
+        )
+        self.declare_partials(
+            of="state_of_charge",
+            wrt=[number_modules_name, soh_name],
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of="state_of_charge",
+            wrt="data:propulsion:he_power_train:battery_pack:"
+            + battery_pack_id
+            + ":SOC_mission_start",
+            method="exact",
+            rows=diagonal,
+            cols=column,
+            val=np.ones(number_of_points),
+        )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        battery_pack_id = self.options["battery_pack_id"]
+
+        number_modules = inputs[
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":number_modules"
+        ]
+        soh = inputs[
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":state_of_health"
+        ]
+        soc_mission_start = inputs[
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":SOC_mission_start"
+        ]
+
+        # Same thresholds as in the decomposed components, see PerformancesModuleCurrent and
+        # PerformancesModuleCRate for the reasons behind them
+        current_out = np.where(inputs["dc_current_out"] < 1, 0.0, inputs["dc_current_out"])
+        current_one_module = current_out / number_modules
+
+        cell_capacity = self.options["cell_capacity_ref"] * soh / 100.0
+        c_rate = np.where(np.abs(current_one_module) < 1e-2, 0.0, current_one_module) / (
+            cell_capacity
+        )
+
+        # Relative capacity polynomial is expressed in mA
+        relative_capacity = np.clip(
+            np.polyval(self.poly, current_one_module * 1000.0),
+            0.85,
+            1.0,
+        )
+
+        soc_decrease = c_rate * inputs["time_step"] * 100.0 / relative_capacity
+
+        outputs["current_one_module"] = current_one_module
+        outputs[
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":cell:capacity"
+        ] = cell_capacity
+        outputs["c_rate"] = c_rate
+        outputs["relative_capacity"] = relative_capacity
+        outputs["state_of_charge_decrease"] = soc_decrease
+        outputs["state_of_charge"] = soc_mission_start - np.cumsum(
+            np.concatenate((np.zeros(1), soc_decrease[:-1]))
+        )
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        battery_pack_id = self.options["battery_pack_id"]
+        cell_capacity_ref = self.options["cell_capacity_ref"]
+
+        number_modules_name = (
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":number_modules"
+        )
+        soh_name = (
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":state_of_health"
+        )
+
+        current_out = inputs["dc_current_out"]
+        time_step = inputs["time_step"]
+        number_modules = inputs[number_modules_name]
+        soh = inputs[soh_name]
+
+        # Values, recomputed as in compute
+        current_one_module = np.where(current_out < 1, 0.0, current_out) / number_modules
+        cell_capacity = cell_capacity_ref * soh / 100.0
+        current_c_rate = np.where(np.abs(current_one_module) < 1e-2, 0.0, current_one_module)
+        c_rate = current_c_rate / cell_capacity
+        relative_capacity_unclipped = np.polyval(self.poly, current_one_module * 1000.0)
+        relative_capacity = np.clip(relative_capacity_unclipped, 0.85, 1.0)
+
+        # Derivatives of each step with respect to its own inputs, taken as in the decomposed
+        # components so that both give the same jacobian
+        d_current_d_current_out = np.full_like(current_out, 1.0 / number_modules)
+        d_current_d_number_modules = -current_out / number_modules**2.0
+
+        d_c_rate_d_current = np.where(np.abs(current_one_module) < 1e-2, 1e-6, 1.0 / cell_capacity)
+        d_c_rate_d_soh = -current_c_rate / (cell_capacity_ref * soh**2.0 / 100.0)
+
+        d_rel_cap_d_current = 1000.0 * np.polyval(self.der_poly, current_one_module * 1000.0)
+        d_rel_cap_d_current = np.where(
+            (relative_capacity_unclipped < 1.0) & (relative_capacity_unclipped > 0.0),
+            d_rel_cap_d_current,
+            0.0,
+        )
+
+        d_decrease_d_c_rate = 100.0 * time_step / relative_capacity
+        d_decrease_d_time_step = 100.0 * c_rate / relative_capacity
+        d_decrease_d_rel_cap = -100.0 * c_rate * time_step / relative_capacity**2.0
+
+        # Chain rule
+        d_decrease_d_current = (
+            d_decrease_d_c_rate * d_c_rate_d_current + d_decrease_d_rel_cap * d_rel_cap_d_current
+        )
+        d_decrease_d_current_out = d_decrease_d_current * d_current_d_current_out
+        d_decrease_d_number_modules = d_decrease_d_current * d_current_d_number_modules
+        d_decrease_d_soh = d_decrease_d_c_rate * d_c_rate_d_soh
+
+        partials["current_one_module", "dc_current_out"] = d_current_d_current_out
+        partials["current_one_module", number_modules_name] = d_current_d_number_modules
+
+        partials["c_rate", "dc_current_out"] = d_c_rate_d_current * d_current_d_current_out
+        partials["c_rate", number_modules_name] = d_c_rate_d_current * d_current_d_number_modules
+        partials["c_rate", soh_name] = d_c_rate_d_soh
+
+        partials["relative_capacity", "dc_current_out"] = (
+            d_rel_cap_d_current * d_current_d_current_out
+        )
+        partials["relative_capacity", number_modules_name] = (
+            d_rel_cap_d_current * d_current_d_number_modules
+        )
+
+        partials["state_of_charge_decrease", "dc_current_out"] = d_decrease_d_current_out
+        partials["state_of_charge_decrease", number_modules_name] = d_decrease_d_number_modules
+        partials["state_of_charge_decrease", soh_name] = d_decrease_d_soh
+        partials["state_of_charge_decrease", "time_step"] = d_decrease_d_time_step
+
+        # The state of charge at point i is reduced by the decrease of all the points before it.
+        # The tril indices are sorted by row so the column index gives the point of the decrease
+        _, cols_lower = np.tril_indices(len(current_out), -1)
+        partials["state_of_charge", "dc_current_out"] = -d_decrease_d_current_out[cols_lower]
+        partials["state_of_charge", "time_step"] = -d_decrease_d_time_step[cols_lower]
+        partials["state_of_charge", number_modules_name] = -np.concatenate(
+            (np.zeros(1), np.cumsum(d_decrease_d_number_modules)[:-1])
+        )
+        partials["state_of_charge", soh_name] = -np.concatenate(
+            (np.zeros(1), np.cumsum(d_decrease_d_soh)[:-1])
+        )
@@ -0,0 +1,393 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import openmdao.api as om
+import numpy as np
+
+# Coefficients of the polynomial giving the entropic heat coefficient as a function of the state
+# of charge, highest degree first, see PerformancesEntropicHeatCoefficient
+ENTROPIC_HEAT_COEFFICIENT_POLY = np.array([1.028e-6, -2.869e-4, 2.154e-2, -0.355]) * 1e-3
+
+
+class PerformancesBatteryFusedVoltageAndLosses(om.ExplicitComponent):
+    """
+    Computation of the voltage at the output of the battery, of its losses, efficiency and
+    energy consumption in a single component. Gives the same results as the chain going from
+    PerformancesCellVoltage to PerformancesEnergyConsumed but saves the transfers between those
+    components, which are significant when the number of points is high.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # Depending on the mode, the voltage computed by this component is not the one used for
+        # the power and energy consumption, see PerformancesBatteryVoltage
+        self.output_name = "voltage_out"
+
+        # For each output, the name of the inputs it depends on, filled in setup
+        self.dependencies = {}
+
+    def initialize(self):
+        self.options.declare(
+            "number_of_points", default=1, desc="number of equilibrium to be treated"
+        )
+        self.options.declare(
+            name="battery_pack_id",
+            default=None,
+            desc="Identifier of the battery pack",
+            allow_none=False,
+        )
+        self.options.declare(
+            name="direct_bus_connection",
+            default=False,
+            types=bool,
+            desc="If the battery is directly connected to a bus, a special mode is required to "
+            "interface the two",
+        )
+        self.options.declare(
+            "cut_off_voltage", default=2.6, desc="Cut-off voltage of the battery cells"
+        )
+
+    def setup(self):
+        number_of_points = self.options["number_of_points"]
+        battery_pack_id = self.options["battery_pack_id"]
+
+        number_cells_name = (
+            "data:propulsion:he_power_train:battery_pack:"
+            + battery_pack_id
+            + ":module:number_cells"
+        )
+        number_modules_name = (
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":number_modules"
+        )
+
+        self.add_input("open_circuit_voltage", units="V", val=np.full(number_of_points, np.nan))
+        self.add_input("internal_resistance", units="ohm", val=np.full(number_of_points, np.nan))
+        self.add_input("current_one_module", units="A", val=np.full(number_of_points, np.nan))
+        self.add_input("state_of_charge", units="percent", val=np.full(number_of_points, np.nan))
+        self.add_input("cell_temperature", units="degK", val=np.full(number_of_points, np.nan))
+        self.add_input("dc_current_out", units="A", val=np.full(number_of_points, np.nan))
+        self.add_input("time_step", units="h", val=np.full(number_of_points, np.nan))
+        self.add_input(
+            number_cells_name,
+            val=np.nan,
+            desc="Number of cells in series inside one battery module",
+        )
+        self.add_input(
+            number_modules_name,
+            val=np.nan,
+            desc="Number of modules in parallel inside the battery pack",
+        )
+
+        voltage_dependencies = [
+            "open_circuit_voltage",
+            "internal_resistance",
+            "current_one_module",
+        ]
+        module_voltage_dependencies = voltage_dependencies + [number_cells_name]
+
+        if self.options["direct_bus_connection"]:
+            self.output_name = "battery_voltage"
+            # This input will come from the bus
+            self.add_input("voltage_out", units="V", val=np.full(number_of_points, np.nan))
+            power_voltage_dependencies = ["voltage_out"]
+        else:
+            power_voltage_dependencies = module_voltage_dependencies
+
+        self.add_output("terminal_voltage", units="V", val=np.full(number_of_points, 4.0))
+        self.add_output("module_voltage", units="V", val=np.full(number_of_points, 500.0))
+        self.add_output(self.output_name, units="V", val=np.full(number_of_points, 500.0))
+        self.add_output("joule_losses_cell", units="W", val=np.full(number_of_points, 1))
+        self.add_output(
+            "entropic_heat_coefficient", units="V/degK", val=np.full(number_of_points, 1e-3)
+        )
+        self.add_output("entropic_losses_cell", units="W", val=np.full(number_of_points, 1))
+        self.add_output("losses_cell", units="W", val=np.full(number_of_points, 1))
+        self.add_output("losses_battery", units="W", val=np.full(number_of_points, 1e3))
+        self.add_output("power_out", units="kW", val=np.full(number_of_points, 20.0))
+        self.add_output("efficiency", val=np.full(number_of_points, 1.0), lower=0.0, upper=1.0)
+        self.add_output(
+            "non_consumable_energy_t",
+            val=np.full(number_of_points, 0.0),
+            desc="fuel consumed at each time step in the battery",
+            units="W*h",
+        )
+        self.add_output(
+            "data:propulsion:he_power_train:battery_pack:"
+            + battery_pack_id
+            + ":energy_consumed_mission",
+            units="W*h",
+            val=50e3,
+            desc="Energy drawn from the battery for the mission",
+        )
+
+        losses_cell_dependencies = [
+            "internal_resistance",
+            "current_one_module",
+            "cell_temperature",
+            "state_of_charge",
+        ]
+        losses_battery_dependencies = losses_cell_dependencies + [
+            number_cells_name,
+            number_modules_name,
+        ]
+        power_dependencies = ["dc_current_out"] + power_voltage_dependencies
+        energy_dependencies = power_dependencies + ["time_step"]
+
+        self.dependencies = {
+            "terminal_voltage": voltage_dependencies,
+            "module_voltage": module_voltage_dependencies,
+            self.output_name: module_voltage_dependencies,
+            "joule_losses_cell": ["internal_resistance", "current_one_module"],
+            "entropic_heat_coefficient": ["state_of_charge"],
+            "entropic_losses_cell": ["current_one_module", "cell_temperature", "state_of_charge"],
+            "losses_cell": losses_cell_dependencies,
+            "losses_battery": losses_battery_dependencies,
+            "power_out": power_dependencies,
+            "efficiency": list(dict.fromkeys(losses_battery_dependencies + power_dependencies)),
+            "non_consumable_energy_t": energy_dependencies,
+        }
+
+    def setup_partials(self):
+        number_of_points = self.options["number_of_points"]
+        battery_pack_id = self.options["battery_pack_id"]
+
+        scalar_inputs = [
+            "data:propulsion:he_power_train:battery_pack:"
+            + battery_pack_id
+            + ":module:number_cells",
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":number_modules",
+        ]
+
+        diagonal = np.arange(number_of_points)
+        column = np.zeros(number_of_points)
+
+        for output_name, input_names in self.dependencies.items():
+            for input_name in input_names:
+                self.declare_partials(
+                    of=output_name,
+                    wrt=input_name,
+                    method="exact",
+                    rows=diagonal,
+                    cols=column if input_name in scalar_inputs else diagonal,
+                )
+
+        # The energy consumed on the mission is the sum of the energy consumed at each point
+        for input_name in self.dependencies["non_consumable_energy_t"]:
+            if input_name in scalar_inputs:
+                self.declare_partials(
+                    of="data:propulsion:he_power_train:battery_pack:"
+                    + battery_pack_id
+                    + ":energy_consumed_mission",
+                    wrt=input_name,
+                    method="exact",
+                )
+            else:
+                self.declare_partials(
+                    of="data:propulsion:he_power_train:battery_pack:"
+                    + battery_pack_id
+                    + ":energy_consumed_mission",
+                    wrt=input_name,
+                    method="exact",
+                    rows=column,
+                    cols=diagonal,
+                )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        battery_pack_id = self.options["battery_pack_id"]
+
+        number_cells = inputs[
+            "data:propulsion:he_power_train:battery_pack:"
+            + battery_pack_id
+            + ":module:number_cells"
+        ]
+        number_modules = inputs[
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":number_modules"
+        ]
+        current_one_module = inputs["current_one_module"]
+        internal_resistance = inputs["internal_resistance"]
+        current_out = inputs["dc_current_out"]
+
+        terminal_voltage = np.clip(
+            inputs["open_circuit_voltage"] - internal_resistance * current_one_module,
+            self.options["cut_off_voltage"],
+            5.0,
+        )
+        module_voltage = terminal_voltage * number_cells
+
+        if self.options["direct_bus_connection"]:
+            power_voltage = inputs["voltage_out"]
+        else:
+            power_voltage = module_voltage
+
+        soc = np.clip(inputs["state_of_charge"], 10 - 1e-3, 100 + 1e-3)
+        entropic_heat_coefficient = np.polyval(ENTROPIC_HEAT_COEFFICIENT_POLY, soc)
+
+        joule_losses_cell = internal_resistance * current_one_module**2.0
+        entropic_losses_cell = (
+            -current_one_module * inputs["cell_temperature"] * entropic_heat_coefficient
+        )
+        losses_cell = joule_losses_cell + entropic_losses_cell
+        losses_battery = losses_cell * number_cells * number_modules
+
+        power_out = power_voltage * current_out
+
+        # See PerformancesBatteryEfficiency for why it is done this way
+        efficiency = np.ones_like(power_out)
+        np.divide(
+            power_out - losses_battery,
+            power_out,
+            out=efficiency,
+            where=np.abs(power_out) >= 200.0,
+        )
+
+        energy_consumed = power_out * inputs["time_step"]
+
+        outputs["terminal_voltage"] = terminal_voltage
+        outputs["module_voltage"] = module_voltage
+        outputs[self.output_name] = module_voltage
+        outputs["joule_losses_cell"] = joule_losses_cell
+        outputs["entropic_heat_coefficient"] = entropic_heat_coefficient
+        outputs["entropic_losses_cell"] = entropic_losses_cell
+        outputs["losses_cell"] = losses_cell
+        outputs["losses_battery"] = losses_battery
+        outputs["power_out"] = power_out / 1000.0
+        outputs["efficiency"] = efficiency
+        outputs["non_consumable_energy_t"] = energy_consumed
+        outputs[
+            "data:propulsion:he_power_train:battery_pack:"
+            + battery_pack_id
+            + ":energy_consumed_mission"
+        ] = np.sum(energy_consumed)
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        battery_pack_id = self.options["battery_pack_id"]
+
+        number_cells_name = (
+            "data:propulsion:he_power_train:battery_pack:"
+            + battery_pack_id
+            + ":module:number_cells"
+        )
+        number_modules_name = (
+            "data:propulsion:he_power_train:battery_pack:" + battery_pack_id + ":number_modules"
+        )
+        energy_consumed_mission_name = (
+            "data:propulsion:he_power_train:battery_pack:"
+            + battery_pack_id
+            + ":energy_consumed_mission"
+        )
+
+        number_cells = inputs[number_cells_name]
+        number_modules = inputs[number_modules_name]
+        current_one_module = inputs["current_one_module"]
+        internal_resistance = inputs["internal_resistance"]
+        cell_temperature = inputs["cell_temperature"]
+        current_out = inputs["dc_current_out"]
+        time_step = inputs["time_step"]
+
+        # Values, recomputed as in compute
+        terminal_voltage = np.clip(
+            inputs["open_circuit_voltage"] - internal_resistance * current_one_module,
+            self.options["cut_off_voltage"],
+            5.0,
+        )
+        module_voltage = terminal_voltage * number_cells
+        soc = np.clip(inputs["state_of_charge"], 10 - 1e-3, 100 + 1e-3)
+        entropic_heat_coefficient = np.polyval(ENTROPIC_HEAT_COEFFICIENT_POLY, soc)
+        losses_cell = (
+            internal_resistance * current_one_module**2.0
+            - current_one_module * cell_temperature * entropic_heat_coefficient
+        )
+        losses_battery = losses_cell * number_cells * number_modules
+
+        # Derivatives of each intermediate variable with respect to the inputs of the
+        # component, the clipping being ignored as in the decomposed components
+        d_terminal_voltage = {
+            "open_circuit_voltage": np.ones_like(terminal_voltage),
+            "internal_resistance": -current_one_module,
+            "current_one_module": -internal_resistance,
+        }
+        d_module_voltage = {
+            name: derivative * number_cells for name, derivative in d_terminal_voltage.items()
+        }
+        d_module_voltage[number_cells_name] = terminal_voltage
+
+        d_entropic_heat_coefficient = np.polyval(np.polyder(ENTROPIC_HEAT_COEFFICIENT_POLY), soc)
+        d_joule_losses = {
+            "internal_resistance": current_one_module**2.0,
+            "current_one_module": 2.0 * internal_resistance * current_one_module,
+        }
+        d_entropic_losses = {
+            "current_one_module": -cell_temperature * entropic_heat_coefficient,
+            "cell_temperature": -current_one_module * entropic_heat_coefficient,
+            "state_of_charge": -current_one_module * cell_temperature * d_entropic_heat_coefficient,
+        }
+        d_losses_cell = {
+            "internal_resistance": d_joule_losses["internal_resistance"],
+            "current_one_module": d_joule_losses["current_one_module"]
+            + d_entropic_losses["current_one_module"],
+            "cell_temperature": d_entropic_losses["cell_temperature"],
+            "state_of_charge": d_entropic_losses["state_of_charge"],
+        }
+        d_losses_battery = {
+            name: derivative * number_cells * number_modules
+            for name, derivative in d_losses_cell.items()
+        }
+        d_losses_battery[number_cells_name] = losses_cell * number_modules
+        d_losses_battery[number_modules_name] = losses_cell * number_cells
+
+        if self.options["direct_bus_connection"]:
+            power_voltage = inputs["voltage_out"]
+            d_power_voltage = {"voltage_out": np.ones_like(power_voltage)}
+        else:
+            power_voltage = module_voltage
+            d_power_voltage = d_module_voltage
+
+        # In W, the output is in kW
+        power_out = power_voltage * current_out
+        d_power = {name: derivative * current_out for name, derivative in d_power_voltage.items()}
+        d_power["dc_current_out"] = power_voltage
+
+        # See PerformancesBatteryEfficiency for the values used when the power is too low
+        d_efficiency_d_losses = np.full_like(power_out, 1e-6)
+        np.divide(-1.0, power_out, out=d_efficiency_d_losses, where=np.abs(power_out) >= 200.0)
+        d_efficiency_d_power = np.full_like(power_out, 1e-6)
+        np.divide(
+            losses_battery,
+            power_out**2.0,
+            out=d_efficiency_d_power,
+            where=np.abs(power_out) >= 200.0,
+        )
+        d_efficiency = {}
+        for name, derivative in d_losses_battery.items():
+            d_efficiency[name] = d_efficiency_d_losses * derivative
+        for name, derivative in d_power.items():
+            d_efficiency[name] = d_efficiency.get(name, 0.0) + d_efficiency_d_power * derivative
+
+        d_energy = {name: derivative * time_step for name, derivative in d_power.items()}
+        d_energy["time_step"] = power_out
+
+        derivatives = {
+            "terminal_voltage": d_terminal_voltage,
+            "module_voltage": d_module_voltage,
+            self.output_name: d_module_voltage,
+            "joule_losses_cell": d_joule_losses,
+            "entropic_heat_coefficient": {"state_of_charge": d_entropic_heat_coefficient},
+            "entropic_losses_cell": d_entropic_losses,
+            "losses_cell": d_losses_cell,
+            "losses_battery": d_losses_battery,
+            "power_out": {name: derivative / 1000.0 for name, derivative in d_power.items()},
+            "efficiency": d_efficiency,
+            "non_consumable_energy_t": d_energy,
+        }
+
+        for output_name, input_names in self.dependencies.items():
+            for input_name in input_names:
+                partials[output_name, input_name] = derivatives[output_name][input_name]
+
+        for input_name in self.dependencies["non_consumable_energy_t"]:
+            if input_name in (number_cells_name, number_modules_name):
+                partials[energy_consumed_mission_name, input_name] = np.sum(d_energy[input_name])
+            else:
+                partials[energy_consumed_mission_name, input_name] = d_energy[input_name]
@@ -48,6 +48,13 @@ class SizingBatteryPack(om.Group):
             desc="If the battery is directly connected to a bus, a special mode is required to "
             "interface the two",
         )
+        self.options.declare(
+            name="fused",
+            default=False,
+            types=bool,
+            desc="If True, some chains of components of the performances are replaced by a "
+            "single component giving the same results",
+        )
 
     def setup(self):
         battery_pack_id = self.options["battery_pack_id"]
@@ -1246,6 +1246,50 @@ def test_performances_battery_pack():
     problem.check_partials(compact_print=True)
 
 
+def test_performances_battery_pack_fused():
+    for direct_bus_connection in [False, True]:
+        options = {
+            "number_of_points": NB_POINTS_TEST,
+            "battery_pack_id": "battery_pack_1",
+            "direct_bus_connection": direct_bus_connection,
+        }
+
+        # Research independent input value in .xml file
+        ivc = get_indep_var_comp(
+            list_inputs(PerformancesBatteryPack(**options)),
+            __file__,
+            XML_FILE,
+        )
+        ivc.add_output("time_step", units="s", val=np.full(NB_POINTS_TEST, 500))
+        if direct_bus_connection:
+            ivc.add_output("voltage_out", np.linspace(600, 500, NB_POINTS_TEST), units="V")
+        else:
+            ivc.add_output("dc_current_out", np.linspace(400, 410, NB_POINTS_TEST), units="A")
+
+        # Run problem with the decomposed and the fused components
+        problem = run_system(PerformancesBatteryPack(**options), ivc)
+        problem_fused = run_system(PerformancesBatteryPack(**options, fused=True), ivc)
+
+        for output_name in [
+            "dc_current_out",
+            "voltage_out",
+            "state_of_charge",
+            "c_rate",
+            "losses_cell",
+            "losses_battery",
+            "power_out",
+            "efficiency",
+            "non_consumable_energy_t",
+            "data:propulsion:he_power_train:battery_pack:battery_pack_1:energy_consumed_mission",
+            "data:propulsion:he_power_train:battery_pack:battery_pack_1:SOC_min",
+        ]:
+            assert problem_fused.get_val(output_name) == pytest.approx(
+                problem.get_val(output_name), rel=1e-6
+            )
+
+        problem_fused.check_partials(compact_print=True)
+
+
 def test_time_between_cycles():
     ivc = om.IndepVarComp()
     ivc.add_output("data:TLAR:flight_per_year", val=280.0)
@@ -4,15 +4,22 @@
 
 import openmdao.api as om
 
-from .perf_inflight_co2_emissions import PerformancesHighRPMICEInFlightCO2Emissions
-from .perf_inflight_co_emissions import PerformancesHighRPMICEInFlightCOEmissions
-from .perf_inflight_nox_emissions import PerformancesHighRPMICEInFlightNOxEmissions
-from .perf_inflight_sox_emissions import PerformancesHighRPMICEInFlightSOxEmissions
-from .perf_inflight_h2o_emissions import PerformancesHighRPMICEInFlightH2OEmissions
-from .perf_inflight_hc_emissions import PerformancesHighRPMICEInFlightHCEmissions
-from .perf_inflight_lead_emissions import PerformancesHighRPMICEInFlightLeadEmissions
+from fastga_he.models.propulsion.sub_components import PerformancesInFlightEmissions
 from .perf_inflight_emissions_sum import PerformancesHighRPMICEInFlightEmissionsSum
 
+# Default value of the emission index of each species, in g/kg. The values for CO2 and H2O are
+# taken from :cite:`european:2019`, the ones for CO, NOx, SOx and HC from :cite:`kalivoda:1997`
+# and the one for lead from :cite:`rindlisbacher:2007`
+EMISSION_INDICES = {
+    "CO2": 3100.0,
+    "CO": 798.0,
+    "NOx": 3.14,
+    "SOx": 0.42,
+    "H2O": 1237.0,
+    "HC": 18.867,
+    "lead": 0.794,
+}
+
 
 class PerformancesHighRPMICEInFlightEmissions(om.Group):
     """
@@ -35,51 +42,11 @@ class PerformancesHighRPMICEInFlightEmissions(om.Group):
         high_rpm_ice_id = self.options["high_rpm_ice_id"]
 
         self.add_subsystem(
-            name="CO2_emissions",
-            subsys=PerformancesHighRPMICEInFlightCO2Emissions(
-                high_rpm_ice_id=high_rpm_ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="CO_emissions",
-            subsys=PerformancesHighRPMICEInFlightCOEmissions(
-                high_rpm_ice_id=high_rpm_ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="NOx_emissions",
-            subsys=PerformancesHighRPMICEInFlightNOxEmissions(
-                high_rpm_ice_id=high_rpm_ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="SOx_emissions",
-            subsys=PerformancesHighRPMICEInFlightSOxEmissions(
-                high_rpm_ice_id=high_rpm_ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="water_vapour_emissions",
-            subsys=PerformancesHighRPMICEInFlightH2OEmissions(
-                high_rpm_ice_id=high_rpm_ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="HC_emissions",
-            subsys=PerformancesHighRPMICEInFlightHCEmissions(
-                high_rpm_ice_id=high_rpm_ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="lead_emissions",
-            subsys=PerformancesHighRPMICEInFlightLeadEmissions(
-                high_rpm_ice_id=high_rpm_ice_id, number_of_points=number_of_points
+            name="species_emissions",
+            subsys=PerformancesInFlightEmissions(
+                number_of_points=number_of_points,
+                prefix="data:propulsion:he_power_train:high_rpm_ICE:" + high_rpm_ice_id,
+                emission_indices=EMISSION_INDICES,
             ),
             promotes=["*"],
         )
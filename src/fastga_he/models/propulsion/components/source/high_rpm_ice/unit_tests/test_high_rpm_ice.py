@@ -33,13 +33,6 @@ from ..components.perf_engine_rpm import PerformancesEngineRPM
 from ..components.perf_torque import PerformancesTorque
 from ..components.perf_mean_effective_pressure import PerformancesMeanEffectivePressure
 from ..components.perf_sfc import PerformancesSFC
-from ..components.perf_inflight_co2_emissions import PerformancesHighRPMICEInFlightCO2Emissions
-from ..components.perf_inflight_co_emissions import PerformancesHighRPMICEInFlightCOEmissions
-from ..components.perf_inflight_nox_emissions import PerformancesHighRPMICEInFlightNOxEmissions
-from ..components.perf_inflight_sox_emissions import PerformancesHighRPMICEInFlightSOxEmissions
-from ..components.perf_inflight_h2o_emissions import PerformancesHighRPMICEInFlightH2OEmissions
-from ..components.perf_inflight_hc_emissions import PerformancesHighRPMICEInFlightHCEmissions
-from ..components.perf_inflight_lead_emissions import PerformancesHighRPMICEInFlightLeadEmissions
 from ..components.perf_inflight_emissions_sum import PerformancesHighRPMICEInFlightEmissionsSum
 from ..components.perf_inflight_emissions import PerformancesHighRPMICEInFlightEmissions
 from ..components.perf_maximum import PerformancesMaximum
@@ -575,215 +568,6 @@ def test_fuel_consumed():
     problem.check_partials(compact_print=True)
 
 
-def test_in_flight_co2_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([0.428, 0.758, 0.85, 0.96, 1.11, 1.28, 1.47, 1.67, 1.88, 2.08]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesHighRPMICEInFlightCO2Emissions(
-            high_rpm_ice_id="ice_1", number_of_points=NB_POINTS_TEST
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("CO2_emissions", units="g") == pytest.approx(
-        np.array([1326.8, 2349.8, 2635.0, 2976.0, 3441.0, 3968.0, 4557.0, 5177.0, 5828.0, 6448.0]),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_co_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([0.428, 0.758, 0.85, 0.96, 1.11, 1.28, 1.47, 1.67, 1.88, 2.08]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesHighRPMICEInFlightCOEmissions(
-            high_rpm_ice_id="ice_1", number_of_points=NB_POINTS_TEST
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("CO_emissions", units="g") == pytest.approx(
-        np.array(
-            [341.544, 604.884, 678.3, 766.08, 885.78, 1021.44, 1173.06, 1332.66, 1500.24, 1659.84]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_nox_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([0.428, 0.758, 0.85, 0.96, 1.11, 1.28, 1.47, 1.67, 1.88, 2.08]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesHighRPMICEInFlightNOxEmissions(
-            high_rpm_ice_id="ice_1", number_of_points=NB_POINTS_TEST
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("NOx_emissions", units="g") == pytest.approx(
-        np.array([1.34392, 2.38012, 2.669, 3.0144, 3.4854, 4.0192, 4.6158, 5.2438, 5.9032, 6.5312]),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_sox_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([0.428, 0.758, 0.85, 0.96, 1.11, 1.28, 1.47, 1.67, 1.88, 2.08]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesHighRPMICEInFlightSOxEmissions(
-            high_rpm_ice_id="ice_1", number_of_points=NB_POINTS_TEST
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("SOx_emissions", units="g") == pytest.approx(
-        np.array([0.17976, 0.31836, 0.357, 0.4032, 0.4662, 0.5376, 0.6174, 0.7014, 0.7896, 0.8736]),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_h2o_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([0.428, 0.758, 0.85, 0.96, 1.11, 1.28, 1.47, 1.67, 1.88, 2.08]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesHighRPMICEInFlightH2OEmissions(
-            high_rpm_ice_id="ice_1", number_of_points=NB_POINTS_TEST
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("H2O_emissions", units="g") == pytest.approx(
-        np.array(
-            [
-                529.436,
-                937.646,
-                1051.45,
-                1187.52,
-                1373.07,
-                1583.36,
-                1818.39,
-                2065.79,
-                2325.56,
-                2572.96,
-            ]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_hc_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([0.428, 0.758, 0.85, 0.96, 1.11, 1.28, 1.47, 1.67, 1.88, 2.08]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesHighRPMICEInFlightHCEmissions(
-            high_rpm_ice_id="ice_1", number_of_points=NB_POINTS_TEST
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("HC_emissions", units="g") == pytest.approx(
-        np.array(
-            [
-                8.075076,
-                14.301186,
-                16.03695,
-                18.11232,
-                20.94237,
-                24.14976,
-                27.73449,
-                31.50789,
-                35.46996,
-                39.24336,
-            ]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_lead_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([0.428, 0.758, 0.85, 0.96, 1.11, 1.28, 1.47, 1.67, 1.88, 2.08]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesHighRPMICEInFlightLeadEmissions(
-            high_rpm_ice_id="ice_1", number_of_points=NB_POINTS_TEST
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("lead_emissions", units="g") == pytest.approx(
-        np.array(
-            [
-                0.339832,
-                0.601852,
-                0.6749,
-                0.76224,
-                0.88134,
-                1.01632,
-                1.16718,
-                1.32598,
-                1.49272,
-                1.65152,
-            ]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
 def test_in_flight_emissions_sum():
     ivc = om.IndepVarComp()
     ivc.add_output(
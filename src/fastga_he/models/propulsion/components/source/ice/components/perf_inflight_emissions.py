@@ -4,16 +4,23 @@
 
 import openmdao.api as om
 
-from .perf_inflight_co2_emissions import PerformancesICEInFlightCO2Emissions
-from .perf_inflight_co_emissions import PerformancesICEInFlightCOEmissions
-from .perf_inflight_nox_emissions import PerformancesICEInFlightNOxEmissions
-from .perf_inflight_sox_emissions import PerformancesICEInFlightSOxEmissions
-from .perf_inflight_h2o_emissions import PerformancesICEInFlightH2OEmissions
-from .perf_inflight_hc_emissions import PerformancesICEInFlightHCEmissions
-from .perf_inflight_lead_emissions import PerformancesICEInFlightLeadEmissions
+from fastga_he.models.propulsion.sub_components import PerformancesInFlightEmissions
 from .perf_inflight_emissions_sum import PerformancesICEInFlightEmissionsSum
 from .perf_inflight_lto_emissions_sum import PerformancesICELTOEmissionsSum
 
+# Default value of the emission index of each species, in g/kg. The values for CO2 and H2O are
+# taken from :cite:`european:2019`, the ones for CO, NOx, SOx and HC from :cite:`kalivoda:1997`
+# and the one for lead from :cite:`rindlisbacher:2007`
+EMISSION_INDICES = {
+    "CO2": 3100.0,
+    "CO": 798.0,
+    "NOx": 3.14,
+    "SOx": 0.42,
+    "H2O": 1237.0,
+    "HC": 18.867,
+    "lead": 0.794,
+}
+
 
 class PerformancesICEInFlightEmissions(om.Group):
     """
@@ -36,51 +43,11 @@ class PerformancesICEInFlightEmissions(om.Group):
         ice_id = self.options["ice_id"]
 
         self.add_subsystem(
-            name="CO2_emissions",
-            subsys=PerformancesICEInFlightCO2Emissions(
-                ice_id=ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="CO_emissions",
-            subsys=PerformancesICEInFlightCOEmissions(
-                ice_id=ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="NOx_emissions",
-            subsys=PerformancesICEInFlightNOxEmissions(
-                ice_id=ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="SOx_emissions",
-            subsys=PerformancesICEInFlightSOxEmissions(
-                ice_id=ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="water_vapour_emissions",
-            subsys=PerformancesICEInFlightH2OEmissions(
-                ice_id=ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="HC_emissions",
-            subsys=PerformancesICEInFlightHCEmissions(
-                ice_id=ice_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="lead_emissions",
-            subsys=PerformancesICEInFlightLeadEmissions(
-                ice_id=ice_id, number_of_points=number_of_points
+            name="species_emissions",
+            subsys=PerformancesInFlightEmissions(
+                number_of_points=number_of_points,
+                prefix="data:propulsion:he_power_train:ICE:" + ice_id,
+                emission_indices=EMISSION_INDICES,
             ),
             promotes=["*"],
         )
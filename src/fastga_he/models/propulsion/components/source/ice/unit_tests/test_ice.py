@@ -40,13 +40,6 @@ from ..components.perf_fuel_consumption import PerformancesICEFuelConsumption
 from ..components.perf_fuel_consumed import PerformancesICEFuelConsumed
 from ..components.perf_maximum import PerformancesMaximum
 
-from ..components.perf_inflight_co2_emissions import PerformancesICEInFlightCO2Emissions
-from ..components.perf_inflight_co_emissions import PerformancesICEInFlightCOEmissions
-from ..components.perf_inflight_nox_emissions import PerformancesICEInFlightNOxEmissions
-from ..components.perf_inflight_sox_emissions import PerformancesICEInFlightSOxEmissions
-from ..components.perf_inflight_h2o_emissions import PerformancesICEInFlightH2OEmissions
-from ..components.perf_inflight_hc_emissions import PerformancesICEInFlightHCEmissions
-from ..components.perf_inflight_lead_emissions import PerformancesICEInFlightLeadEmissions
 from ..components.perf_inflight_emissions_sum import PerformancesICEInFlightEmissionsSum
 from ..components.perf_inflight_lto_emissions_sum import PerformancesICELTOEmissionsSum
 from ..components.perf_inflight_emissions import PerformancesICEInFlightEmissions
@@ -533,198 +526,6 @@ def test_performances_ice():
     om.n2(problem, show_browser=False, outfile=pth.join(pth.dirname(__file__), "n2.html"))
 
 
-def test_in_flight_co2_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([5.12, 5.5, 5.9, 6.33, 6.81, 7.33, 7.89, 8.44, 9.1, 9.72]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesICEInFlightCO2Emissions(ice_id="ice_1", number_of_points=NB_POINTS_TEST), ivc
-    )
-
-    assert problem.get_val("CO2_emissions", units="g") == pytest.approx(
-        np.array(
-            [
-                15872.0,
-                17050.0,
-                18290.0,
-                19623.0,
-                21111.0,
-                22723.0,
-                24459.0,
-                26164.0,
-                28210.0,
-                30132.0,
-            ]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_co_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([5.12, 5.5, 5.9, 6.33, 6.81, 7.33, 7.89, 8.44, 9.1, 9.72]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesICEInFlightCOEmissions(ice_id="ice_1", number_of_points=NB_POINTS_TEST), ivc
-    )
-
-    assert problem.get_val("CO_emissions", units="g") == pytest.approx(
-        np.array(
-            [4085.76, 4389.0, 4708.2, 5051.34, 5434.38, 5849.34, 6296.22, 6735.12, 7261.8, 7756.56]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_nox_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([5.12, 5.5, 5.9, 6.33, 6.81, 7.33, 7.89, 8.44, 9.1, 9.72]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesICEInFlightNOxEmissions(ice_id="ice_1", number_of_points=NB_POINTS_TEST), ivc
-    )
-
-    assert problem.get_val("NOx_emissions", units="g") == pytest.approx(
-        np.array(
-            [16.0768, 17.27, 18.526, 19.8762, 21.3834, 23.0162, 24.7746, 26.5016, 28.574, 30.5208]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_sox_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([5.12, 5.5, 5.9, 6.33, 6.81, 7.33, 7.89, 8.44, 9.1, 9.72]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesICEInFlightSOxEmissions(ice_id="ice_1", number_of_points=NB_POINTS_TEST), ivc
-    )
-
-    assert problem.get_val("SOx_emissions", units="g") == pytest.approx(
-        np.array([2.1504, 2.31, 2.478, 2.6586, 2.8602, 3.0786, 3.3138, 3.5448, 3.822, 4.0824]),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_h2o_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([5.12, 5.5, 5.9, 6.33, 6.81, 7.33, 7.89, 8.44, 9.1, 9.72]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesICEInFlightH2OEmissions(ice_id="ice_1", number_of_points=NB_POINTS_TEST), ivc
-    )
-
-    assert problem.get_val("H2O_emissions", units="g") == pytest.approx(
-        np.array(
-            [
-                6333.44,
-                6803.5,
-                7298.3,
-                7830.21,
-                8423.97,
-                9067.21,
-                9759.93,
-                10440.28,
-                11256.7,
-                12023.64,
-            ]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_hc_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([5.12, 5.5, 5.9, 6.33, 6.81, 7.33, 7.89, 8.44, 9.1, 9.72]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesICEInFlightHCEmissions(ice_id="ice_1", number_of_points=NB_POINTS_TEST), ivc
-    )
-
-    assert problem.get_val("HC_emissions", units="g") == pytest.approx(
-        np.array(
-            [
-                96.59904,
-                103.7685,
-                111.3153,
-                119.42811,
-                128.48427,
-                138.29511,
-                148.86063,
-                159.23748,
-                171.6897,
-                183.38724,
-            ]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_lead_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([5.12, 5.5, 5.9, 6.33, 6.81, 7.33, 7.89, 8.44, 9.1, 9.72]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesICEInFlightLeadEmissions(ice_id="ice_1", number_of_points=NB_POINTS_TEST), ivc
-    )
-
-    assert problem.get_val("lead_emissions", units="g") == pytest.approx(
-        np.array(
-            [4.06528, 4.367, 4.6846, 5.02602, 5.40714, 5.82002, 6.26466, 6.70136, 7.2254, 7.71768]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
 def test_in_flight_emissions_sum():
     ivc = om.IndepVarComp()
     ivc.add_output(
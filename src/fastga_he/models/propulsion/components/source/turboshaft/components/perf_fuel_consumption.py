@@ -114,29 +114,11 @@ class PerformancesTurboshaftFuelConsumption(om.ExplicitComponent):
         design_power = power_rating * power_ratio
 
         fuel_consumption = (
-            10**2.48320
-            * density_ratio
-            ** (
-                2.42792 * np.log10(design_t41t) * np.log10(design_opr)
-                - 0.81294 * np.log10(design_power) ** 2
-                + 5.25258 * np.log10(design_power)
-                - 0.68143 * np.log10(design_t41t) ** 2
-                - 2.43656 * np.log10(design_power) * np.log10(design_opr)
-                - 4.01243 * np.log10(power)
-                + 1.15653 * np.log10(design_power) * np.log10(power)
-                + 0.32787 * np.log10(density_ratio)
+            self.fuel_consumption_surrogate(
+                density_ratio, mach, power, design_t41t, design_opr, design_power
             )
-            * mach ** (-0.10964 - 0.04483 * np.log10(mach) * np.log10(design_opr))
-            * design_power
-            ** (
-                0.02476 * np.log10(power) ** 2
-                + 4.82231
-                - 0.45400 * np.log10(design_power) * np.log10(design_t41t)
-                + 0.71625 * np.log10(design_power)
-            )
-            * design_t41t ** (0.29604 * np.log10(design_t41t) * np.log10(power) - 2.92384)
-            * power ** (-2.76852)
-        ) * k_fc
+            * k_fc
+        )
 
         outputs["fuel_consumption"] = fuel_consumption
 
@@ -165,44 +147,17 @@ class PerformancesTurboshaftFuelConsumption(om.ExplicitComponent):
 
         design_power = power_rating * power_ratio
 
-        fuel_consumption = (
-            10**2.48320
-            * density_ratio
-            ** (
-                2.42792 * np.log10(design_t41t) * np.log10(design_opr)
-                - 0.81294 * np.log10(design_power) ** 2
-                + 5.25258 * np.log10(design_power)
-                - 0.68143 * np.log10(design_t41t) ** 2
-                - 2.43656 * np.log10(design_power) * np.log10(design_opr)
-                - 4.01243 * np.log10(power)
-                + 1.15653 * np.log10(design_power) * np.log10(power)
-                + 0.32787 * np.log10(density_ratio)
-            )
-            * mach ** (-0.10964 - 0.04483 * np.log10(mach) * np.log10(design_opr))
-            * design_power
-            ** (
-                0.02476 * np.log10(power) ** 2
-                + 4.82231
-                - 0.45400 * np.log10(design_power) * np.log10(design_t41t)
-                + 0.71625 * np.log10(design_power)
-            )
-            * design_t41t ** (0.29604 * np.log10(design_t41t) * np.log10(power) - 2.92384)
-            * power ** (-2.76852)
+        fuel_consumption = self.fuel_consumption_surrogate(
+            density_ratio, mach, power, design_t41t, design_opr, design_power
+        )
+        log_derivatives = self.fuel_consumption_surrogate_log_derivatives(
+            density_ratio, mach, power, design_t41t, design_opr, design_power
         )
 
         d_fc_d_log_fc = 10 ** np.log10(fuel_consumption) * np.log(10)
 
         # Partials derivative for density ratio
-        d_log_fc_d_log_sigma = (
-            2.42792 * np.log10(design_t41t) * np.log10(design_opr)
-            - 0.81294 * np.log10(design_power) ** 2
-            + 5.25258 * np.log10(design_power)
-            - 0.68143 * np.log10(design_t41t) ** 2
-            - 2.43656 * np.log10(design_power) * np.log10(design_opr)
-            - 4.01243 * np.log10(power)
-            + 1.15653 * np.log10(design_power) * np.log10(power)
-            + 2.0 * 0.32787 * np.log10(density_ratio)
-        )
+        d_log_fc_d_log_sigma = log_derivatives["density_ratio"]
         d_log_sigma_d_sigma = 1.0 / (np.log(10) * density_ratio)
 
         partials["fuel_consumption", "density_ratio"] = (
@@ -210,7 +165,7 @@ class PerformancesTurboshaftFuelConsumption(om.ExplicitComponent):
         )
 
         # Partials derivative for mach number
-        d_log_fc_d_log_mach = -0.10964 - 2.0 * 0.04483 * np.log10(mach) * np.log10(design_opr)
+        d_log_fc_d_log_mach = log_derivatives["mach"]
         d_log_mach_d_mach = 1.0 / (np.log(10) * mach)
 
         partials["fuel_consumption", "mach"] = (
@@ -218,16 +173,7 @@ class PerformancesTurboshaftFuelConsumption(om.ExplicitComponent):
         )
 
         # Partials derivative for design power related inputs
-        d_log_fc_d_log_power_des = (
-            -2.0 * 0.81294 * np.log10(design_power) * np.log10(density_ratio)
-            + 5.25258 * np.log10(density_ratio)
-            - 2.43656 * np.log10(density_ratio) * np.log10(design_opr)
-            + 1.15653 * np.log10(density_ratio) * np.log10(power)
-            + 0.02476 * np.log10(power) ** 2
-            + 4.82231
-            - 2.0 * 0.45400 * np.log10(design_power) * np.log10(design_t41t)
-            + 2.0 * 0.71625 * np.log10(design_power)
-        )
+        d_log_fc_d_log_power_des = log_derivatives["design_power"]
         d_log_power_des_d_power_des = 1.0 / (np.log(10) * design_power)
 
         partials[
@@ -254,13 +200,7 @@ class PerformancesTurboshaftFuelConsumption(om.ExplicitComponent):
         )
 
         # Partials derivative for design T41t
-        d_log_fc_d_log_t41t = (
-            2.42792 * np.log10(density_ratio) * np.log10(design_opr)
-            - 2.0 * 0.68143 * np.log10(design_t41t) * np.log10(density_ratio)
-            - 0.45400 * np.log10(design_power) ** 2.0
-            + 2.0 * 0.29604 * np.log10(design_t41t) * np.log10(power)
-            - 2.92384
-        )
+        d_log_fc_d_log_t41t = log_derivatives["design_t41t"]
         d_log_t41t_d_t41t = 1.0 / (np.log(10) * design_t41t)
         partials[
             "fuel_consumption",
@@ -268,11 +208,7 @@ class PerformancesTurboshaftFuelConsumption(om.ExplicitComponent):
         ] = d_fc_d_log_fc * d_log_fc_d_log_t41t * d_log_t41t_d_t41t * k_fc
 
         # Partials derivative for design OPR
-        d_log_fc_d_log_opr = (
-            2.42792 * np.log10(design_t41t) * np.log10(density_ratio)
-            - 2.43656 * np.log10(design_power) * np.log10(density_ratio)
-            - 0.04483 * np.log10(mach) ** 2.0
-        )
+        d_log_fc_d_log_opr = log_derivatives["design_opr"]
         d_log_opr_d_opr = 1.0 / (np.log(10) * design_opr)
 
         partials[
@@ -281,13 +217,7 @@ class PerformancesTurboshaftFuelConsumption(om.ExplicitComponent):
         ] = d_fc_d_log_fc * d_log_fc_d_log_opr * d_log_opr_d_opr * k_fc
 
         # Partials derivative for current shaft power
-        d_log_fc_d_log_power = (
-            -4.01243 * np.log10(density_ratio)
-            + 1.15653 * np.log10(design_power) * np.log10(density_ratio)
-            + 2.0 * 0.02476 * np.log10(power) * np.log10(design_power)
-            + 0.29604 * np.log10(design_t41t) * np.log10(design_t41t)
-            - 2.76852
-        )
+        d_log_fc_d_log_power = log_derivatives["power"]
         d_log_power_d_power = 1.0 / (np.log(10) * power)
 
         partials["fuel_consumption", "power_required"] = (
@@ -295,3 +225,90 @@ class PerformancesTurboshaftFuelConsumption(om.ExplicitComponent):
         )
 
         partials["fuel_consumption", "k_sfc"] = fuel_consumption
+
+    @staticmethod
+    def fuel_consumption_surrogate(
+        density_ratio, mach, power, design_t41t, design_opr, design_power
+    ):
+        """
+        Fuel consumption given by the surrogate model of the turboshaft, in kg/h, before the
+        application of the k-factor. Powers are in kW and the design T41t in K.
+        """
+
+        return (
+            10**2.48320
+            * density_ratio
+            ** (
+                2.42792 * np.log10(design_t41t) * np.log10(design_opr)
+                - 0.81294 * np.log10(design_power) ** 2
+                + 5.25258 * np.log10(design_power)
+                - 0.68143 * np.log10(design_t41t) ** 2
+                - 2.43656 * np.log10(design_power) * np.log10(design_opr)
+                - 4.01243 * np.log10(power)
+                + 1.15653 * np.log10(design_power) * np.log10(power)
+                + 0.32787 * np.log10(density_ratio)
+            )
+            * mach ** (-0.10964 - 0.04483 * np.log10(mach) * np.log10(design_opr))
+            * design_power
+            ** (
+                0.02476 * np.log10(power) ** 2
+                + 4.82231
+                - 0.45400 * np.log10(design_power) * np.log10(design_t41t)
+                + 0.71625 * np.log10(design_power)
+            )
+            * design_t41t ** (0.29604 * np.log10(design_t41t) * np.log10(power) - 2.92384)
+            * power ** (-2.76852)
+        )
+
+    @staticmethod
+    def fuel_consumption_surrogate_log_derivatives(
+        density_ratio, mach, power, design_t41t, design_opr, design_power
+    ) -> dict:
+        """
+        Derivatives of the log10 of the fuel consumption given by the surrogate model with respect
+        to the log10 of each of its inputs, stored in a dictionary keyed by the name of the
+        arguments.
+        """
+
+        return {
+            "density_ratio": (
+                2.42792 * np.log10(design_t41t) * np.log10(design_opr)
+                - 0.81294 * np.log10(design_power) ** 2
+                + 5.25258 * np.log10(design_power)
+                - 0.68143 * np.log10(design_t41t) ** 2
+                - 2.43656 * np.log10(design_power) * np.log10(design_opr)
+                - 4.01243 * np.log10(power)
+                + 1.15653 * np.log10(design_power) * np.log10(power)
+                + 2.0 * 0.32787 * np.log10(density_ratio)
+            ),
+            "mach": -0.10964 - 2.0 * 0.04483 * np.log10(mach) * np.log10(design_opr),
+            "design_power": (
+                -2.0 * 0.81294 * np.log10(design_power) * np.log10(density_ratio)
+                + 5.25258 * np.log10(density_ratio)
+                - 2.43656 * np.log10(density_ratio) * np.log10(design_opr)
+                + 1.15653 * np.log10(density_ratio) * np.log10(power)
+                + 0.02476 * np.log10(power) ** 2
+                + 4.82231
+                - 2.0 * 0.45400 * np.log10(design_power) * np.log10(design_t41t)
+                + 2.0 * 0.71625 * np.log10(design_power)
+            ),
+            "design_t41t": (
+                2.42792 * np.log10(density_ratio) * np.log10(design_opr)
+                - 2.0 * 0.68143 * np.log10(design_t41t) * np.log10(density_ratio)
+                - 0.45400 * np.log10(design_power) ** 2.0
+                + 2.0 * 0.29604 * np.log10(design_t41t) * np.log10(power)
+                - 2.92384
+            ),
+            "design_opr": (
+                2.42792 * np.log10(design_t41t) * np.log10(density_ratio)
+                - 2.43656 * np.log10(design_power) * np.log10(density_ratio)
+                - 0.04483 * np.log10(mach) ** 2.0
+            ),
+            "power": (
+                -4.01243 * np.log10(density_ratio)
+                + 1.15653 * np.log10(design_power) * np.log10(density_ratio)
+                + 2.0 * 0.02476 * np.log10(power) * np.log10(design_power)
+                + 0.29604 * np.log10(design_t41t) * np.log10(design_t41t)
+                - 2.76852
+            ),
+        }
@@ -0,0 +1,350 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import numpy as np
+import openmdao.api as om
+
+from stdatm import AtmosphereWithPartials
+
+from fastga_he.models.environmental_impacts.simple_energy_impact import (
+    ENERGY_CONTENT_JET_FUEL,
+    KWH_TO_MJ,
+)  # In MJ/kg
+from fastga_he.models.propulsion.components.chain_rule import chain_rule
+
+from .perf_density_ratio import DENSITY_SL
+from .perf_required_power import PerformancesRequiredPower
+from .perf_fuel_consumption import PerformancesTurboshaftFuelConsumption
+
+
+class PerformancesTurboshaftFusedFuelConsumption(om.ExplicitComponent):
+    """
+    Computation of the density ratio, Mach number, required power, fuel consumption, fuel
+    consumed, sfc and equivalent efficiency of the turboshaft in a single component. Gives the same
+    results as the chain going from PerformancesDensityRatio to PerformancesEquivalentEfficiency
+    but saves the transfers between those components, which are significant when the number of
+    points is high.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            "number_of_points", default=1, desc="number of equilibrium to be treated"
+        )
+        self.options.declare(
+            name="turboshaft_id",
+            default=None,
+            desc="Identifier of the turboshaft",
+            allow_none=False,
+        )
+
+    def setup(self):
+        number_of_points = self.options["number_of_points"]
+        turboshaft_id = self.options["turboshaft_id"]
+
+        # RPM is not used to compute anything but is needed for compatibility reasons
+        self.add_input("rpm", units="min**-1", val=np.nan, shape=number_of_points)
+        self.add_input("density", units="kg/m**3", val=np.nan, shape=number_of_points)
+        self.add_input("true_airspeed", units="m/s", val=np.nan, shape=number_of_points)
+        self.add_input("altitude", units="m", val=np.nan, shape=number_of_points)
+        self.add_input("shaft_power_out", units="kW", val=np.nan, shape=number_of_points)
+        self.add_input("time_step", units="h", val=np.full(number_of_points, np.nan))
+        self.add_input(
+            "k_sfc",
+            val=1.0,
+            shape=number_of_points,
+            desc="K-factor to adjust the sfc/fuel consumption of the turboshaft, vectorial format",
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":power_offtake",
+            val=0.0,
+            units="kW",
+            desc="Mechanical offtake on the turboshaft, is added to shaft power out",
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":design_point:OPR",
+            val=np.nan,
+            desc="OPR of the turboshaft at the design point",
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":design_point:T41t",
+            units="degK",
+            val=np.nan,
+            desc="Total temperature at the output of the combustion chamber of the turboshaft "
+            "at the design point",
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:turboshaft:"
+            + turboshaft_id
+            + ":design_point:power_ratio",
+            val=np.nan,
+            desc="Ratio of the thermodynamic power divided by the rated power, typical values on "
+            "the PT6A family is between 1.3 and 2.5",
+        )
+        self.add_input(
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":power_rating",
+            units="kW",
+            val=np.nan,
+            desc="Flat rating of the turboshaft",
+        )
+
+        self.add_output("density_ratio", val=1.0, shape=number_of_points, lower=0.0)
+        self.add_output("mach", val=0.2, shape=number_of_points, lower=0.0)
+        self.add_output("power_required", val=500.0, units="kW", shape=number_of_points)
+        self.add_output("shaft_power_for_power_rate", units="kW", val=500.0, shape=number_of_points)
+        self.add_output("fuel_consumption", units="kg/h", val=120.0, shape=number_of_points)
+        self.add_output("fuel_consumed_t", np.full(number_of_points, 1.0), units="kg")
+        self.add_output(
+            "specific_fuel_consumption", units="g/kW/h", val=200.0, shape=number_of_points
+        )
+        self.add_output(
+            "equivalent_efficiency",
+            val=np.full(number_of_points, 0.3),
+            shape=number_of_points,
+            desc="Equivalent efficiency of the turboshaft. Indicative, the sfc should be preferred",
+        )
+
+    def setup_partials(self):
+        number_of_points = self.options["number_of_points"]
+        turboshaft_id = self.options["turboshaft_id"]
+
+        diagonal = np.arange(number_of_points)
+        column = np.zeros(number_of_points)
+
+        power_offtake_name = (
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":power_offtake"
+        )
+        design_point_names = [
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":design_point:OPR",
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":design_point:T41t",
+            "data:propulsion:he_power_train:turboshaft:"
+            + turboshaft_id
+            + ":design_point:power_ratio",
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":power_rating",
+        ]
+        fuel_consumption_outputs = [
+            "fuel_consumption",
+            "fuel_consumed_t",
+            "specific_fuel_consumption",
+            "equivalent_efficiency",
+        ]
+
+        self.declare_partials(
+            of="density_ratio",
+            wrt="density",
+            rows=diagonal,
+            cols=diagonal,
+            val=np.full(number_of_points, 1.0 / DENSITY_SL),
+        )
+        self.declare_partials(
+            of="mach",
+            wrt=["true_airspeed", "altitude"],
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            of=["power_required", "shaft_power_for_power_rate"],
+            wrt="shaft_power_out",
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+            val=np.ones(number_of_points),
+        )
+        self.declare_partials(
+            of=["power_required", "shaft_power_for_power_rate"],
+            wrt=power_offtake_name,
+            method="exact",
+            rows=diagonal,
+            cols=column,
+            val=np.ones(number_of_points),
+        )
+        self.declare_partials(
+            of=fuel_consumption_outputs,
+            wrt=["density", "true_airspeed", "altitude", "shaft_power_out", "k_sfc"],
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+        self.declare_partials(
+            of=fuel_consumption_outputs,
+            wrt=design_point_names + [power_offtake_name],
+            method="exact",
+            rows=diagonal,
+            cols=column,
+        )
+        self.declare_partials(
+            of="fuel_consumed_t",
+            wrt="time_step",
+            method="exact",
+            rows=diagonal,
+            cols=diagonal,
+        )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        turboshaft_id = self.options["turboshaft_id"]
+
+        density_ratio = inputs["density"] / DENSITY_SL
+        speed_of_sound = AtmosphereWithPartials(
+            inputs["altitude"], altitude_in_feet=False
+        ).speed_of_sound
+        mach = inputs["true_airspeed"] / speed_of_sound
+        power = (
+            PerformancesRequiredPower.smooth_power(inputs["shaft_power_out"])
+            + inputs[
+                "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":power_offtake"
+            ]
+        )
+        design_power = (
+            inputs["data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":power_rating"]
+            * inputs[
+                "data:propulsion:he_power_train:turboshaft:"
+                + turboshaft_id
+                + ":design_point:power_ratio"
+            ]
+        )
+
+        fuel_consumption = (
+            PerformancesTurboshaftFuelConsumption.fuel_consumption_surrogate(
+                density_ratio,
+                mach,
+                power,
+                inputs[
+                    "data:propulsion:he_power_train:turboshaft:"
+                    + turboshaft_id
+                    + ":design_point:T41t"
+                ],
+                inputs[
+                    "data:propulsion:he_power_train:turboshaft:"
+                    + turboshaft_id
+                    + ":design_point:OPR"
+                ],
+                design_power,
+            )
+            * inputs["k_sfc"]
+        )
+
+        outputs["density_ratio"] = density_ratio
+        outputs["mach"] = mach
+        outputs["power_required"] = power
+        outputs["shaft_power_for_power_rate"] = power
+        outputs["fuel_consumption"] = fuel_consumption
+        outputs["fuel_consumed_t"] = inputs["time_step"] * fuel_consumption
+        # Fuel consumption is in kg/h so it is converted to g/h for the sfc
+        outputs["specific_fuel_consumption"] = fuel_consumption * 1000.0 / power
+        outputs["equivalent_efficiency"] = power / (
+            fuel_consumption * ENERGY_CONTENT_JET_FUEL / KWH_TO_MJ
+        )
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        turboshaft_id = self.options["turboshaft_id"]
+
+        power_offtake_name = (
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":power_offtake"
+        )
+        design_opr_name = (
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":design_point:OPR"
+        )
+        design_t41t_name = (
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":design_point:T41t"
+        )
+        power_ratio_name = (
+            "data:propulsion:he_power_train:turboshaft:"
+            + turboshaft_id
+            + ":design_point:power_ratio"
+        )
+        power_rating_name = (
+            "data:propulsion:he_power_train:turboshaft:" + turboshaft_id + ":power_rating"
+        )
+
+        density_ratio = inputs["density"] / DENSITY_SL
+        atm = AtmosphereWithPartials(inputs["altitude"], altitude_in_feet=False)
+        speed_of_sound = atm.speed_of_sound
+        mach = inputs["true_airspeed"] / speed_of_sound
+        power = (
+            PerformancesRequiredPower.smooth_power(inputs["shaft_power_out"])
+            + inputs[power_offtake_name]
+        )
+        design_t41t = inputs[design_t41t_name]
+        design_opr = inputs[design_opr_name]
+        power_ratio = inputs[power_ratio_name]
+        power_rating = inputs[power_rating_name]
+        design_power = power_rating * power_ratio
+        k_fc = inputs["k_sfc"]
+        time_step = inputs["time_step"]
+
+        fuel_consumption_surrogate = (
+            PerformancesTurboshaftFuelConsumption.fuel_consumption_surrogate(
+                density_ratio, mach, power, design_t41t, design_opr, design_power
+            )
+        )
+        log_derivatives = (
+            PerformancesTurboshaftFuelConsumption.fuel_consumption_surrogate_log_derivatives(
+                density_ratio, mach, power, design_t41t, design_opr, design_power
+            )
+        )
+        fuel_consumption = fuel_consumption_surrogate * k_fc
+
+        # As in PerformancesRequiredPower, the smoothing of the power is not accounted for in the
+        # derivatives
+        d_power = {"shaft_power_out": 1.0, power_offtake_name: 1.0}
+        d_mach = {
+            "true_airspeed": 1.0 / speed_of_sound,
+            "altitude": -inputs["true_airspeed"]
+            / speed_of_sound**2.0
+            * atm.partial_speed_of_sound_altitude,
+        }
+
+        d_fc_d_log_fc = 10 ** np.log10(fuel_consumption_surrogate) * np.log(10) * k_fc
+        d_fuel_consumption = chain_rule(
+            (
+                d_fc_d_log_fc
+                * log_derivatives["density_ratio"]
+                / (np.log(10) * density_ratio)
+                / DENSITY_SL,
+                {"density": 1.0},
+            ),
+            (d_fc_d_log_fc * log_derivatives["mach"] / (np.log(10) * mach), d_mach),
+            (d_fc_d_log_fc * log_derivatives["power"] / (np.log(10) * power), d_power),
+            (
+                d_fc_d_log_fc * log_derivatives["design_power"] / (np.log(10) * design_power),
+                {power_rating_name: power_ratio, power_ratio_name: power_rating},
+            ),
+            (
+                d_fc_d_log_fc * log_derivatives["design_t41t"] / (np.log(10) * design_t41t),
+                {design_t41t_name: 1.0},
+            ),
+            (
+                d_fc_d_log_fc * log_derivatives["design_opr"] / (np.log(10) * design_opr),
+                {design_opr_name: 1.0},
+            ),
+            (fuel_consumption_surrogate, {"k_sfc": 1.0}),
+        )
+
+        d_fuel_consumed = chain_rule(
+            (time_step, d_fuel_consumption), (fuel_consumption, {"time_step": 1.0})
+        )
+        d_sfc = chain_rule(
+            (1000.0 / power, d_fuel_consumption),
+            (-fuel_consumption * 1000.0 / power**2.0, d_power),
+        )
+        d_equivalent_efficiency = chain_rule(
+            (
+                -(power**2.0)
+                / (fuel_consumption**2.0 * 1000.0)
+                / (ENERGY_CONTENT_JET_FUEL / KWH_TO_MJ),
+                d_sfc,
+            )
+        )
+
+        partials["mach", "true_airspeed"] = d_mach["true_airspeed"]
+        partials["mach", "altitude"] = d_mach["altitude"]
+
+        for output_name, output_derivatives in [
+            ("fuel_consumption", d_fuel_consumption),
+            ("fuel_consumed_t", d_fuel_consumed),
+            ("specific_fuel_consumption", d_sfc),
+            ("equivalent_efficiency", d_equivalent_efficiency),
+        ]:
+            for input_name, derivative in output_derivatives.items():
+                partials[output_name, input_name] = derivative
@@ -4,14 +4,20 @@
 
 import openmdao.api as om
 
-from .perf_inflight_co2_emissions import PerformancesTurboshaftInFlightCO2Emissions
-from .perf_inflight_co_emissions import PerformancesTurboshaftInFlightCOEmissions
-from .perf_inflight_nox_emissions import PerformancesTurboshaftInFlightNOxEmissions
-from .perf_inflight_sox_emissions import PerformancesTurboshaftInFlightSOxEmissions
-from .perf_inflight_h2o_emissions import PerformancesTurboshaftInFlightH2OEmissions
-from .perf_inflight_hc_emissions import PerformancesTurboshaftInFlightHCEmissions
+from fastga_he.models.propulsion.sub_components import PerformancesInFlightEmissions
 from .perf_inflight_emissions_sum import PerformancesTurboshaftInFlightEmissionsSum
 
+# Default value of the emission index of each species, in g/kg. The values for CO2 and H2O are
+# taken from :cite:`kim:2005` and the ones for CO, NOx, SOx and HC from :cite:`baughcum:1998`
+EMISSION_INDICES = {
+    "CO2": 3155.0,
+    "CO": 5.0,
+    "NOx": 11.4,
+    "SOx": 0.8,
+    "H2O": 1237.0,
+    "HC": 0.5,
+}
+
 
 class PerformancesTurboshaftInFlightEmissions(om.Group):
     """
@@ -34,44 +40,11 @@ class PerformancesTurboshaftInFlightEmissions(om.Group):
         turboshaft_id = self.options["turboshaft_id"]
 
         self.add_subsystem(
-            name="CO2_emissions",
-            subsys=PerformancesTurboshaftInFlightCO2Emissions(
-                turboshaft_id=turboshaft_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="CO_emissions",
-            subsys=PerformancesTurboshaftInFlightCOEmissions(
-                turboshaft_id=turboshaft_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="NOx_emissions",
-            subsys=PerformancesTurboshaftInFlightNOxEmissions(
-                turboshaft_id=turboshaft_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="SOx_emissions",
-            subsys=PerformancesTurboshaftInFlightSOxEmissions(
-                turboshaft_id=turboshaft_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="water_vapour_emissions",
-            subsys=PerformancesTurboshaftInFlightH2OEmissions(
-                turboshaft_id=turboshaft_id, number_of_points=number_of_points
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="HC_emissions",
-            subsys=PerformancesTurboshaftInFlightHCEmissions(
-                turboshaft_id=turboshaft_id, number_of_points=number_of_points
+            name="species_emissions",
+            subsys=PerformancesInFlightEmissions(
+                number_of_points=number_of_points,
+                prefix="data:propulsion:he_power_train:turboshaft:" + turboshaft_id,
+                emission_indices=EMISSION_INDICES,
             ),
             promotes=["*"],
         )
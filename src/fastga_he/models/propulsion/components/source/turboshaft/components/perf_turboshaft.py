@@ -22,6 +22,7 @@ from .perf_equivalent_rated_power_itt_limit import PerformancesEquivalentRatedPo
 from .perf_max_power_opr_limit import PerformancesMaxPowerOPRLimit
 from .perf_equivalent_rated_power_opr_limit import PerformancesEquivalentRatedPowerOPRLimit
 from .perf_maximum import PerformancesMaximum
+from .perf_fused_fuel_consumption import PerformancesTurboshaftFusedFuelConsumption
 
 from .perf_inflight_emissions import PerformancesTurboshaftInFlightEmissions
 
@@ -44,6 +45,14 @@ class PerformancesTurboshaft(om.Group):
             "power and some predefined reference points. Otherwise it is constant.",
             allow_none=False,
         )
+        self.options.declare(
+            name="fused",
+            default=False,
+            types=bool,
+            desc="If True, the chain of components computing the fuel consumption of the "
+            "turboshaft is replaced by a single component giving the same results, which is "
+            "faster when the number of points is high",
+        )
 
     def setup(self):
         number_of_points = self.options["number_of_points"]
@@ -65,40 +74,49 @@ class PerformancesTurboshaft(om.Group):
                 ),
                 promotes=["*"],
             )
-        self.add_subsystem(
-            name="density_ratio",
-            subsys=PerformancesDensityRatio(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="mach",
-            subsys=PerformancesMach(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="power_required",
-            subsys=PerformancesRequiredPower(
-                number_of_points=number_of_points, turboshaft_id=turboshaft_id
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="power_for_power_rate",
-            subsys=PerformancesPowerForPowerRate(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="fuel_consumption",
-            subsys=PerformancesTurboshaftFuelConsumption(
-                number_of_points=number_of_points, turboshaft_id=turboshaft_id
-            ),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="fuel_consumed",
-            subsys=PerformancesTurboshaftFuelConsumed(number_of_points=number_of_points),
-            promotes=["*"],
-        )
+        if self.options["fused"]:
+            self.add_subsystem(
+                name="fuel_consumption",
+                subsys=PerformancesTurboshaftFusedFuelConsumption(
+                    number_of_points=number_of_points, turboshaft_id=turboshaft_id
+                ),
+                promotes=["*"],
+            )
+        else:
+            self.add_subsystem(
+                name="density_ratio",
+                subsys=PerformancesDensityRatio(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                name="mach",
+                subsys=PerformancesMach(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                name="power_required",
+                subsys=PerformancesRequiredPower(
+                    number_of_points=number_of_points, turboshaft_id=turboshaft_id
+                ),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                name="power_for_power_rate",
+                subsys=PerformancesPowerForPowerRate(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                name="fuel_consumption",
+                subsys=PerformancesTurboshaftFuelConsumption(
+                    number_of_points=number_of_points, turboshaft_id=turboshaft_id
+                ),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                name="fuel_consumed",
+                subsys=PerformancesTurboshaftFuelConsumed(number_of_points=number_of_points),
+                promotes=["*"],
+            )
         energy_consumed = om.IndepVarComp()
         energy_consumed.add_output(
             "non_consumable_energy_t", np.full(number_of_points, 0.0), units="W*h"
@@ -108,16 +126,17 @@ class PerformancesTurboshaft(om.Group):
             energy_consumed,
             promotes=["non_consumable_energy_t"],
         )
-        self.add_subsystem(
-            name="sfc",
-            subsys=PerformancesSFC(number_of_points=number_of_points),
-            promotes=["*"],
-        )
-        self.add_subsystem(
-            name="equivalent_efficiency",
-            subsys=PerformancesEquivalentEfficiency(number_of_points=number_of_points),
-            promotes=["*"],
-        )
+        if not self.options["fused"]:
+            self.add_subsystem(
+                name="sfc",
+                subsys=PerformancesSFC(number_of_points=number_of_points),
+                promotes=["*"],
+            )
+            self.add_subsystem(
+                name="equivalent_efficiency",
+                subsys=PerformancesEquivalentEfficiency(number_of_points=number_of_points),
+                promotes=["*"],
+            )
         self.add_subsystem(
             name="max_power_itt_limit",
             subsys=PerformancesMaxPowerITTLimit(
@@ -34,6 +34,13 @@ class SizingTurboshaft(om.Group):
             + ", ".join(POSSIBLE_POSITION),
             allow_none=False,
         )
+        self.options.declare(
+            name="fused",
+            default=False,
+            types=bool,
+            desc="If True, some chains of components of the performances are replaced by a "
+            "single component giving the same results",
+        )
 
     def setup(self):
         turboshaft_id = self.options["turboshaft_id"]
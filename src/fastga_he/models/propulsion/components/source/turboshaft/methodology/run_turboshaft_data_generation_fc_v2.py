@@ -1,233 +1,73 @@
 # This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
 # Electric Aircraft.
 # Copyright (C) 2022 ISAE-SUPAERO
+import logging
+import os
 import pathlib
 import time
-import warnings
 
-import openmdao.api as om
 import numpy as np
 import pandas as pd
 
 
 from pyDOE2 import lhs
 
-from .turboshaft_components.turboshaft_geometry_computation import DesignPointCalculation
 from .turboshaft_components.turboshaft_off_design_fuel import Turboshaft
-
-
-def get_ivc_all_data(power_design, t41t_design, opr_design, altitude_design, mach_design):
-    ivc = om.IndepVarComp()
-    ivc.add_output("compressor_bleed_mass_flow", val=0.04, units="kg/s")
-    ivc.add_output("cooling_bleed_ratio", val=0.025)
-    ivc.add_output("pressurization_bleed_ratio", val=0.05)
-
-    ivc.add_output("eta_225", val=0.85)
-    ivc.add_output("eta_253", val=0.86)
-    ivc.add_output("eta_445", val=0.86)
-    ivc.add_output("eta_455", val=0.86)
-    ivc.add_output("total_pressure_loss_02", val=0.8)
-    ivc.add_output("pressure_loss_34", val=0.95)
-    ivc.add_output("combustion_energy", val=43.260e6 * 0.95, units="J/kg")
-
-    ivc.add_output("electric_power", val=0.0, units="hp")
-
-    ivc.add_output(
-        "settings:propulsion:turboprop:design_point:first_stage_pressure_ratio",
-        val=0.25,
-    )
-    ivc.add_output(
-        "settings:propulsion:turboprop:efficiency:high_pressure_axe",
-        val=0.98,
-    )
-    ivc.add_output(
-        "settings:propulsion:turboprop:efficiency:gearbox",
-        val=0.98,
-    )
-    ivc.add_output(
-        "settings:propulsion:turboprop:design_point:mach_exhaust",
-        val=0.4,
-    )
-
-    ivc.add_output(
-        "data:propulsion:turboprop:design_point:altitude",
-        val=altitude_design,
-        units="m",
-    )
-    ivc.add_output("data:propulsion:turboprop:design_point:mach", val=mach_design)
-    ivc.add_output(
-        "data:propulsion:turboprop:design_point:power",
-        val=power_design,
-        units="kW",
-    )
-    ivc.add_output(
-        "data:propulsion:turboprop:design_point:turbine_entry_temperature",
-        val=t41t_design,
-        units="degK",
-    )
-    ivc.add_output(
-        "data:propulsion:turboprop:design_point:OPR",
-        val=opr_design,
-    )
-
-    return ivc
-
-
-def run_design_point(ivc):
-    prob = om.Problem(reports=False)
-    prob.model.add_subsystem("ivc", ivc, promotes=["*"])
-    prob.model.add_subsystem(
-        "turboshaft_sizing",
-        DesignPointCalculation(number_of_points=1),
-        promotes=["*"],
-    )
-
-    prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
-    prob.model.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
-    prob.model.nonlinear_solver.options["iprint"] = 0
-    prob.model.nonlinear_solver.options["maxiter"] = 100
-    prob.model.nonlinear_solver.options["rtol"] = 1e-5
-    prob.model.nonlinear_solver.options["atol"] = 5e-5
-    prob.model.linear_solver = om.DirectSolver()
-
-    prob.setup()
-
-    prob.run_model()
-
-    alpha = prob.get_val("data:propulsion:turboprop:design_point:alpha")[0]
-    alpha_p = prob.get_val("data:propulsion:turboprop:design_point:alpha_p")[0]
-    a41 = prob.get_val("data:propulsion:turboprop:section:41", units="m**2")[0]
-    a45 = prob.get_val("data:propulsion:turboprop:section:45", units="m**2")[0]
-    a8 = prob.get_val("data:propulsion:turboprop:section:8", units="m**2")[0]
-    opr_2_opr_1 = prob.get_val("opr_2")[0] / prob.get_val("opr_1")[0]
-
-    fuel_consumed_design = prob.get_val("fuel_mass_flow", units="kg/h")[0]
-
-    _, _, residuals = prob.model.get_nonlinear_vectors()
-    norm = np.linalg.norm(residuals.asarray())
-
-    if prob.model.nonlinear_solver._iter_count < 100 and not np.isnan(norm) and not np.isinf(norm):
-        converged = [True]
-    else:
-        converged = [False]
-
-    return alpha, alpha_p, a41, a45, a8, opr_2_opr_1, fuel_consumed_design, converged
-
-
-def get_fuel_problem(ivc):
-    prob = om.Problem(reports=False)
-    prob.model.add_subsystem("ivc", ivc, promotes=["*"])
-    prob.model.add_subsystem(
-        "turboshaft_off_design_fuel",
-        Turboshaft(number_of_points=1),
-        promotes=["*"],
-    )
-
-    prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
-    prob.model.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
-    prob.model.nonlinear_solver.linesearch.options["maxiter"] = 5
-    prob.model.nonlinear_solver.linesearch.options["alpha"] = 1.5
-    prob.model.nonlinear_solver.linesearch.options["c"] = 2e-1
-    prob.model.nonlinear_solver.options["iprint"] = 0
-    prob.model.nonlinear_solver.options["maxiter"] = 100
-    prob.model.nonlinear_solver.options["rtol"] = 1e-5
-    prob.model.nonlinear_solver.options["atol"] = 1e-5
-    prob.model.linear_solver = om.DirectSolver()
-
-    return prob
+from .turboshaft_map_generation import (
+    get_design_samples,
+    get_turboshaft_inputs,
+    run_design_point,
+    run_design_samples,
+    run_off_design,
+)
 
 
 def run_off_design_fuel(
-    shaft_power_off_design: list,
-    altitude_off_design: list,
-    mach_off_design: list,
-    ivc: om.IndepVarComp,
+    shaft_power_off_design,
+    altitude_off_design,
+    mach_off_design,
+    inputs: dict,
 ):
-    fuel_consumed = []
-    exhaust_mass_flow = []
-    exhaust_velocity = []
-    p3t = []
-    t3t = []
-    converged = []
-
-    ivc.add_output("altitude", val=altitude_off_design, units="ft")
-    ivc.add_output("mach_0", val=mach_off_design)
-    ivc.add_output("required_shaft_power", val=shaft_power_off_design, units="kW")
-
-    prob = get_fuel_problem(ivc)
-
-    prob.setup()
-
-    prob.run_model()
-
-    _, _, residuals = prob.model.get_nonlinear_vectors()
-    norm = np.linalg.norm(residuals.asarray())
-
-    fuel_consumed.append(prob.get_val("fuel_mass_flow", units="kg/h")[0])
-    exhaust_mass_flow.append(
-        prob.get_val("air_mass_flow", units="kg/s")[0]
-        * (
-            1.0
-            + prob.get_val("fuel_air_ratio")[0]
-            - prob.get_val("compressor_bleed_ratio")[0]
-            - prob.get_val("pressurization_bleed_ratio")[0]
-        )
+    results, converged = run_off_design(
+        Turboshaft,
+        inputs,
+        point_inputs={
+            "altitude": (np.atleast_1d(altitude_off_design), "ft"),
+            "mach_0": (np.atleast_1d(mach_off_design), None),
+            "required_shaft_power": (np.atleast_1d(shaft_power_off_design), "kW"),
+        },
+        outputs={
+            "fuel_mass_flow": "kg/h",
+            "air_mass_flow": "kg/s",
+            "fuel_air_ratio": None,
+            "compressor_bleed_ratio": None,
+            "pressurization_bleed_ratio": None,
+            "velocity_8": "m/s",
+            "total_temperature_3": "degK",
+            "total_pressure_3": "bar",
+        },
+        linesearch_alpha=1.5,
+        atol=1e-5,
     )
-    exhaust_velocity.append(prob.get_val("velocity_8", units="m/s")[0])
-    t3t.append(prob.get_val("total_temperature_3", units="degK")[0])
-    p3t.append(prob.get_val("total_pressure_3", units="bar")[0])
 
-    if prob.model.nonlinear_solver._iter_count < 100 and not np.isnan(norm) and not np.isinf(norm):
-        converged.append(True)
-    else:
-        converged.append(False)
-        prob = get_fuel_problem(ivc)
-        prob.setup()
-
-    # i = 1
-
-    # for altitude, mach, power in zip(
-    #     altitude_off_design[1:], mach_off_design[1:], shaft_power_off_design[1:]
-    # ):
-    #     prob.set_val("altitude", val=altitude, units="ft")
-    #     prob.set_val("mach_0", val=mach)
-    #     prob.set_val("required_shaft_power", val=power, units="kW")
-    #
-    #     if i % 10 == 0:
-    #         print(str(i / 5) + " %")
-    #
-    #     prob.run_model()
-    #     _, _, residuals = prob.model.get_nonlinear_vectors()
-    #     norm = np.linalg.norm(residuals.asarray())
-    #
-    #     fuel_consumed.append(prob.get_val("fuel_mass_flow", units="kg/h")[0])
-    #     exhaust_thrust.append(prob.get_val("exhaust_thrust", units="N")[0])
-    #     t3t.append(prob.get_val("total_temperature_3", units="degK")[0])
-    #     p3t.append(prob.get_val("total_pressure_3", units="bar")[0])
-    #
-    #     if (
-    #         prob.model.nonlinear_solver._iter_count < 100
-    #         and not np.isnan(norm)
-    #         and not np.isinf(norm)
-    #     ):
-    #         converged.append(True)
-    #     else:
-    #         converged.append(False)
-    #         prob = get_fuel_problem(ivc)
-    #         prob.setup()
-    #
-    #         print(
-    #             prob.model.nonlinear_solver._iter_count < 100
-    #             and not np.isnan(norm)
-    #             and not np.isinf(norm)
-    #         )
-    #
-    #     i += 1
+    exhaust_mass_flow = results["air_mass_flow"] * (
+        1.0
+        + results["fuel_air_ratio"]
+        - results["compressor_bleed_ratio"]
+        - results["pressurization_bleed_ratio"]
+    )
 
-    return converged, fuel_consumed, exhaust_mass_flow, exhaust_velocity, t3t, p3t
+    return (
+        converged,
+        results["fuel_mass_flow"],
+        exhaust_mass_flow,
+        results["velocity_8"],
+        results["total_temperature_3"],
+        results["total_pressure_3"],
+    )
 
 
-def run_and_save_turboshaft_full_performances(
+def compute_turboshaft_fuel_consumed(
     power_design,
     t41t_design,
     opr_design,
@@ -235,8 +75,6 @@ def run_and_save_turboshaft_full_performances(
     altitude,
     mach,
     power_rate,
-    data_folder_pth,
-    save=True,
 ):
     print("Design thermodynamic power: " + str(power_design) + " kW")
     print("Design TET: " + str(t41t_design) + " degK")
@@ -248,25 +86,9 @@ def run_and_save_turboshaft_full_performances(
     print("Mach (-):", mach)
     print("Power rate (-):", power_rate)
 
-    data_ivc = get_ivc_all_data(power_design, t41t_design, opr_design, 0.0, 0.0)
-
-    (
-        alpha,
-        alpha_p,
-        a41,
-        a45,
-        a8,
-        opr_2_opr_1,
-        fuel_consumed_design,
-        design_converged,
-    ) = run_design_point(data_ivc)
-
-    data_ivc.add_output("data:propulsion:turboprop:section:41", val=a41, units="m**2")
-    data_ivc.add_output("data:propulsion:turboprop:section:45", val=a45, units="m**2")
-    data_ivc.add_output("data:propulsion:turboprop:section:8", val=a8, units="m**2")
-    data_ivc.add_output("data:propulsion:turboprop:design_point:alpha", val=alpha)
-    data_ivc.add_output("data:propulsion:turboprop:design_point:alpha_p", val=alpha_p)
-    data_ivc.add_output("data:propulsion:turboprop:design_point:opr_2_opr_1", val=opr_2_opr_1)
+    inputs = get_turboshaft_inputs(power_design, t41t_design, opr_design, 0.0, 0.0)
+
+    inputs, fuel_consumed_design, design_converged = run_design_point(inputs)
 
     # fig = go.Figure()
     #
@@ -291,7 +113,7 @@ def run_and_save_turboshaft_full_performances(
     #
     # fig.show()
 
-    if design_converged[0]:
+    if design_converged:
         (
             converged,
             fuel_consumed,
@@ -299,10 +121,10 @@ def run_and_save_turboshaft_full_performances(
             exhaust_velocity,
             t3t,
             p3t,
-        ) = run_off_design_fuel(power_rate * shaft_power_limit, altitude, mach, data_ivc)
+        ) = run_off_design_fuel(power_rate * shaft_power_limit, altitude, mach, inputs)
     else:
         _, fuel_consumed, exhaust_mass_flow, exhaust_velocity, t3t, p3t = run_off_design_fuel(
-            power_rate * shaft_power_limit, altitude, mach, data_ivc
+            power_rate * shaft_power_limit, altitude, mach, inputs
         )
         converged = [False]
 
@@ -363,25 +185,24 @@ def run_and_save_turboshaft_full_performances(
         ],
     )
 
-    result_file_path_fc = data_folder_pth / "fuel_consumed_v2.csv"
+    return result_dataframe_fc
 
-    if save:
-        if result_file_path_fc.exists():
-            existing_data = pd.read_csv(result_file_path_fc, index_col=0)
-            stacked_dataframe = pd.concat([existing_data, result_dataframe_fc], axis=0)
-            stacked_dataframe.to_csv(result_file_path_fc)
 
-        else:
-            result_dataframe_fc.to_csv(result_file_path_fc)
-    else:
-        print(altitude, mach, power_rate * shaft_power_limit, fuel_consumed)
+def run_design_sample(turboshaft_design_parameter):
+    result_dataframe_fc = compute_turboshaft_fuel_consumed(
+        turboshaft_design_parameter[1],
+        turboshaft_design_parameter[5] + 273.15,
+        turboshaft_design_parameter[2],
+        turboshaft_design_parameter[0],
+        turboshaft_design_parameter[6],
+        turboshaft_design_parameter[7],
+        turboshaft_design_parameter[8],
+    )
 
+    return {"fuel_consumed_v2.csv": result_dataframe_fc}
 
-if __name__ == "__main__":
-    path_to_current_file = pathlib.Path(__file__)
-    parent_folder = path_to_current_file.parents[0]
-    data_folder_path = parent_folder / "data"
 
+def draw_design_samples():
     doeX = lhs(9, samples=10, criterion="correlation")
 
     power_min_kW, power_max_kW = (190.0, 354.0)
@@ -418,19 +239,28 @@ if __name__ == "__main__":
     doeX[:, 7] = doeX[:, 7] * (mach_max - mach_min) + mach_min
     doeX[:, 8] = doeX[:, 8] * (power_rate_max - power_rate_min) + power_rate_min
 
-    for turboshaft_design_parameter in doeX:
-        t1 = time.time()
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            run_and_save_turboshaft_full_performances(
-                turboshaft_design_parameter[1],
-                turboshaft_design_parameter[5] + 273.15,
-                turboshaft_design_parameter[2],
-                turboshaft_design_parameter[0],
-                turboshaft_design_parameter[6],
-                turboshaft_design_parameter[7],
-                turboshaft_design_parameter[8],
-                data_folder_path,
-            )
-        t2 = time.time()
-        print("Turboprop done after " + str(t2 - t1) + " s!")
+    return doeX
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    path_to_current_file = pathlib.Path(__file__)
+    parent_folder = path_to_current_file.parents[0]
+    data_folder_path = parent_folder / "data"
+
+    # The samples are saved so that an interrupted generation resumes on the same samples
+    design_samples = get_design_samples(
+        data_folder_path / "fuel_consumed_v2_design_samples.csv", draw_design_samples
+    )
+
+    t1 = time.time()
+    run_design_samples(
+        run_design_sample,
+        design_samples,
+        data_folder_path,
+        progress_file_name="fuel_consumed_v2_design_samples_done.txt",
+        number_of_processes=os.cpu_count(),
+    )
+    t2 = time.time()
+    print("Turboprops done after " + str(t2 - t1) + " s!")
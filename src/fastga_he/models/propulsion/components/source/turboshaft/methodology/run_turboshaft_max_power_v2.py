@@ -2,190 +2,71 @@
 # Electric Aircraft.
 # Copyright (C) 2022 ISAE-SUPAERO
 
-import copy
+import logging
+import os
 import pathlib
 import time
-import warnings
 
-import openmdao.api as om
 import numpy as np
 import pandas as pd
 
 from pyDOE2 import lhs
 
-from .turboshaft_components.turboshaft_geometry_computation import DesignPointCalculation
 from .turboshaft_components.turboshaft_off_design_max_power import (
     TurboshaftMaxPowerOPRLimit,
     TurboshaftMaxPowerITTLimit,
 )
+from .turboshaft_map_generation import (
+    get_design_samples,
+    get_turboshaft_inputs,
+    run_design_point,
+    run_design_samples,
+    run_off_design,
+)
 
 
-def get_ivc_all_data(
+def get_inputs_all_data(
     power_design, t41t_design, opr_design, altitude_design, mach_design, opr_limit, itt_limit
 ):
-    ivc = om.IndepVarComp()
-    ivc.add_output("compressor_bleed_mass_flow", val=0.04, units="kg/s")
-    ivc.add_output("cooling_bleed_ratio", val=0.025)
-    ivc.add_output("pressurization_bleed_ratio", val=0.05)
-
-    ivc.add_output("eta_225", val=0.85)
-    ivc.add_output("eta_253", val=0.86)
-    ivc.add_output("eta_445", val=0.86)
-    ivc.add_output("eta_455", val=0.86)
-    ivc.add_output("total_pressure_loss_02", val=0.8)
-    ivc.add_output("pressure_loss_34", val=0.95)
-    ivc.add_output("combustion_energy", val=43.260e6 * 0.95, units="J/kg")
-
-    ivc.add_output("electric_power", val=0.0, units="hp")
-
-    ivc.add_output(
-        "settings:propulsion:turboprop:design_point:first_stage_pressure_ratio",
-        val=0.25,
-    )
-    ivc.add_output(
-        "settings:propulsion:turboprop:efficiency:high_pressure_axe",
-        val=0.98,
-    )
-    ivc.add_output(
-        "settings:propulsion:turboprop:efficiency:gearbox",
-        val=0.98,
-    )
-    ivc.add_output(
-        "settings:propulsion:turboprop:design_point:mach_exhaust",
-        val=0.4,
-    )
-
-    ivc.add_output(
-        "data:propulsion:turboprop:design_point:altitude",
-        val=altitude_design,
-        units="m",
-    )
-    ivc.add_output("data:propulsion:turboprop:design_point:mach", val=mach_design)
-    ivc.add_output(
-        "data:propulsion:turboprop:design_point:power",
-        val=power_design,
-        units="kW",
-    )
-    ivc.add_output(
-        "data:propulsion:turboprop:design_point:turbine_entry_temperature",
-        val=t41t_design,
-        units="degK",
+    inputs = get_turboshaft_inputs(
+        power_design, t41t_design, opr_design, altitude_design, mach_design
     )
-    ivc.add_output(
-        "data:propulsion:turboprop:design_point:OPR",
-        val=opr_design,
+    inputs["itt_limit"] = (itt_limit, "degK")
+    inputs["opr_limit"] = (opr_limit, None)
+
+    return inputs
+
+
+def run_max_power_opr_limit(altitude_off_design, mach_off_design, inputs: dict):
+    results, converged = run_off_design(
+        TurboshaftMaxPowerOPRLimit,
+        inputs,
+        point_inputs={
+            "altitude": (np.atleast_1d(altitude_off_design), "ft"),
+            "mach_0": (np.atleast_1d(mach_off_design), None),
+        },
+        outputs={"required_shaft_power": "kW"},
+        linesearch_alpha=1.7,
+        atol=5e-5,
     )
-    ivc.add_output("itt_limit", val=itt_limit, units="degK")
-    ivc.add_output("opr_limit", val=opr_limit)
 
-    return ivc
+    return results["required_shaft_power"][0], converged[0]
 
 
-def run_design_point(ivc):
-    prob = om.Problem(reports=False)
-    prob.model.add_subsystem("ivc", ivc, promotes=["*"])
-    prob.model.add_subsystem(
-        "turboshaft_sizing",
-        DesignPointCalculation(number_of_points=1),
-        promotes=["*"],
+def run_max_power_itt_limit(altitude_off_design, mach_off_design, inputs: dict):
+    results, converged = run_off_design(
+        TurboshaftMaxPowerITTLimit,
+        inputs,
+        point_inputs={
+            "altitude": (np.atleast_1d(altitude_off_design), "ft"),
+            "mach_0": (np.atleast_1d(mach_off_design), None),
+        },
+        outputs={"required_shaft_power": "kW"},
+        linesearch_alpha=1.7,
+        atol=5e-5,
     )
 
-    prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
-    prob.model.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
-    prob.model.nonlinear_solver.options["iprint"] = 0
-    prob.model.nonlinear_solver.options["maxiter"] = 100
-    prob.model.nonlinear_solver.options["rtol"] = 1e-5
-    prob.model.nonlinear_solver.options["atol"] = 5e-5
-    prob.model.linear_solver = om.DirectSolver()
-
-    prob.setup()
-
-    prob.run_model()
-
-    alpha = prob.get_val("data:propulsion:turboprop:design_point:alpha")[0]
-    alpha_p = prob.get_val("data:propulsion:turboprop:design_point:alpha_p")[0]
-    a41 = prob.get_val("data:propulsion:turboprop:section:41", units="m**2")[0]
-    a45 = prob.get_val("data:propulsion:turboprop:section:45", units="m**2")[0]
-    a8 = prob.get_val("data:propulsion:turboprop:section:8", units="m**2")[0]
-    opr_2_opr_1 = prob.get_val("opr_2")[0] / prob.get_val("opr_1")[0]
-
-    fuel_consumed_design = prob.get_val("fuel_mass_flow", units="kg/h")[0]
-
-    return alpha, alpha_p, a41, a45, a8, opr_2_opr_1, fuel_consumed_design
-
-
-def run_max_power_opr_limit(altitude_off_design: list, mach_off_design: list, ivc: om.IndepVarComp):
-    ivc.add_output("altitude", val=altitude_off_design, units="ft")
-    ivc.add_output("mach_0", val=mach_off_design)
-
-    prob = om.Problem(reports=False)
-    prob.model.add_subsystem("ivc", ivc, promotes=["*"])
-    prob.model.add_subsystem(
-        "turboshaft_off_design_max_power_opr_limit",
-        TurboshaftMaxPowerOPRLimit(number_of_points=1),
-        promotes=["*"],
-    )
-
-    prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
-    prob.model.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
-    prob.model.nonlinear_solver.linesearch.options["maxiter"] = 5
-    prob.model.nonlinear_solver.linesearch.options["alpha"] = 1.7
-    prob.model.nonlinear_solver.linesearch.options["c"] = 2e-1
-    prob.model.nonlinear_solver.options["iprint"] = 0
-    prob.model.nonlinear_solver.options["maxiter"] = 100
-    prob.model.nonlinear_solver.options["rtol"] = 1e-5
-    prob.model.nonlinear_solver.options["atol"] = 5e-5
-    prob.model.linear_solver = om.DirectSolver()
-
-    prob.setup()
-
-    prob.run_model()
-    _, _, residuals = prob.model.get_nonlinear_vectors()
-    norm = np.linalg.norm(residuals.asarray())
-
-    max_power = prob.get_val("required_shaft_power", units="kW")[0]
-
-    if prob.model.nonlinear_solver._iter_count < 100 and not np.isnan(norm) and not np.isinf(norm):
-        return max_power, True
-    else:
-        return max_power, False
-
-
-def run_max_power_itt_limit(altitude_off_design: list, mach_off_design: list, ivc: om.IndepVarComp):
-    ivc.add_output("altitude", val=altitude_off_design, units="ft")
-    ivc.add_output("mach_0", val=mach_off_design)
-
-    prob = om.Problem(reports=False)
-    prob.model.add_subsystem("ivc", ivc, promotes=["*"])
-    prob.model.add_subsystem(
-        "turboshaft_off_design_max_power_opr_limit",
-        TurboshaftMaxPowerITTLimit(number_of_points=1),
-        promotes=["*"],
-    )
-
-    prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
-    prob.model.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
-    prob.model.nonlinear_solver.linesearch.options["maxiter"] = 5
-    prob.model.nonlinear_solver.linesearch.options["alpha"] = 1.7
-    prob.model.nonlinear_solver.linesearch.options["c"] = 2e-1
-    prob.model.nonlinear_solver.options["iprint"] = 0
-    prob.model.nonlinear_solver.options["maxiter"] = 100
-    prob.model.nonlinear_solver.options["rtol"] = 1e-5
-    prob.model.nonlinear_solver.options["atol"] = 5e-5
-    prob.model.linear_solver = om.DirectSolver()
-
-    prob.setup()
-
-    prob.run_model()
-    _, _, residuals = prob.model.get_nonlinear_vectors()
-    norm = np.linalg.norm(residuals.asarray())
-
-    max_power = prob.get_val("required_shaft_power", units="kW")[0]
-
-    if prob.model.nonlinear_solver._iter_count < 100 and not np.isnan(norm) and not np.isinf(norm):
-        return max_power, True
-    else:
-        return max_power, False
+    return results["required_shaft_power"][0], converged[0]
 
 
 def run_turboshaft_max_power(
@@ -205,34 +86,70 @@ def run_turboshaft_max_power(
     print("Limit OPR: " + str(opr_limit))
     print("Limit ITT: " + str(itt_limit) + " degK")
 
-    data_ivc = get_ivc_all_data(
+    inputs = get_inputs_all_data(
         power_design, t41t_design, opr_design, 0.0, 0.0, opr_limit, itt_limit
     )
 
-    alpha, alpha_p, a41, a45, a8, opr_2_opr_1, fuel_consumed_design = run_design_point(data_ivc)
+    inputs, _, _ = run_design_point(inputs)
 
-    data_ivc.add_output("data:propulsion:turboprop:section:41", val=a41, units="m**2")
-    data_ivc.add_output("data:propulsion:turboprop:section:45", val=a45, units="m**2")
-    data_ivc.add_output("data:propulsion:turboprop:section:8", val=a8, units="m**2")
-    data_ivc.add_output("data:propulsion:turboprop:design_point:alpha", val=alpha)
-    data_ivc.add_output("data:propulsion:turboprop:design_point:alpha_p", val=alpha_p)
-    data_ivc.add_output("data:propulsion:turboprop:design_point:opr_2_opr_1", val=opr_2_opr_1)
-
-    data_ivc_bis = copy.deepcopy(data_ivc)
-
-    max_power_opr, converged_opr = run_max_power_opr_limit(altitude, mach, data_ivc)
-    max_power_itt, converged_itt = run_max_power_itt_limit(altitude, mach, data_ivc_bis)
+    max_power_opr, converged_opr = run_max_power_opr_limit(altitude, mach, inputs)
+    max_power_itt, converged_itt = run_max_power_itt_limit(altitude, mach, inputs)
 
     converged_max_power = converged_opr & converged_itt
 
     return max_power_opr, max_power_itt, converged_max_power
 
 
-if __name__ == "__main__":
-    path_to_current_file = pathlib.Path(__file__)
-    parent_folder = path_to_current_file.parents[0]
-    data_folder_path = parent_folder / "data"
+def run_design_sample(turboshaft_design_parameter):
+    max_power_opr, max_power_itt, converged = run_turboshaft_max_power(
+        turboshaft_design_parameter[1],
+        turboshaft_design_parameter[5] + 273.15,
+        turboshaft_design_parameter[2],
+        turboshaft_design_parameter[3],
+        turboshaft_design_parameter[4] + 273.15,
+        turboshaft_design_parameter[6],
+        turboshaft_design_parameter[7],
+    )
+
+    data = np.array(
+        [
+            [
+                turboshaft_design_parameter[1],
+                turboshaft_design_parameter[5] + 273.15,
+                turboshaft_design_parameter[2],
+                0.0,
+                0.0,
+                turboshaft_design_parameter[3],
+                turboshaft_design_parameter[4] + 273.15,
+                turboshaft_design_parameter[6],
+                turboshaft_design_parameter[7],
+                max_power_opr,
+                max_power_itt,
+            ]
+        ]
+    )
+
+    result_dataframe_max_power = pd.DataFrame(
+        data[np.array([converged])],
+        columns=[
+            "Design Power (kW)",
+            "Design T41t (degK)",
+            "Design OPR (-)",
+            "Design altitude (ft)",
+            "Design Mach (-)",
+            "Limit OPR (-)",
+            "Limit ITT (degK)",
+            "Altitude (ft)",
+            "Mach (-)",
+            "Max Power OPR Limit (kW)",
+            "Max Power ITT Limit (kW)",
+        ],
+    )
+
+    return {"max_power_v2.csv": result_dataframe_max_power}
 
+
+def draw_design_samples():
     doeX = lhs(8, samples=500, criterion="correlation")
 
     power_min_kW, power_max_kW = (354.0, 1268.0)
@@ -267,88 +184,28 @@ if __name__ == "__main__":
     doeX[:, 6] = doeX[:, 6] * (altitude_max - altitude_min) + altitude_min
     doeX[:, 7] = doeX[:, 7] * (mach_max - mach_min) + mach_min
 
-    max_power_opr_list = []
-    max_power_itt_list = []
-    rated_power = []
-    thermodynamic_power_design = []
-    opr_design_list = []
-    opr_limit_list = []
-    itt_limit_list = []
-    tet_design = []
-    altitude_list = []
-    mach_list = []
-
-    for turboshaft_design_parameter in doeX:
-        try:
-            t1 = time.time()
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                max_power_opr, max_power_itt, converged = run_turboshaft_max_power(
-                    turboshaft_design_parameter[1],
-                    turboshaft_design_parameter[5] + 273.15,
-                    turboshaft_design_parameter[2],
-                    turboshaft_design_parameter[3],
-                    turboshaft_design_parameter[4] + 273.15,
-                    turboshaft_design_parameter[6],
-                    turboshaft_design_parameter[7],
-                )
-
-                if converged:
-                    max_power_opr_list.append(max_power_opr)
-                    max_power_itt_list.append(max_power_itt)
-                    rated_power.append(turboshaft_design_parameter[0])
-                    thermodynamic_power_design.append(turboshaft_design_parameter[1])
-                    opr_design_list.append(turboshaft_design_parameter[2])
-                    opr_limit_list.append(turboshaft_design_parameter[3])
-                    itt_limit_list.append(turboshaft_design_parameter[4] + 273.15)
-                    tet_design.append(turboshaft_design_parameter[5] + 273.15)
-                    altitude_list.append(turboshaft_design_parameter[6])
-                    mach_list.append(turboshaft_design_parameter[7])
-
-            t2 = time.time()
-
-            print("Turboprop done after " + str(t2 - t1) + " s!")
-        # Bad, I know
-        except:  # noqa: E722
-            pass
-
-    data = np.c_[
-        np.array(thermodynamic_power_design),
-        np.array(tet_design),
-        np.array(opr_design_list),
-        np.zeros_like(np.array(thermodynamic_power_design)),
-        np.zeros_like(np.array(thermodynamic_power_design)),
-        np.array(opr_limit_list),
-        np.array(itt_limit_list),
-        np.array(altitude_list),
-        np.array(mach_list),
-        np.array(max_power_opr_list),
-        np.array(max_power_itt_list),
-    ]
-
-    result_file_path_max_power = data_folder_path / "max_power_v2.csv"
+    return doeX
 
-    result_dataframe_max_power = pd.DataFrame(
-        data,
-        columns=[
-            "Design Power (kW)",
-            "Design T41t (degK)",
-            "Design OPR (-)",
-            "Design altitude (ft)",
-            "Design Mach (-)",
-            "Limit OPR (-)",
-            "Limit ITT (degK)",
-            "Altitude (ft)",
-            "Mach (-)",
-            "Max Power OPR Limit (kW)",
-            "Max Power ITT Limit (kW)",
-        ],
-    )
 
-    if result_file_path_max_power.exists():
-        existing_data = pd.read_csv(result_file_path_max_power, index_col=0)
-        stacked_dataframe = pd.concat([existing_data, result_dataframe_max_power], axis=0)
-        stacked_dataframe.to_csv(result_file_path_max_power)
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
 
-    else:
-        result_dataframe_max_power.to_csv(result_file_path_max_power)
+    path_to_current_file = pathlib.Path(__file__)
+    parent_folder = path_to_current_file.parents[0]
+    data_folder_path = parent_folder / "data"
+
+    # The samples are saved so that an interrupted generation resumes on the same samples
+    design_samples = get_design_samples(
+        data_folder_path / "max_power_v2_design_samples.csv", draw_design_samples
+    )
+
+    t1 = time.time()
+    run_design_samples(
+        run_design_sample,
+        design_samples,
+        data_folder_path,
+        progress_file_name="max_power_v2_design_samples_done.txt",
+        number_of_processes=os.cpu_count(),
+    )
+    t2 = time.time()
+    print("Turboprops done after " + str(t2 - t1) + " s!")
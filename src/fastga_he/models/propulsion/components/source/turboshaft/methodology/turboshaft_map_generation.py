@@ -0,0 +1,373 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import logging
+import multiprocessing
+import pathlib
+import traceback
+import warnings
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import openmdao.api as om
+import pandas as pd
+
+from .turboshaft_components.turboshaft_geometry_computation import DesignPointCalculation
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_ITERATIONS = 100
+
+# Off-design points solved in the same problem. The jacobian of the off-design problem is dense,
+# so its cost grows quickly with the number of points. Solving the points by chunks keeps most of
+# the gain of the vectorization while limiting that cost.
+DEFAULT_POINTS_PER_CHUNK = 25
+
+
+def get_turboshaft_inputs(
+    power_design, t41t_design, opr_design, altitude_design, mach_design
+) -> Dict[str, Tuple[float, Optional[str]]]:
+    """
+    Returns the inputs of the design point and off-design computations of the turboshaft, as a
+    dict with the name of the input as key and its value and units as value.
+
+    :param power_design: thermodynamic power at the design point, in kW.
+    :param t41t_design: turbine entry temperature at the design point, in degK.
+    :param opr_design: overall pressure ratio at the design point.
+    :param altitude_design: altitude of the design point, in m.
+    :param mach_design: Mach number of the design point.
+    """
+
+    return {
+        "compressor_bleed_mass_flow": (0.04, "kg/s"),
+        "cooling_bleed_ratio": (0.025, None),
+        "pressurization_bleed_ratio": (0.05, None),
+        "eta_225": (0.85, None),
+        "eta_253": (0.86, None),
+        "eta_445": (0.86, None),
+        "eta_455": (0.86, None),
+        "total_pressure_loss_02": (0.8, None),
+        "pressure_loss_34": (0.95, None),
+        "combustion_energy": (43.260e6 * 0.95, "J/kg"),
+        "electric_power": (0.0, "hp"),
+        "settings:propulsion:turboprop:design_point:first_stage_pressure_ratio": (0.25, None),
+        "settings:propulsion:turboprop:efficiency:high_pressure_axe": (0.98, None),
+        "settings:propulsion:turboprop:efficiency:gearbox": (0.98, None),
+        "settings:propulsion:turboprop:design_point:mach_exhaust": (0.4, None),
+        "data:propulsion:turboprop:design_point:altitude": (altitude_design, "m"),
+        "data:propulsion:turboprop:design_point:mach": (mach_design, None),
+        "data:propulsion:turboprop:design_point:power": (power_design, "kW"),
+        "data:propulsion:turboprop:design_point:turbine_entry_temperature": (t41t_design, "degK"),
+        "data:propulsion:turboprop:design_point:OPR": (opr_design, None),
+    }
+
+
+def run_design_point(inputs: dict) -> Tuple[dict, float, bool]:
+    """
+    Sizes the turboshaft at its design point. Returns the inputs completed with the geometry of
+    the turboshaft, as needed for the off-design computations, the fuel consumed at the design
+    point, in kg/h, and whether the computation converged.
+
+    :param inputs: inputs of the turboshaft, as given by get_turboshaft_inputs.
+    """
+
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem(
+        "turboshaft_sizing",
+        DesignPointCalculation(number_of_points=1),
+        promotes=["*"],
+    )
+
+    prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
+    prob.model.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
+    prob.model.nonlinear_solver.options["iprint"] = 0
+    prob.model.nonlinear_solver.options["maxiter"] = MAX_ITERATIONS
+    prob.model.nonlinear_solver.options["rtol"] = 1e-5
+    prob.model.nonlinear_solver.options["atol"] = 5e-5
+    prob.model.linear_solver = om.DirectSolver()
+
+    prob.setup()
+    _set_inputs(prob, inputs)
+
+    prob.run_model()
+
+    design_inputs = dict(inputs)
+    design_inputs["data:propulsion:turboprop:section:41"] = (
+        prob.get_val("data:propulsion:turboprop:section:41", units="m**2")[0],
+        "m**2",
+    )
+    design_inputs["data:propulsion:turboprop:section:45"] = (
+        prob.get_val("data:propulsion:turboprop:section:45", units="m**2")[0],
+        "m**2",
+    )
+    design_inputs["data:propulsion:turboprop:section:8"] = (
+        prob.get_val("data:propulsion:turboprop:section:8", units="m**2")[0],
+        "m**2",
+    )
+    design_inputs["data:propulsion:turboprop:design_point:alpha"] = (
+        prob.get_val("data:propulsion:turboprop:design_point:alpha")[0],
+        None,
+    )
+    design_inputs["data:propulsion:turboprop:design_point:alpha_p"] = (
+        prob.get_val("data:propulsion:turboprop:design_point:alpha_p")[0],
+        None,
+    )
+    design_inputs["data:propulsion:turboprop:design_point:opr_2_opr_1"] = (
+        prob.get_val("opr_2")[0] / prob.get_val("opr_1")[0],
+        None,
+    )
+
+    fuel_consumed_design = prob.get_val("fuel_mass_flow", units="kg/h")[0]
+
+    return design_inputs, fuel_consumed_design, _has_converged(prob)
+
+
+def run_off_design(
+    off_design_class,
+    inputs: dict,
+    point_inputs: dict,
+    outputs: dict,
+    linesearch_alpha: float = 1.5,
+    atol: float = 1e-5,
+    points_per_chunk: int = DEFAULT_POINTS_PER_CHUNK,
+) -> Tuple[dict, np.ndarray]:
+    """
+    Computes the off-design performances of a turboshaft at several points. Rather than running
+    a problem for each point, the points are solved together, by chunks of points_per_chunk, in
+    a problem with as many points. If the computation of a chunk doesn't converge, its points are
+    solved one by one, as it may be due to a single point, so that only the points that don't
+    converge on their own are lost.
+
+    Returns the value of the outputs at each point, as a dict with the name of the output as key,
+    and an array telling whether the computation converged at each point.
+
+    :param off_design_class: group for the off-design computation, which must accept a
+    number_of_points option, e.g. Turboshaft or TurboshaftMaxPowerOPRLimit.
+    :param inputs: inputs of the turboshaft that are the same at all points, completed with its
+    geometry, as given by run_design_point.
+    :param point_inputs: inputs that change from one point to the other, as a dict with the name
+    of the input as key and its values and units as value.
+    :param outputs: outputs to return, as a dict with their name as key and their units as value.
+    :param linesearch_alpha: initial step of the line search of the Newton solver.
+    :param atol: absolute tolerance of the Newton solver.
+    :param points_per_chunk: maximum number of points solved in the same problem.
+    """
+
+    number_of_points = len(next(iter(point_inputs.values()))[0])
+
+    results = {output_name: np.zeros(number_of_points) for output_name in outputs}
+    converged = np.zeros(number_of_points, dtype=bool)
+
+    # Problems are kept from one chunk to the other so that they are only setup once per size
+    problems = {}
+
+    for chunk_start in range(0, number_of_points, points_per_chunk):
+        chunk = slice(chunk_start, min(chunk_start + points_per_chunk, number_of_points))
+        chunk_size = chunk.stop - chunk.start
+
+        if chunk_size not in problems:
+            problems[chunk_size] = _get_off_design_problem(
+                off_design_class, chunk_size, inputs, linesearch_alpha, atol
+            )
+        prob = problems[chunk_size]
+
+        for input_name, (values, units) in point_inputs.items():
+            prob.set_val(input_name, np.asarray(values)[chunk], units=units)
+        prob.run_model()
+
+        if _has_converged(prob):
+            for output_name, units in outputs.items():
+                results[output_name][chunk] = prob.get_val(output_name, units=units)
+            converged[chunk] = True
+            continue
+
+        # The values in the failed problem may be far from any solution, so it is not reused
+        del problems[chunk_size]
+
+        for point_idx in range(chunk.start, chunk.stop):
+            if 1 not in problems:
+                problems[1] = _get_off_design_problem(
+                    off_design_class, 1, inputs, linesearch_alpha, atol
+                )
+            prob = problems[1]
+
+            for input_name, (values, units) in point_inputs.items():
+                prob.set_val(input_name, np.asarray(values)[point_idx], units=units)
+            prob.run_model()
+
+            for output_name, units in outputs.items():
+                results[output_name][point_idx] = prob.get_val(output_name, units=units)[0]
+            converged[point_idx] = _has_converged(prob)
+
+            if not converged[point_idx]:
+                del problems[1]
+
+    return results, converged
+
+
+def get_design_samples(design_samples_file_path, draw_design_samples: Callable) -> np.ndarray:
+    """
+    Returns the design samples of a map generation. They are drawn and saved in a file the first
+    time, and read from that file afterward, so that an interrupted generation can be resumed on
+    the same samples.
+
+    :param design_samples_file_path: path to the file where the samples are saved.
+    :param draw_design_samples: function with no argument that draws the samples, as a 2D array
+    with one row per sample.
+    """
+
+    design_samples_file_path = pathlib.Path(design_samples_file_path)
+
+    if design_samples_file_path.exists():
+        return pd.read_csv(design_samples_file_path, index_col=0).to_numpy()
+
+    design_samples = np.asarray(draw_design_samples())
+    design_samples_file_path.parent.mkdir(parents=True, exist_ok=True)
+    pd.DataFrame(design_samples).to_csv(design_samples_file_path)
+
+    return design_samples
+
+
+def run_design_samples(
+    run_design_sample: Callable,
+    design_samples,
+    results_folder_path,
+    progress_file_name: str,
+    number_of_processes: int = 1,
+):
+    """
+    Runs a function on each design sample and appends the results to csv files as soon as a
+    sample is done. The samples are distributed over a pool of processes and only the main
+    process writes in the files.
+
+    The index of the samples done is saved in a progress file, the samples already in it are
+    skipped, so that an interrupted generation can be resumed by calling this function again
+    with the same samples. A sample which raises an error is logged and not saved as done, so
+    that it is tried again when resuming.
+
+    :param run_design_sample: function that takes a design sample and returns its results as a
+    dict with the name of the csv file as key and the results, as a DataFrame, as value. It must
+    be defined at the top level of a module to be sent to the other processes.
+    :param design_samples: design samples, one row per sample.
+    :param results_folder_path: path to the folder where the results and the progress file are
+    written.
+    :param progress_file_name: name of the file with the index of the samples done.
+    :param number_of_processes: number of processes to run the samples on, if 1, the samples are
+    run in the current process.
+    """
+
+    results_folder_path = pathlib.Path(results_folder_path)
+    results_folder_path.mkdir(parents=True, exist_ok=True)
+    progress_file_path = results_folder_path / progress_file_name
+
+    samples_done = set()
+    if progress_file_path.exists():
+        samples_done = {int(line) for line in progress_file_path.read_text().split()}
+
+    tasks = [
+        (run_design_sample, sample_idx, design_sample)
+        for sample_idx, design_sample in enumerate(design_samples)
+        if sample_idx not in samples_done
+    ]
+
+    if samples_done:
+        _LOGGER.info(
+            "%d design samples already done, %d left to run", len(samples_done), len(tasks)
+        )
+
+    if number_of_processes == 1:
+        for sample_idx, results, error in map(_run_design_sample_task, tasks):
+            _save_design_sample_results(
+                results_folder_path, progress_file_path, sample_idx, results, error
+            )
+
+    else:
+        with multiprocessing.Pool(number_of_processes) as pool:
+            for sample_idx, results, error in pool.imap_unordered(_run_design_sample_task, tasks):
+                _save_design_sample_results(
+                    results_folder_path, progress_file_path, sample_idx, results, error
+                )
+
+
+def _run_design_sample_task(task):
+    run_design_sample, sample_idx, design_sample = task
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return sample_idx, run_design_sample(design_sample), None
+
+    # Any error is sent back so that one sample can't stop the generation
+    except Exception:  # noqa
+        return sample_idx, None, traceback.format_exc()
+
+
+def _save_design_sample_results(
+    results_folder_path: pathlib.Path,
+    progress_file_path: pathlib.Path,
+    sample_idx: int,
+    results: Optional[dict],
+    error: Optional[str],
+):
+    if error is not None:
+        _LOGGER.warning("Design sample %d failed:\n%s", sample_idx, error)
+        return
+
+    for results_file_name, results_df in results.items():
+        results_file_path = results_folder_path / results_file_name
+        results_df.to_csv(results_file_path, mode="a", header=not results_file_path.exists())
+
+    # Written after the results so that a sample is only seen as done once its results are saved
+    with open(progress_file_path, "a") as progress_file:
+        progress_file.write(str(sample_idx) + "\n")
+
+    _LOGGER.info("Design sample %d done", sample_idx)
+
+
+def _get_off_design_problem(
+    off_design_class, number_of_points: int, inputs: dict, linesearch_alpha: float, atol: float
+) -> om.Problem:
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem(
+        "turboshaft_off_design",
+        off_design_class(number_of_points=number_of_points),
+        promotes=["*"],
+    )
+
+    prob.model.nonlinear_solver = om.NewtonSolver(solve_subsystems=True)
+    prob.model.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
+    prob.model.nonlinear_solver.linesearch.options["maxiter"] = 5
+    prob.model.nonlinear_solver.linesearch.options["alpha"] = linesearch_alpha
+    prob.model.nonlinear_solver.linesearch.options["c"] = 2e-1
+    prob.model.nonlinear_solver.options["iprint"] = 0
+    prob.model.nonlinear_solver.options["maxiter"] = MAX_ITERATIONS
+    prob.model.nonlinear_solver.options["rtol"] = 1e-5
+    prob.model.nonlinear_solver.options["atol"] = atol
+    prob.model.linear_solver = om.DirectSolver()
+
+    prob.setup()
+    _set_inputs(prob, inputs)
+
+    return prob
+
+
+def _set_inputs(prob: om.Problem, inputs: dict):
+    # The inputs are not given with an IndepVarComp but set on the automatic one so that the
+    # scalar inputs are broadcast to the number of points of the variables they are connected
+    # to. Inputs not used by the problem are skipped so that the same dict can be used for all
+    # the computations.
+    input_names = {
+        metadata["prom_name"] for metadata in prob.model.get_io_metadata(iotypes="input").values()
+    }
+
+    for input_name, (value, units) in inputs.items():
+        if input_name in input_names:
+            prob.set_val(input_name, value, units=units)
+
+
+def _has_converged(prob: om.Problem) -> bool:
+    _, _, residuals = prob.model.get_nonlinear_vectors()
+    norm = np.linalg.norm(residuals.asarray())
+
+    return prob.model.nonlinear_solver._iter_count < MAX_ITERATIONS and np.isfinite(norm)
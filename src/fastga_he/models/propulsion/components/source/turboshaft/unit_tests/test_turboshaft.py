@@ -47,12 +47,6 @@ from ..components.perf_fuel_consumed import PerformancesTurboshaftFuelConsumed
 from ..components.perf_sfc import PerformancesSFC
 from ..components.perf_equivalent_efficiency import PerformancesEquivalentEfficiency
 
-from ..components.perf_inflight_co2_emissions import PerformancesTurboshaftInFlightCO2Emissions
-from ..components.perf_inflight_h2o_emissions import PerformancesTurboshaftInFlightH2OEmissions
-from ..components.perf_inflight_sox_emissions import PerformancesTurboshaftInFlightSOxEmissions
-from ..components.perf_inflight_co_emissions import PerformancesTurboshaftInFlightCOEmissions
-from ..components.perf_inflight_hc_emissions import PerformancesTurboshaftInFlightHCEmissions
-from ..components.perf_inflight_nox_emissions import PerformancesTurboshaftInFlightNOxEmissions
 from ..components.perf_inflight_emissions_sum import PerformancesTurboshaftInFlightEmissionsSum
 from ..components.perf_inflight_emissions import PerformancesTurboshaftInFlightEmissions
 
@@ -833,152 +827,6 @@ def test_equivalent_efficiency():
     problem.check_partials(compact_print=True)
 
 
-def test_in_flight_co_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([29.46, 29.60, 29.58, 29.44, 29.13, 28.70, 28.19, 27.55, 26.84, 26.11]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesTurboshaftInFlightCOEmissions(
-            number_of_points=NB_POINTS_TEST, turboshaft_id="turboshaft_1"
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("CO_emissions", units="g") == pytest.approx(
-        np.array([147.3, 148.0, 147.9, 147.2, 145.65, 143.5, 140.95, 137.75, 134.2, 130.55]),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_co2_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([29.46, 29.60, 29.58, 29.44, 29.13, 28.70, 28.19, 27.55, 26.84, 26.11]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesTurboshaftInFlightCO2Emissions(
-            number_of_points=NB_POINTS_TEST, turboshaft_id="turboshaft_1"
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("CO2_emissions", units="kg") == pytest.approx(
-        np.array([92.9, 93.3, 93.3, 92.8, 91.9, 90.5, 88.9, 86.9, 84.6, 82.3]),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_h2o_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([29.46, 29.60, 29.58, 29.44, 29.13, 28.70, 28.19, 27.55, 26.84, 26.11]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesTurboshaftInFlightH2OEmissions(
-            number_of_points=NB_POINTS_TEST, turboshaft_id="turboshaft_1"
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("H2O_emissions", units="kg") == pytest.approx(
-        np.array([36.4, 36.6, 36.5, 36.4, 36.0, 35.5, 34.8, 34.0, 33.2, 32.2]),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_sox_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([29.46, 29.60, 29.58, 29.44, 29.13, 28.70, 28.19, 27.55, 26.84, 26.11]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesTurboshaftInFlightSOxEmissions(
-            number_of_points=NB_POINTS_TEST, turboshaft_id="turboshaft_1"
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("SOx_emissions", units="g") == pytest.approx(
-        np.array([23.568, 23.68, 23.664, 23.552, 23.304, 22.96, 22.552, 22.04, 21.472, 20.888]),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_hc_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([29.46, 29.60, 29.58, 29.44, 29.13, 28.70, 28.19, 27.55, 26.84, 26.11]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesTurboshaftInFlightHCEmissions(
-            number_of_points=NB_POINTS_TEST, turboshaft_id="turboshaft_1"
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("HC_emissions", units="g") == pytest.approx(
-        np.array([14.73, 14.8, 14.79, 14.72, 14.565, 14.35, 14.095, 13.775, 13.42, 13.055]),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
-def test_in_flight_nox_emissions():
-    ivc = om.IndepVarComp()
-    ivc.add_output(
-        "fuel_consumed_t",
-        val=np.array([29.46, 29.60, 29.58, 29.44, 29.13, 28.70, 28.19, 27.55, 26.84, 26.11]),
-        units="kg",
-    )
-
-    # Run problem and check obtained value(s) is/(are) correct
-    problem = run_system(
-        PerformancesTurboshaftInFlightNOxEmissions(
-            number_of_points=NB_POINTS_TEST, turboshaft_id="turboshaft_1"
-        ),
-        ivc,
-    )
-
-    assert problem.get_val("NOx_emissions", units="g") == pytest.approx(
-        np.array(
-            [335.844, 337.44, 337.212, 335.616, 332.082, 327.18, 321.366, 314.07, 305.976, 297.654]
-        ),
-        rel=1e-2,
-    )
-
-    problem.check_partials(compact_print=True)
-
-
 def test_in_flight_emissions_sum():
     ivc = om.IndepVarComp()
     ivc.add_output(
@@ -1160,6 +1008,48 @@ def test_performances_turboshaft():
     problem.check_partials(compact_print=True)
 
 
+def test_performances_turboshaft_fused():
+    options = {"turboshaft_id": "turboshaft_1", "number_of_points": NB_POINTS_TEST}
+
+    ivc = get_indep_var_comp(
+        list_inputs(PerformancesTurboshaft(**options)),
+        __file__,
+        XML_FILE,
+    )
+    ivc.add_output("altitude", val=np.linspace(0.0, 3000.0, NB_POINTS_TEST), units="m")
+    # Unused but necessary for compatibility
+    ivc.add_output("rpm", val=np.full(NB_POINTS_TEST, 2000.0), units="min**-1")
+    ivc.add_output("true_airspeed", val=np.linspace(81.8, 90.5, NB_POINTS_TEST), units="m/s")
+    ivc.add_output("shaft_power_out", val=np.linspace(250, 575.174, NB_POINTS_TEST), units="kW")
+    ivc.add_output("time_step", units="s", val=np.full(NB_POINTS_TEST, 500))
+    ivc.add_output(
+        "density",
+        val=np.linspace(1.225, 0.413, NB_POINTS_TEST),
+        units="kg/m**3",
+    )
+
+    # Run problem with the decomposed and the fused components
+    problem = run_system(PerformancesTurboshaft(**options), ivc)
+    problem_fused = run_system(PerformancesTurboshaft(**options, fused=True), ivc)
+
+    for output_name in [
+        "density_ratio",
+        "mach",
+        "power_required",
+        "shaft_power_for_power_rate",
+        "fuel_consumption",
+        "fuel_consumed_t",
+        "specific_fuel_consumption",
+        "equivalent_efficiency",
+        "data:propulsion:he_power_train:turboshaft:turboshaft_1:power_max",
+    ]:
+        assert problem_fused.get_val(output_name) == pytest.approx(
+            problem.get_val(output_name), rel=1e-6
+        )
+
+    problem_fused.check_partials(compact_print=True)
+
+
 def test_slipstream_density_ratio():
     ivc = om.IndepVarComp()
     ivc.add_output(
@@ -8,3 +8,4 @@
 from .heat_sink.components.sizing_heat_sink import SizingHeatSink
 from .inductor.components.sizing_inductor import SizingInductor
 from .capacitor.components.sizing_capacitor import SizingCapacitor
+from .inflight_emissions.components.perf_inflight_emissions import PerformancesInFlightEmissions
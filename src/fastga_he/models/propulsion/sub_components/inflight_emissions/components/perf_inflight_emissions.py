@@ -0,0 +1,103 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import openmdao.api as om
+import numpy as np
+
+
+class PerformancesInFlightEmissions(om.ExplicitComponent):
+    """
+    Computation of the in flight emissions of all the species produced by a combustion source. The
+    emissions of each species are the fuel consumed at each point multiplied by the emission index
+    of the species. The species and the default value of their emission index are given as a
+    table so that the same component can be used for all the combustion sources.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            "number_of_points", default=1, desc="number of equilibrium to be treated"
+        )
+        self.options.declare(
+            name="prefix",
+            default=None,
+            desc="Prefix for the components that will use the emission indices, e.g. "
+            "data:propulsion:he_power_train:ICE:ice_1",
+            allow_none=False,
+        )
+        self.options.declare(
+            name="emission_indices",
+            default=None,
+            types=dict,
+            desc="Default value of the emission index of each species, in g/kg, keyed by the "
+            "name of the species",
+            allow_none=False,
+        )
+
+    def setup(self):
+        prefix = self.options["prefix"]
+        number_of_points = self.options["number_of_points"]
+
+        self.add_input("fuel_consumed_t", np.full(number_of_points, np.nan), units="kg")
+
+        for species, emission_index in self.options["emission_indices"].items():
+            self.add_input(
+                prefix + ":emission_index:" + species,
+                units="g/kg",
+                val=emission_index,
+            )
+
+            self.add_output(
+                species + "_emissions", np.full(number_of_points, emission_index), units="g"
+            )
+
+            self.declare_partials(
+                of=species + "_emissions",
+                wrt="fuel_consumed_t",
+                method="exact",
+                rows=np.arange(number_of_points),
+                cols=np.arange(number_of_points),
+            )
+            self.declare_partials(
+                of=species + "_emissions",
+                wrt=prefix + ":emission_index:" + species,
+                method="exact",
+                rows=np.arange(number_of_points),
+                cols=np.zeros(number_of_points),
+            )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        species_list = list(self.options["emission_indices"])
+
+        # One row per species so that all the emissions are computed at once
+        emissions = np.outer(self._get_emission_indices(inputs), inputs["fuel_consumed_t"])
+
+        for species, species_emissions in zip(species_list, emissions):
+            outputs[species + "_emissions"] = species_emissions
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        prefix = self.options["prefix"]
+        number_of_points = self.options["number_of_points"]
+        species_list = list(self.options["emission_indices"])
+
+        partials_fuel = np.repeat(
+            self._get_emission_indices(inputs)[:, np.newaxis], number_of_points, axis=1
+        )
+
+        for species, partial_fuel in zip(species_list, partials_fuel):
+            partials[species + "_emissions", "fuel_consumed_t"] = partial_fuel
+            partials[species + "_emissions", prefix + ":emission_index:" + species] = inputs[
+                "fuel_consumed_t"
+            ]
+
+    def _get_emission_indices(self, inputs) -> np.ndarray:
+        """Returns the emission index of each species, in the order of the table."""
+
+        prefix = self.options["prefix"]
+
+        return np.array(
+            [
+                inputs[prefix + ":emission_index:" + species][0]
+                for species in self.options["emission_indices"]
+            ]
+        )
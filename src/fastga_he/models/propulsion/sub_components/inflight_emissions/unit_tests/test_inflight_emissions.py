@@ -0,0 +1,65 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import openmdao.api as om
+import numpy as np
+import pytest
+
+from ..components.perf_inflight_emissions import PerformancesInFlightEmissions
+
+from fastga_he.powertrain_builder.powertrain import PT_DATA_PREFIX
+
+from tests.testing_utilities import run_system
+
+PREFIX = PT_DATA_PREFIX + "ICE:ice_1"
+NB_POINTS_TEST = 10
+
+
+def test_in_flight_emissions():
+    ivc = om.IndepVarComp()
+    ivc.add_output(
+        "fuel_consumed_t",
+        val=np.array([5.12, 5.5, 5.9, 6.33, 6.81, 7.33, 7.89, 8.44, 9.1, 9.72]),
+        units="kg",
+    )
+    ivc.add_output(PREFIX + ":emission_index:NOx", val=11.4, units="g/kg")
+
+    # Run problem and check obtained value(s) is/(are) correct
+    problem = run_system(
+        PerformancesInFlightEmissions(
+            number_of_points=NB_POINTS_TEST,
+            prefix=PREFIX,
+            emission_indices={"CO2": 3100.0, "NOx": 3.14, "lead": 0.794},
+        ),
+        ivc,
+    )
+
+    assert problem.get_val("CO2_emissions", units="g") == pytest.approx(
+        np.array(
+            [
+                15872.0,
+                17050.0,
+                18290.0,
+                19623.0,
+                21111.0,
+                22723.0,
+                24459.0,
+                26164.0,
+                28210.0,
+                30132.0,
+            ]
+        ),
+        rel=1e-2,
+    )
+    # The emission index given as an input is used instead of the default one
+    assert problem.get_val("NOx_emissions", units="g") == pytest.approx(
+        np.array([58.368, 62.7, 67.26, 72.162, 77.634, 83.562, 89.946, 96.216, 103.74, 110.808]),
+        rel=1e-2,
+    )
+    assert problem.get_val("lead_emissions", units="g") == pytest.approx(
+        np.array([4.065, 4.367, 4.685, 5.026, 5.407, 5.820, 6.265, 6.701, 7.225, 7.718]),
+        rel=1e-2,
+    )
+
+    problem.check_partials(compact_print=True)
@@ -98,7 +98,7 @@ class InFlightCGVariation(om.ExplicitComponent):
                 "data:geometry:cabin:seats:passenger:count_by_row",
                 "settings:weight:aircraft:payload:design_mass_per_passenger",
             ],
-            method="fd",
+            method="exact",
         )
 
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
@@ -149,6 +149,72 @@ class InFlightCGVariation(om.ExplicitComponent):
             "data:weight:aircraft:payload",
         ] = 0.0
 
+        npax = inputs["data:TLAR:NPAX_design"]
+        count_by_row = inputs["data:geometry:cabin:seats:passenger:count_by_row"]
+        luggage_weight = inputs["data:TLAR:luggage_mass_design"]
+        cg_rear_fret = inputs["data:weight:payload:rear_fret:CG:x"]
+        l_pilot_seat = inputs["data:geometry:cabin:seats:pilot:length"]
+        l_pass_seat = inputs["data:geometry:cabin:seats:passenger:length"]
+        design_mass_p_pax = inputs["settings:weight:aircraft:payload:design_mass_per_passenger"]
+        lav = inputs["data:geometry:fuselage:front_length"]
+
+        l_instr = 0.7
+        nrows = int(np.ceil(npax / count_by_row).item())
+
+        # The equivalent moment of the passengers is their mass times the sum on each row of the
+        # position of the row times the number of persons on it, the payload cancels out
+        passenger_moment_arm = (lav + l_instr) * (npax + 2.0) + l_pilot_seat * 2.0
+        d_arm_d_l_pass_seat = 0.0
+        d_arm_d_count_by_row = 0.0
+        for idx in range(nrows):
+            length = l_pilot_seat + (idx + 0.5) * l_pass_seat
+            nb_pers = min(count_by_row, npax - idx * count_by_row)
+            passenger_moment_arm = passenger_moment_arm + length * nb_pers
+            d_arm_d_l_pass_seat = d_arm_d_l_pass_seat + (idx + 0.5) * nb_pers
+            # On full rows adding seats on a row adds a person, on the last row it removes
+            # as many persons as there are full rows before it
+            if count_by_row < npax - idx * count_by_row:
+                d_arm_d_count_by_row = d_arm_d_count_by_row + length
+            else:
+                d_arm_d_count_by_row = d_arm_d_count_by_row - length * idx
+
+        # An additional passenger sits on the row being filled
+        filled_row_idx = np.floor(npax / count_by_row)
+        d_arm_d_npax = lav + l_instr + l_pilot_seat + (filled_row_idx + 0.5) * l_pass_seat
+
+        partials[
+            "data:weight:aircraft:in_flight_variation:fixed_mass_comp:equivalent_moment",
+            "data:TLAR:NPAX_design",
+        ] = design_mass_p_pax * d_arm_d_npax
+        partials[
+            "data:weight:aircraft:in_flight_variation:fixed_mass_comp:equivalent_moment",
+            "data:TLAR:luggage_mass_design",
+        ] = cg_rear_fret
+        partials[
+            "data:weight:aircraft:in_flight_variation:fixed_mass_comp:equivalent_moment",
+            "data:weight:payload:rear_fret:CG:x",
+        ] = luggage_weight
+        partials[
+            "data:weight:aircraft:in_flight_variation:fixed_mass_comp:equivalent_moment",
+            "data:geometry:fuselage:front_length",
+        ] = design_mass_p_pax * (npax + 2.0)
+        partials[
+            "data:weight:aircraft:in_flight_variation:fixed_mass_comp:equivalent_moment",
+            "data:geometry:cabin:seats:pilot:length",
+        ] = design_mass_p_pax * (npax + 2.0)
+        partials[
+            "data:weight:aircraft:in_flight_variation:fixed_mass_comp:equivalent_moment",
+            "data:geometry:cabin:seats:passenger:length",
+        ] = design_mass_p_pax * d_arm_d_l_pass_seat
+        partials[
+            "data:weight:aircraft:in_flight_variation:fixed_mass_comp:equivalent_moment",
+            "data:geometry:cabin:seats:passenger:count_by_row",
+        ] = design_mass_p_pax * d_arm_d_count_by_row
+        partials[
+            "data:weight:aircraft:in_flight_variation:fixed_mass_comp:equivalent_moment",
+            "settings:weight:aircraft:payload:design_mass_per_passenger",
+        ] = passenger_moment_arm
+
 
 @oad.RegisterSubmodel(SUBMODEL_CG_VARIATION, "fastga_he.submodel.performances.cg_variation.simple")
 class InFlightCGVariationSimple(om.ExplicitComponent):
@@ -5,6 +5,7 @@
 import pytest
 
 from ..cg_components.b_propulsion.b_cg import PowerTrainCG
+from ..cg_variation import InFlightCGVariation
 from ..op_cg_variation import OperationalInFlightCGVariation
 
 from tests.testing_utilities import run_system, get_indep_var_comp, list_inputs
@@ -25,6 +26,24 @@ def test_propulsion_weight():
     problem.check_partials(compact_print=True)
 
 
+def test_cg_variation_comp():
+    """Tests in flight cg variation computation from sample XML data."""
+    # Research independent input value in .xml file
+    ivc = get_indep_var_comp(list_inputs(InFlightCGVariation()), __file__, XML_FILE)
+
+    # Run problem and check obtained value(s) is/(are) correct
+    problem = run_system(InFlightCGVariation(), ivc)
+    assert problem.get_val(
+        "data:weight:aircraft:in_flight_variation:fixed_mass_comp:equivalent_moment",
+        units="kg*m",
+    ) == pytest.approx(5214.0, rel=1e-2)
+    assert problem.get_val(
+        "data:weight:aircraft:in_flight_variation:fixed_mass_comp:mass", units="kg"
+    ) == pytest.approx(1499.0, rel=1e-2)
+
+    problem.check_partials(compact_print=True)
+
+
 def test_operation_cg_variation_comp():
     """Tests propulsion weight computation from sample XML data."""
     # Research independent input value in .xml file
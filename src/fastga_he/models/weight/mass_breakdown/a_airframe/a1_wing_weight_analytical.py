@@ -20,6 +20,7 @@ import openmdao.api as om
 
 import fastoad.api as oad
 
+from .wing_components.compute_spanwise_loads import ComputeWingSpanwiseLoads
 from .wing_components.compute_web_mass import ComputeWebMass
 from .wing_components.compute_upper_flange import ComputeUpperFlange
 from .wing_components.compute_lower_flange import ComputeLowerFlange
@@ -52,6 +53,7 @@ class ComputeWingMassAnalytical(om.Group):
         self.linear_solver = om.LinearBlockGS()
 
     def setup(self):
+        self.add_subsystem("compute_spanwise_loads", ComputeWingSpanwiseLoads(), promotes=["*"])
         self.add_subsystem("compute_web_mass_max_fuel", ComputeWebMass(), promotes=["*"])
         self.add_subsystem(
             "compute_web_mass_min_fuel", ComputeWebMass(min_fuel_in_wing=True), promotes=["*"]
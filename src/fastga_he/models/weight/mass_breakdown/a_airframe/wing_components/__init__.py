@@ -16,6 +16,7 @@
 # pylint: disable=unused-import
 # flake8: noqa
 
+from .compute_spanwise_loads import ComputeWingSpanwiseLoads
 from .compute_web_mass import ComputeWebMass
 from .compute_lower_flange import ComputeLowerFlange
 from .compute_upper_flange import ComputeUpperFlange
@@ -19,9 +19,13 @@ import openmdao.api as om
 import numpy as np
 
 from scipy.integrate import trapezoid
-from scipy.interpolate import interp1d
 
-from fastga_he.models.load_analysis.wing.aerostructural_loads import AerostructuralLoadHE
+from fastga_he.models.load_analysis.wing.aerostructural_loads import (
+    AerostructuralLoadHE,
+    SPAN_MESH_POINT_LOADS,
+)
+
+from .compute_spanwise_loads import ComputeWingSpanwiseLoads
 
 from stdatm import Atmosphere
 
@@ -35,7 +39,6 @@ class ComputeLowerFlange(om.ExplicitComponent):
         self.add_input("data:geometry:wing:aileron:chord_ratio", val=np.nan)
         self.add_input("data:geometry:fuselage:maximum_width", val=np.nan, units="m")
         self.add_input("data:geometry:fuselage:maximum_height", val=np.nan, units="m")
-        self.add_input("data:geometry:landing_gear:y", val=np.nan, units="m")
         self.add_input("data:geometry:landing_gear:type", val=np.nan)
         self.add_input("data:geometry:wing:span", val=np.nan, units="m")
         self.add_input("data:geometry:wing:area", val=np.nan, units="m**2")
@@ -43,7 +46,6 @@ class ComputeLowerFlange(om.ExplicitComponent):
         self.add_input("data:geometry:wing:root:chord", val=np.nan, units="m")
         self.add_input("data:geometry:wing:root:y", val=np.nan, units="m")
         self.add_input("data:geometry:wing:root:thickness_ratio", val=np.nan)
-        self.add_input("data:geometry:wing:tip:chord", val=np.nan, units="m")
         self.add_input("data:geometry:wing:tip:y", val=np.nan, units="m")
         self.add_input("data:geometry:wing:tip:thickness_ratio", val=np.nan)
         self.add_input("data:geometry:wing:taper_ratio", val=np.nan)
@@ -53,147 +55,38 @@ class ComputeLowerFlange(om.ExplicitComponent):
         self.add_input("data:mission:sizing:cs23:characteristic_speed:vc", val=np.nan, units="m/s")
 
         self.add_input(
-            "data:aerodynamics:wing:low_speed:Y_vector",
-            val=np.nan,
-            shape_by_conn=True,
-            units="m",
+            "data:loads:wing:spanwise:y_vector", val=np.nan, units="m", shape=SPAN_MESH_POINT_LOADS
         )
         self.add_input(
-            "data:aerodynamics:wing:low_speed:chord_vector",
+            "data:loads:wing:spanwise:chord_vector",
             val=np.nan,
-            shape_by_conn=True,
-            copy_shape="data:aerodynamics:wing:low_speed:Y_vector",
             units="m",
+            shape=SPAN_MESH_POINT_LOADS,
         )
         self.add_input(
-            "data:aerodynamics:wing:low_speed:CL_vector",
-            val=np.nan,
-            shape_by_conn=True,
-            copy_shape="data:aerodynamics:wing:low_speed:Y_vector",
-        )
-        self.add_input(
-            "data:aerodynamics:slipstream:wing:cruise:only_prop:CL_vector",
+            "data:loads:wing:spanwise:lift_chord",
             val=np.nan,
-            shape_by_conn=True,
-            copy_shape="data:aerodynamics:slipstream:wing:cruise:prop_on:Y_vector",
+            units="m",
+            shape=SPAN_MESH_POINT_LOADS,
         )
         self.add_input(
-            "data:aerodynamics:slipstream:wing:cruise:prop_on:Y_vector",
+            "data:loads:wing:spanwise:slipstream_lift_chord",
             val=np.nan,
-            shape_by_conn=True,
             units="m",
+            shape=SPAN_MESH_POINT_LOADS,
         )
         self.add_input("data:aerodynamics:wing:low_speed:CL_ref", val=np.nan)
         self.add_input(
             "data:aerodynamics:slipstream:wing:cruise:prop_on:velocity", val=np.nan, units="m/s"
         )
 
-        self.add_input("data:weight:airframe:landing_gear:main:mass", val=np.nan, units="kg")
-        self.add_input(
-            "data:weight:airframe:wing:punctual_mass:y_ratio",
-            shape_by_conn=True,
-            val=0.0,
-        )
         self.add_input(
             "data:weight:airframe:wing:punctual_mass:mass",
             shape_by_conn=True,
-            copy_shape="data:weight:airframe:wing:punctual_mass:y_ratio",
-            units="kg",
-            val=0.0,
-        )
-        # Same as with punctual loads expect here, we will have a tag to "turn it off" when at MZFW
-        self.add_input(
-            "data:weight:airframe:wing:punctual_tanks:y_ratio",
-            shape_by_conn=True,
-            val=0.0,
-        )
-        self.add_input(
-            "data:weight:airframe:wing:punctual_tanks:fuel_inside",
-            shape_by_conn=True,
-            copy_shape="data:weight:airframe:wing:punctual_tanks:y_ratio",
             units="kg",
             val=0.0,
         )
 
-        # Here we add all the inputs necessary for the addition of the distributed mass other
-        # than the fuel (batteries for instance), this input will later be an output of the
-        # powertrain sizing but their default value will be set at 0 so that it is used the same
-        # way as before even when not using the pt file. Note that setting the inputs like that
-        # imposes that they are provided as inputs somewhere else as it cannot take default value
-        self.add_input(
-            "data:weight:airframe:wing:distributed_mass:y_ratio_start",
-            shape_by_conn=True,
-            val=0.0,
-            desc="Array containing the starting positions of all distributed mass on the wing",
-        )
-        self.add_input(
-            "data:weight:airframe:wing:distributed_mass:y_ratio_end",
-            shape_by_conn=True,
-            val=0.0,
-            desc="Array containing the end positions of all distributed mass on the wing",
-            copy_shape="data:weight:airframe:wing:distributed_mass:y_ratio_start",
-        )
-        self.add_input(
-            "data:weight:airframe:wing:distributed_mass:start_chord",
-            shape_by_conn=True,
-            val=0.0,
-            units="m",
-            desc="Array containing the value of the wing chord at the beginning of the distributed mass",
-            copy_shape="data:weight:airframe:wing:distributed_mass:y_ratio_start",
-        )
-        self.add_input(
-            "data:weight:airframe:wing:distributed_mass:chord_slope",
-            shape_by_conn=True,
-            val=0.0,
-            desc="Array containing the value of the chord slope for the distributed mass. Mass is assumed to vary with chord only (not thickness)",
-            copy_shape="data:weight:airframe:wing:distributed_mass:y_ratio_start",
-        )
-        self.add_input(
-            "data:weight:airframe:wing:distributed_mass:mass",
-            shape_by_conn=True,
-            val=0.0,
-            units="kg",
-            desc="Array containing the value of masses that are distributed on the wing",
-            copy_shape="data:weight:airframe:wing:distributed_mass:y_ratio_start",
-        )
-        # Here we add all the inputs necessary for the addition of the distributed tanks
-        self.add_input(
-            "data:weight:airframe:wing:distributed_tanks:y_ratio_start",
-            shape_by_conn=True,
-            val=np.nan,
-            desc="Array containing the starting positions of all distributed tanks on the wing",
-        )
-        self.add_input(
-            "data:weight:airframe:wing:distributed_tanks:y_ratio_end",
-            shape_by_conn=True,
-            val=np.nan,
-            desc="Array containing the end positions of all distributed tanks on the wing",
-            copy_shape="data:weight:airframe:wing:distributed_tanks:y_ratio_start",
-        )
-        self.add_input(
-            "data:weight:airframe:wing:distributed_tanks:start_chord",
-            shape_by_conn=True,
-            val=np.nan,
-            units="m",
-            desc="Array containing the value of the wing chord at the beginning of the distributed tanks",
-            copy_shape="data:weight:airframe:wing:distributed_tanks:y_ratio_start",
-        )
-        self.add_input(
-            "data:weight:airframe:wing:distributed_tanks:chord_slope",
-            shape_by_conn=True,
-            val=np.nan,
-            desc="Array containing the value of the chord slope for the distributed tanks. Fuel mass is assumed to vary with chord only (not thickness)",
-            copy_shape="data:weight:airframe:wing:distributed_tanks:y_ratio_start",
-        )
-        self.add_input(
-            "data:weight:airframe:wing:distributed_tanks:fuel_inside",
-            shape_by_conn=True,
-            val=np.nan,
-            units="kg",
-            desc="Array containing the value of fuel inside the tanks that are distributed on the wing",
-            copy_shape="data:weight:airframe:wing:distributed_tanks:y_ratio_start",
-        )
-
         self.add_input("data:mission:sizing:cs23:safety_factor", val=np.nan)
 
         self.add_input("settings:geometry:fuel_tanks:depth", val=np.nan)
@@ -222,8 +115,6 @@ class ComputeLowerFlange(om.ExplicitComponent):
             desc="Aluminum maximum compression stress",
         )
 
-        self.add_input("data:weight:airframe:wing:mass", val=np.nan, units="kg")
-
         self.add_input("data:weight:aircraft:MZFW", val=np.nan, units="kg")
 
         if not self.options["min_fuel_in_wing"]:
@@ -235,6 +126,13 @@ class ComputeLowerFlange(om.ExplicitComponent):
                 "data:mission:sizing:cs23:sizing_factor:ultimate_mtow:negative", val=np.nan
             )
 
+            self.add_input(
+                "data:loads:wing:spanwise:relief_force:max_fuel_in_wing",
+                val=np.nan,
+                units="N/m",
+                shape=SPAN_MESH_POINT_LOADS,
+            )
+
             self.add_output(
                 "data:weight:airframe:wing:lower_flange:mass:max_fuel_in_wing", units="kg"
             )
@@ -246,18 +144,56 @@ class ComputeLowerFlange(om.ExplicitComponent):
                 "data:mission:sizing:cs23:sizing_factor:ultimate_mzfw:negative", val=np.nan
             )
 
+            self.add_input(
+                "data:loads:wing:spanwise:relief_force:min_fuel_in_wing",
+                val=np.nan,
+                units="N/m",
+                shape=SPAN_MESH_POINT_LOADS,
+            )
+
             self.add_output(
                 "data:weight:airframe:wing:lower_flange:mass:min_fuel_in_wing", units="kg"
             )
 
+        self.declare_partials(
+            of="*",
+            wrt=ComputeWingSpanwiseLoads.get_spanwise_loads_names(
+                min_fuel_in_wing=self.options["min_fuel_in_wing"]
+            ),
+            method="exact",
+        )
+        # The atmosphere and the sweep only intervene through scalars, so computing those partials
+        # with the complex step only costs a few evaluations
+        self.declare_partials(
+            of="*",
+            wrt=[
+                "data:geometry:fuselage:maximum_width",
+                "data:geometry:fuselage:maximum_height",
+                "data:geometry:wing:span",
+                "data:geometry:wing:area",
+                "data:geometry:wing:thickness_ratio",
+                "data:geometry:wing:root:chord",
+                "data:geometry:wing:taper_ratio",
+                "data:geometry:wing:sweep_25",
+                "data:mission:sizing:main_route:cruise:altitude",
+                "data:mission:sizing:cs23:characteristic_speed:vc",
+                "data:mission:sizing:cs23:safety_factor",
+                "data:mission:sizing:cs23:sizing_factor:*",
+                "data:aerodynamics:wing:low_speed:CL_ref",
+                "data:aerodynamics:slipstream:wing:cruise:prop_on:velocity",
+                "data:weight:aircraft:*",
+                "settings:wing:airfoil:flanges:height_ratio",
+                "settings:materials:aluminium:*",
+            ],
+            method="cs",
+        )
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
         Component that computes the wing web mass necessary to react to the given linear force
         vector, according to the methodology developed by Raquel Alonso Castilla.
         """
 
-        wing_mass = inputs["data:weight:airframe:wing:mass"]
-
         if not self.options["min_fuel_in_wing"]:
             mass = inputs["data:weight:aircraft:MTOW"]
             load_factor_pos = inputs[
@@ -266,7 +202,6 @@ class ComputeLowerFlange(om.ExplicitComponent):
             load_factor_neg = inputs[
                 "data:mission:sizing:cs23:sizing_factor:ultimate_mtow:negative"
             ]
-            fuel_tag = 1.0
         else:
             mass = inputs["data:weight:aircraft:MZFW"]
             load_factor_pos = inputs[
@@ -275,7 +210,6 @@ class ComputeLowerFlange(om.ExplicitComponent):
             load_factor_neg = inputs[
                 "data:mission:sizing:cs23:sizing_factor:ultimate_mzfw:negative"
             ]
-            fuel_tag = 0.0
 
         fus_width = inputs["data:geometry:fuselage:maximum_width"]
         fus_height = inputs["data:geometry:fuselage:maximum_height"]
@@ -283,16 +217,10 @@ class ComputeLowerFlange(om.ExplicitComponent):
         wing_area = inputs["data:geometry:wing:area"]
         thickness_ratio = inputs["data:geometry:wing:thickness_ratio"]
         root_chord = inputs["data:geometry:wing:root:chord"]
-        tip_chord = inputs["data:geometry:wing:tip:chord"]
         taper_ratio = inputs["data:geometry:wing:taper_ratio"]
         sweep_25 = inputs["data:geometry:wing:sweep_25"]
 
-        y_vector = inputs["data:aerodynamics:wing:low_speed:Y_vector"]
-        y_vector_slip = inputs["data:aerodynamics:slipstream:wing:cruise:prop_on:Y_vector"]
-        cl_vector = inputs["data:aerodynamics:wing:low_speed:CL_vector"]
-        cl_vector_slip = inputs["data:aerodynamics:slipstream:wing:cruise:only_prop:CL_vector"]
         cl_ref = inputs["data:aerodynamics:wing:low_speed:CL_ref"]
-        chord_vector = inputs["data:aerodynamics:wing:low_speed:chord_vector"]
         v_ref = inputs["data:aerodynamics:slipstream:wing:cruise:prop_on:velocity"]
 
         cruise_alt = inputs["data:mission:sizing:main_route:cruise:altitude"]
@@ -304,40 +232,9 @@ class ComputeLowerFlange(om.ExplicitComponent):
 
         safety_factor = inputs["data:mission:sizing:cs23:safety_factor"]
 
-        # STEP 1 - DELETE THE ADDITIONAL ZEROS WE HAD TO PUT TO FIT OPENMDAO AND ADD A POINT AT
-        # THE ROOT (Y=0) AND AT THE VERY TIP (Y=SPAN/2) TO GET THE WHOLE SPAN OF THE WING IN
-        # THE INTERPOLATION WE WILL DO LATER ##############
-
-        semi_span = wing_span / 2.0
-
         atm = Atmosphere(cruise_alt, altitude_in_feet=True)
         atm.equivalent_airspeed = inputs["data:mission:sizing:cs23:characteristic_speed:vc"]
 
-        # We delete the zeros
-        y_vector = AerostructuralLoadHE.delete_additional_zeros(y_vector)
-        y_vector_slip = AerostructuralLoadHE.delete_additional_zeros(y_vector_slip)
-        cl_vector = AerostructuralLoadHE.delete_additional_zeros(cl_vector, len(y_vector))
-        cl_vector_slip = AerostructuralLoadHE.delete_additional_zeros(
-            cl_vector_slip, len(y_vector_slip)
-        )
-        chord_vector = AerostructuralLoadHE.delete_additional_zeros(chord_vector, len(y_vector))
-
-        # We add the first point at the root
-        y_vector, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector, 0.0)
-        y_vector_slip, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector_slip, 0.0)
-        cl_vector = np.insert(cl_vector, 0, cl_vector[0])
-        cl_vector_slip = np.insert(cl_vector_slip, 0, cl_vector_slip[0])
-        chord_vector = np.insert(chord_vector, 0, root_chord)
-
-        # And the last point at the tip
-        y_vector_orig, _ = AerostructuralLoadHE.insert_in_sorted_array(y_vector, semi_span)
-        y_vector_slip_orig, _ = AerostructuralLoadHE.insert_in_sorted_array(
-            y_vector_slip, semi_span
-        )
-        cl_vector_orig = np.append(cl_vector, 0.0)
-        cl_vector_slip = np.append(cl_vector_slip, 0.0)
-        chord_vector_orig = np.append(chord_vector, tip_chord)
-
         fus_radius = np.sqrt(fus_height * fus_width) / 2.0
 
         sweep_e = np.arctan(
@@ -353,17 +250,12 @@ class ComputeLowerFlange(om.ExplicitComponent):
 
         dynamic_pressure = 1.0 / 2.0 * atm.density * v_c_tas**2.0
 
-        y_vector, weight_array_orig = AerostructuralLoadHE.compute_relief_force(
-            inputs, y_vector_orig, chord_vector_orig, wing_mass, fuel_tag
-        )
-        cl_s = AerostructuralLoadHE.compute_cl_s(
-            y_vector_orig, y_vector_orig, y_vector, cl_vector_orig, chord_vector_orig
-        )
-        cl_s_slip = AerostructuralLoadHE.compute_cl_s(
-            y_vector_slip_orig, y_vector_orig, y_vector, cl_vector_slip, chord_vector_orig
+        y_vector, chord_vector, cl_s, cl_s_slip, weight_array_orig = (
+            ComputeWingSpanwiseLoads.get_spanwise_loads(
+                inputs, min_fuel_in_wing=self.options["min_fuel_in_wing"]
+            )
         )
-        chord_vector_inter = interp1d(y_vector_orig, chord_vector_orig)
-        chord_vector = chord_vector_inter(y_vector)
+
         lower_flange_area_pos = np.zeros_like(y_vector)
         lower_flange_area_neg = np.zeros_like(y_vector)
 
@@ -381,20 +273,24 @@ class ComputeLowerFlange(om.ExplicitComponent):
 
             height_vector = thickness_ratio * h_ratio * chord_vector
 
-            if np.sign(load_factor) > 0:
+            if np.sign(load_factor.real) > 0:
                 lower_flange_area_pos = (
-                    1.0 / height_vector * abs(bending_moment / max_tension_stress)
+                    1.0
+                    / height_vector
+                    * AerostructuralLoadHE.absolute_value(bending_moment / max_tension_stress)
                 )
 
             else:
                 lower_flange_area_neg = (
-                    1.0 / height_vector * abs(bending_moment / max_compression_stress)
+                    1.0
+                    / height_vector
+                    * AerostructuralLoadHE.absolute_value(bending_moment / max_compression_stress)
                 )
 
         lower_flange_area = np.fmax(lower_flange_area_pos, lower_flange_area_neg)
-        lower_flange_mass = abs(2.0 * rho_m / np.cos(sweep_e)) * trapezoid(
-            lower_flange_area, y_vector
-        )
+        lower_flange_mass = AerostructuralLoadHE.absolute_value(
+            2.0 * rho_m / np.cos(sweep_e)
+        ) * trapezoid(lower_flange_area, y_vector)
 
         if len(inputs["data:weight:airframe:wing:punctual_mass:mass"]) > 4:
             lower_flange_mass *= 1.1
@@ -407,3 +303,162 @@ class ComputeLowerFlange(om.ExplicitComponent):
             outputs["data:weight:airframe:wing:lower_flange:mass:min_fuel_in_wing"] = (
                 lower_flange_mass
             )
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        if not self.options["min_fuel_in_wing"]:
+            mass = inputs["data:weight:aircraft:MTOW"]
+            load_factor_pos = inputs[
+                "data:mission:sizing:cs23:sizing_factor:ultimate_mtow:positive"
+            ]
+            load_factor_neg = inputs[
+                "data:mission:sizing:cs23:sizing_factor:ultimate_mtow:negative"
+            ]
+            output_name = "data:weight:airframe:wing:lower_flange:mass:max_fuel_in_wing"
+        else:
+            mass = inputs["data:weight:aircraft:MZFW"]
+            load_factor_pos = inputs[
+                "data:mission:sizing:cs23:sizing_factor:ultimate_mzfw:positive"
+            ]
+            load_factor_neg = inputs[
+                "data:mission:sizing:cs23:sizing_factor:ultimate_mzfw:negative"
+            ]
+            output_name = "data:weight:airframe:wing:lower_flange:mass:min_fuel_in_wing"
+
+        fus_width = inputs["data:geometry:fuselage:maximum_width"]
+        fus_height = inputs["data:geometry:fuselage:maximum_height"]
+        wing_span = inputs["data:geometry:wing:span"]
+        wing_area = inputs["data:geometry:wing:area"]
+        thickness_ratio = inputs["data:geometry:wing:thickness_ratio"]
+        root_chord = inputs["data:geometry:wing:root:chord"]
+        taper_ratio = inputs["data:geometry:wing:taper_ratio"]
+        sweep_25 = inputs["data:geometry:wing:sweep_25"]
+
+        cl_ref = inputs["data:aerodynamics:wing:low_speed:CL_ref"]
+        v_ref = inputs["data:aerodynamics:slipstream:wing:cruise:prop_on:velocity"]
+
+        cruise_alt = inputs["data:mission:sizing:main_route:cruise:altitude"]
+
+        rho_m = inputs["settings:materials:aluminium:density"]
+        max_tension_stress = inputs["settings:materials:aluminium:max_tension_stress"]
+        max_compression_stress = inputs["settings:materials:aluminium:max_compression_stress"]
+        h_ratio = inputs["settings:wing:airfoil:flanges:height_ratio"]
+
+        safety_factor = inputs["data:mission:sizing:cs23:safety_factor"]
+
+        atm = Atmosphere(cruise_alt, altitude_in_feet=True)
+        atm.equivalent_airspeed = inputs["data:mission:sizing:cs23:characteristic_speed:vc"]
+
+        fus_radius = np.sqrt(fus_height * fus_width) / 2.0
+
+        sweep_e = np.arctan(
+            np.tan(sweep_25)
+            + (1.0 - taper_ratio)
+            * root_chord
+            / (wing_span / 2.0 - fus_radius)
+            * (25.0 - 35.0)
+            / 100.0
+        )
+
+        v_c_tas = atm.true_airspeed
+
+        dynamic_pressure = 1.0 / 2.0 * atm.density * v_c_tas**2.0
+
+        y_vector, chord_vector, cl_s, cl_s_slip, weight_array_orig = (
+            ComputeWingSpanwiseLoads.get_spanwise_loads(
+                inputs, min_fuel_in_wing=self.options["min_fuel_in_wing"]
+            )
+        )
+
+        height_vector = thickness_ratio * h_ratio * chord_vector
+
+        # For each sign of the load factor, the flange area and the partials of the bending
+        # moment it is computed from, the last load factor of a given sign is the one kept
+        load_cases = {}
+
+        for load_factor in [load_factor_pos, load_factor_neg]:
+            cl_wing = 1.05 * (load_factor * mass * 9.81) / (dynamic_pressure * wing_area)
+            cl_s_actual = cl_s * cl_wing / cl_ref
+            cl_s_slip_actual = safety_factor * cl_s_slip * (v_ref / v_c_tas) ** 2.0
+            lift_section = dynamic_pressure * (cl_s_actual + cl_s_slip_actual)
+            weight_array = weight_array_orig * load_factor
+            tot_force_array = lift_section + weight_array
+
+            bending_moment = AerostructuralLoadHE.compute_bending_moment_diagram(
+                y_vector, tot_force_array
+            )
+            (
+                d_bending_d_force,
+                d_bending_d_y,
+            ) = AerostructuralLoadHE.compute_bending_moment_diagram_partials(
+                y_vector, tot_force_array
+            )
+
+            if np.sign(load_factor) > 0:
+                max_stress = max_tension_stress
+            else:
+                max_stress = max_compression_stress
+
+            load_cases[bool(np.sign(load_factor) > 0)] = (
+                1.0 / height_vector * abs(bending_moment / max_stress),
+                np.sign(bending_moment) / (height_vector * abs(max_stress)),
+                d_bending_d_force,
+                d_bending_d_y,
+                np.array(
+                    [
+                        dynamic_pressure * cl_wing / cl_ref,
+                        dynamic_pressure * safety_factor * (v_ref / v_c_tas) ** 2.0,
+                        load_factor,
+                    ]
+                ).flatten(),
+            )
+
+        lower_flange_area_pos = (
+            load_cases[True][0] if True in load_cases else np.zeros_like(y_vector)
+        )
+        lower_flange_area_neg = (
+            load_cases[False][0] if False in load_cases else np.zeros_like(y_vector)
+        )
+        lower_flange_area = np.fmax(lower_flange_area_pos, lower_flange_area_neg)
+
+        d_trapezoid_d_area, d_trapezoid_d_y = (
+            AerostructuralLoadHE.reverse_cumulative_trapezoid_partials(lower_flange_area, y_vector)
+        )
+
+        mass_factor = abs(2.0 * rho_m / np.cos(sweep_e))
+        if len(inputs["data:weight:airframe:wing:punctual_mass:mass"]) > 4:
+            mass_factor *= 1.1
+
+        d_mass_d_area = mass_factor * d_trapezoid_d_area[0]
+
+        d_mass_d_y = mass_factor * d_trapezoid_d_y[0]
+        d_mass_d_chord = -d_mass_d_area * lower_flange_area / chord_vector
+        d_mass_d_cl_s = np.zeros_like(y_vector)
+        d_mass_d_cl_s_slip = np.zeros_like(y_vector)
+        d_mass_d_weight = np.zeros_like(y_vector)
+
+        for positive_load_factor, load_case in load_cases.items():
+            _, d_area_d_bending, d_bending_d_force, d_bending_d_y, d_force = load_case
+
+            # The maximum area is the one of the positive load factor in case of a tie
+            if positive_load_factor:
+                is_max_area = lower_flange_area_pos >= lower_flange_area_neg
+            else:
+                is_max_area = lower_flange_area_neg > lower_flange_area_pos
+
+            d_mass_d_bending = d_mass_d_area * is_max_area * d_area_d_bending
+            d_mass_d_force = d_mass_d_bending @ d_bending_d_force
+
+            d_mass_d_y += d_mass_d_bending @ d_bending_d_y
+            d_mass_d_cl_s += d_mass_d_force * d_force[0]
+            d_mass_d_cl_s_slip += d_mass_d_force * d_force[1]
+            d_mass_d_weight += d_mass_d_force * d_force[2]
+
+        for input_name, partials_stations in zip(
+            ComputeWingSpanwiseLoads.get_spanwise_loads_names(
+                min_fuel_in_wing=self.options["min_fuel_in_wing"]
+            ),
+            [d_mass_d_y, d_mass_d_chord, d_mass_d_cl_s, d_mass_d_cl_s_slip, d_mass_d_weight],
+        ):
+            partials[output_name, input_name] = ComputeWingSpanwiseLoads.pad_spanwise_partials(
+                partials_stations
+            )
@@ -35,6 +35,12 @@ class ComputeMiscMass(om.ExplicitComponent):
 
         self.add_output("data:weight:airframe:wing:misc:mass", units="kg")
 
+        self.declare_partials(
+            of="*",
+            wrt=["data:geometry:wing:area", "settings:wing:structure:F_COMP"],
+            method="exact",
+        )
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
         Component that computes the misc mass necessary to react to the given linear force
@@ -50,3 +56,19 @@ class ComputeMiscMass(om.ExplicitComponent):
             misc_mass *= 1.1
 
         outputs["data:weight:airframe:wing:misc:mass"] = misc_mass
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        wing_area_sq_ft = inputs["data:geometry:wing:area"]
+        f_comp = inputs["settings:wing:structure:F_COMP"]
+
+        if inputs["data:geometry:propulsion:engine:count"] > 4:
+            engine_factor = 1.1
+        else:
+            engine_factor = 1.0
+
+        partials["data:weight:airframe:wing:misc:mass", "data:geometry:wing:area"] = (
+            0.16 * (1.0 - 0.3 * f_comp) * 1.2 * wing_area_sq_ft**0.2 * 0.453592 * engine_factor
+        )
+        partials["data:weight:airframe:wing:misc:mass", "settings:wing:structure:F_COMP"] = (
+            -0.16 * 0.3 * wing_area_sq_ft**1.2 * 0.453592 * engine_factor
+        )
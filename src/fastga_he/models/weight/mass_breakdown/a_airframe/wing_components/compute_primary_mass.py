@@ -47,6 +47,25 @@ class ComputePrimaryMass(om.ExplicitComponent):
 
         self.add_output("data:weight:airframe:wing:primary_structure:mass", units="kg")
 
+        self.declare_partials(
+            of="*",
+            wrt=[
+                "data:weight:airframe:wing:skin:mass",
+                "data:weight:airframe:wing:ribs:mass",
+                "data:weight:airframe:wing:misc:mass",
+            ],
+            val=1.0,
+        )
+        self.declare_partials(
+            of="*",
+            wrt=[
+                "data:weight:airframe:wing:web:mass:*",
+                "data:weight:airframe:wing:lower_flange:mass:*",
+                "data:weight:airframe:wing:upper_flange:mass:*",
+            ],
+            method="exact",
+        )
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         primary_mass = (
             max(
@@ -67,3 +86,18 @@ class ComputePrimaryMass(om.ExplicitComponent):
         )
 
         outputs["data:weight:airframe:wing:primary_structure:mass"] = primary_mass
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        for sub_component in ["web", "lower_flange", "upper_flange"]:
+            max_fuel_name = "data:weight:airframe:wing:" + sub_component + ":mass:max_fuel_in_wing"
+            min_fuel_name = "data:weight:airframe:wing:" + sub_component + ":mass:min_fuel_in_wing"
+
+            # Only the most constraining case counts, the one with the most fuel in case of a tie
+            max_fuel_sizing = inputs[max_fuel_name] >= inputs[min_fuel_name]
+
+            partials["data:weight:airframe:wing:primary_structure:mass", max_fuel_name] = np.where(
+                max_fuel_sizing, 1.0, 0.0
+            )
+            partials["data:weight:airframe:wing:primary_structure:mass", min_fuel_name] = np.where(
+                max_fuel_sizing, 0.0, 1.0
+            )
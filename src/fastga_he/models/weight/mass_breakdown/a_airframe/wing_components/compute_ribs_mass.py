@@ -50,6 +50,18 @@ class ComputeRibsMass(om.ExplicitComponent):
 
         self.add_output("data:weight:airframe:wing:ribs:mass", units="kg")
 
+        # The number of ribs is rounded, so the partials are approximated
+        self.declare_partials(
+            of="*",
+            wrt=[
+                "data:geometry:fuselage:maximum_width",
+                "data:geometry:fuselage:maximum_height",
+                "data:geometry:wing:*",
+                "settings:*",
+            ],
+            method="fd",
+        )
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
         Component that computes the ribs mass necessary to react to the given linear force
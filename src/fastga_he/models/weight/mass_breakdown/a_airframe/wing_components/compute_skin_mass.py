@@ -90,6 +90,21 @@ class ComputeSkinMass(om.ExplicitComponent):
 
         self.add_output("data:weight:airframe:wing:skin:mass", units="kg")
 
+        # The lift slope is interpolated and the most constraining speed is selected, so the
+        # partials are approximated, all the inputs are scalars except the mach interpolation
+        self.declare_partials(
+            of="*",
+            wrt=[
+                "data:geometry:fuselage:maximum_width",
+                "data:geometry:fuselage:maximum_height",
+                "data:geometry:wing:*",
+                "data:mission:sizing:*",
+                "data:aerodynamics:aircraft:mach_interpolation:*",
+                "settings:*",
+            ],
+            method="fd",
+        )
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         """
         Component that computes the skin mass necessary to react to the given linear force
@@ -0,0 +1,343 @@
+"""
+Computes the spanwise distributions shared by the models of the wing mass, based on the model
+presented by Raquel ALONSO in her MAE research project report.
+"""
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import openmdao.api as om
+import numpy as np
+
+from fastga_he.models.load_analysis.wing.aerostructural_loads import (
+    AerostructuralLoadHE,
+    SPAN_MESH_POINT_LOADS,
+    PADDED_AERODYNAMIC_INPUTS,
+)
+
+
+class ComputeWingSpanwiseLoads(om.ExplicitComponent):
+    """
+    Computes the y stations refined around the point masses, the chord and the linear lift
+    coefficients at those stations as well as the relief force with and without fuel in the
+    wing. Those do not depend on the load case, so they are computed once here and used by the
+    web and flange mass components rather than recomputed in each of them.
+
+    As with the loads, the arrays are padded with zeros to fit the format imposed by OpenMDAO.
+    """
+
+    def setup(self):
+        self.add_input("data:geometry:landing_gear:y", val=np.nan, units="m")
+        self.add_input("data:geometry:wing:span", val=np.nan, units="m")
+        self.add_input("data:geometry:wing:root:chord", val=np.nan, units="m")
+        self.add_input("data:geometry:wing:tip:chord", val=np.nan, units="m")
+
+        self.add_input(
+            "data:aerodynamics:wing:low_speed:Y_vector",
+            val=np.nan,
+            shape_by_conn=True,
+            units="m",
+        )
+        self.add_input(
+            "data:aerodynamics:wing:low_speed:chord_vector",
+            val=np.nan,
+            shape_by_conn=True,
+            copy_shape="data:aerodynamics:wing:low_speed:Y_vector",
+            units="m",
+        )
+        self.add_input(
+            "data:aerodynamics:wing:low_speed:CL_vector",
+            val=np.nan,
+            shape_by_conn=True,
+            copy_shape="data:aerodynamics:wing:low_speed:Y_vector",
+        )
+        self.add_input(
+            "data:aerodynamics:slipstream:wing:cruise:only_prop:CL_vector",
+            val=np.nan,
+            shape_by_conn=True,
+            copy_shape="data:aerodynamics:slipstream:wing:cruise:prop_on:Y_vector",
+        )
+        self.add_input(
+            "data:aerodynamics:slipstream:wing:cruise:prop_on:Y_vector",
+            val=np.nan,
+            shape_by_conn=True,
+            units="m",
+        )
+        self.add_input("data:weight:airframe:landing_gear:main:mass", val=np.nan, units="kg")
+        self.add_input(
+            "data:weight:airframe:wing:punctual_mass:y_ratio",
+            shape_by_conn=True,
+            val=0.0,
+        )
+        self.add_input(
+            "data:weight:airframe:wing:punctual_mass:mass",
+            shape_by_conn=True,
+            copy_shape="data:weight:airframe:wing:punctual_mass:y_ratio",
+            units="kg",
+            val=0.0,
+        )
+        # Same as with punctual loads expect here, we will have a tag to "turn it off" when at MZFW
+        self.add_input(
+            "data:weight:airframe:wing:punctual_tanks:y_ratio",
+            shape_by_conn=True,
+            val=0.0,
+        )
+        self.add_input(
+            "data:weight:airframe:wing:punctual_tanks:fuel_inside",
+            shape_by_conn=True,
+            copy_shape="data:weight:airframe:wing:punctual_tanks:y_ratio",
+            units="kg",
+            val=0.0,
+        )
+        # Here we add all the inputs necessary for the addition of the distributed mass other
+        # than the fuel (batteries for instance), this input will later be an output of the
+        # powertrain sizing but their default value will be set at 0 so that it is used the same
+        # way as before even when not using the pt file. Note that setting the inputs like that
+        # imposes that they are provided as inputs somewhere else as it cannot take default value
+        self.add_input(
+            "data:weight:airframe:wing:distributed_mass:y_ratio_start",
+            shape_by_conn=True,
+            val=0.0,
+            desc="Array containing the starting positions of all distributed mass on the wing",
+        )
+        self.add_input(
+            "data:weight:airframe:wing:distributed_mass:y_ratio_end",
+            shape_by_conn=True,
+            val=0.0,
+            desc="Array containing the end positions of all distributed mass on the wing",
+            copy_shape="data:weight:airframe:wing:distributed_mass:y_ratio_start",
+        )
+        self.add_input(
+            "data:weight:airframe:wing:distributed_mass:start_chord",
+            shape_by_conn=True,
+            val=0.0,
+            units="m",
+            desc="Array containing the value of the wing chord at the beginning of the distributed mass",
+            copy_shape="data:weight:airframe:wing:distributed_mass:y_ratio_start",
+        )
+        self.add_input(
+            "data:weight:airframe:wing:distributed_mass:chord_slope",
+            shape_by_conn=True,
+            val=0.0,
+            desc="Array containing the value of the chord slope for the distributed mass. Mass is assumed to vary with chord only (not thickness)",
+            copy_shape="data:weight:airframe:wing:distributed_mass:y_ratio_start",
+        )
+        self.add_input(
+            "data:weight:airframe:wing:distributed_mass:mass",
+            shape_by_conn=True,
+            val=0.0,
+            units="kg",
+            desc="Array containing the value of masses that are distributed on the wing",
+            copy_shape="data:weight:airframe:wing:distributed_mass:y_ratio_start",
+        )
+        # Here we add all the inputs necessary for the addition of the distributed tanks
+        self.add_input(
+            "data:weight:airframe:wing:distributed_tanks:y_ratio_start",
+            shape_by_conn=True,
+            val=np.nan,
+            desc="Array containing the starting positions of all distributed tanks on the wing",
+        )
+        self.add_input(
+            "data:weight:airframe:wing:distributed_tanks:y_ratio_end",
+            shape_by_conn=True,
+            val=np.nan,
+            desc="Array containing the end positions of all distributed tanks on the wing",
+            copy_shape="data:weight:airframe:wing:distributed_tanks:y_ratio_start",
+        )
+        self.add_input(
+            "data:weight:airframe:wing:distributed_tanks:start_chord",
+            shape_by_conn=True,
+            val=np.nan,
+            units="m",
+            desc="Array containing the value of the wing chord at the beginning of the distributed tanks",
+            copy_shape="data:weight:airframe:wing:distributed_tanks:y_ratio_start",
+        )
+        self.add_input(
+            "data:weight:airframe:wing:distributed_tanks:chord_slope",
+            shape_by_conn=True,
+            val=np.nan,
+            desc="Array containing the value of the chord slope for the distributed tanks. Fuel mass is assumed to vary with chord only (not thickness)",
+            copy_shape="data:weight:airframe:wing:distributed_tanks:y_ratio_start",
+        )
+        self.add_input(
+            "data:weight:airframe:wing:distributed_tanks:fuel_inside",
+            shape_by_conn=True,
+            val=np.nan,
+            units="kg",
+            desc="Array containing the value of fuel inside the tanks that are distributed on the wing",
+            copy_shape="data:weight:airframe:wing:distributed_tanks:y_ratio_start",
+        )
+
+        self.add_input("data:weight:airframe:wing:mass", val=np.nan, units="kg")
+
+        self.add_output(
+            "data:loads:wing:spanwise:y_vector",
+            units="m",
+            shape=SPAN_MESH_POINT_LOADS,
+            desc="Y stations at which the distributions are given, refined around point masses",
+        )
+        self.add_output(
+            "data:loads:wing:spanwise:chord_vector",
+            units="m",
+            shape=SPAN_MESH_POINT_LOADS,
+            desc="Chord of the wing at the y stations",
+        )
+        self.add_output(
+            "data:loads:wing:spanwise:lift_chord",
+            units="m",
+            shape=SPAN_MESH_POINT_LOADS,
+            desc="Product of the low speed lift coefficient and the chord at the y stations",
+        )
+        self.add_output(
+            "data:loads:wing:spanwise:slipstream_lift_chord",
+            units="m",
+            shape=SPAN_MESH_POINT_LOADS,
+            desc="Product of the lift coefficient increase due to the slipstream and the chord at "
+            "the y stations",
+        )
+        self.add_output(
+            "data:loads:wing:spanwise:relief_force:max_fuel_in_wing",
+            units="N/m",
+            shape=SPAN_MESH_POINT_LOADS,
+            desc="Linear weight of the components on the wing at the y stations with the tanks "
+            "full, for a load factor of 1",
+        )
+        self.add_output(
+            "data:loads:wing:spanwise:relief_force:min_fuel_in_wing",
+            units="N/m",
+            shape=SPAN_MESH_POINT_LOADS,
+            desc="Linear weight of the components on the wing at the y stations with the tanks "
+            "empty, for a load factor of 1",
+        )
+
+        # The y stations are refined around the point masses and the distributions are
+        # interpolated on them, so the partials are computed with the complex step
+        self.declare_partials(
+            of="*",
+            wrt=[
+                "data:geometry:landing_gear:y",
+                "data:geometry:wing:span",
+                "data:geometry:wing:root:chord",
+                "data:geometry:wing:tip:chord",
+                "data:weight:*",
+            ]
+            + PADDED_AERODYNAMIC_INPUTS,
+            method="cs",
+        )
+
+    def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
+        wing_mass = inputs["data:weight:airframe:wing:mass"]
+
+        (
+            y_vector_orig,
+            y_vector_slip_orig,
+            cl_vector_orig,
+            cl_vector_slip,
+            chord_vector_orig,
+        ) = AerostructuralLoadHE.complete_span_vectors(
+            inputs["data:aerodynamics:wing:low_speed:Y_vector"],
+            inputs["data:aerodynamics:slipstream:wing:cruise:prop_on:Y_vector"],
+            inputs["data:aerodynamics:wing:low_speed:CL_vector"],
+            inputs["data:aerodynamics:slipstream:wing:cruise:only_prop:CL_vector"],
+            inputs["data:aerodynamics:wing:low_speed:chord_vector"],
+            inputs["data:geometry:wing:span"] / 2.0,
+            root_chord=inputs["data:geometry:wing:root:chord"],
+            tip_chord=inputs["data:geometry:wing:tip:chord"],
+        )
+
+        # The stations added for the point masses don't depend on the quantity of fuel so they
+        # are the same in both cases
+        y_vector, weight_array_max_fuel = AerostructuralLoadHE.compute_relief_force(
+            inputs, y_vector_orig, chord_vector_orig, wing_mass, 1.0
+        )
+        _, weight_array_min_fuel = AerostructuralLoadHE.compute_relief_force(
+            inputs, y_vector_orig, chord_vector_orig, wing_mass, 0.0
+        )
+        cl_s = AerostructuralLoadHE.compute_cl_s(
+            y_vector_orig, y_vector_orig, y_vector, cl_vector_orig, chord_vector_orig
+        )
+        cl_s_slip = AerostructuralLoadHE.compute_cl_s(
+            y_vector_slip_orig, y_vector_orig, y_vector, cl_vector_slip, chord_vector_orig
+        )
+        chord_vector = AerostructuralLoadHE.interpolate(y_vector_orig, chord_vector_orig, y_vector)
+
+        additional_zeros = np.zeros(SPAN_MESH_POINT_LOADS - len(y_vector))
+
+        outputs["data:loads:wing:spanwise:y_vector"] = np.concatenate([y_vector, additional_zeros])
+        outputs["data:loads:wing:spanwise:chord_vector"] = np.concatenate(
+            [chord_vector, additional_zeros]
+        )
+        outputs["data:loads:wing:spanwise:lift_chord"] = np.concatenate([cl_s, additional_zeros])
+        outputs["data:loads:wing:spanwise:slipstream_lift_chord"] = np.concatenate(
+            [cl_s_slip, additional_zeros]
+        )
+        outputs["data:loads:wing:spanwise:relief_force:max_fuel_in_wing"] = np.concatenate(
+            [weight_array_max_fuel, additional_zeros]
+        )
+        outputs["data:loads:wing:spanwise:relief_force:min_fuel_in_wing"] = np.concatenate(
+            [weight_array_min_fuel, additional_zeros]
+        )
+
+    @staticmethod
+    def get_spanwise_loads(inputs, min_fuel_in_wing: bool = False):
+        """
+        Returns the y stations, chord, linear lift coefficients and relief force computed by
+        the component, without the additional zeros.
+
+        :param inputs: inputs of a component connected to the outputs of this component.
+        :param min_fuel_in_wing: True to get the relief force with the tanks empty.
+        """
+
+        y_vector = AerostructuralLoadHE.delete_additional_zeros(
+            inputs["data:loads:wing:spanwise:y_vector"]
+        )
+        nb_stations = len(y_vector)
+
+        if min_fuel_in_wing:
+            weight_array = inputs["data:loads:wing:spanwise:relief_force:min_fuel_in_wing"]
+        else:
+            weight_array = inputs["data:loads:wing:spanwise:relief_force:max_fuel_in_wing"]
+
+        return (
+            y_vector,
+            inputs["data:loads:wing:spanwise:chord_vector"][:nb_stations],
+            inputs["data:loads:wing:spanwise:lift_chord"][:nb_stations],
+            inputs["data:loads:wing:spanwise:slipstream_lift_chord"][:nb_stations],
+            weight_array[:nb_stations],
+        )
+
+    @staticmethod
+    def get_spanwise_loads_names(min_fuel_in_wing: bool = False) -> list:
+        """
+        Returns the name of the inputs whose values are returned by get_spanwise_loads, in the
+        same order.
+
+        :param min_fuel_in_wing: True to get the relief force with the tanks empty.
+        """
+
+        if min_fuel_in_wing:
+            relief_force_name = "data:loads:wing:spanwise:relief_force:min_fuel_in_wing"
+        else:
+            relief_force_name = "data:loads:wing:spanwise:relief_force:max_fuel_in_wing"
+
+        return [
+            "data:loads:wing:spanwise:y_vector",
+            "data:loads:wing:spanwise:chord_vector",
+            "data:loads:wing:spanwise:lift_chord",
+            "data:loads:wing:spanwise:slipstream_lift_chord",
+            relief_force_name,
+        ]
+
+    @staticmethod
+    def pad_spanwise_partials(partials_array):
+        """
+        Adds zeros to partials computed with respect to the values returned by
+        get_spanwise_loads so that they fit the format imposed by OpenMDAO. The additional
+        zeros of the inputs are not used so the partials with respect to them are nil.
+
+        :param partials_array: partials with respect to the values at the y stations.
+        """
+
+        return np.concatenate(
+            [partials_array, np.zeros(SPAN_MESH_POINT_LOADS - len(partials_array))]
+        )
@@ -27,6 +27,8 @@ class UpdateWingMass(om.ExplicitComponent):
 
         self.add_output("data:weight:airframe:wing:mass", val=100.0, units="kg")
 
+        self.declare_partials(of="*", wrt="*", method="exact")
+
     def compute(self, inputs, outputs, discrete_inputs=None, discrete_outputs=None):
         primary_structure_mass = inputs["data:weight:airframe:wing:primary_structure:mass"]
         secondary_structure_mass = inputs["data:weight:airframe:wing:secondary_structure:mass"]
@@ -36,3 +38,18 @@ class UpdateWingMass(om.ExplicitComponent):
         outputs["data:weight:airframe:wing:mass"] = (
             wing_mass * inputs["data:weight:airframe:wing:k_factor"]
         )
+
+    def compute_partials(self, inputs, partials, discrete_inputs=None):
+        primary_structure_mass = inputs["data:weight:airframe:wing:primary_structure:mass"]
+        secondary_structure_mass = inputs["data:weight:airframe:wing:secondary_structure:mass"]
+        k_factor = inputs["data:weight:airframe:wing:k_factor"]
+
+        partials[
+            "data:weight:airframe:wing:mass", "data:weight:airframe:wing:primary_structure:mass"
+        ] = k_factor
+        partials[
+            "data:weight:airframe:wing:mass", "data:weight:airframe:wing:secondary_structure:mass"
+        ] = k_factor
+        partials["data:weight:airframe:wing:mass", "data:weight:airframe:wing:k_factor"] = (
+            primary_structure_mass + secondary_structure_mass
+        )
@@ -35,6 +35,42 @@ def test_compute_wing_mass_analytical():
     assert problem["data:weight:airframe:wing:mass"] == pytest.approx(172.0, abs=1e-2)
 
 
+def test_compute_wing_mass_analytical_derivatives():
+    # Research independent input value in .xml file
+    ivc = get_indep_var_comp(list_inputs(ComputeWingMassAnalytical()), __file__, XML_FILE)
+
+    problem = run_system(ComputeWingMassAnalytical(), ivc)
+
+    inputs_name = [
+        "data:geometry:wing:span",
+        "data:geometry:wing:area",
+        "data:weight:aircraft:MTOW",
+        "data:weight:aircraft:MZFW",
+    ]
+    totals = problem.compute_totals(of=["data:weight:airframe:wing:mass"], wrt=inputs_name)
+
+    # Compared to central finite differences on the whole wing mass loop. The relief uses the
+    # smallest of the MTOW and the MZFW, so the derivative with respect to the MTOW is zero here.
+    for input_name in inputs_name:
+        input_value = problem.get_val(input_name).copy()
+        step = 1e-3 * input_value
+
+        problem.set_val(input_name, input_value + step)
+        problem.run_model()
+        wing_mass_plus = problem.get_val("data:weight:airframe:wing:mass").copy()
+
+        problem.set_val(input_name, input_value - step)
+        problem.run_model()
+        wing_mass_minus = problem.get_val("data:weight:airframe:wing:mass").copy()
+
+        problem.set_val(input_name, input_value)
+
+        derivative_fd = (wing_mass_plus - wing_mass_minus) / (2.0 * step)
+        derivative = totals["data:weight:airframe:wing:mass", input_name]
+
+        assert derivative.flatten() == pytest.approx(derivative_fd, rel=5e-2, abs=1e-6)
+
+
 def test_payload_mass():
     """Tests propulsion weight computation from sample XML data."""
 
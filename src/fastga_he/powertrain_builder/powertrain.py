@@ -7,11 +7,15 @@ power train module with the aircraft sizing modules from FAST-OAD-GA based on th
 # Copyright (C) 2025 ISAE-SUPAERO
 
 import copy
+import hashlib
 import json
 import logging
+import os
+import pickle
 import sys
 import os.path as pth
 import pathlib
+import tempfile
 import time
 
 from abc import ABC
@@ -53,6 +57,13 @@ KEY_PT_WATCHER = "watcher_file_path"
 
 PT_DATA_PREFIX = "data:propulsion:he_power_train:"
 
+# Environment variable containing the path to the folder where the products of the reading of the
+# power train files are stored, if not set, they are only cached in memory. An environment
+# variable is used so that child processes, e.g. the workers of a parallel DOE, inherit it.
+DISK_CACHE_ENVIRONMENT_VARIABLE = "FASTGA_HE_POWER_TRAIN_CACHE_FOLDER"
+# Hash of the files that define how the power train files are read, computed on first use
+_REGISTERED_COMPONENTS_VERSION = None
+
 PROMOTION_FROM_MISSION = {
     "thrust": "N",
     "altitude": "m",
@@ -97,6 +108,11 @@ CONNECTION_VARIABLE = [
     "_connection_list",
     "_components_connection_outputs",
     "_components_connection_inputs",
+    "_components_connection_output_to_input",
+    "_components_connection_input_to_output",
+    "_components_name_to_id",
+    "_components_name_to_efficiency",
+    "_components_name_to_options",
 ]
 
 
@@ -174,6 +190,18 @@ class FASTGAHEPowerTrainConfigurator:
         # connections between components
         self._components_connection_inputs = None
 
+        # Contains, for each output (resp. input) needed to make the connections between
+        # components, the input (resp. output) it is connected to. Avoids searching the lists
+        # above each time the connected variable is needed
+        self._components_connection_output_to_input = None
+        self._components_connection_input_to_output = None
+
+        # Contains the id, efficiency and options of each component indexed by its name. Built
+        # once the connections are generated since some options are only set at that point
+        self._components_name_to_id = None
+        self._components_name_to_efficiency = None
+        self._components_name_to_options = None
+
         # Contains a list, for each component, of all the variables that will be monitored in the
         # performances watcher of the power train, meaning this should be a list of list
         self._components_perf_watchers = None
@@ -247,6 +275,10 @@ class FASTGAHEPowerTrainConfigurator:
 
         self._reset_cache_instance()
 
+        # A new process can reuse the products of the reading of the same file by another one
+        if not FASTGAHEPowerTrainConfigurator._cache[self._power_train_file].get("_serializer"):
+            self._read_disk_cache_instance()
+
         if not FASTGAHEPowerTrainConfigurator._cache[self._power_train_file].get("_serializer"):
             self._serializer = _YAMLSerializer()
             self._serializer.read(self._power_train_file)
@@ -419,17 +451,30 @@ class FASTGAHEPowerTrainConfigurator:
                     components_options_list.append(component["options"])
 
                     # While we are at it, we also check that we have the right options and with the
-                    # right names
+                    # right names. All the mandatory options must be declared while the optional
+                    # ones can be omitted
 
-                    if set(component["options"].keys()) != set(
-                        resources.DICTIONARY_ATT[component_id]
+                    mandatory_options = set(resources.DICTIONARY_ATT[component_id] or [])
+                    optional_options = set(resources.DICTIONARY_OPT_ATT[component_id])
+                    declared_options = set(component["options"].keys())
+
+                    if not (
+                        mandatory_options
+                        <= declared_options
+                        <= mandatory_options | optional_options
                     ):
                         raise FASTGAHEUnknownOption(
                             "Component "
                             + component_id
                             + " does not have all options declare or they "
                             "have an erroneous name. The following options should be declared: "
-                            + ", ".join(resources.DICTIONARY_ATT[component_id])
+                            + ", ".join(sorted(mandatory_options))
+                            + (
+                                " and the following ones can be declared: "
+                                + ", ".join(sorted(optional_options))
+                                if optional_options
+                                else ""
+                            )
                         )
                 else:
                     components_options_list.append(None)
@@ -469,7 +514,7 @@ class FASTGAHEPowerTrainConfigurator:
 
         pt_cache = FASTGAHEPowerTrainConfigurator._cache[self._power_train_file]
 
-        if not pt_cache.get("_connections_list"):
+        if not pt_cache.get("_connection_list"):
             self._generate_connections_list()
             # Populate cache
             self._set_cache_instance(CONNECTION_VARIABLE)
@@ -481,6 +526,7 @@ class FASTGAHEPowerTrainConfigurator:
 
         if not pt_cache.get("get_connection_time"):
             pt_cache["get_connection_time"] = end_time - start_time
+            self._write_disk_cache_instance()
 
     def _generate_connections_list(self):
         """
@@ -584,6 +630,13 @@ class FASTGAHEPowerTrainConfigurator:
 
                 if not target_option:
                     self._components_options[target_index] = {"direct_bus_connection": True}
+                # Options may have been declared in the power train file, in which case the
+                # direct connection is added to them
+                elif "direct_bus_connection" not in target_option:
+                    self._components_options[target_index] = {
+                        **target_option,
+                        "direct_bus_connection": True,
+                    }
 
                 current_outputs = resources.DICTIONARY_OUT[target_id]
 
@@ -645,6 +698,24 @@ class FASTGAHEPowerTrainConfigurator:
         self._components_connection_outputs = openmdao_output_list
         self._components_connection_inputs = openmdao_input_list
 
+        # Only the first occurrence is kept, as would be the case when using list.index()
+        output_to_input = {}
+        input_to_output = {}
+        for openmdao_output, openmdao_input in zip(openmdao_output_list, openmdao_input_list):
+            output_to_input.setdefault(openmdao_output, openmdao_input)
+            input_to_output.setdefault(openmdao_input, openmdao_output)
+
+        self._components_connection_output_to_input = output_to_input
+        self._components_connection_input_to_output = input_to_output
+
+        self._components_name_to_id = dict(zip(self._components_name, self._components_id))
+        self._components_name_to_efficiency = dict(
+            zip(self._components_name, self._components_efficiency)
+        )
+        self._components_name_to_options = dict(
+            zip(self._components_name, self._components_options)
+        )
+
     def _check_connection(self, connections_list):
         """
         This function ensures that all the connections defined in the powertrain respect the
@@ -1564,7 +1635,7 @@ class FASTGAHEPowerTrainConfigurator:
         components_name_organised_list = []
 
         name_to_id = dict(zip(self._components_name, self._components_id))
-        id_to_option = dict(zip(self._components_id, self._components_options))
+        name_to_option = dict(zip(self._components_name, self._components_options))
 
         for component_name, components_perf_watchers in zip(
             self._components_name, self._components_perf_watchers
@@ -1575,9 +1646,13 @@ class FASTGAHEPowerTrainConfigurator:
             # a unique case
             component_id = name_to_id[component_name]
             if component_id == "fastga_he.pt_component.battery_pack":
-                component_option = id_to_option[component_id]
-                # If there is a direct connection, the option won't be empty
-                if component_option and {"voltage_out": "V"} in component_perf_watchers_copy:
+                component_option = name_to_option[component_name]
+                # Other options can be declared so we check the direct connection one explicitly
+                if (
+                    component_option
+                    and component_option.get("direct_bus_connection")
+                    and {"voltage_out": "V"} in component_perf_watchers_copy
+                ):
                     # We remove what has become an input and add what has become an output
                     component_perf_watchers_copy.remove({"voltage_out": "V"})
                     component_perf_watchers_copy.append({"dc_current_out": "A"})
@@ -2116,6 +2191,99 @@ class FASTGAHEPowerTrainConfigurator:
 
         FASTGAHEPowerTrainConfigurator._cache[self._power_train_file] = pt_cache
 
+    @staticmethod
+    def set_disk_cache_folder(disk_cache_folder_path=None):
+        """
+        Sets the folder where the products of the reading of the power train files (parsed file,
+        components and connections lists) are stored so that they can be reused by other
+        processes. The folder is given through an environment variable so that it is also used
+        by the processes started afterward.
+
+        :param disk_cache_folder_path: path to the folder, if None the products are only cached
+        in memory.
+        """
+
+        if disk_cache_folder_path is None:
+            os.environ.pop(DISK_CACHE_ENVIRONMENT_VARIABLE, None)
+        else:
+            os.environ[DISK_CACHE_ENVIRONMENT_VARIABLE] = str(disk_cache_folder_path)
+
+    def _get_disk_cache_file_path(self):
+        """
+        Returns the path to the file in which the cache instance of the power train file is
+        stored on disk, or None if the disk cache is not used. The name of the file is a hash of
+        the content of the power train file and of the files that define how it is read, so that
+        a modification of either makes the previous instances unusable.
+        """
+
+        disk_cache_folder_path = os.environ.get(DISK_CACHE_ENVIRONMENT_VARIABLE)
+        if not disk_cache_folder_path:
+            return None
+
+        file_hash = hashlib.sha256(_get_registered_components_version().encode())
+        file_hash.update(pathlib.Path(self._power_train_file).read_bytes())
+
+        return pth.join(disk_cache_folder_path, file_hash.hexdigest() + ".pkl")
+
+    def _read_disk_cache_instance(self):
+        """
+        Replaces the cache instance of the power train file with the one stored on disk, if it
+        exists. Any file that can't be read is ignored.
+        """
+
+        disk_cache_file_path = self._get_disk_cache_file_path()
+        if not disk_cache_file_path or not pth.exists(disk_cache_file_path):
+            return
+
+        try:
+            with open(disk_cache_file_path, "rb") as disk_cache_file:
+                disk_pt_cache = pickle.load(disk_cache_file)
+        except Exception as error:
+            _LOGGER.debug(
+                "Could not read the cache of %s from %s: %s",
+                self._power_train_file,
+                disk_cache_file_path,
+                error,
+            )
+            return
+
+        pt_cache = FASTGAHEPowerTrainConfigurator._cache[self._power_train_file]
+        disk_pt_cache["last_mod_time"] = pathlib.Path(self._power_train_file).lstat().st_mtime
+        if pt_cache.get("skip_test"):
+            disk_pt_cache["skip_test"] = True
+
+        FASTGAHEPowerTrainConfigurator._cache[self._power_train_file] = disk_pt_cache
+
+    def _write_disk_cache_instance(self):
+        """
+        Stores the cache instance of the power train file on disk. The file is first written
+        under a temporary name and then renamed so that concurrent processes never read a
+        partially written file.
+        """
+
+        disk_cache_file_path = self._get_disk_cache_file_path()
+        if not disk_cache_file_path:
+            return
+
+        try:
+            os.makedirs(pth.dirname(disk_cache_file_path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=pth.dirname(disk_cache_file_path), suffix=".tmp", delete=False
+            ) as disk_cache_file:
+                pickle.dump(
+                    FASTGAHEPowerTrainConfigurator._cache[self._power_train_file],
+                    disk_cache_file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+            os.replace(disk_cache_file.name, disk_cache_file_path)
+        except OSError as error:
+            _LOGGER.warning(
+                "Could not write the cache of %s in %s: %s",
+                self._power_train_file,
+                disk_cache_file_path,
+                error,
+            )
+
     @staticmethod
     def get_number_of_cell_in_series(component_name: str, component_type: str, inputs) -> float:
         """
@@ -2278,7 +2446,7 @@ class FASTGAHEPowerTrainConfigurator:
         number_of_points = len(power_output)
 
         # First we need to search what mode the splitter is in
-        name_to_option = dict(zip(self._components_name, self._components_options))
+        name_to_option = self._components_name_to_options
 
         # Check that an option is declared, else it means it is in default mode which is
         # percent_split
@@ -2326,7 +2494,7 @@ class FASTGAHEPowerTrainConfigurator:
         number_of_points = len(power_output)
 
         # First we need to search what mode the gearbox is in
-        name_to_option = dict(zip(self._components_name, self._components_options))
+        name_to_option = self._components_name_to_options
 
         # Check that an option is declared, else it means it is in default mode which is
         # percent_split
@@ -2359,247 +2527,151 @@ class FASTGAHEPowerTrainConfigurator:
 
         return primary_input, secondary_output
 
-    def get_power_to_set(self, inputs, propulsive_power_dict: dict) -> Tuple[dict, dict]:
+    def _get_power_propagation_plan(self, propulsive_nodes: tuple) -> dict:
         """
-        Returns a list of the power at each nodes of each subgraph. Also returns a list of the
-        dict of current variable names and the value they should be set at for each of the
-        subgraph. Dict will be empty if there is no power to set. The power to set are defined in
-        the registered_components.py file.
+        Returns the plan used to propagate the propulsive power from the propulsors to the
+        sources. It contains the list of nodes of the graph, the operations to perform on them in
+        topological order, the nodes to remove from the result and where to read each power to
+        set. As it only depends on the powertrain architecture and on which nodes are propulsors,
+        it is computed once and stored in the cache.
 
-        :param inputs: inputs vector, in the OpenMDAO format, which contains the value of the
-        voltages to check
-        :param propulsive_power_dict: dictionary with the propulsive power of each propulsor
+        :param propulsive_nodes: tuple with the name of the nodes where the propulsive power is
+        given
         """
 
-        # We rewrite the propulsive power dict to match the name of the nodes
-        propulsive_loads_name = list(propulsive_power_dict.keys())
-        propulsive_loads_proper_name = []
-        proper_propulsive_power_dict = {}
+        pt_cache = FASTGAHEPowerTrainConfigurator._cache[self._power_train_file]
+        plan_cache = pt_cache.setdefault("_power_propagation_plan", {})
 
-        for propulsive_load_name in propulsive_loads_name:
-            propulsive_load_proper_name = propulsive_load_name + "_out"
-            propulsive_loads_proper_name.append(propulsive_load_name)
-            proper_propulsive_power_dict[propulsive_load_proper_name] = propulsive_power_dict[
-                propulsive_load_name
-            ]
+        if propulsive_nodes in plan_cache:
+            return plan_cache[propulsive_nodes]
 
         graph = self.get_directed_graph_sub_propulsion_chain()
 
-        # Need to be put here else the _get_component hasn't triggered yet
-        name_to_id = dict(zip(self._components_name, self._components_id))
-        name_to_eta = dict(zip(self._components_name, self._components_efficiency))
+        name_to_id = self._components_name_to_id
+        name_to_eta = self._components_name_to_efficiency
+        output_to_input = self._components_connection_output_to_input
+        input_to_output = self._components_connection_input_to_output
 
-        # Get a list of nodes who hasn't been treated, will serve as way to check that good
-        # progress is made.
-        untreated_nodes = list(graph.nodes)
+        graph_nodes = list(graph.nodes)
 
-        power_at_each_node = {}
-        # Initialize the dict with the power at each node with an array full of zeros except for
-        # propulsors.
-        template_power = list(proper_propulsive_power_dict.values())[0]
-        treated_nodes = []
-        for untreated_node in untreated_nodes:
-            if untreated_node in list(proper_propulsive_power_dict.keys()):
-                power_at_each_node[untreated_node] = proper_propulsive_power_dict[untreated_node]
-                treated_nodes.append(untreated_node)
-            else:
-                power_at_each_node[untreated_node] = np.zeros_like(template_power)
+        # Nodes are treated once all their predecessors have been treated, so we keep track of
+        # the number of untreated predecessors for each node and treat them in topological order
+        # starting from the propulsors. Nodes without predecessors which are not propulsors,
+        # and all the nodes downstream of them, are never treated and their power remains zero.
+        propulsive_nodes_set = set(propulsive_nodes)
+        treated_nodes = [node for node in graph_nodes if node in propulsive_nodes_set]
+        treated_nodes_set = set(treated_nodes)
+        untreated_predecessors = {node: len(graph.pred[node]) for node in graph_nodes}
 
+        steps = []
         node_to_remove_at_the_end = []
 
-        # Remove treated nodes
-        untreated_nodes = [x for x in untreated_nodes if x not in treated_nodes]
+        idx_node = 0
+        while idx_node < len(treated_nodes):
+            treated_node = treated_nodes[idx_node]
+            idx_node += 1
 
-        # Now we can start treating the nodes. We'll just keep going over the graph until all
-        # nodes have been treated and we'll check that progress is being made by monitoring the
-        # number of nodes treated each loop.
-        previous_treated_node_number = 1
+            for node in graph.succ[treated_node]:
+                untreated_predecessors[node] -= 1
 
-        while len(untreated_nodes) != 0 and previous_treated_node_number != 0:
-            previous_treated_node_number = 0
-
-            for node in untreated_nodes:
-                # First check that we can treat the node. If we can't we move to the next node.
-                # A node can be treated if all its predecessor were treated
-                can_be_treated = True
-                for predecessor in graph.pred[node]:
-                    if predecessor not in treated_nodes:
-                        can_be_treated = False
-
-                if not can_be_treated:
+                if untreated_predecessors[node] != 0 or node in treated_nodes_set:
                     continue
 
-                component_name = copy.deepcopy(node)
+                treated_nodes.append(node)
+                treated_nodes_set.add(node)
+
+                component_name = node
                 component_end = component_name[-1]
                 if component_end.isdigit():
                     str_to_replace = "_" + component_end
                     component_name = component_name.replace(str_to_replace, "")
                 component_name = component_name.replace("_out", "").replace("_in", "")
 
-                # Here we are sure the node can be treated. But we'll add it to the list of
-                # treated nodes only after we compute its value. Several case can however happen.
-
-                # 1) If it only has one predecessor and that predecessor only has one successor it
-                # means its either the connection between the input and output of a component so
-                # we include the efficiency or its the output of a component connected to the
-                # input of another one.
-                if len(list(graph.pred[node])) == 1:
-                    predecessor = list(graph.pred[node])[0]
-                    if predecessor.endswith("_1"):
-                        predecessor = predecessor.replace("_1", "")
-                    predecessor_name = predecessor.replace("_out", "").replace("_in", "")
-
-                    if len(list(graph.succ[predecessor])) == 1:
-                        # To get the component name, we remove the "_in" the "_out" and the "_1".
-                        # We should only have to remove the "_1" as we are ensure that there is
-                        # only one predecessor it must be a "_1"
-
-                        # if name is the same, we compute the power below base on the efficiency,
-                        # else its the same power, to refactor, we'll just say the efficiency is 1
-                        if component_name == predecessor_name:
-                            eta = name_to_eta[component_name]
-                        else:
-                            eta = 1.0
-
-                        power_at_each_node[node] = power_at_each_node[predecessor] / eta
-
-                        treated_nodes.append(node)
-                        previous_treated_node_number += 1
-                        continue
-
-                # 2) If it only has one predecessor and that predecessor only more than successor it
-                # means its a component that splits_power (either planetary gear, splitter, ...).
-                if len(list(graph.pred[node])) == 1:
-                    predecessor = list(graph.pred[node])[0]
-                    if predecessor.endswith("_1"):
-                        predecessor = predecessor.replace("_1", "")
-                    predecessor_name = predecessor.replace("_out", "").replace("_in", "")
-
-                    if len(list(graph.succ[predecessor])) > 1:
-                        # Check the predecessor type
-                        predecessor_type = name_to_id[predecessor_name]
-
-                        if predecessor_type == "fastga_he.pt_component.dc_splitter":
-                            (
-                                primary_input_power,
-                                secondary_power_output,
-                            ) = self.splitter_power_inputs(
-                                inputs=inputs,
-                                components_name=predecessor_name,
-                                power_output=power_at_each_node[predecessor],
-                            )
-
-                            # Then identify which current output it correspond to. Here if the
-                            # component in question is not an sspc, the following should work.
-                            # Else we will try both way
-
-                            output_name = component_name + ".dc_current_out"
-                            if name_to_id[component_name] == "fastga_he.pt_component.dc_sspc":
-                                if output_name not in self._components_connection_outputs:
-                                    output_name = component_name + ".dc_current_in"
-
-                            if name_to_id[component_name] == "fastga_he.pt_component.dc_line":
-                                output_name = component_name + ".dc_current"
-
-                            # We look at the number of the corresponding splitter input
-                            index = self._components_connection_outputs.index(output_name)
-                            splitter_input_name = self._components_connection_inputs[index]
-
-                            if splitter_input_name.endswith("1"):
-                                power_at_each_node[node] = primary_input_power
-                                power_at_each_node[predecessor + "_1"] = primary_input_power
-                            else:
-                                power_at_each_node[node] = secondary_power_output
-                                power_at_each_node[predecessor + "_2"] = secondary_power_output
-
-                            if predecessor not in node_to_remove_at_the_end:
-                                node_to_remove_at_the_end.append(predecessor)
-
-                        elif predecessor_type == "fastga_he.pt_component.planetary_gear":
-                            (
-                                primary_input_power,
-                                secondary_power_output,
-                            ) = self.gearbox_power_inputs(
-                                inputs=inputs,
-                                components_name=predecessor_name,
-                                power_output=power_at_each_node[predecessor],
-                            )
+                # If it has more than one predecessor it is the output of a bus/fuel system/gear.
+                # In this case we simply sum all the predecessor.
+                if len(graph.pred[node]) > 1:
+                    steps.append(("sum", node, tuple(graph.pred[node])))
+                    continue
 
-                            # We look at the number of the corresponding gearbox input. Will be a
-                            # bit farfetched as we need to find using the current neighbor. For
-                            # gearboxes, the two connexion are rpm and shaft power and they are
-                            # both output of the input side of the gearbox, so we'll have to use
-                            # the input list
-                            # We look at the number of the corresponding splitter input
-                            input_name = component_name + ".shaft_power_out"
-                            index = self._components_connection_inputs.index(input_name)
-                            gearbox_input_name = self._components_connection_outputs[index]
-
-                            if gearbox_input_name.endswith("1"):
-                                power_at_each_node[node] = primary_input_power
-                                power_at_each_node[predecessor + "_1"] = primary_input_power
-                            else:
-                                power_at_each_node[node] = secondary_power_output
-                                power_at_each_node[predecessor + "_2"] = primary_input_power
-
-                            if predecessor not in node_to_remove_at_the_end:
-                                node_to_remove_at_the_end.append(predecessor)
-
-                        elif predecessor_type == "fastga_he.pt_component.fuel_system":
-                            input_power_dict = self.fuel_system_power_inputs(
-                                inputs=inputs,
-                                components_name=predecessor_name,
-                                power_output=power_at_each_node[predecessor],
-                            )
+                predecessor = list(graph.pred[node])[0]
+                if predecessor.endswith("_1"):
+                    predecessor = predecessor.replace("_1", "")
+                predecessor_name = predecessor.replace("_out", "").replace("_in", "")
+
+                # If that predecessor only has one successor it means its either the connection
+                # between the input and output of a component so we include the efficiency or
+                # its the output of a component connected to the input of another one.
+                if len(graph.succ[predecessor]) == 1:
+                    if component_name == predecessor_name:
+                        eta = name_to_eta[component_name]
+                    else:
+                        eta = 1.0
 
-                            output_name = component_name + ".fuel_consumed_t"
-                            index = self._components_connection_inputs.index(output_name)
-                            fuel_system_input_name = self._components_connection_outputs[index]
-                            input_number = fuel_system_input_name[-1]
-                            power_at_each_node[node] = input_power_dict[
-                                "fuel_consumed_in_t_" + input_number
-                            ]
-                            power_at_each_node[predecessor + "_" + input_number] = input_power_dict[
-                                "fuel_consumed_in_t_" + input_number
-                            ]
-
-                            if predecessor not in node_to_remove_at_the_end:
-                                node_to_remove_at_the_end.append(predecessor)
-
-                        treated_nodes.append(node)
-                        previous_treated_node_number += 1
-                        continue
-
-                # 2) If it has more than one predecessor it is the output of a bus/fuel
-                # system/gear. In this case we simply sum all the predecessor. We should be able
-                # to do so since we ensured to get there that all predecessor were already treated
-                if len(list(graph.pred[node])) > 1:
-                    power = np.zeros_like(template_power)
-                    for current_predecessor in graph.pred[node]:
-                        power += power_at_each_node[current_predecessor]
-
-                    power_at_each_node[node] = power
-                    treated_nodes.append(node)
-                    previous_treated_node_number += 1
+                    steps.append(("efficiency", node, predecessor, eta))
                     continue
 
-            # Now we remove all nodes we treated in this while loop
-            untreated_nodes = [x for x in untreated_nodes if x not in treated_nodes]
+                # Else it means its a component that splits_power (either planetary gear,
+                # splitter, ...).
+                predecessor_type = name_to_id[predecessor_name]
+
+                if predecessor_type == "fastga_he.pt_component.dc_splitter":
+                    output_name = component_name + ".dc_current_out"
+                    if name_to_id[component_name] == "fastga_he.pt_component.dc_sspc":
+                        if output_name not in output_to_input:
+                            output_name = component_name + ".dc_current_in"
+
+                    if name_to_id[component_name] == "fastga_he.pt_component.dc_line":
+                        output_name = component_name + ".dc_current"
+
+                    splitter_input_name = output_to_input[output_name]
+                    steps.append(
+                        (
+                            "dc_splitter",
+                            node,
+                            predecessor,
+                            predecessor_name,
+                            splitter_input_name.endswith("1"),
+                        )
+                    )
 
-        for node_to_remove in node_to_remove_at_the_end:
-            power_at_each_node.pop(node_to_remove)
+                elif predecessor_type == "fastga_he.pt_component.planetary_gear":
+                    gearbox_input_name = input_to_output[component_name + ".shaft_power_out"]
+                    steps.append(
+                        (
+                            "planetary_gear",
+                            node,
+                            predecessor,
+                            predecessor_name,
+                            gearbox_input_name.endswith("1"),
+                        )
+                    )
 
-        self._power_at_each_node = power_at_each_node
+                elif predecessor_type == "fastga_he.pt_component.fuel_system":
+                    fuel_system_input_name = input_to_output[component_name + ".fuel_consumed_t"]
+                    steps.append(
+                        (
+                            "fuel_system",
+                            node,
+                            predecessor,
+                            predecessor_name,
+                            fuel_system_input_name[-1],
+                        )
+                    )
+
+                else:
+                    continue
+
+                if predecessor not in node_to_remove_at_the_end:
+                    node_to_remove_at_the_end.append(predecessor)
 
-        final_list = {}
+        # Lastly, we identify from which node each power to set should be read
+        power_to_set_list = []
 
-        for node in list(graph.nodes):
+        for node in graph_nodes:
             component_name = node.replace("_in", "").replace("_out", "")
             component_id = name_to_id[component_name]
 
-            power_to_set = resources.DICTIONARY_P_TO_SET[component_id]
-
-            for power in power_to_set:
+            for power in resources.DICTIONARY_P_TO_SET[component_id]:
                 # These are tuple which contains the "in" or "out" tag plus the name of the
                 # variable
                 if power[1] == "in" and node.endswith("_in"):
@@ -2609,15 +2681,123 @@ class FASTGAHEPowerTrainConfigurator:
                     # the node name will not match and will need to be modified. We will
                     # check that we are in this case if the variable name endswith a number
                     if variable_name[-1].isdigit():
-                        final_list[variable_name] = power_at_each_node[
-                            node + "_" + variable_name[-1]
-                        ]
+                        power_to_set_list.append((variable_name, node + "_" + variable_name[-1]))
                     else:
-                        final_list[variable_name] = power_at_each_node[node]
+                        power_to_set_list.append((variable_name, node))
 
                 elif power[1] == "out" and node.endswith("_out"):
                     variable_name = component_name + "." + power[0]
-                    final_list[variable_name] = power_at_each_node[node]
+                    power_to_set_list.append((variable_name, node))
+
+        plan = {
+            "nodes": graph_nodes,
+            "steps": steps,
+            "node_to_remove_at_the_end": node_to_remove_at_the_end,
+            "power_to_set": power_to_set_list,
+        }
+        plan_cache[propulsive_nodes] = plan
+
+        return plan
+
+    def get_power_to_set(self, inputs, propulsive_power_dict: dict) -> Tuple[dict, dict]:
+        """
+        Returns a list of the power at each nodes of each subgraph. Also returns a list of the
+        dict of current variable names and the value they should be set at for each of the
+        subgraph. Dict will be empty if there is no power to set. The power to set are defined in
+        the registered_components.py file.
+
+        :param inputs: inputs vector, in the OpenMDAO format, which contains the value of the
+        voltages to check
+        :param propulsive_power_dict: dictionary with the propulsive power of each propulsor
+        """
+
+        self._get_connections()
+
+        # We rewrite the propulsive power dict to match the name of the nodes
+        proper_propulsive_power_dict = {}
+
+        for propulsive_load_name, propulsive_power in propulsive_power_dict.items():
+            proper_propulsive_power_dict[propulsive_load_name + "_out"] = propulsive_power
+
+        plan = self._get_power_propagation_plan(tuple(proper_propulsive_power_dict.keys()))
+
+        power_at_each_node = {}
+        # Initialize the dict with the power at each node with an array full of zeros except for
+        # propulsors.
+        template_power = list(proper_propulsive_power_dict.values())[0]
+        for node in plan["nodes"]:
+            if node in proper_propulsive_power_dict:
+                power_at_each_node[node] = proper_propulsive_power_dict[node]
+            else:
+                power_at_each_node[node] = np.zeros_like(template_power)
+
+        # Since steps are sorted in topological order, the power of all the predecessors of a
+        # node are known by the time we reach it
+        for step in plan["steps"]:
+            step_type = step[0]
+            node = step[1]
+
+            if step_type == "efficiency":
+                _, _, predecessor, eta = step
+                power_at_each_node[node] = power_at_each_node[predecessor] / eta
+
+            elif step_type == "sum":
+                power = np.zeros_like(template_power)
+                for predecessor in step[2]:
+                    power += power_at_each_node[predecessor]
+                power_at_each_node[node] = power
+
+            elif step_type == "dc_splitter":
+                _, _, predecessor, predecessor_name, is_primary = step
+                primary_input_power, secondary_power_output = self.splitter_power_inputs(
+                    inputs=inputs,
+                    components_name=predecessor_name,
+                    power_output=power_at_each_node[predecessor],
+                )
+
+                if is_primary:
+                    power_at_each_node[node] = primary_input_power
+                    power_at_each_node[predecessor + "_1"] = primary_input_power
+                else:
+                    power_at_each_node[node] = secondary_power_output
+                    power_at_each_node[predecessor + "_2"] = secondary_power_output
+
+            elif step_type == "planetary_gear":
+                _, _, predecessor, predecessor_name, is_primary = step
+                primary_input_power, secondary_power_output = self.gearbox_power_inputs(
+                    inputs=inputs,
+                    components_name=predecessor_name,
+                    power_output=power_at_each_node[predecessor],
+                )
+
+                if is_primary:
+                    power_at_each_node[node] = primary_input_power
+                    power_at_each_node[predecessor + "_1"] = primary_input_power
+                else:
+                    power_at_each_node[node] = secondary_power_output
+                    power_at_each_node[predecessor + "_2"] = primary_input_power
+
+            elif step_type == "fuel_system":
+                _, _, predecessor, predecessor_name, input_number = step
+                input_power_dict = self.fuel_system_power_inputs(
+                    inputs=inputs,
+                    components_name=predecessor_name,
+                    power_output=power_at_each_node[predecessor],
+                )
+
+                power_at_each_node[node] = input_power_dict["fuel_consumed_in_t_" + input_number]
+                power_at_each_node[predecessor + "_" + input_number] = input_power_dict[
+                    "fuel_consumed_in_t_" + input_number
+                ]
+
+        for node_to_remove in plan["node_to_remove_at_the_end"]:
+            power_at_each_node.pop(node_to_remove)
+
+        self._power_at_each_node = power_at_each_node
+
+        final_list = {
+            variable_name: power_at_each_node[node] for variable_name, node in plan["power_to_set"]
+        }
 
         return power_at_each_node, final_list
 
@@ -3219,6 +3399,29 @@ class _YAMLSerializer(ABC):
             yaml.dump(self._data, file)
 
 
+def _get_registered_components_version() -> str:
+    """
+    Returns a hash of the files that define how the power train files are read: the registered
+    components, the schema of the file and this module. It is only computed once per process.
+    """
+
+    global _REGISTERED_COMPONENTS_VERSION
+
+    if _REGISTERED_COMPONENTS_VERSION is None:
+        resources_folder_path = pathlib.Path(resources.__file__).parent
+        version_hash = hashlib.sha256()
+        for file_path in (
+            resources_folder_path / "registered_components.py",
+            resources_folder_path / JSON_SCHEMA_NAME,
+            pathlib.Path(__file__),
+        ):
+            version_hash.update(file_path.read_bytes())
+
+        _REGISTERED_COMPONENTS_VERSION = version_hash.hexdigest()
+
+    return _REGISTERED_COMPONENTS_VERSION
+
+
 def format_to_array(input_array: np.ndarray, number_of_points: int) -> np.ndarray:
     """
     Takes an inputs which is either a one-element array or a multi-element array and formats it.
@@ -13,6 +13,7 @@ from .registered_components import (
     DICTIONARY_CN_ID,
     DICTIONARY_CT,
     DICTIONARY_ATT,
+    DICTIONARY_OPT_ATT,
     DICTIONARY_PT,
     DICTIONARY_SPT,
     DICTIONARY_PTS,
@@ -13,6 +13,9 @@ CT = "components_type"
 # CTC is used to store the class of the components type type, like "propulsor", "connector", ...
 CTC = "components_type_class"
 ATT = "attributes"
+# OPT_ATT contains the options that can be declared for the component in the power train file but,
+# as opposed to the ATT ones, don't have to
+OPT_ATT = "optional_attributes"
 # The IN and OUT field contain the input and output in the system sense of the term,
 # meaning the output of the prop is the propulsive power while its input is the mechanical power.
 # In those inputs, there will be tuple of two element: the first filled when the system
@@ -105,6 +108,7 @@ PROPELLER = {
     CN_ID: "propeller_id",
     CT: "propeller",
     ATT: None,
+    OPT_ATT: [],
     PT: ["convergence:*", "true_airspeed", "altitude", "density", "settings:*"],
     SPT: ["data:*", "true_airspeed", "cl_wing_clean", "density", "alpha"],
     PTS: [],
@@ -152,6 +156,7 @@ PMSM = {
     CN_ID: "motor_id",
     CT: "PMSM",
     ATT: None,
+    OPT_ATT: [],
     PT: ["settings:*"],
     SPT: [],
     PTS: [],
@@ -196,6 +201,7 @@ SM_PMSM = {
     CN_ID: "motor_id",
     CT: "SM_PMSM",
     ATT: None,
+    OPT_ATT: ["fused"],
     PT: ["settings:*", "density", "altitude"],
     SPT: [],
     PTS: [],
@@ -244,6 +250,7 @@ INVERTER = {
     CN_ID: "inverter_id",
     CT: "inverter",
     ATT: None,
+    OPT_ATT: ["fused"],
     PT: ["settings:*"],
     SPT: [],
     PTS: [],
@@ -300,6 +307,7 @@ DC_BUS = {
     CN_ID: "dc_bus_id",
     CT: "DC_bus",
     ATT: ["number_of_inputs", "number_of_outputs"],
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -335,6 +343,7 @@ DC_LINE = {
     CN_ID: "harness_id",
     CT: "DC_cable_harness",
     ATT: None,
+    OPT_ATT: [],
     PT: ["exterior_temperature", "settings:*", "time_step"],
     SPT: [],
     PTS: [],
@@ -370,6 +379,7 @@ DC_DC_CONVERTER = {
     CN_ID: "dc_dc_converter_id",
     CT: "DC_DC_converter",
     ATT: None,
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -410,6 +420,7 @@ BATTERY_PACK = {
     CN_ID: "battery_pack_id",
     CT: "battery_pack",
     ATT: None,
+    OPT_ATT: ["fused"],
     PT: [
         "time_step",
         "settings:*",
@@ -463,6 +474,7 @@ DC_SSPC = {
     CN_ID: "dc_sspc_id",
     CT: "DC_SSPC",
     ATT: ["closed_by_default"],
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -503,6 +515,7 @@ DC_SPLITTER = {
     CN_ID: "dc_splitter_id",
     CT: "DC_splitter",
     ATT: ["splitter_mode"],
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -543,6 +556,7 @@ RECTIFIER = {
     CN_ID: "rectifier_id",
     CT: "rectifier",
     ATT: None,
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -593,6 +607,7 @@ GENERATOR = {
     CN_ID: "generator_id",
     CT: "generator",
     ATT: None,
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -641,6 +656,7 @@ ICE = {
     CN_ID: "ice_id",
     CT: "ICE",
     ATT: None,
+    OPT_ATT: [],
     PT: ["time_step", "density", "settings:*", "altitude"],
     SPT: [],
     PTS: [],
@@ -689,6 +705,7 @@ HIGH_RPM_ICE = {
     CN_ID: "high_rpm_ice_id",
     CT: "high_rpm_ICE",
     ATT: None,
+    OPT_ATT: [],
     PT: ["time_step", "density"],
     SPT: [],
     PTS: [],
@@ -738,6 +755,7 @@ FUEL_TANK = {
     CN_ID: "fuel_tank_id",
     CT: "fuel_tank",
     ATT: None,
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -775,6 +793,7 @@ FUEL_SYSTEM = {
     CN_ID: "fuel_system_id",
     CT: "fuel_system",
     ATT: ["number_of_engines", "number_of_tanks"],
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -812,6 +831,7 @@ H2_FUEL_SYSTEM = {
     CN_ID: "h2_fuel_system_id",
     CT: "H2_fuel_system",
     ATT: ["number_of_power_sources", "number_of_tanks", "compact", "wing_related"],
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -849,6 +869,7 @@ TURBOSHAFT = {
     CN_ID: "turboshaft_id",
     CT: "turboshaft",
     ATT: None,
+    OPT_ATT: ["fused"],
     PT: ["time_step", "density", "settings:*", "altitude", "true_airspeed"],
     SPT: ["data:*", "true_airspeed", "density", "altitude"],
     PTS: ["shaft_power_out"],
@@ -903,6 +924,7 @@ SPEED_REDUCER = {
     CN_ID: "speed_reducer_id",
     CT: "speed_reducer",
     ATT: None,
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -943,6 +965,7 @@ PLANETARY_GEAR = {
     CN_ID: "planetary_gear_id",
     CT: "planetary_gear",
     ATT: ["gear_mode"],
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -987,6 +1010,7 @@ TURBO_GENERATOR = {
     CN_ID: "turbo_generator_id",
     CT: "turbo_generator",
     ATT: None,
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -1033,6 +1057,7 @@ GEARBOX = {
     CN_ID: "gearbox_id",
     CT: "gearbox",
     ATT: [],
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -1074,6 +1099,7 @@ DC_AUX_LOAD = {
     CN_ID: "aux_load_id",
     CT: "aux_load",
     ATT: None,
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -1112,6 +1138,7 @@ GASEOUS_HYDROGEN_TANK = {
     CN_ID: "gaseous_hydrogen_tank_id",
     CT: "gaseous_hydrogen_tank",
     ATT: None,
+    OPT_ATT: [],
     PT: [],
     SPT: [],
     PTS: [],
@@ -1149,6 +1176,7 @@ PEMFC_STACK = {
     CN_ID: "pemfc_stack_id",
     CT: "PEMFC_stack",
     ATT: ["model_fidelity"],
+    OPT_ATT: [],
     PT: ["time_step", "altitude"],
     SPT: [],
     PTS: [],
@@ -1219,6 +1247,7 @@ DICTIONARY_CN = {}
 DICTIONARY_CN_ID = {}
 DICTIONARY_CT = {}
 DICTIONARY_ATT = {}
+DICTIONARY_OPT_ATT = {}
 DICTIONARY_PT = {}
 DICTIONARY_SPT = {}
 DICTIONARY_PTS = {}
@@ -1252,6 +1281,7 @@ for known_component in KNOWN_COMPONENTS:
     DICTIONARY_CN_ID[known_component[ID]] = known_component[CN_ID]
     DICTIONARY_CT[known_component[ID]] = known_component[CT]
     DICTIONARY_ATT[known_component[ID]] = known_component[ATT]
+    DICTIONARY_OPT_ATT[known_component[ID]] = known_component[OPT_ATT]
     DICTIONARY_PT[known_component[ID]] = known_component[PT]
     DICTIONARY_SPT[known_component[ID]] = known_component[SPT]
     DICTIONARY_PTS[known_component[ID]] = known_component[PTS]
@@ -8,11 +8,17 @@ import pathlib
 import shutil
 import pytest
 import time
+from unittest.mock import patch
 import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
 
-from ..powertrain import FASTGAHEPowerTrainConfigurator, COMPONENT_VARIABLE, CONNECTION_VARIABLE
+from ..powertrain import (
+    FASTGAHEPowerTrainConfigurator,
+    COMPONENT_VARIABLE,
+    CONNECTION_VARIABLE,
+    _YAMLSerializer,
+)
 from ..exceptions import (
     FASTGAHESingleSSPCAtEndOfLine,
     FASTGAHEImpossiblePair,
@@ -309,6 +315,42 @@ def test_connection_cache():
         assert connection_cache[variable] == power_train_configurator.__dict__[variable]
 
 
+def test_disk_cache(tmp_path):
+    sample_power_train_file_path = pth.join(pth.dirname(__file__), "data", YML_FILE)
+
+    FASTGAHEPowerTrainConfigurator._cache = {}
+    FASTGAHEPowerTrainConfigurator.set_disk_cache_folder(tmp_path)
+
+    try:
+        power_train_configurator = FASTGAHEPowerTrainConfigurator(
+            power_train_file_path=sample_power_train_file_path
+        )
+        power_train_configurator._get_connections()
+
+        assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+        # Emulates a new process, which should not need to read the file again
+        FASTGAHEPowerTrainConfigurator._cache = {}
+        with patch.object(_YAMLSerializer, "read", side_effect=AssertionError):
+            power_train_configurator_disk = FASTGAHEPowerTrainConfigurator(
+                power_train_file_path=sample_power_train_file_path
+            )
+            power_train_configurator_disk._get_connections()
+
+    finally:
+        FASTGAHEPowerTrainConfigurator.set_disk_cache_folder(None)
+        FASTGAHEPowerTrainConfigurator._cache = {}
+
+    assert (
+        power_train_configurator_disk._serializer.data == power_train_configurator._serializer.data
+    )
+    for variable in COMPONENT_VARIABLE + CONNECTION_VARIABLE:
+        assert (
+            power_train_configurator_disk.__dict__[variable]
+            == power_train_configurator.__dict__[variable]
+        )
+
+
 def test_cache_with_modified_file():
     sample_power_train_file_path = pth.join(pth.dirname(__file__), "data", YML_FILE)
     directory = pth.dirname(sample_power_train_file_path)
@@ -528,6 +570,45 @@ def test_power_train_file_direct_bus_battery_connection():
     )
 
 
+def test_power_train_file_direct_bus_battery_connection_with_options():
+    sample_power_train_file_path = pth.join(
+        pth.dirname(__file__),
+        "data",
+        "sample_power_train_file_direct_battery_bus_connection_fused.yml",
+    )
+    power_train_configurator = FASTGAHEPowerTrainConfigurator(
+        power_train_file_path=sample_power_train_file_path
+    )
+
+    power_train_configurator._get_components()
+    power_train_configurator._get_connections()
+
+    # The option of the direct connection is added to the ones declared in the file
+    battery_index = power_train_configurator._components_name.index("battery_pack_1")
+    assert power_train_configurator._components_options[battery_index] == {
+        "fused": True,
+        "direct_bus_connection": True,
+    }
+
+    assert "battery_pack_1.voltage_out" in power_train_configurator._components_connection_inputs
+    assert (
+        "battery_pack_1.dc_current_out" in power_train_configurator._components_connection_outputs
+    )
+
+    (
+        components_name,
+        components_perf_watchers_name,
+        _,
+    ) = power_train_configurator.get_performance_watcher_elements_list()
+    battery_watchers_name = [
+        watcher_name
+        for component_name, watcher_name in zip(components_name, components_perf_watchers_name)
+        if component_name == "battery_pack_1"
+    ]
+    assert "voltage_out" not in battery_watchers_name
+    assert "dc_current_out" in battery_watchers_name
+
+
 def test_power_train_file_connections_splitter():
     sample_power_train_file_path = pth.join(
         pth.dirname(__file__), "data", "sample_power_train_file_splitter.yml"
@@ -1164,6 +1245,47 @@ def test_get_power_on_each_node_unequal_branches():
     assert power_at_each_node["dc_bus_4_in"] == pytest.approx(276.8e3, rel=1e-3)
 
 
+def test_power_propagation_plan_cached():
+    sample_power_train_file_path = pth.join(
+        pth.dirname(__file__), "data", "sample_power_train_file_quad_prop.yml"
+    )
+    power_train_configurator = FASTGAHEPowerTrainConfigurator(
+        power_train_file_path=sample_power_train_file_path
+    )
+
+    propulsive_power_dict = {
+        "propeller_0": np.array([50e3]),
+        "propeller_1": np.array([50e3]),
+        "propeller_2": np.array([50e3]),
+        "propeller_3": np.array([50e3]),
+    }
+
+    power_at_each_node, power_to_set = power_train_configurator.get_power_to_set(
+        inputs=None, propulsive_power_dict=propulsive_power_dict
+    )
+
+    pt_cache = FASTGAHEPowerTrainConfigurator._cache[power_train_configurator._power_train_file]
+    plan_cache = pt_cache["_power_propagation_plan"]
+    assert ("propeller_0_out", "propeller_1_out", "propeller_2_out", "propeller_3_out") in (
+        plan_cache
+    )
+
+    # A new configurator on the same file should reuse the plan and give the same results
+    power_train_configurator_bis = FASTGAHEPowerTrainConfigurator(
+        power_train_file_path=sample_power_train_file_path
+    )
+    power_at_each_node_bis, power_to_set_bis = power_train_configurator_bis.get_power_to_set(
+        inputs=None, propulsive_power_dict=propulsive_power_dict
+    )
+
+    assert pt_cache["_power_propagation_plan"] is plan_cache
+    assert len(plan_cache) == 1
+    for node, power in power_at_each_node.items():
+        assert power_at_each_node_bis[node] == pytest.approx(power, rel=1e-10)
+    for variable_name, power in power_to_set.items():
+        assert power_to_set_bis[variable_name] == pytest.approx(power, rel=1e-10)
+
+
 def test_power_to_set():
     # Very simple power train
     sample_power_train_file_path = pth.join(
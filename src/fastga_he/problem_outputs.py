@@ -0,0 +1,82 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+"""Saving and restoring the outputs, or the whole state, of the model of an OpenMDAO problem."""
+
+import numpy as np
+import openmdao.api as om
+
+
+def get_outputs_values(problem: om.Problem) -> np.ndarray:
+    """
+    Returns a copy of the values of all the outputs of the model of a problem, as a flat array.
+    The outputs also contain the inputs of the problem through its independent variable
+    components. The problem must have gone through its final setup.
+
+    Working on the output vector as a whole, rather than with problem.get_val and
+    problem.set_val, restores the state the solvers start from, implicit outputs included, at the
+    cost of a single copy instead of one call per variable, of which the models of this package
+    have thousands.
+
+    :param problem: the problem to get the values of the outputs from.
+    """
+
+    _, outputs, _ = problem.model.get_nonlinear_vectors()
+
+    return outputs.asarray().copy()
+
+
+def set_outputs_values(problem: om.Problem, outputs_values: np.ndarray):
+    """
+    Sets all the outputs of the model of a problem to values obtained with get_outputs_values on
+    the same problem.
+
+    :param problem: the problem to set the values of the outputs of.
+    :param outputs_values: the values of all the outputs, as a flat array.
+    """
+
+    _, outputs, _ = problem.model.get_nonlinear_vectors()
+
+    outputs.set_val(outputs_values)
+
+
+def get_problem_state(problem: om.Problem) -> dict:
+    """
+    Returns a copy of the inputs, outputs and residuals of the model of a problem, as flat arrays.
+    The problem must have gone through its final setup.
+
+    :param problem: the problem to get the state of.
+    """
+
+    inputs, outputs, residuals = problem.model.get_nonlinear_vectors()
+
+    return {
+        "inputs": inputs.asarray().copy(),
+        "outputs": outputs.asarray().copy(),
+        "residuals": residuals.asarray().copy(),
+    }
+
+
+def set_problem_state(problem: om.Problem, state: dict):
+    """
+    Brings the model of a problem back to a state obtained with get_problem_state on the same
+    problem. On top of the inputs, outputs and residuals, the systems of the model that keep
+    values from one run to the next, such as the ones deciding whether to redo their initial
+    guesses, are reset through their reset_guess_state method. With the state taken right after
+    setup, the next run gives the same results as on a freshly set up problem.
+
+    :param problem: the problem to set the state of.
+    :param state: the inputs, outputs and residuals of the model, as flat arrays.
+    """
+
+    inputs, outputs, residuals = problem.model.get_nonlinear_vectors()
+
+    inputs.set_val(state["inputs"])
+    outputs.set_val(state["outputs"])
+    residuals.set_val(state["residuals"])
+
+    for system in problem.model.system_iter(include_self=True, recurse=True):
+        reset_guess_state = getattr(system, "reset_guess_state", None)
+        if callable(reset_guess_state):
+            reset_guess_state()
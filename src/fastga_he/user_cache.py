@@ -0,0 +1,28 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+"""Location of the files that FAST-OAD-GA-HE caches between runs."""
+
+import os
+import os.path as pth
+import tempfile
+
+
+def get_user_cache_folder_path(*sub_folders: str) -> str:
+    """
+    Returns the fastga_he folder of the user cache, or one of its sub folders. The cache files
+    are written there rather than next to the files they are computed from since those may be
+    read-only, e.g. in the resources of an installed package.
+
+    :param sub_folders: names of the sub folders of the fastga_he folder of the user cache.
+    """
+
+    if os.name == "nt":
+        cache_folder_path = os.environ.get("LOCALAPPDATA") or tempfile.gettempdir()
+    else:
+        cache_folder_path = os.environ.get("XDG_CACHE_HOME") or pth.join(
+            pth.expanduser("~"), ".cache"
+        )
+
+    return pth.join(cache_folder_path, "fastga_he", *sub_folders)
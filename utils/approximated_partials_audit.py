@@ -0,0 +1,214 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import argparse
+import ast
+import importlib
+import os
+import os.path as pth
+import time
+
+import numpy as np
+import openmdao.api as om
+from fastoad.module_management._plugins import FastoadLoader
+
+SOURCE_FOLDER_PATH = pth.join(pth.dirname(__file__), "..", "src", "fastga_he")
+
+APPROXIMATION_METHODS = ("fd", "cs")
+
+
+def find_approximated_partials(source_folder_path: str = SOURCE_FOLDER_PATH) -> list:
+    """
+    Lists all the partials declared with an approximation method in the source files, test
+    files excluded. Each element of the list is a dict containing the path of the file, the
+    module and class it belongs to, the line of the declaration, the of and wrt arguments as
+    written in the code and the method.
+
+    :param source_folder_path: path to the folder to scan.
+    """
+
+    approximated_partials = []
+    package_root = pth.dirname(pth.abspath(source_folder_path))
+
+    for root, dir_names, file_names in os.walk(source_folder_path):
+        dir_names[:] = sorted(dir_name for dir_name in dir_names if "test" not in dir_name)
+
+        for file_name in sorted(file_names):
+            if not file_name.endswith(".py") or file_name.startswith("test_"):
+                continue
+
+            file_path = pth.join(root, file_name)
+            with open(file_path, "r", encoding="utf-8") as file:
+                source = file.read()
+
+            module_name = (
+                pth.relpath(file_path, package_root)[: -len(".py")].replace(os.sep, ".")
+            ).removesuffix(".__init__")
+
+            for class_node in ast.walk(ast.parse(source)):
+                if not isinstance(class_node, ast.ClassDef):
+                    continue
+
+                for call_node in ast.walk(class_node):
+                    if not (
+                        isinstance(call_node, ast.Call)
+                        and isinstance(call_node.func, ast.Attribute)
+                        and call_node.func.attr == "declare_partials"
+                    ):
+                        continue
+
+                    arguments = {keyword.arg: keyword.value for keyword in call_node.keywords}
+                    for name, value in zip(["of", "wrt"], call_node.args):
+                        arguments[name] = value
+
+                    method = arguments.get("method")
+                    if not (
+                        isinstance(method, ast.Constant) and method.value in APPROXIMATION_METHODS
+                    ):
+                        continue
+
+                    approximated_partials.append(
+                        {
+                            "file_path": file_path,
+                            "module_name": module_name,
+                            "class_name": class_node.name,
+                            "line": call_node.lineno,
+                            "of": " ".join(ast.get_source_segment(source, arguments["of"]).split()),
+                            "wrt": " ".join(
+                                ast.get_source_segment(source, arguments["wrt"]).split()
+                            ),
+                            "method": method.value,
+                        }
+                    )
+
+    return approximated_partials
+
+
+def time_linearize(
+    module_name: str, class_name: str, number_of_points: int, number_of_loops: int
+) -> float:
+    """
+    Returns the mean time taken to linearize the component, the number of points of the
+    component is set to the one given, ids to a dummy value and inputs which don't have a
+    default value are set to 1.0.
+
+    :param module_name: name of the module the component is defined in.
+    :param class_name: name of the component class.
+    :param number_of_points: value given to all the options that define a number of points.
+    :param number_of_loops: number of linearizations to average the time on.
+    """
+
+    component = getattr(importlib.import_module(module_name), class_name)()
+
+    for option_name in component.options:
+        if option_name.startswith("number_of_points"):
+            component.options[option_name] = number_of_points
+        elif option_name.endswith("_id") and not component.options[option_name]:
+            component.options[option_name] = "component_1"
+
+    problem = om.Problem(reports=False)
+    problem.model.add_subsystem("component", component, promotes=["*"])
+    problem.setup()
+
+    for meta in component.get_io_metadata(
+        iotypes="input", metadata_keys=["val"], get_remote=False
+    ).values():
+        value = np.where(np.isnan(meta["val"]), 1.0, meta["val"])
+        problem.set_val(meta["prom_name"], value)
+
+    problem.run_model()
+
+    start = time.perf_counter()
+    for _ in range(number_of_loops):
+        component.run_linearize()
+
+    return (time.perf_counter() - start) / number_of_loops
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Lists the partials declared with an approximation method in FAST-OAD-CS23-HE "
+        "and times the linearization of the components they belong to."
+    )
+    parser.add_argument(
+        "--number-of-points",
+        type=int,
+        default=90,
+        help="number of points given to the components that are vectorized",
+    )
+    parser.add_argument(
+        "--number-of-loops",
+        type=int,
+        default=5,
+        help="number of linearizations the time is averaged on",
+    )
+    parser.add_argument(
+        "--no-timing", action="store_true", help="only list the partials, don't time them"
+    )
+    args = parser.parse_args()
+
+    # Ensures the submodels are registered before importing the components, as it is done for
+    # the tests
+    FastoadLoader()
+
+    approximated_partials = find_approximated_partials()
+
+    components = {}
+    for partial in approximated_partials:
+        print(
+            pth.relpath(partial["file_path"], SOURCE_FOLDER_PATH)
+            + ":"
+            + str(partial["line"])
+            + " "
+            + partial["class_name"]
+            + ", of="
+            + partial["of"]
+            + ", wrt="
+            + partial["wrt"]
+            + ", method="
+            + partial["method"]
+        )
+        components[(partial["module_name"], partial["class_name"])] = None
+
+    print(
+        str(len(approximated_partials))
+        + " approximated partials found in "
+        + str(len(components))
+        + " components"
+    )
+
+    if args.no_timing:
+        return
+
+    for module_name, class_name in components:
+        try:
+            linearize_time = time_linearize(
+                module_name, class_name, args.number_of_points, args.number_of_loops
+            )
+            result = str(linearize_time) + " s"
+        # Some components need inputs with consistent values or files to run, which can't be
+        # guessed here
+        except Exception as error:
+            result = (
+                "could not be timed alone ("
+                + type(error).__name__
+                + ": "
+                + " ".join(str(error).split())[:200]
+                + ")"
+            )
+
+        print(
+            "Timer for the linearization of "
+            + module_name
+            + "."
+            + class_name
+            + " with "
+            + str(args.number_of_points)
+            + " points: "
+            + result
+        )
+
+
+if __name__ == "__main__":
+    main()
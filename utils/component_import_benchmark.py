@@ -0,0 +1,125 @@
+# This file is part of FAST-OAD_CS23-HE : A framework for rapid Overall Aircraft Design of Hybrid
+# Electric Aircraft.
+# Copyright (C) 2025 ISAE-SUPAERO
+
+import argparse
+import subprocess
+import sys
+import time
+
+COMPONENTS_PACKAGE = "fastga_he.models.propulsion.components"
+
+# Power train made of a propeller, a PMSM and a battery pack, with the connectors between them
+PT_FILE_PATH = "models/propulsion/assemblers/unit_tests/data/sample_power_train_file.yml"
+
+# Each scenario is run in a fresh interpreter so that nothing is already imported. The last
+# scenario builds and sets up the performances of a power train the way a DOE or batch worker
+# does. The first RegisterSubmodel decorator it meets starts the plugin load of FAST-OAD, which
+# imports the whole models package, so it imports every component package whatever the
+# components the power train actually uses, and a lazy lookup of the component classes can't
+# make such a worker start faster.
+SCENARIOS = {
+    "plugin load": (
+        "from fastoad.module_management._plugins import FastoadLoader\nFastoadLoader()\n"
+    ),
+    "components package": "import " + COMPONENTS_PACKAGE + "\n",
+    "propeller + motor + battery model": (
+        "import os.path as pth\n"
+        "import openmdao.api as om\n"
+        "import fastga_he\n"
+        "from fastga_he.models.propulsion.assemblers.performances_from_pt_file import (\n"
+        "    PowerTrainPerformancesFromFile,\n"
+        ")\n"
+        "problem = om.Problem(reports=False)\n"
+        "problem.model.add_subsystem(\n"
+        "    'performances',\n"
+        "    PowerTrainPerformancesFromFile(\n"
+        "        power_train_file_path=pth.join(pth.dirname(fastga_he.__file__), '"
+        + PT_FILE_PATH
+        + "'),\n"
+        "        number_of_points=2,\n"
+        "    ),\n"
+        "    promotes=['*'],\n"
+        ")\n"
+        "problem.setup()\n"
+    ),
+}
+
+
+def time_import(code: str):
+    """
+    Runs the code in a new interpreter with the import time option and returns the total time
+    spent running it and importing modules, in s, the total number of modules imported and the
+    number of modules imported from the components package.
+
+    :param code: the code to run.
+    """
+
+    start_time = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    run_time = time.perf_counter() - start_time
+
+    total_time = 0.0
+    nb_modules = 0
+    nb_component_modules = 0
+
+    # Each line of the output is formatted as "import time: self [us] | cumulative | name", the
+    # self time of all modules is summed to get the total time
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_time, _, module_name = line[len("import time:") :].split("|")
+        total_time += float(self_time) * 1e-6
+        nb_modules += 1
+
+        if module_name.strip().startswith(COMPONENTS_PACKAGE):
+            nb_component_modules += 1
+
+    return run_time, total_time, nb_modules, nb_component_modules
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Times the imports needed to get the components of FAST-OAD-CS23-HE, "
+        "based on the import time option of python, and the time to set up a power train model "
+        "with them."
+    )
+    parser.add_argument(
+        "--number-of-loops",
+        type=int,
+        default=3,
+        help="number of runs of each scenario the time is averaged on",
+    )
+    args = parser.parse_args()
+
+    for scenario_name, code in SCENARIOS.items():
+        mean_run_time = 0.0
+        mean_import_time = 0.0
+        for _ in range(args.number_of_loops):
+            run_time, import_time, nb_modules, nb_component_modules = time_import(code)
+            mean_run_time += run_time / args.number_of_loops
+            mean_import_time += import_time / args.number_of_loops
+
+        print(
+            "Timer for scenario '"
+            + scenario_name
+            + "': "
+            + str(mean_run_time)
+            + " s end to end, "
+            + str(mean_import_time)
+            + " s of imports, "
+            + str(nb_modules)
+            + " modules imported, "
+            + str(nb_component_modules)
+            + " of them from the components package"
+        )
+
+
+if __name__ == "__main__":
+    main()